@@ -0,0 +1,50 @@
+"""Measure the cost of a DAQ library call through the `advantech_daq.api` wrappers
+
+The functions bound once by `prototype` are compared against the way the
+wrappers used to call them, with the argument types set on every call.
+
+Run it from the root of the repository, with `DAQ_BACKEND=simulator`
+to do without the board:
+
+    DAQ_BACKEND=simulator python -m benchmarks.api_calls
+"""
+
+from ctypes import c_int32
+from timeit import repeat
+
+from pyHM.advantech_daq import Scenario
+from pyHM.advantech_daq.api import c_uint_, daq_ctrl_base, dll
+
+CALLS: int = 100_000
+
+
+def get_state_per_call(obj: int) -> int:
+    """The call as it used to be, the argument types set every time"""
+    dll.TDaqCtrlBase_getState.argtypes = [c_uint_]
+    dll.TDaqCtrlBase_getState.restype = c_int32
+    return dll.TDaqCtrlBase_getState(obj)
+
+
+def rate(statement: str, **namespace: object) -> float:
+    """Get the best rate of the calls, per second"""
+    return CALLS / min(repeat(statement, number=CALLS, repeat=5, globals=namespace))
+
+
+def main() -> None:
+    obj: int = daq_ctrl_base.create(Scenario.WaveformAI.value)
+    try:
+        daq_ctrl_base.get_state(obj)  # bind the function
+        per_call: float = rate(
+            "get_state_per_call(obj)", get_state_per_call=get_state_per_call, obj=obj
+        )
+        bound: float = rate(
+            "get_state(obj)", get_state=daq_ctrl_base.get_state, obj=obj
+        )
+    finally:
+        daq_ctrl_base.dispose(obj)
+    print(f"argtypes set per call: {per_call:10.0f} calls/s")
+    print(f"bound once:            {bound:10.0f} calls/s  ({bound / per_call:.2f}×)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Measure the synchronous detection of an angle
+
+An angle of 400 modulation cycles of 256 scans of 3 channels per half-period
+is demodulated the way the measurement used to do it, by the nested means
+over the cycles of the half-periods once the angle is measured,
+and the way it does it now, by the running statistics of every channel
+accumulated block by block as the half-periods arrive.
+The raw ADC counts are demodulated, too, by the scales of the channels.
+
+Run it from the root of the repository:
+
+    python -m benchmarks.demodulation
+"""
+
+from array import array
+from random import Random
+from timeit import repeat
+from typing import Callable
+
+from pyHM.advantech_daq import MathInterval
+from pyHM.advantech_daq.channel_scale import ChannelScale
+from pyHM.constants import RECEIVER_MARK_TYPE, RECEIVERS
+from pyHM.numeric import RunningStatistics, synchronous_detection
+from pyHM.thread_hm import ThreadHM
+
+CYCLE_COUNT: int = 400
+SAMPLE_COUNT: int = 256
+CHANNEL_COUNT: int = 3
+PERIOD_SAMPLE_COUNT: int = SAMPLE_COUNT * CHANNEL_COUNT
+# the default sample rate of the measurement, [scans/s]
+SAMPLE_RATE: int = 68300
+
+Results = dict[RECEIVER_MARK_TYPE, tuple[float, float]]
+
+
+def block(adc_buffer: memoryview, cycle: int) -> memoryview:
+    """Get the scans of a cycle out of a half-period buffer"""
+    return adc_buffer[cycle * PERIOD_SAMPLE_COUNT : (cycle + 1) * PERIOD_SAMPLE_COUNT]
+
+
+def accumulate(
+    adc_buffers: dict[int, memoryview], channel_scales: list[ChannelScale]
+) -> dict[int, list[RunningStatistics]]:
+    """Accumulate the statistics of the channels the way the measurement does"""
+    adc_statistics: dict[int, list[RunningStatistics]] = {
+        period: [RunningStatistics() for _ in range(CHANNEL_COUNT)] for period in (0, 1)
+    }
+    for cycle in range(CYCLE_COUNT):
+        for period in (0, 1):
+            ThreadHM._add_adc_statistics(
+                block(adc_buffers[period], cycle),
+                adc_statistics[period],
+                channel_scales,
+                CHANNEL_COUNT,
+            )
+    return adc_statistics
+
+
+def detect(
+    adc_statistics: dict[int, list[RunningStatistics]],
+    channel_scales: list[ChannelScale],
+) -> Results:
+    """Demodulate the angle by the statistics the way the measurement does"""
+    scaled_statistics: dict[int, list[RunningStatistics]] = {
+        period: ThreadHM._scaled_adc_statistics(adc_statistics[period], channel_scales)
+        for period in (0, 1)
+    }
+    return {
+        receiver: synchronous_detection(
+            [scaled_statistics[period][int(receiver)] for period in (0, 1)]
+        )
+        for receiver in RECEIVERS
+    }
+
+
+def detect_by_nested_means(data_adc: dict[int, list[list[float]]]) -> Results:
+    """Demodulate the angle the way the measurement used to, from the scaled data"""
+    results: Results = {}
+    for receiver in RECEIVERS:
+        mean = [
+            sum(
+                sum(d_cycle[int(receiver) :: CHANNEL_COUNT])
+                / (len(d_cycle) // CHANNEL_COUNT)
+                for d_cycle in data_adc[period]
+            )
+            / len(data_adc[period])
+            for period in (0, 1)
+        ]
+        results[receiver] = ((mean[0] - mean[1]) / 2, (mean[0] + mean[1]) / 2)
+    return results
+
+
+def best_time(function: Callable[[], object]) -> float:
+    """Get the best time of a call of `function`, [s]"""
+    return min(repeat(function, number=1, repeat=5))
+
+
+def main() -> None:
+    random: Random = Random(0)
+    scale: ChannelScale = ChannelScale(MathInterval(0, -10.0, 10.0), 0xFFFF)
+    channel_scales: list[ChannelScale] = [scale] * CHANNEL_COUNT
+    # the counts are unsigned, and stored as signed, as the driver does
+    counts: dict[int, memoryview] = {
+        period: memoryview(
+            array(
+                "H",
+                (
+                    random.randint(-0x800, 0x800) + (0x4000 if period else 0xC000)
+                    for _ in range(CYCLE_COUNT * PERIOD_SAMPLE_COUNT)
+                ),
+            )
+        )
+        .cast("B")
+        .cast("h")
+        for period in (0, 1)
+    }
+    values: dict[int, memoryview] = {
+        period: memoryview(scale.scale(counts[period])) for period in (0, 1)
+    }
+    data_adc: dict[int, list[list[float]]] = {
+        period: [block(values[period], cycle).tolist() for cycle in range(CYCLE_COUNT)]
+        for period in (0, 1)
+    }
+
+    def show(label: str, seconds: float, results: Results) -> None:
+        print(
+            f"{label}: {seconds * 1e3:7.2f} ms, "
+            + ", ".join(f"{sd:+.9f} V" for sd, _ in results.values())
+        )
+
+    show(
+        "nested means, after the angle",
+        best_time(lambda: detect_by_nested_means(data_adc)),
+        detect_by_nested_means(data_adc),
+    )
+    for label, adc_buffers, scales in (
+        ("statistics", values, []),
+        ("statistics, raw", counts, channel_scales),
+    ):
+        fold_time: float = best_time(
+            lambda adc_buffers=adc_buffers, scales=scales: accumulate(
+                adc_buffers, scales
+            )
+        )
+        adc_statistics: dict[int, list[RunningStatistics]] = accumulate(
+            adc_buffers, scales
+        )
+        show(
+            f"{label}, after the angle",
+            best_time(
+                lambda adc_statistics=adc_statistics, scales=scales: detect(
+                    adc_statistics, scales
+                )
+            ),
+            detect(adc_statistics, scales),
+        )
+        # every block is folded while the next one is acquired
+        print(
+            f"{label}, per block: {fold_time / CYCLE_COUNT / 2 * 1e3:.3f} ms"
+            f" of {SAMPLE_COUNT / SAMPLE_RATE * 1e3:.2f} ms to acquire it"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Measure the conversion of values into the enumeration items
+
+Every `to*` converter of `advantech_daq.utils` is timed over all the values
+of its enumeration, against the conversion the converters used to do,
+the membership check followed by the call of the enumeration.
+
+Run it from the root of the repository:
+
+    python -m benchmarks.enum_decoding
+"""
+
+from enum import Enum
+from timeit import repeat
+from typing import Any, Callable
+
+from pyHM import advantech_daq
+from pyHM.advantech_daq import utils
+
+ROUNDS: int = 20
+
+
+def to_enum_item[T](enum_type: type[T], value: Any) -> T:
+    """The conversion as it used to be"""
+    if value not in enum_type:
+        raise ValueError(f"{enum_type.__name__} has no {value!r}")
+    return enum_type(value)
+
+
+def best_time(convert: Callable[[Any], Any], values: list[Any]) -> float:
+    """Get the best time to convert all the `values`, [s]"""
+    return (
+        min(
+            repeat(
+                lambda: [convert(value) for value in values], number=ROUNDS, repeat=5
+            )
+        )
+        / ROUNDS
+    )
+
+
+def main() -> None:
+    count: int = 0
+    table_total: float = 0.0
+    check_total: float = 0.0
+    for name in utils.__all__:
+        if not name.startswith("to") or name == "to_enum_item":
+            continue
+        converter: Callable[[int], Enum] = getattr(utils, name)
+        return_type: type | str = converter.__annotations__["return"]
+        enum_type: type[Enum] = getattr(
+            advantech_daq,
+            return_type if isinstance(return_type, str) else return_type.__name__,
+        )
+        values: list[Any] = [item.value for item in enum_type]
+        assert [converter(value) for value in values] == list(enum_type)
+        table_time: float = best_time(converter, values)
+        check_time: float = best_time(
+            lambda value, enum_type=enum_type: to_enum_item(enum_type, value), values
+        )
+        print(
+            f"{name:<22}{len(values):5} items:"
+            f" {table_time / len(values) * 1e9:6.0f} ns"
+            f" vs {check_time / len(values) * 1e9:6.0f} ns"
+        )
+        count += len(values)
+        table_total += table_time
+        check_total += check_time
+    print(
+        f"all {count} items: {table_total * 1e3:.2f} ms vs {check_total * 1e3:.2f} ms,"
+        f" {check_total / table_total:.1f}× faster"
+    )
+
+
+if __name__ == "__main__":
+    main()
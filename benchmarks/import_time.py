@@ -0,0 +1,77 @@
+"""Measure the start-up cost of importing `pyHM`
+
+The package is imported in fresh interpreters with `python -X importtime`,
+and the best cumulative import times of it and of `advantech_daq` are shown.
+Then, what has been left out of the import is loaded and timed:
+the rarely used enumerations and the DAQ library.
+
+Run it from the root of the repository, with `DAQ_BACKEND=simulator`
+to do without the board:
+
+    DAQ_BACKEND=simulator python -m benchmarks.import_time
+"""
+
+import subprocess
+import sys
+
+RUNS: int = 7
+MODULES: tuple[str, ...] = ("pyHM", "pyHM.advantech_daq", "pyHM.advantech_daq.api")
+
+# what is deferred, loaded and timed after the import
+DEFERRED: str = """
+import sys
+from time import perf_counter
+
+import pyHM
+from pyHM.advantech_daq import api
+
+print(
+    api._dll is not None,
+    [name for name in sys.modules if name.startswith("pyHM.advantech_daq._")],
+)
+start = perf_counter()
+from pyHM.advantech_daq import CountingType, FwAction, ProductId, SignalDrop
+enumerations = perf_counter()
+api._library()
+library = perf_counter()
+print(enumerations - start, library - enumerations)
+"""
+
+
+def import_times() -> dict[str, int]:
+    """Get the cumulative import times of `MODULES` in a fresh interpreter, [μs]"""
+    log: str = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pyHM"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    times: dict[str, int] = {}
+    for line in log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() in MODULES and cumulative.strip().isdecimal():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    runs: list[dict[str, int]] = [import_times() for _ in range(RUNS)]
+    for module in MODULES:
+        print(f"import {module}: {min(run[module] for run in runs) / 1e3:7.1f} ms")
+
+    output: list[str] = subprocess.run(
+        [sys.executable, "-c", DEFERRED],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.splitlines()
+    print("loaded by the import, the library and the enumeration modules:", output[0])
+    enumerations, library = map(float, output[1].split())
+    print(f"the deferred enumerations: {enumerations * 1e3:7.1f} ms")
+    print(f"the library:               {library * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
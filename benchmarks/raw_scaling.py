@@ -0,0 +1,99 @@
+"""Measure the throughput of the scaled and the raw ADC data of a channel
+
+A second of the samples at the top sample rate of the board is acquired twice,
+as `double` values and as raw 16-bit counts.
+The mean of every channel is then taken from the values, as the measurement
+does with them, and from the counts by the `ChannelScale` of the channel,
+which is compared against their conversion into the values, too.
+
+Run it from the root of the repository, with `DAQ_BACKEND=simulator`
+to do without the board:
+
+    DAQ_BACKEND=simulator python -m benchmarks.raw_scaling
+"""
+
+from array import array
+from time import perf_counter, sleep
+from timeit import repeat
+from typing import Callable
+
+from pyHM.advantech_daq import AISignalType
+from pyHM.advantech_daq.channel_scale import ChannelScale
+from pyHM.advantech_daq.waveform_ai_ctrl import WaveformAICtrl
+from pyHM.constants import DEVICE_DESCRIPTION
+
+# the top sample rate of the board, as `Settings.sample_rate` allows it, [S/s]
+SAMPLE_RATE: int = 200_000
+CHANNEL_COUNT: int = 3
+SCAN_COUNT: int = SAMPLE_RATE // CHANNEL_COUNT
+
+
+def acquire(wf_ai_ctrl: WaveformAICtrl, type_code: str) -> memoryview:
+    """Acquire a second of the samples into an array of `type_code` items"""
+    buffer: memoryview = memoryview(
+        array(type_code, [0]) * (SCAN_COUNT * CHANNEL_COUNT)
+    )
+    wf_ai_ctrl.prepare()
+    wf_ai_ctrl.start()
+    sleep(SCAN_COUNT / wf_ai_ctrl.conversion.clockRate)
+    stored: int = 0
+    while stored < len(buffer):
+        stored += wf_ai_ctrl.getDataInto(buffer, stored, timeout=1000)[1]
+    wf_ai_ctrl.stop()
+    return buffer
+
+
+def throughput(function: Callable[[], object]) -> float:
+    """Get the best rate of the samples processed by `function`, per second"""
+    return SCAN_COUNT * CHANNEL_COUNT / min(repeat(function, number=1, repeat=10))
+
+
+def main() -> None:
+    wf_ai_ctrl: WaveformAICtrl = WaveformAICtrl(DEVICE_DESCRIPTION)
+    try:
+        wf_ai_ctrl.conversion.channelStart = 0
+        wf_ai_ctrl.conversion.channelCount = CHANNEL_COUNT
+        wf_ai_ctrl.conversion.clockRate = SAMPLE_RATE / CHANNEL_COUNT
+        for channel in wf_ai_ctrl.channels:
+            channel.signalType = AISignalType.Differential
+        wf_ai_ctrl.record.sectionLength = SCAN_COUNT
+        wf_ai_ctrl.record.sectionCount = 1
+
+        start: float = perf_counter()
+        values: memoryview = acquire(wf_ai_ctrl, "d")
+        counts: memoryview = acquire(wf_ai_ctrl, "h").cast("B").cast("H")
+        print(f"acquired in {perf_counter() - start:.2f} s")
+        scales: list[ChannelScale] = wf_ai_ctrl.channelScales
+    finally:
+        wf_ai_ctrl.dispose()
+
+    channels: range = range(CHANNEL_COUNT)
+    for channel in channels:
+        print(
+            f"channel {channel}:"
+            f" {sum(values[channel::CHANNEL_COUNT]) / SCAN_COUNT:+.4f} V"
+            f" from the values,"
+            f" {scales[channel].mean(counts[channel::CHANNEL_COUNT]):+.4f} V"
+            f" from the counts"
+        )
+    print(f"bytes: {values.nbytes} as the values, {counts.nbytes} as the counts")
+    for label, function in (
+        (
+            "the means of the values",
+            lambda: [sum(values[c::CHANNEL_COUNT]) / SCAN_COUNT for c in channels],
+        ),
+        (
+            "the means of the counts",
+            lambda: [scales[c].mean(counts[c::CHANNEL_COUNT]) for c in channels],
+        ),
+        (
+            "the counts converted",
+            lambda: [scales[c].scale(counts[c::CHANNEL_COUNT]) for c in channels],
+        ),
+    ):
+        rate: float = throughput(function)
+        print(f"{label}: {rate / 1e6:6.2f} MS/s, {rate / SAMPLE_RATE:5.1f}× real time")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,11 +24,11 @@ from qtpy.QtWidgets import (
     QWidget,
 )
 
+from .board_group import BoardGroup
 from .chart_widget import ChartWidget
 from .constants import RECEIVER_MARK_TYPE, RECEIVERS, WAVELENGTHS
 from .preferences import Preferences
 from .settings import Settings
-from .thread_hm import ThreadHM
 
 __all__ = ["MainWindow", "run_gui"]
 
@@ -41,11 +41,23 @@ _qt_version_info_: Final[tuple[int | str, ...]] = tuple(
 
 
 class TableWidget(QTableWidget):
-    def __init__(self, angles: Iterable[float], parent: QWidget | None = None) -> None:
+    def __init__(
+        self,
+        angles: Iterable[float],
+        board_count: int = 1,
+        parent: QWidget | None = None,
+    ) -> None:
         super().__init__(parent)
 
-        self.setColumnCount(2)
-        self.setHorizontalHeaderLabels([self.tr("3-mm"), self.tr("2-mm")])
+        labels: list[str] = [self.tr("3-mm"), self.tr("2-mm")]
+        if board_count > 1:
+            labels = [
+                self.tr("{} #{}").format(label, board + 1)
+                for board in range(board_count)
+                for label in labels
+            ]
+        self.setColumnCount(len(labels))
+        self.setHorizontalHeaderLabels(labels)
         angles = list(angles)
         self.setRowCount(len(angles))
         self.setVerticalHeaderLabels(
@@ -63,16 +75,21 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(QApplication.applicationName())
 
         self.settings: Settings = Settings(self)
-        try:
-            self.thread_hm: ThreadHM = ThreadHM(self.settings, self)
-        except ValueError as ex:
-            QMessageBox.critical(self, self.tr("Error"), str(ex))
+
+        if Preferences(self.settings, self).exec() == Preferences.DialogCode.Rejected:
             QApplication.exit()
             exit()
 
-        if Preferences(self.settings, self).exec() == Preferences.DialogCode.Rejected:
+        try:
+            self.boards: BoardGroup = BoardGroup(
+                self.settings, self.settings.devices, self
+            )
+        except ValueError as ex:
+            QMessageBox.critical(self, self.tr("Error"), str(ex))
             QApplication.exit()
             exit()
+        # the data files being written, by board
+        self.data_files: dict[int, str] = {}
 
         central_widget: QWidget = QWidget(self)
         self.setCentralWidget(central_widget)
@@ -117,15 +134,18 @@ class MainWindow(QMainWindow):
                     partial(self.on_series_visibility_changed, index)
                 )
             series_visible_check.setChecked(True)
-            for receiver in RECEIVERS:
-                self.charts[receiver].series(index).setName(name)
+            for board, device in enumerate(self.boards.devices):
+                for receiver in RECEIVERS:
+                    self.charts[receiver].series(
+                        self._series_index(board, index)
+                    ).setName(name if len(self.boards) == 1 else f"{name} ({device})")
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, visibility_dock)
         menu_view.addAction(visibility_dock.toggleViewAction())
 
         voltage_dock: QDockWidget = QDockWidget(self.tr("Voltage"), self)
         voltage_dock.setObjectName("VoltageDock")
         self.voltage_table: TableWidget = TableWidget(
-            self.settings.angles, visibility_dock
+            self.settings.angles, len(self.boards), visibility_dock
         )
         voltage_dock.setWidget(self.voltage_table)
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, voltage_dock)
@@ -169,14 +189,16 @@ class MainWindow(QMainWindow):
 
         self.settings.restore_widget(self)
 
-        self.thread_hm.finished.connect(self._on_thread_finished)
-        self.thread_hm.dataFileChanged.connect(self._on_thread_data_file_changed)
-        self.thread_hm.stateChanged.connect(self._on_thread_state_changed)
-        self.thread_hm.absorptionCalculated.connect(
-            self._on_thread_absorption_calculated
-        )
-        self.thread_hm.dataObtained.connect(self._on_thread_data_obtained)
-        self.thread_hm.start(QThread.Priority.TimeCriticalPriority)
+        self.boards.finished.connect(self._on_thread_finished)
+        self.boards.dataFileChanged.connect(self._on_thread_data_file_changed)
+        self.boards.stateChanged.connect(self._on_thread_state_changed)
+        self.boards.absorptionCalculated.connect(self._on_thread_absorption_calculated)
+        self.boards.dataObtained.connect(self._on_thread_data_obtained)
+        self.boards.start(QThread.Priority.TimeCriticalPriority)
+
+    @staticmethod
+    def _series_index(board: int, index: int) -> int:
+        return 2 * board + index
 
     def about(self) -> None:
         QMessageBox.about(
@@ -197,17 +219,26 @@ class MainWindow(QMainWindow):
     def _on_stop_button_clicked(self) -> None:
         self.setDisabled(True)
         self.stop_button.setDisabled(True)
-        self.thread_hm.requestInterruption()
-        self.thread_hm.quit()
-        self.thread_hm.wait()
+        self.boards.requestInterruption()
+        self.boards.quit()
+        self.boards.wait()
         self.setEnabled(True)
 
-    @Slot(str)
-    def _on_thread_data_file_changed(self, filename: str) -> None:
-        self.setWindowTitle(QApplication.applicationName() + " — " + filename)
+    @Slot(int, str)
+    def _on_thread_data_file_changed(self, board: int, filename: str) -> None:
+        self.data_files[board] = filename
+        self.setWindowTitle(
+            QApplication.applicationName()
+            + " — "
+            + ", ".join(self.data_files[b] for b in sorted(self.data_files))
+        )
 
-    @Slot(str, int, int)
-    def _on_thread_state_changed(self, msg: str, pos: int, max_pos: int) -> None:
+    @Slot(int, str, int, int)
+    def _on_thread_state_changed(
+        self, board: int, msg: str, pos: int, max_pos: int
+    ) -> None:
+        if len(self.boards) > 1:
+            msg = f"{self.boards.devices[board]}: {msg}"
         self.status_bar.showMessage(msg)
         self.progress_bar.setMaximum(max_pos)
         self.progress_bar.setValue(pos)
@@ -215,46 +246,54 @@ class MainWindow(QMainWindow):
             self.progress_bar.minimum() != self.progress_bar.maximum()
         )
 
-    @Slot(RECEIVER_MARK_TYPE, int, float)
+    @Slot(int, RECEIVER_MARK_TYPE, int, float)
     def _on_thread_data_obtained(
         self,
+        board: int,
         receiver: RECEIVER_MARK_TYPE,
         angle_index: int,
         data_mean: float,
     ) -> None:
         self.voltage_table.setItem(
             angle_index,
-            int(receiver),
+            board * len(RECEIVERS) + int(receiver),
             QTableWidgetItem(self.locale().toString(data_mean, "g", 4)),
         )
         self.voltage_table.resizeColumnsToContents()
 
-    @Slot(QDateTime, RECEIVER_MARK_TYPE, float, float)
+    @Slot(int, QDateTime, RECEIVER_MARK_TYPE, float, float)
     def _on_thread_absorption_calculated(
         self,
+        board: int,
         time: QDateTime,
         receiver: RECEIVER_MARK_TYPE,
         data_res: float,
         tau0: float,
     ) -> None:
         if not isnan(data_res) and not isnan(tau0):
-            self.charts[receiver].series(0).append(time.toMSecsSinceEpoch(), data_res)
-            self.charts[receiver].series(1).append(time.toMSecsSinceEpoch(), tau0)
-            self.charts[receiver].chart().update()
+            chart: ChartWidget = self.charts[receiver]
+            chart.series(self._series_index(board, 0)).append(
+                time.toMSecsSinceEpoch(), data_res
+            )
+            chart.series(self._series_index(board, 1)).append(
+                time.toMSecsSinceEpoch(), tau0
+            )
+            chart.chart().update()
 
     def closeEvent(self, event: QCloseEvent) -> None:
-        self.thread_hm.requestInterruption()
-        self.thread_hm.quit()
-        self.thread_hm.wait()
+        self.boards.requestInterruption()
+        self.boards.quit()
+        self.boards.wait()
         self.settings.save_widget(self)
         self.settings.sync()
         return super().closeEvent(event)
 
     def on_series_visibility_changed(self, index: int, state: Qt.CheckState) -> None:
-        for receiver in RECEIVERS:
-            self.charts[receiver].series(index).setVisible(
-                state == Qt.CheckState.Checked
-            )
+        for board in range(len(self.boards)):
+            for receiver in RECEIVERS:
+                self.charts[receiver].series(
+                    self._series_index(board, index)
+                ).setVisible(state == Qt.CheckState.Checked)
 
 
 def run_gui() -> int:
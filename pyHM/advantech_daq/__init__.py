@@ -1,5 +1,6 @@
 from ctypes import Structure, c_double, c_int32, c_int64, c_uint8, c_wchar
 from enum import Enum, IntEnum
+from importlib import import_module
 from typing import Any
 
 __all__ = [
@@ -13,10 +14,10 @@ __all__ = [
     "MAX_SIG_DROP_DESC_LEN",
     "MAX_TRIG_COUNT",
     "MAX_VRG_DESC_LEN",
-    "AccessMode",
-    "ActiveSignal",
     "AIChannelType",
     "AISignalType",
+    "AccessMode",
+    "ActiveSignal",
     "BaudRate",
     "BfdAIEventArgs",
     "BfdAOEventArgs",
@@ -33,15 +34,15 @@ __all__ = [
     "CounterValueRegister",
     "CountingType",
     "CouplingType",
+    "DIOPortDir",
+    "DIOPortType",
+    "DOCircuitType",
     "DataMark",
     "Depository",
     "DeviceEventArgs",
     "DeviceInformation",
     "DeviceTreeNode",
     "DiSnapEventArgs",
-    "DIOPortDir",
-    "DIOPortType",
-    "DOCircuitType",
     "ErrorCode",
     "ErrorRetType",
     "EventId",
@@ -103,13 +104,6 @@ class ModuleType(IntEnum):
     DaqAny = -1
 
 
-class FwAction(IntEnum):
-    FwNormal = 1
-    FwMandatory = 2
-
-    FwAbort = -1
-
-
 class AccessMode(IntEnum):
     ModeRead = 0
     ModeWrite = 1
@@ -399,102 +393,6 @@ class SignalPolarity(IntEnum):
     Positive = 1
 
 
-class CountingType(IntEnum):
-    CountingNone = 0
-    DownCount = 1  # counter value decreases on each clock
-    UpCount = 2  # counter value increases on each clock
-    PulseDirection = 3  # counting direction is determined by two signals, one is clock, the other is direction signal
-    TwoPulse = 4  # counting direction is determined by two signals, an up-counting, and a down-counting ones
-    AbPhaseX1 = 5  # AB phase, 1x rate up/down counting
-    AbPhaseX2 = 6  # AB phase, 2x rate up/down counting
-    AbPhaseX4 = 7  # AB phase, 4x rate up/down counting
-
-
-class OutSignalType(IntEnum):
-    SignalOutNone = 0  # no output or output is 'disabled'
-    ChipDefined = 1  # hardware chip defined
-    NegChipDefined = 2  # hardware chip defined, negative logical
-    PositivePulse = 3  # a low-to-high pulse
-    NegativePulse = 4  # a high-to-low pulse
-    ToggledFromLow = 5  # the level toggled from low to high
-    ToggledFromHigh = 6  # the level toggled from high to low
-
-
-class CounterCapability(IntEnum):
-    Primary = 1
-    InstantEventCount = 2
-    OneShot = 3
-    TimerPulse = 4
-    InstantFreqMeter = 5
-    InstantPwmIn = 6
-    InstantPwmOut = 7
-    UpDownCount = 8
-    BufferedEventCount = 9
-    BufferedPwmIn = 10
-    BufferedPwmOut = 11
-    BufferedUpDownCount = 12
-    InstantEdgeSeparation = 13
-
-
-class CounterOperationMode(IntEnum):
-    C8254_M0 = 0  # 8254 mode 0, interrupt on terminal count
-    C8254_M1 = 1  # 8254 mode 1, hardware retriggerable one-shot
-    C8254_M2 = 2  # 8254 mode 2, rate generator
-    C8254_M3 = 3  # 8254 mode 3, square save mode
-    C8254_M4 = 4  # 8254 mode 4, software triggered strobe
-    C8254_M5 = 5  # 8254 mode 5, hardware triggered strobe
-
-    C1780_MA = 6  # Mode A level & pulse out, Software-Triggered without Hardware Gating
-    C1780_MB = (
-        7  # Mode B level & pulse out, Software-Triggered with Level Gating, = 8254_M0
-    )
-    C1780_MC = 8  # Mode C level & pulse out, Hardware-triggered strobe level
-    C1780_MD = 9  # Mode D level & Pulse out, Rate generate with no hardware gating
-    C1780_ME = 10  # Mode E level & pulse out, Rate generator with level Gating
-    C1780_MF = 11  # Mode F level & pulse out, Non-retriggerable One-shot (Pulse type = 8254_M1)
-    C1780_MG = 12  # Mode G level & pulse out, Software-triggered delayed pulse one-shot
-    C1780_MH = 13  # Mode H level & pulse out, Software-triggered delayed pulse one-shot with hardware gating
-    C1780_MI = 14  # Mode I level & pulse out, Hardware-triggered delay pulse strobe
-    C1780_MJ = 15  # Mode J level & pulse out, Variable Duty Cycle Rate Generator with No Hardware Gating
-    C1780_MK = 16  # Mode K level & pulse out, Variable Duty Cycle Rate Generator with Level Gating
-    C1780_ML = 17  # Mode L level & pulse out, Hardware-Triggered Delayed Pulse One-Shot
-    C1780_MO = (
-        18  # Mode O level & pulse out, Hardware-Triggered Strobe with Edge Disarm
-    )
-    C1780_MR = (
-        19  # Mode R level & pulse out, Non-Retriggerbale One-Shot with Edge Disarm
-    )
-    C1780_MU = 20  # Mode U level & pulse out, Hardware-Triggered Delayed Pulse Strobe with Edge Disarm
-    C1780_MX = 21  # Mode X level & pulse out, Hardware-Triggered Delayed Pulse One-Shot with Edge Disarm
-
-
-class CounterValueRegister(IntEnum):
-    CntLoad = 0
-    CntPreset = 0
-    CntHold = 1
-    CntOverCompare = 2
-    CntUnderCompare = 3
-
-
-class CounterCascadeGroup(IntEnum):
-    GroupNone = 0  # no cascade
-    Cnt0Cnt1 = 1  # Counter 0 as first, counter 1 as second.
-    Cnt2Cnt3 = 2  # Counter 2 as first, counter 3 as second
-    Cnt4Cnt5 = 3  # Counter 4 as first, counter 5 as second
-    Cnt6Cnt7 = 4  # Counter 6 as first, counter 7 as second
-
-
-class FreqMeasureMethod(IntEnum):
-    # Intelligently select the measurement method according to the input signal.
-    AutoAdaptive = 0
-    # Using system timing clock to calculate the frequency
-    CountingPulseBySysTime = 1
-    # Using the device timing clock to calculate the frequency
-    CountingPulseByDevTime = 2
-    # Calculate the frequency from the period of the signal
-    PeriodInverse = 3
-
-
 class ActiveSignal(IntEnum):
     ActiveNone = 0
     RisingEdge = 1
@@ -517,779 +415,6 @@ class SignalPosition(IntEnum):
     OnAMSI = 2
 
 
-class SignalDrop(IntEnum):
-    SignalNone = 0  # No connection
-
-    # Internal signal connector
-    InternalClock = (
-        1  # Device built-in clock, the highest freq one if there are several ones.
-    )
-    Internal1KHz = 2  # Device built-in clock, 1KHz
-    Internal10KHz = 3  # Device built-in clock, 10KHz
-    Internal100KHz = 4  # Device built-in clock, 100KHz
-    Internal1MHz = 5  # Device built-in clock, 1MHz
-    Internal10MHz = 6  # Device built-in clock, 10MHz
-    Internal20MHz = 7  # Device built-in clock, 20MHz
-    Internal30MHz = 8  # Device built-in clock, 30MHz
-    Internal40MHz = 9  # Device built-in clock, 40MHz
-    Internal50MHz = 10  # Device built-in clock, 50MHz
-    Internal60MHz = 11  # Device built-in clock, 60MHz
-
-    DIPatternMatch = 12  # When DI pattern match occurred
-    DIStatusChange = 13  # When DI status change occurred
-
-    # Function pin on connector
-    ExtAnalogClock = 14  # Analog clock pin of connector
-    ExtAnalogScanClock = 15  # scan clock pin of connector
-    ExtAnalogTrigger = 16  # external analog trigger pin of connector
-    ExtAnalogTrigger0 = (16,)  # external analog trigger pin of connector 0
-    ExtDigitalClock = 17  # digital clock pin of connector
-    ExtDigitalTrigger0 = (
-        18  # external digital trigger 0 pin(or DI start trigger pin) of connector
-    )
-    ExtDigitalTrigger1 = (
-        19  # external digital trigger 1 pin(or DI stop trigger pin) of connector
-    )
-    ExtDigitalTrigger2 = (
-        20  # external digital trigger 2 pin(or DO start trigger pin) of connector
-    )
-    ExtDigitalTrigger3 = (
-        21  # external digital trigger 3 pin(or DO stop trigger pin) of connector
-    )
-    ChFreezeDO = 22  # Channel freeze DO ports pin
-
-    # Signal source or target on the connector
-    # AI channel pins
-    AI0 = 23
-    AI1 = 24
-    AI2 = 25
-    AI3 = 26
-    AI4 = 27
-    AI5 = 28
-    AI6 = 29
-    AI7 = 30
-    AI8 = 31
-    AI9 = 32
-    AI10 = 33
-    AI11 = 34
-    AI12 = 35
-    AI13 = 36
-    AI14 = 37
-    AI15 = 38
-    AI16 = 39
-    AI17 = 40
-    AI18 = 41
-    AI19 = 42
-    AI20 = 43
-    AI21 = 44
-    AI22 = 45
-    AI23 = 46
-    AI24 = 47
-    AI25 = 48
-    AI26 = 49
-    AI27 = 50
-    AI28 = 51
-    AI29 = 52
-    AI30 = 53
-    AI31 = 54
-    AI32 = 55
-    AI33 = 56
-    AI34 = 57
-    AI35 = 58
-    AI36 = 59
-    AI37 = 60
-    AI38 = 61
-    AI39 = 62
-    AI40 = 63
-    AI41 = 64
-    AI42 = 65
-    AI43 = 66
-    AI44 = 67
-    AI45 = 68
-    AI46 = 69
-    AI47 = 70
-    AI48 = 71
-    AI49 = 72
-    AI50 = 73
-    AI51 = 74
-    AI52 = 75
-    AI53 = 76
-    AI54 = 77
-    AI55 = 78
-    AI56 = 79
-    AI57 = 80
-    AI58 = 81
-    AI59 = 82
-    AI60 = 83
-    AI61 = 84
-    AI62 = 85
-    AI63 = 86
-
-    # AO channel pins
-    AO0 = 87
-    AO1 = 88
-    AO2 = 89
-    AO3 = 90
-    AO4 = 91
-    AO5 = 92
-    AO6 = 93
-    AO7 = 94
-    AO8 = 95
-    AO9 = 96
-    AO10 = 97
-    AO11 = 98
-    AO12 = 99
-    AO13 = 100
-    AO14 = 101
-    AO15 = 102
-    AO16 = 103
-    AO17 = 104
-    AO18 = 105
-    AO19 = 106
-    AO20 = 107
-    AO21 = 108
-    AO22 = 109
-    AO23 = 110
-    AO24 = 111
-    AO25 = 112
-    AO26 = 113
-    AO27 = 114
-    AO28 = 115
-    AO29 = 116
-    AO30 = 117
-    AO31 = 118
-
-    # DI pins
-    DI0 = 119
-    DI1 = 120
-    DI2 = 121
-    DI3 = 122
-    DI4 = 123
-    DI5 = 124
-    DI6 = 125
-    DI7 = 126
-    DI8 = 127
-    DI9 = 128
-    DI10 = 129
-    DI11 = 130
-    DI12 = 131
-    DI13 = 132
-    DI14 = 133
-    DI15 = 134
-    DI16 = 135
-    DI17 = 136
-    DI18 = 137
-    DI19 = 138
-    DI20 = 139
-    DI21 = 140
-    DI22 = 141
-    DI23 = 142
-    DI24 = 143
-    DI25 = 144
-    DI26 = 145
-    DI27 = 146
-    DI28 = 147
-    DI29 = 148
-    DI30 = 149
-    DI31 = 150
-    DI32 = 151
-    DI33 = 152
-    DI34 = 153
-    DI35 = 154
-    DI36 = 155
-    DI37 = 156
-    DI38 = 157
-    DI39 = 158
-    DI40 = 159
-    DI41 = 160
-    DI42 = 161
-    DI43 = 162
-    DI44 = 163
-    DI45 = 164
-    DI46 = 165
-    DI47 = 166
-    DI48 = 167
-    DI49 = 168
-    DI50 = 169
-    DI51 = 170
-    DI52 = 171
-    DI53 = 172
-    DI54 = 173
-    DI55 = 174
-    DI56 = 175
-    DI57 = 176
-    DI58 = 177
-    DI59 = 178
-    DI60 = 179
-    DI61 = 180
-    DI62 = 181
-    DI63 = 182
-    DI64 = 183
-    DI65 = 184
-    DI66 = 185
-    DI67 = 186
-    DI68 = 187
-    DI69 = 188
-    DI70 = 189
-    DI71 = 190
-    DI72 = 191
-    DI73 = 192
-    DI74 = 193
-    DI75 = 194
-    DI76 = 195
-    DI77 = 196
-    DI78 = 197
-    DI79 = 198
-    DI80 = 199
-    DI81 = 200
-    DI82 = 201
-    DI83 = 202
-    DI84 = 203
-    DI85 = 204
-    DI86 = 205
-    DI87 = 206
-    DI88 = 207
-    DI89 = 208
-    DI90 = 209
-    DI91 = 210
-    DI92 = 211
-    DI93 = 212
-    DI94 = 213
-    DI95 = 214
-    DI96 = 215
-    DI97 = 216
-    DI98 = 217
-    DI99 = 218
-    DI100 = 219
-    DI101 = 220
-    DI102 = 221
-    DI103 = 222
-    DI104 = 223
-    DI105 = 224
-    DI106 = 225
-    DI107 = 226
-    DI108 = 227
-    DI109 = 228
-    DI110 = 229
-    DI111 = 230
-    DI112 = 231
-    DI113 = 232
-    DI114 = 233
-    DI115 = 234
-    DI116 = 235
-    DI117 = 236
-    DI118 = 237
-    DI119 = 238
-    DI120 = 239
-    DI121 = 240
-    DI122 = 241
-    DI123 = 242
-    DI124 = 243
-    DI125 = 244
-    DI126 = 245
-    DI127 = 246
-    DI128 = 247
-    DI129 = 248
-    DI130 = 249
-    DI131 = 250
-    DI132 = 251
-    DI133 = 252
-    DI134 = 253
-    DI135 = 254
-    DI136 = 255
-    DI137 = 256
-    DI138 = 257
-    DI139 = 258
-    DI140 = 259
-    DI141 = 260
-    DI142 = 261
-    DI143 = 262
-    DI144 = 263
-    DI145 = 264
-    DI146 = 265
-    DI147 = 266
-    DI148 = 267
-    DI149 = 268
-    DI150 = 269
-    DI151 = 270
-    DI152 = 271
-    DI153 = 272
-    DI154 = 273
-    DI155 = 274
-    DI156 = 275
-    DI157 = 276
-    DI158 = 277
-    DI159 = 278
-    DI160 = 279
-    DI161 = 280
-    DI162 = 281
-    DI163 = 282
-    DI164 = 283
-    DI165 = 284
-    DI166 = 285
-    DI167 = 286
-    DI168 = 287
-    DI169 = 288
-    DI170 = 289
-    DI171 = 290
-    DI172 = 291
-    DI173 = 292
-    DI174 = 293
-    DI175 = 294
-    DI176 = 295
-    DI177 = 296
-    DI178 = 297
-    DI179 = 298
-    DI180 = 299
-    DI181 = 300
-    DI182 = 301
-    DI183 = 302
-    DI184 = 303
-    DI185 = 304
-    DI186 = 305
-    DI187 = 306
-    DI188 = 307
-    DI189 = 308
-    DI190 = 309
-    DI191 = 310
-    DI192 = 311
-    DI193 = 312
-    DI194 = 313
-    DI195 = 314
-    DI196 = 315
-    DI197 = 316
-    DI198 = 317
-    DI199 = 318
-    DI200 = 319
-    DI201 = 320
-    DI202 = 321
-    DI203 = 322
-    DI204 = 323
-    DI205 = 324
-    DI206 = 325
-    DI207 = 326
-    DI208 = 327
-    DI209 = 328
-    DI210 = 329
-    DI211 = 330
-    DI212 = 331
-    DI213 = 332
-    DI214 = 333
-    DI215 = 334
-    DI216 = 335
-    DI217 = 336
-    DI218 = 337
-    DI219 = 338
-    DI220 = 339
-    DI221 = 340
-    DI222 = 341
-    DI223 = 342
-    DI224 = 343
-    DI225 = 344
-    DI226 = 345
-    DI227 = 346
-    DI228 = 347
-    DI229 = 348
-    DI230 = 349
-    DI231 = 350
-    DI232 = 351
-    DI233 = 352
-    DI234 = 353
-    DI235 = 354
-    DI236 = 355
-    DI237 = 356
-    DI238 = 357
-    DI239 = 358
-    DI240 = 359
-    DI241 = 360
-    DI242 = 361
-    DI243 = 362
-    DI244 = 363
-    DI245 = 364
-    DI246 = 365
-    DI247 = 366
-    DI248 = 367
-    DI249 = 368
-    DI250 = 369
-    DI251 = 370
-    DI252 = 371
-    DI253 = 372
-    DI254 = 373
-    DI255 = 374
-
-    # DIO pins
-    DIO0 = 375
-    DIO1 = 376
-    DIO2 = 377
-    DIO3 = 378
-    DIO4 = 379
-    DIO5 = 380
-    DIO6 = 381
-    DIO7 = 382
-    DIO8 = 383
-    DIO9 = 384
-    DIO10 = 385
-    DIO11 = 386
-    DIO12 = 387
-    DIO13 = 388
-    DIO14 = 389
-    DIO15 = 390
-    DIO16 = 391
-    DIO17 = 392
-    DIO18 = 393
-    DIO19 = 394
-    DIO20 = 395
-    DIO21 = 396
-    DIO22 = 397
-    DIO23 = 398
-    DIO24 = 399
-    DIO25 = 400
-    DIO26 = 401
-    DIO27 = 402
-    DIO28 = 403
-    DIO29 = 404
-    DIO30 = 405
-    DIO31 = 406
-    DIO32 = 407
-    DIO33 = 408
-    DIO34 = 409
-    DIO35 = 410
-    DIO36 = 411
-    DIO37 = 412
-    DIO38 = 413
-    DIO39 = 414
-    DIO40 = 415
-    DIO41 = 416
-    DIO42 = 417
-    DIO43 = 418
-    DIO44 = 419
-    DIO45 = 420
-    DIO46 = 421
-    DIO47 = 422
-    DIO48 = 423
-    DIO49 = 424
-    DIO50 = 425
-    DIO51 = 426
-    DIO52 = 427
-    DIO53 = 428
-    DIO54 = 429
-    DIO55 = 430
-    DIO56 = 431
-    DIO57 = 432
-    DIO58 = 433
-    DIO59 = 434
-    DIO60 = 435
-    DIO61 = 436
-    DIO62 = 437
-    DIO63 = 438
-    DIO64 = 439
-    DIO65 = 440
-    DIO66 = 441
-    DIO67 = 442
-    DIO68 = 443
-    DIO69 = 444
-    DIO70 = 445
-    DIO71 = 446
-    DIO72 = 447
-    DIO73 = 448
-    DIO74 = 449
-    DIO75 = 450
-    DIO76 = 451
-    DIO77 = 452
-    DIO78 = 453
-    DIO79 = 454
-    DIO80 = 455
-    DIO81 = 456
-    DIO82 = 457
-    DIO83 = 458
-    DIO84 = 459
-    DIO85 = 460
-    DIO86 = 461
-    DIO87 = 462
-    DIO88 = 463
-    DIO89 = 464
-    DIO90 = 465
-    DIO91 = 466
-    DIO92 = 467
-    DIO93 = 468
-    DIO94 = 469
-    DIO95 = 470
-    DIO96 = 471
-    DIO97 = 472
-    DIO98 = 473
-    DIO99 = 474
-    DIO100 = 475
-    DIO101 = 476
-    DIO102 = 477
-    DIO103 = 478
-    DIO104 = 479
-    DIO105 = 480
-    DIO106 = 481
-    DIO107 = 482
-    DIO108 = 483
-    DIO109 = 484
-    DIO110 = 485
-    DIO111 = 486
-    DIO112 = 487
-    DIO113 = 488
-    DIO114 = 489
-    DIO115 = 490
-    DIO116 = 491
-    DIO117 = 492
-    DIO118 = 493
-    DIO119 = 494
-    DIO120 = 495
-    DIO121 = 496
-    DIO122 = 497
-    DIO123 = 498
-    DIO124 = 499
-    DIO125 = 500
-    DIO126 = 501
-    DIO127 = 502
-    DIO128 = 503
-    DIO129 = 504
-    DIO130 = 505
-    DIO131 = 506
-    DIO132 = 507
-    DIO133 = 508
-    DIO134 = 509
-    DIO135 = 510
-    DIO136 = 511
-    DIO137 = 512
-    DIO138 = 513
-    DIO139 = 514
-    DIO140 = 515
-    DIO141 = 516
-    DIO142 = 517
-    DIO143 = 518
-    DIO144 = 519
-    DIO145 = 520
-    DIO146 = 521
-    DIO147 = 522
-    DIO148 = 523
-    DIO149 = 524
-    DIO150 = 525
-    DIO151 = 526
-    DIO152 = 527
-    DIO153 = 528
-    DIO154 = 529
-    DIO155 = 530
-    DIO156 = 531
-    DIO157 = 532
-    DIO158 = 533
-    DIO159 = 534
-    DIO160 = 535
-    DIO161 = 536
-    DIO162 = 537
-    DIO163 = 538
-    DIO164 = 539
-    DIO165 = 540
-    DIO166 = 541
-    DIO167 = 542
-    DIO168 = 543
-    DIO169 = 544
-    DIO170 = 545
-    DIO171 = 546
-    DIO172 = 547
-    DIO173 = 548
-    DIO174 = 549
-    DIO175 = 550
-    DIO176 = 551
-    DIO177 = 552
-    DIO178 = 553
-    DIO179 = 554
-    DIO180 = 555
-    DIO181 = 556
-    DIO182 = 557
-    DIO183 = 558
-    DIO184 = 559
-    DIO185 = 560
-    DIO186 = 561
-    DIO187 = 562
-    DIO188 = 563
-    DIO189 = 564
-    DIO190 = 565
-    DIO191 = 566
-    DIO192 = 567
-    DIO193 = 568
-    DIO194 = 569
-    DIO195 = 570
-    DIO196 = 571
-    DIO197 = 572
-    DIO198 = 573
-    DIO199 = 574
-    DIO200 = 575
-    DIO201 = 576
-    DIO202 = 577
-    DIO203 = 578
-    DIO204 = 579
-    DIO205 = 580
-    DIO206 = 581
-    DIO207 = 582
-    DIO208 = 583
-    DIO209 = 584
-    DIO210 = 585
-    DIO211 = 586
-    DIO212 = 587
-    DIO213 = 588
-    DIO214 = 589
-    DIO215 = 590
-    DIO216 = 591
-    DIO217 = 592
-    DIO218 = 593
-    DIO219 = 594
-    DIO220 = 595
-    DIO221 = 596
-    DIO222 = 597
-    DIO223 = 598
-    DIO224 = 599
-    DIO225 = 600
-    DIO226 = 601
-    DIO227 = 602
-    DIO228 = 603
-    DIO229 = 604
-    DIO230 = 605
-    DIO231 = 606
-    DIO232 = 607
-    DIO233 = 608
-    DIO234 = 609
-    DIO235 = 610
-    DIO236 = 611
-    DIO237 = 612
-    DIO238 = 613
-    DIO239 = 614
-    DIO240 = 615
-    DIO241 = 616
-    DIO242 = 617
-    DIO243 = 618
-    DIO244 = 619
-    DIO245 = 620
-    DIO246 = 621
-    DIO247 = 622
-    DIO248 = 623
-    DIO249 = 624
-    DIO250 = 625
-    DIO251 = 626
-    DIO252 = 627
-    DIO253 = 628
-    DIO254 = 629
-    DIO255 = 630
-
-    # Counter clock pins
-    CntClk0 = 631
-    CntClk1 = 632
-    CntClk2 = 633
-    CntClk3 = 634
-    CntClk4 = 635
-    CntClk5 = 636
-    CntClk6 = 637
-    CntClk7 = 638
-
-    # counter gate pins
-    CntGate0 = 639
-    CntGate1 = 640
-    CntGate2 = 641
-    CntGate3 = 642
-    CntGate4 = 643
-    CntGate5 = 644
-    CntGate6 = 645
-    CntGate7 = 646
-
-    # counter out pins
-    CntOut0 = 647
-    CntOut1 = 648
-    CntOut2 = 649
-    CntOut3 = 650
-    CntOut4 = 651
-    CntOut5 = 652
-    CntOut6 = 653
-    CntOut7 = 654
-
-    # counter frequency out pins
-    CntFreqOut0 = 655
-    CntFreqOut1 = 656
-    CntFreqOut2 = 657
-    CntFreqOut3 = 658
-    CntFreqOut4 = 659
-    CntFreqOut5 = 660
-    CntFreqOut6 = 661
-    CntFreqOut7 = 662
-
-    # AMSI pins
-    AMSI0 = 663
-    AMSI1 = 664
-    AMSI2 = 665
-    AMSI3 = 666
-    AMSI4 = 667
-    AMSI5 = 668
-    AMSI6 = 669
-    AMSI7 = 670
-    AMSI8 = 671
-    AMSI9 = 672
-    AMSI10 = 673
-    AMSI11 = 674
-    AMSI12 = 675
-    AMSI13 = 676
-    AMSI14 = 677
-    AMSI15 = 678
-    AMSI16 = 679
-    AMSI17 = 680
-    AMSI18 = 681
-    AMSI19 = 682
-
-    # new clocks
-    Internal2Hz = 683  # Device built-in clock, 2Hz
-    Internal20Hz = 684  # Device built-in clock, 20Hz
-    Internal200Hz = 685  # Device built-in clock, 200KHz
-    Internal2KHz = 686  # Device built-in clock, 2KHz
-    Internal20KHz = 687  # Device built-in clock, 20KHz
-    Internal200KHz = 688  # Device built-in clock, 200KHz
-    Internal2MHz = 689  # Device built-in clock, 2MHz
-
-    # New Function pin on connector
-    ExtAnalogTrigger1 = 690  # external analog trigger pin of connector 1
-
-    # Reference clock
-    ExtDigRefClock = 691  # digital clock pin of connector
-    Internal100MHz = 692
-    AIConvClock = 693
-
-    # digital trigger from master after ADC latency
-    SigExtDigitalTrgADCLatency = 694
-    SigExtDigitalTrg0ADCLatency = SigExtDigitalTrgADCLatency
-    SigExtDigitalTrg1ADCLatency = 695
-
-    # digital trigger from master/MSDI pin after ADC latency
-    MDSITrg0 = 696
-    MDSITrg1 = 697
-
-    MDSITrg0ADCLatency = 698
-    MDSITrg1ADCLatency = 699
-
-    # reference clock source from master/MDSI pin
-    MDSIRefClock = 700
-    MDSIClock = 701
-
-    # clock source & trigger for Master/Slave module
-    # internal clock x, as a master module
-    IntClock0 = 702
-    IntClock1 = 703
-    IntClock2 = 704
-    IntClock3 = 705
-
-    # clock from internal clock x, as a slave module
-    IntClk0Slv = 706
-    IntClk1Slv = 707
-    IntClk2Slv = 708
-    IntClk3Slv = 709
-
-    # Trigger x from trigger pin, as a slave module
-    ExtDigTrg0Slv = 710
-    ExtDigTrg1Slv = 711
-    ExtDigTrg2Slv = 712
-    ExtDigTrg3Slv = 713
-
-
 class EventId(IntEnum):
     DeviceRemoved = 0  # The device was removed from system
     DeviceReconnected = 1  # The device is reconnected
@@ -2152,11 +1277,7 @@ class ErrorCode(Enum):
 
     @staticmethod
     def lookup(value: int) -> "ErrorCode":
-        value = value & 0xFFFFFFFF
-        for code in ErrorCode:
-            if value == code.value:
-                return code
-        return ErrorCode.ErrorUndefined
+        return _error_codes_by_value.get(value & 0xFFFFFFFF, ErrorCode.ErrorUndefined)
 
     # def toInt(self) -> int:
     #     return self.value
@@ -2165,293 +1286,8 @@ class ErrorCode(Enum):
     #     return AdxEnumToString("ErrorCode", self.value, 256)
 
 
-class ProductId(IntEnum):
-    BD_DEMO = 0x00  # demo board
-    BD_PCL818 = 0x05  # PCL-818 board
-    BD_PCL818H = 0x11  # PCL-818H
-    BD_PCL818L = 0x21  # PCL-818L
-    BD_PCL818HG = 0x22  # PCL-818HG
-    BD_PCL818HD = 0x2B  # PCL-818HD
-    BD_PCM3718 = 0x37  # PCM-3718
-    BD_PCM3724 = 0x38  # PCM-3724
-    BD_PCM3730 = 0x5A  # PCM-3730
-    BD_PCI1750 = 0x5E  # PCI-1750
-    BD_PCI1751 = 0x5F  # PCI-1751
-    BD_PCI1710 = 0x60  # PCI-1710
-    BD_PCI1712 = 0x61  # PCI-1712
-    BD_PCI1710HG = 0x67  # PCI-1710HG
-    BD_PCI1711 = 0x73  # PCI-1711
-    BD_PCI1711L = 0x75  # PCI-1711L
-    BD_PCI1713 = 0x68  # PCI-1713
-    BD_PCI1753 = 0x69  # PCI-1753
-    BD_PCI1760 = 0x6A  # PCI-1760
-    BD_PCI1720 = 0x6B  # PCI-1720
-    BD_PCM3718H = 0x6D  # PCM-3718H
-    BD_PCM3718HG = 0x6E  # PCM-3718HG
-    BD_PCI1716 = 0x74  # PCI-1716
-    BD_PCI1731 = 0x75  # PCI-1731
-    BD_PCI1754 = 0x7B  # PCI-1754
-    BD_PCI1752 = 0x7C  # PCI-1752
-    BD_PCI1756 = 0x7D  # PCI-1756
-    BD_PCM3725 = 0x7F  # PCM-3725
-    BD_PCI1762 = 0x80  # PCI-1762
-    BD_PCI1721 = 0x81  # PCI-1721
-    BD_PCI1761 = 0x82  # PCI-1761
-    BD_PCI1723 = 0x83  # PCI-1723
-    BD_PCI1730 = 0x87  # PCI-1730
-    BD_PCI1733 = 0x88  # PCI-1733
-    BD_PCI1734 = 0x89  # PCI-1734
-    BD_PCI1710L = 0x90  # PCI-1710L
-    BD_PCI1710HGL = 0x91  # PCI-1710HGL
-    BD_PCM3712 = 0x93  # PCM-3712
-    BD_PCM3723 = 0x94  # PCM-3723
-    BD_PCI1780 = 0x95  # PCI-1780
-    BD_MIC3756 = 0x96  # MIC-3756
-    BD_PCI1755 = 0x97  # PCI-1755
-    BD_PCI1714 = 0x98  # PCI-1714
-    BD_PCI1757 = 0x99  # PCI-1757
-    BD_MIC3716 = 0x9A  # MIC-3716
-    BD_MIC3761 = 0x9B  # MIC-3761
-    BD_MIC3753 = 0x9C  # MIC-3753
-    BD_MIC3780 = 0x9D  # MIC-3780
-    BD_PCI1724 = 0x9E  # PCI-1724
-    BD_PCI1758UDI = 0xA3  # PCI-1758UDI
-    BD_PCI1758UDO = 0xA4  # PCI-1758UDO
-    BD_PCI1747 = 0xA5  # PCI-1747
-    BD_PCM3780 = 0xA6  # PCM-3780
-    BD_MIC3747 = 0xA7  # MIC-3747
-    BD_PCI1758UDIO = 0xA8  # PCI-1758UDIO
-    BD_PCI1712L = 0xA9  # PCI-1712L
-    BD_PCI1763UP = 0xAC  # PCI-1763UP
-    BD_PCI1736UP = 0xAD  # PCI-1736UP
-    BD_PCI1714UL = 0xAE  # PCI-1714UL
-    BD_MIC3714 = 0xAF  # MIC-3714
-    BD_PCM3718HO = 0xB1  # PCM-3718HO
-    BD_PCI1741U = 0xB3  # PCI-1741U
-    BD_MIC3723 = 0xB4  # MIC-3723
-    BD_PCI1718HDU = 0xB5  # PCI-1718HDU
-    BD_MIC3758DIO = 0xB6  # MIC-3758DIO
-    BD_PCI1727U = 0xB7  # PCI-1727U
-    BD_PCI1718HGU = 0xB8  # PCI-1718HGU
-    BD_PCI1715U = 0xB9  # PCI-1715U
-    BD_PCI1716L = 0xBA  # PCI-1716L
-    BD_PCI1735U = 0xBB  # PCI-1735U
-    BD_USB4711 = 0xBC  # USB4711
-    BD_PCI1737U = 0xBD  # PCI-1737U
-    BD_PCI1739U = 0xBE  # PCI-1739U
-    BD_PCI1742U = 0xC0  # PCI-1742U
-    BD_USB4718 = 0xC6  # USB-4718
-    BD_MIC3755 = 0xC7  # MIC3755
-    BD_USB4761 = 0xC8  # USB4761
-    BD_PCI1784 = 0xCC  # PCI-1784
-    BD_USB4716 = 0xCD  # USB4716
-    BD_PCI1752U = 0xCE  # PCI-1752U
-    BD_PCI1752USO = 0xCF  # PCI-1752USO
-    BD_USB4751 = 0xD0  # USB4751
-    BD_USB4751L = 0xD1  # USB4751L
-    BD_USB4750 = 0xD2  # USB4750
-    BD_MIC3713 = 0xD3  # MIC-3713
-    BD_USB4711A = 0xD8  # USB4711A
-    BD_PCM3753P = 0xD9  # PCM3753P
-    BD_PCM3784 = 0xDA  # PCM3784
-    BD_PCM3761I = 0xDB  # PCM-3761I
-    BD_MIC3751 = 0xDC  # MIC-3751
-    BD_PCM3730I = 0xDD  # PCM-3730I
-    BD_PCM3813I = 0xE0  # PCM-3813I
-    BD_PCIE1744 = 0xE1  # PCIE-1744
-    BD_PCI1730U = 0xE2  # PCI-1730U
-    BD_PCI1760U = 0xE3  # PCI-1760U
-    BD_MIC3720 = 0xE4  # MIC-3720
-    BD_PCM3810I = 0xE9  # PCM-3810I
-    BD_USB4702 = 0xEA  # USB4702
-    BD_USB4704 = 0xEB  # USB4704
-    BD_PCM3810I_HG = 0xEC  # PCM-3810I_HG
-    BD_PCI1713U = 0xED  # PCI-1713U
-
-    # !!!BioDAQ only Product ID starts from here!!!
-    BD_PCI1706U = 0x800
-    BD_PCI1706MSU = 0x801
-    BD_PCI1706UL = 0x802
-    BD_PCIE1752 = 0x803
-    BD_PCIE1754 = 0x804
-    BD_PCIE1756 = 0x805
-    BD_MIC1911 = 0x806
-    BD_MIC3750 = 0x807
-    BD_MIC3711 = 0x808
-    BD_PCIE1730 = 0x809
-    BD_PCI1710_ECU = 0x80A
-    BD_PCI1720_ECU = 0x80B
-    BD_PCIE1760 = 0x80C
-    BD_PCIE1751 = 0x80D
-    BD_ECUP1706 = 0x80E
-    BD_PCIE1753 = 0x80F
-    BD_PCIE1810 = 0x810
-    BD_ECUP1702L = 0x811
-    BD_PCIE1816 = 0x812
-    BD_PCM27D24DI = 0x813
-    BD_PCIE1816H = 0x814
-    BD_PCIE1840 = 0x815
-    BD_PCL725 = 0x816
-    BD_PCI176E = 0x817
-    BD_PCIE1802 = 0x818
-    BD_AIISE730 = 0x819
-    BD_PCIE1812 = 0x81A
-    BD_MIC1810 = 0x81B
-    BD_PCIE1802L = 0x81C
-    BD_PCIE1813 = 0x81D
-    BD_PCIE1840L = 0x81E
-    BD_PCIE1730H = 0x81F
-    BD_PCIE1756H = 0x820
-    BD_PCIERXM01 = 0x821  # PCIe-RXM01
-    BD_MIC1816 = 0x822
-    BD_USB5830 = 0x823
-    BD_USB5850 = 0x824
-    BD_USB5860 = 0x825
-    BD_VPX1172 = 0x826
-    BD_USB5855 = 0x827
-    BD_USB5856 = 0x828
-    BD_USB5862 = 0x829
-    BD_PCIE1840T = 0x82A
-    BD_AudioCard = 0x82B
-    BD_AIIS1750 = 0x82C
-    BD_PCIE1840HL = 0x82D
-    BD_PCIE1765 = 0x82E
-    BD_PCIE1761H = 0x82F
-    BD_PCIE1762H = 0x830
-    BD_PCIE1884 = 0x831
-    BD_PCIE1758DIO = 0x832
-    BD_PCIE1758DI = 0x833
-    BD_PCIE1758DO = 0x834
-
-    #
-    BD_USB5817 = 0x835
-    BD_USB5801 = 0x836
-    BD_PCM2731 = 0x837
-    BD_MOS1110 = 0x838
-    BD_PCIE1750UH = 0x839
-    BD_PCIE1750U = 0x83A
-    BD_USB5820 = 0x83B
-
-    #
-    BD_THK1710R = 0x83C
-    BD_PCIE1803 = 0x83D
-    BD_PCIE1824 = 0x83E
-    BD_PCIE1805 = 0x83F
-
-    #
-    BD_MIOE1747 = 0x840
-    BD_ECUP1710 = 0x841
-    BD_PCIE1824L = 0x842
-
-    #
-    BD_PCIE1763AH = 0x843
-    BD_PCIE1763DH = 0x844
-
-    #
-    BD_MIC1816B = 0x845
-
-    #
-    BD_SUSIGPIO = 0x846
-
-    #
-    BD_MIC1810B = 0x847
-
-    # iDAQ series
-    BD_IDAQ731 = 0x848
-    BD_IDAQ763D = 0x849
-    BD_IDAQ817 = 0x84A
-    BD_IDAQ821 = 0x84B
-
-    #
-    BD_EAPIGPIO = 0x84C
-
-    # iDAQ series
-    BD_IDAQ841 = 0x84D
-    BD_IDAQ801 = 0x84E
-    BD_IDAQ815 = 0x84F
-
-    #
-    BD_PCIE1842 = 0x850
-    BD_MIOE3842 = 0x851
-
-    BD_USB4716B = 0x852
-
-    # iDAQ Fusion (Virtual Fusion Device, iDAQSyncBpInternal)
-    BD_IDAQ1CHASSYNC = 0x853  # Fused device of modules from same chassis
-
-    BD_USB4711B = 0x854
-    BD_IDAQ751 = 0x855
-
-    BD_FusionAuto = 0x856
-
-    BD_AIIS1882 = 0x857
-
-    BD_MIOE3842L = 0x858
-
-    BD_PCI1716B = 0x859
-    BD_USB4750B = 0x85A
-    BD_USB4761B = 0x85B
-    BD_PCI1716LB = 0x85C
-    BD_PCI1716H = 0x85D
-
-    BD_PCIE1816B = 0x85E
-    BD_PCIE1816HB = 0x85F
-
-    BD_ECUP1710T = 0x860
-    BD_PCI1712B = 0x861
-    BD_PCI1715B = 0x862
-    BD_PCI1721B = 0x863
-
-    BD_USB4751B = 0x864
-    BD_USB4751LB = 0x865
-
-    BD_PCIE1841 = 0x866
-    BD_PCIE1841L = 0x867
-    BD_PCIE1810B = 0x868
-    BD_PCIE1812B = 0x869
-    BD_PCIE1760B = 0x86A
-    BD_PCIE1751B = 0x86B
-    BD_PCIE1753B = 0x86C
-
-    # WISE-5000 starts from here
-    BD_WISE5051 = 0x901
-    BD_WISE5056 = 0x902
-    BD_WISE5056SO = 0x903
-    BD_WISE5015 = 0x904
-    BD_WISE5017 = 0x905
-    BD_WISE5018 = 0x906
-    BD_WISE5024 = 0x907
-    BD_WISE5080 = 0x908
-    BD_WISE5074 = 0x909
-    BD_WISE5001 = 0x90A
-    BD_WISE5052 = 0x90B
-    BD_WISE5057 = 0x90C
-    BD_WISE5057SO = 0x90D
-    BD_WISE5017C = 0x90E
-    BD_WISE5017V = 0x90F
-    BD_WISE5079 = 0x910
-
-    BD_AMAX5051 = 0x911
-    BD_AMAX5056 = 0x912
-    BD_AMAX5056SO = 0x913
-    BD_AMAX5015 = 0x914
-    BD_AMAX5017 = 0x915
-    BD_AMAX5018 = 0x916
-    BD_AMAX5024 = 0x917
-    BD_AMAX5080 = 0x918
-    BD_AMAX5074 = 0x919
-    BD_AMAX5001 = 0x91A
-    BD_AMAX5052 = 0x91B
-    BD_AMAX5057 = 0x91C
-    BD_AMAX5057SO = 0x91D
-    BD_AMAX5017C = 0x91E
-    BD_AMAX5017V = 0x91F
-    BD_AMAX5079 = 0x920
-    BD_AMAX5017H = 0x921
-    BD_AMAX5082 = 0x923
-    BD_AMAX5060 = 0x924
-    # Unknown productId
-    BD_UNKNOWN = -1
+# `ErrorCode.lookup` is called on every value the library returns
+_error_codes_by_value: dict[int, ErrorCode] = {code.value: code for code in ErrorCode}
 
 
 class ControlState(IntEnum):
@@ -2656,3 +1492,30 @@ class PulseWidth(Structure):
         ("HiPeriod", c_double),
         ("LoPeriod", c_double),
     ]
+
+
+# rarely used enumerations live in modules of their own and are created on first access
+_lazy_modules: dict[str, str] = {
+    "CountingType": "._counter",
+    "OutSignalType": "._counter",
+    "CounterCapability": "._counter",
+    "CounterOperationMode": "._counter",
+    "CounterValueRegister": "._counter",
+    "CounterCascadeGroup": "._counter",
+    "FreqMeasureMethod": "._counter",
+    "FwAction": "._firmware",
+    "ProductId": "._product_id",
+    "SignalDrop": "._signal_drop",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _lazy_modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(import_module(_lazy_modules[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_modules))
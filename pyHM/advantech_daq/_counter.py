@@ -0,0 +1,107 @@
+from enum import IntEnum
+
+__all__ = [
+    "CounterCapability",
+    "CounterCascadeGroup",
+    "CounterOperationMode",
+    "CounterValueRegister",
+    "CountingType",
+    "FreqMeasureMethod",
+    "OutSignalType",
+]
+
+
+class CountingType(IntEnum):
+    CountingNone = 0
+    DownCount = 1  # counter value decreases on each clock
+    UpCount = 2  # counter value increases on each clock
+    PulseDirection = 3  # counting direction is determined by two signals, one is clock, the other is direction signal
+    TwoPulse = 4  # counting direction is determined by two signals, an up-counting, and a down-counting ones
+    AbPhaseX1 = 5  # AB phase, 1x rate up/down counting
+    AbPhaseX2 = 6  # AB phase, 2x rate up/down counting
+    AbPhaseX4 = 7  # AB phase, 4x rate up/down counting
+
+
+class OutSignalType(IntEnum):
+    SignalOutNone = 0  # no output or output is 'disabled'
+    ChipDefined = 1  # hardware chip defined
+    NegChipDefined = 2  # hardware chip defined, negative logical
+    PositivePulse = 3  # a low-to-high pulse
+    NegativePulse = 4  # a high-to-low pulse
+    ToggledFromLow = 5  # the level toggled from low to high
+    ToggledFromHigh = 6  # the level toggled from high to low
+
+
+class CounterCapability(IntEnum):
+    Primary = 1
+    InstantEventCount = 2
+    OneShot = 3
+    TimerPulse = 4
+    InstantFreqMeter = 5
+    InstantPwmIn = 6
+    InstantPwmOut = 7
+    UpDownCount = 8
+    BufferedEventCount = 9
+    BufferedPwmIn = 10
+    BufferedPwmOut = 11
+    BufferedUpDownCount = 12
+    InstantEdgeSeparation = 13
+
+
+class CounterOperationMode(IntEnum):
+    C8254_M0 = 0  # 8254 mode 0, interrupt on terminal count
+    C8254_M1 = 1  # 8254 mode 1, hardware retriggerable one-shot
+    C8254_M2 = 2  # 8254 mode 2, rate generator
+    C8254_M3 = 3  # 8254 mode 3, square save mode
+    C8254_M4 = 4  # 8254 mode 4, software triggered strobe
+    C8254_M5 = 5  # 8254 mode 5, hardware triggered strobe
+
+    C1780_MA = 6  # Mode A level & pulse out, Software-Triggered without Hardware Gating
+    C1780_MB = (
+        7  # Mode B level & pulse out, Software-Triggered with Level Gating, = 8254_M0
+    )
+    C1780_MC = 8  # Mode C level & pulse out, Hardware-triggered strobe level
+    C1780_MD = 9  # Mode D level & Pulse out, Rate generate with no hardware gating
+    C1780_ME = 10  # Mode E level & pulse out, Rate generator with level Gating
+    C1780_MF = 11  # Mode F level & pulse out, Non-retriggerable One-shot (Pulse type = 8254_M1)
+    C1780_MG = 12  # Mode G level & pulse out, Software-triggered delayed pulse one-shot
+    C1780_MH = 13  # Mode H level & pulse out, Software-triggered delayed pulse one-shot with hardware gating
+    C1780_MI = 14  # Mode I level & pulse out, Hardware-triggered delay pulse strobe
+    C1780_MJ = 15  # Mode J level & pulse out, Variable Duty Cycle Rate Generator with No Hardware Gating
+    C1780_MK = 16  # Mode K level & pulse out, Variable Duty Cycle Rate Generator with Level Gating
+    C1780_ML = 17  # Mode L level & pulse out, Hardware-Triggered Delayed Pulse One-Shot
+    C1780_MO = (
+        18  # Mode O level & pulse out, Hardware-Triggered Strobe with Edge Disarm
+    )
+    C1780_MR = (
+        19  # Mode R level & pulse out, Non-Retriggerbale One-Shot with Edge Disarm
+    )
+    C1780_MU = 20  # Mode U level & pulse out, Hardware-Triggered Delayed Pulse Strobe with Edge Disarm
+    C1780_MX = 21  # Mode X level & pulse out, Hardware-Triggered Delayed Pulse One-Shot with Edge Disarm
+
+
+class CounterValueRegister(IntEnum):
+    CntLoad = 0
+    CntPreset = 0
+    CntHold = 1
+    CntOverCompare = 2
+    CntUnderCompare = 3
+
+
+class CounterCascadeGroup(IntEnum):
+    GroupNone = 0  # no cascade
+    Cnt0Cnt1 = 1  # Counter 0 as first, counter 1 as second.
+    Cnt2Cnt3 = 2  # Counter 2 as first, counter 3 as second
+    Cnt4Cnt5 = 3  # Counter 4 as first, counter 5 as second
+    Cnt6Cnt7 = 4  # Counter 6 as first, counter 7 as second
+
+
+class FreqMeasureMethod(IntEnum):
+    # Intelligently select the measurement method according to the input signal.
+    AutoAdaptive = 0
+    # Using system timing clock to calculate the frequency
+    CountingPulseBySysTime = 1
+    # Using the device timing clock to calculate the frequency
+    CountingPulseByDevTime = 2
+    # Calculate the frequency from the period of the signal
+    PeriodInverse = 3
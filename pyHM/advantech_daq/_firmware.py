@@ -0,0 +1,12 @@
+from enum import IntEnum
+
+__all__ = [
+    "FwAction",
+]
+
+
+class FwAction(IntEnum):
+    FwNormal = 1
+    FwMandatory = 2
+
+    FwAbort = -1
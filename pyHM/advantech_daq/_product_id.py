@@ -0,0 +1,294 @@
+from enum import IntEnum
+
+__all__ = [
+    "ProductId",
+]
+
+
+class ProductId(IntEnum):
+    BD_DEMO = 0x00  # demo board
+    BD_PCL818 = 0x05  # PCL-818 board
+    BD_PCL818H = 0x11  # PCL-818H
+    BD_PCL818L = 0x21  # PCL-818L
+    BD_PCL818HG = 0x22  # PCL-818HG
+    BD_PCL818HD = 0x2B  # PCL-818HD
+    BD_PCM3718 = 0x37  # PCM-3718
+    BD_PCM3724 = 0x38  # PCM-3724
+    BD_PCM3730 = 0x5A  # PCM-3730
+    BD_PCI1750 = 0x5E  # PCI-1750
+    BD_PCI1751 = 0x5F  # PCI-1751
+    BD_PCI1710 = 0x60  # PCI-1710
+    BD_PCI1712 = 0x61  # PCI-1712
+    BD_PCI1710HG = 0x67  # PCI-1710HG
+    BD_PCI1711 = 0x73  # PCI-1711
+    BD_PCI1711L = 0x75  # PCI-1711L
+    BD_PCI1713 = 0x68  # PCI-1713
+    BD_PCI1753 = 0x69  # PCI-1753
+    BD_PCI1760 = 0x6A  # PCI-1760
+    BD_PCI1720 = 0x6B  # PCI-1720
+    BD_PCM3718H = 0x6D  # PCM-3718H
+    BD_PCM3718HG = 0x6E  # PCM-3718HG
+    BD_PCI1716 = 0x74  # PCI-1716
+    BD_PCI1731 = 0x75  # PCI-1731
+    BD_PCI1754 = 0x7B  # PCI-1754
+    BD_PCI1752 = 0x7C  # PCI-1752
+    BD_PCI1756 = 0x7D  # PCI-1756
+    BD_PCM3725 = 0x7F  # PCM-3725
+    BD_PCI1762 = 0x80  # PCI-1762
+    BD_PCI1721 = 0x81  # PCI-1721
+    BD_PCI1761 = 0x82  # PCI-1761
+    BD_PCI1723 = 0x83  # PCI-1723
+    BD_PCI1730 = 0x87  # PCI-1730
+    BD_PCI1733 = 0x88  # PCI-1733
+    BD_PCI1734 = 0x89  # PCI-1734
+    BD_PCI1710L = 0x90  # PCI-1710L
+    BD_PCI1710HGL = 0x91  # PCI-1710HGL
+    BD_PCM3712 = 0x93  # PCM-3712
+    BD_PCM3723 = 0x94  # PCM-3723
+    BD_PCI1780 = 0x95  # PCI-1780
+    BD_MIC3756 = 0x96  # MIC-3756
+    BD_PCI1755 = 0x97  # PCI-1755
+    BD_PCI1714 = 0x98  # PCI-1714
+    BD_PCI1757 = 0x99  # PCI-1757
+    BD_MIC3716 = 0x9A  # MIC-3716
+    BD_MIC3761 = 0x9B  # MIC-3761
+    BD_MIC3753 = 0x9C  # MIC-3753
+    BD_MIC3780 = 0x9D  # MIC-3780
+    BD_PCI1724 = 0x9E  # PCI-1724
+    BD_PCI1758UDI = 0xA3  # PCI-1758UDI
+    BD_PCI1758UDO = 0xA4  # PCI-1758UDO
+    BD_PCI1747 = 0xA5  # PCI-1747
+    BD_PCM3780 = 0xA6  # PCM-3780
+    BD_MIC3747 = 0xA7  # MIC-3747
+    BD_PCI1758UDIO = 0xA8  # PCI-1758UDIO
+    BD_PCI1712L = 0xA9  # PCI-1712L
+    BD_PCI1763UP = 0xAC  # PCI-1763UP
+    BD_PCI1736UP = 0xAD  # PCI-1736UP
+    BD_PCI1714UL = 0xAE  # PCI-1714UL
+    BD_MIC3714 = 0xAF  # MIC-3714
+    BD_PCM3718HO = 0xB1  # PCM-3718HO
+    BD_PCI1741U = 0xB3  # PCI-1741U
+    BD_MIC3723 = 0xB4  # MIC-3723
+    BD_PCI1718HDU = 0xB5  # PCI-1718HDU
+    BD_MIC3758DIO = 0xB6  # MIC-3758DIO
+    BD_PCI1727U = 0xB7  # PCI-1727U
+    BD_PCI1718HGU = 0xB8  # PCI-1718HGU
+    BD_PCI1715U = 0xB9  # PCI-1715U
+    BD_PCI1716L = 0xBA  # PCI-1716L
+    BD_PCI1735U = 0xBB  # PCI-1735U
+    BD_USB4711 = 0xBC  # USB4711
+    BD_PCI1737U = 0xBD  # PCI-1737U
+    BD_PCI1739U = 0xBE  # PCI-1739U
+    BD_PCI1742U = 0xC0  # PCI-1742U
+    BD_USB4718 = 0xC6  # USB-4718
+    BD_MIC3755 = 0xC7  # MIC3755
+    BD_USB4761 = 0xC8  # USB4761
+    BD_PCI1784 = 0xCC  # PCI-1784
+    BD_USB4716 = 0xCD  # USB4716
+    BD_PCI1752U = 0xCE  # PCI-1752U
+    BD_PCI1752USO = 0xCF  # PCI-1752USO
+    BD_USB4751 = 0xD0  # USB4751
+    BD_USB4751L = 0xD1  # USB4751L
+    BD_USB4750 = 0xD2  # USB4750
+    BD_MIC3713 = 0xD3  # MIC-3713
+    BD_USB4711A = 0xD8  # USB4711A
+    BD_PCM3753P = 0xD9  # PCM3753P
+    BD_PCM3784 = 0xDA  # PCM3784
+    BD_PCM3761I = 0xDB  # PCM-3761I
+    BD_MIC3751 = 0xDC  # MIC-3751
+    BD_PCM3730I = 0xDD  # PCM-3730I
+    BD_PCM3813I = 0xE0  # PCM-3813I
+    BD_PCIE1744 = 0xE1  # PCIE-1744
+    BD_PCI1730U = 0xE2  # PCI-1730U
+    BD_PCI1760U = 0xE3  # PCI-1760U
+    BD_MIC3720 = 0xE4  # MIC-3720
+    BD_PCM3810I = 0xE9  # PCM-3810I
+    BD_USB4702 = 0xEA  # USB4702
+    BD_USB4704 = 0xEB  # USB4704
+    BD_PCM3810I_HG = 0xEC  # PCM-3810I_HG
+    BD_PCI1713U = 0xED  # PCI-1713U
+
+    # !!!BioDAQ only Product ID starts from here!!!
+    BD_PCI1706U = 0x800
+    BD_PCI1706MSU = 0x801
+    BD_PCI1706UL = 0x802
+    BD_PCIE1752 = 0x803
+    BD_PCIE1754 = 0x804
+    BD_PCIE1756 = 0x805
+    BD_MIC1911 = 0x806
+    BD_MIC3750 = 0x807
+    BD_MIC3711 = 0x808
+    BD_PCIE1730 = 0x809
+    BD_PCI1710_ECU = 0x80A
+    BD_PCI1720_ECU = 0x80B
+    BD_PCIE1760 = 0x80C
+    BD_PCIE1751 = 0x80D
+    BD_ECUP1706 = 0x80E
+    BD_PCIE1753 = 0x80F
+    BD_PCIE1810 = 0x810
+    BD_ECUP1702L = 0x811
+    BD_PCIE1816 = 0x812
+    BD_PCM27D24DI = 0x813
+    BD_PCIE1816H = 0x814
+    BD_PCIE1840 = 0x815
+    BD_PCL725 = 0x816
+    BD_PCI176E = 0x817
+    BD_PCIE1802 = 0x818
+    BD_AIISE730 = 0x819
+    BD_PCIE1812 = 0x81A
+    BD_MIC1810 = 0x81B
+    BD_PCIE1802L = 0x81C
+    BD_PCIE1813 = 0x81D
+    BD_PCIE1840L = 0x81E
+    BD_PCIE1730H = 0x81F
+    BD_PCIE1756H = 0x820
+    BD_PCIERXM01 = 0x821  # PCIe-RXM01
+    BD_MIC1816 = 0x822
+    BD_USB5830 = 0x823
+    BD_USB5850 = 0x824
+    BD_USB5860 = 0x825
+    BD_VPX1172 = 0x826
+    BD_USB5855 = 0x827
+    BD_USB5856 = 0x828
+    BD_USB5862 = 0x829
+    BD_PCIE1840T = 0x82A
+    BD_AudioCard = 0x82B
+    BD_AIIS1750 = 0x82C
+    BD_PCIE1840HL = 0x82D
+    BD_PCIE1765 = 0x82E
+    BD_PCIE1761H = 0x82F
+    BD_PCIE1762H = 0x830
+    BD_PCIE1884 = 0x831
+    BD_PCIE1758DIO = 0x832
+    BD_PCIE1758DI = 0x833
+    BD_PCIE1758DO = 0x834
+
+    #
+    BD_USB5817 = 0x835
+    BD_USB5801 = 0x836
+    BD_PCM2731 = 0x837
+    BD_MOS1110 = 0x838
+    BD_PCIE1750UH = 0x839
+    BD_PCIE1750U = 0x83A
+    BD_USB5820 = 0x83B
+
+    #
+    BD_THK1710R = 0x83C
+    BD_PCIE1803 = 0x83D
+    BD_PCIE1824 = 0x83E
+    BD_PCIE1805 = 0x83F
+
+    #
+    BD_MIOE1747 = 0x840
+    BD_ECUP1710 = 0x841
+    BD_PCIE1824L = 0x842
+
+    #
+    BD_PCIE1763AH = 0x843
+    BD_PCIE1763DH = 0x844
+
+    #
+    BD_MIC1816B = 0x845
+
+    #
+    BD_SUSIGPIO = 0x846
+
+    #
+    BD_MIC1810B = 0x847
+
+    # iDAQ series
+    BD_IDAQ731 = 0x848
+    BD_IDAQ763D = 0x849
+    BD_IDAQ817 = 0x84A
+    BD_IDAQ821 = 0x84B
+
+    #
+    BD_EAPIGPIO = 0x84C
+
+    # iDAQ series
+    BD_IDAQ841 = 0x84D
+    BD_IDAQ801 = 0x84E
+    BD_IDAQ815 = 0x84F
+
+    #
+    BD_PCIE1842 = 0x850
+    BD_MIOE3842 = 0x851
+
+    BD_USB4716B = 0x852
+
+    # iDAQ Fusion (Virtual Fusion Device, iDAQSyncBpInternal)
+    BD_IDAQ1CHASSYNC = 0x853  # Fused device of modules from same chassis
+
+    BD_USB4711B = 0x854
+    BD_IDAQ751 = 0x855
+
+    BD_FusionAuto = 0x856
+
+    BD_AIIS1882 = 0x857
+
+    BD_MIOE3842L = 0x858
+
+    BD_PCI1716B = 0x859
+    BD_USB4750B = 0x85A
+    BD_USB4761B = 0x85B
+    BD_PCI1716LB = 0x85C
+    BD_PCI1716H = 0x85D
+
+    BD_PCIE1816B = 0x85E
+    BD_PCIE1816HB = 0x85F
+
+    BD_ECUP1710T = 0x860
+    BD_PCI1712B = 0x861
+    BD_PCI1715B = 0x862
+    BD_PCI1721B = 0x863
+
+    BD_USB4751B = 0x864
+    BD_USB4751LB = 0x865
+
+    BD_PCIE1841 = 0x866
+    BD_PCIE1841L = 0x867
+    BD_PCIE1810B = 0x868
+    BD_PCIE1812B = 0x869
+    BD_PCIE1760B = 0x86A
+    BD_PCIE1751B = 0x86B
+    BD_PCIE1753B = 0x86C
+
+    # WISE-5000 starts from here
+    BD_WISE5051 = 0x901
+    BD_WISE5056 = 0x902
+    BD_WISE5056SO = 0x903
+    BD_WISE5015 = 0x904
+    BD_WISE5017 = 0x905
+    BD_WISE5018 = 0x906
+    BD_WISE5024 = 0x907
+    BD_WISE5080 = 0x908
+    BD_WISE5074 = 0x909
+    BD_WISE5001 = 0x90A
+    BD_WISE5052 = 0x90B
+    BD_WISE5057 = 0x90C
+    BD_WISE5057SO = 0x90D
+    BD_WISE5017C = 0x90E
+    BD_WISE5017V = 0x90F
+    BD_WISE5079 = 0x910
+
+    BD_AMAX5051 = 0x911
+    BD_AMAX5056 = 0x912
+    BD_AMAX5056SO = 0x913
+    BD_AMAX5015 = 0x914
+    BD_AMAX5017 = 0x915
+    BD_AMAX5018 = 0x916
+    BD_AMAX5024 = 0x917
+    BD_AMAX5080 = 0x918
+    BD_AMAX5074 = 0x919
+    BD_AMAX5001 = 0x91A
+    BD_AMAX5052 = 0x91B
+    BD_AMAX5057 = 0x91C
+    BD_AMAX5057SO = 0x91D
+    BD_AMAX5017C = 0x91E
+    BD_AMAX5017V = 0x91F
+    BD_AMAX5079 = 0x920
+    BD_AMAX5017H = 0x921
+    BD_AMAX5082 = 0x923
+    BD_AMAX5060 = 0x924
+    # Unknown productId
+    BD_UNKNOWN = -1
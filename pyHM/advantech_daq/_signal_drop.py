@@ -0,0 +1,778 @@
+from enum import IntEnum
+
+__all__ = [
+    "SignalDrop",
+]
+
+
+class SignalDrop(IntEnum):
+    SignalNone = 0  # No connection
+
+    # Internal signal connector
+    InternalClock = (
+        1  # Device built-in clock, the highest freq one if there are several ones.
+    )
+    Internal1KHz = 2  # Device built-in clock, 1KHz
+    Internal10KHz = 3  # Device built-in clock, 10KHz
+    Internal100KHz = 4  # Device built-in clock, 100KHz
+    Internal1MHz = 5  # Device built-in clock, 1MHz
+    Internal10MHz = 6  # Device built-in clock, 10MHz
+    Internal20MHz = 7  # Device built-in clock, 20MHz
+    Internal30MHz = 8  # Device built-in clock, 30MHz
+    Internal40MHz = 9  # Device built-in clock, 40MHz
+    Internal50MHz = 10  # Device built-in clock, 50MHz
+    Internal60MHz = 11  # Device built-in clock, 60MHz
+
+    DIPatternMatch = 12  # When DI pattern match occurred
+    DIStatusChange = 13  # When DI status change occurred
+
+    # Function pin on connector
+    ExtAnalogClock = 14  # Analog clock pin of connector
+    ExtAnalogScanClock = 15  # scan clock pin of connector
+    ExtAnalogTrigger = 16  # external analog trigger pin of connector
+    ExtAnalogTrigger0 = (16,)  # external analog trigger pin of connector 0
+    ExtDigitalClock = 17  # digital clock pin of connector
+    ExtDigitalTrigger0 = (
+        18  # external digital trigger 0 pin(or DI start trigger pin) of connector
+    )
+    ExtDigitalTrigger1 = (
+        19  # external digital trigger 1 pin(or DI stop trigger pin) of connector
+    )
+    ExtDigitalTrigger2 = (
+        20  # external digital trigger 2 pin(or DO start trigger pin) of connector
+    )
+    ExtDigitalTrigger3 = (
+        21  # external digital trigger 3 pin(or DO stop trigger pin) of connector
+    )
+    ChFreezeDO = 22  # Channel freeze DO ports pin
+
+    # Signal source or target on the connector
+    # AI channel pins
+    AI0 = 23
+    AI1 = 24
+    AI2 = 25
+    AI3 = 26
+    AI4 = 27
+    AI5 = 28
+    AI6 = 29
+    AI7 = 30
+    AI8 = 31
+    AI9 = 32
+    AI10 = 33
+    AI11 = 34
+    AI12 = 35
+    AI13 = 36
+    AI14 = 37
+    AI15 = 38
+    AI16 = 39
+    AI17 = 40
+    AI18 = 41
+    AI19 = 42
+    AI20 = 43
+    AI21 = 44
+    AI22 = 45
+    AI23 = 46
+    AI24 = 47
+    AI25 = 48
+    AI26 = 49
+    AI27 = 50
+    AI28 = 51
+    AI29 = 52
+    AI30 = 53
+    AI31 = 54
+    AI32 = 55
+    AI33 = 56
+    AI34 = 57
+    AI35 = 58
+    AI36 = 59
+    AI37 = 60
+    AI38 = 61
+    AI39 = 62
+    AI40 = 63
+    AI41 = 64
+    AI42 = 65
+    AI43 = 66
+    AI44 = 67
+    AI45 = 68
+    AI46 = 69
+    AI47 = 70
+    AI48 = 71
+    AI49 = 72
+    AI50 = 73
+    AI51 = 74
+    AI52 = 75
+    AI53 = 76
+    AI54 = 77
+    AI55 = 78
+    AI56 = 79
+    AI57 = 80
+    AI58 = 81
+    AI59 = 82
+    AI60 = 83
+    AI61 = 84
+    AI62 = 85
+    AI63 = 86
+
+    # AO channel pins
+    AO0 = 87
+    AO1 = 88
+    AO2 = 89
+    AO3 = 90
+    AO4 = 91
+    AO5 = 92
+    AO6 = 93
+    AO7 = 94
+    AO8 = 95
+    AO9 = 96
+    AO10 = 97
+    AO11 = 98
+    AO12 = 99
+    AO13 = 100
+    AO14 = 101
+    AO15 = 102
+    AO16 = 103
+    AO17 = 104
+    AO18 = 105
+    AO19 = 106
+    AO20 = 107
+    AO21 = 108
+    AO22 = 109
+    AO23 = 110
+    AO24 = 111
+    AO25 = 112
+    AO26 = 113
+    AO27 = 114
+    AO28 = 115
+    AO29 = 116
+    AO30 = 117
+    AO31 = 118
+
+    # DI pins
+    DI0 = 119
+    DI1 = 120
+    DI2 = 121
+    DI3 = 122
+    DI4 = 123
+    DI5 = 124
+    DI6 = 125
+    DI7 = 126
+    DI8 = 127
+    DI9 = 128
+    DI10 = 129
+    DI11 = 130
+    DI12 = 131
+    DI13 = 132
+    DI14 = 133
+    DI15 = 134
+    DI16 = 135
+    DI17 = 136
+    DI18 = 137
+    DI19 = 138
+    DI20 = 139
+    DI21 = 140
+    DI22 = 141
+    DI23 = 142
+    DI24 = 143
+    DI25 = 144
+    DI26 = 145
+    DI27 = 146
+    DI28 = 147
+    DI29 = 148
+    DI30 = 149
+    DI31 = 150
+    DI32 = 151
+    DI33 = 152
+    DI34 = 153
+    DI35 = 154
+    DI36 = 155
+    DI37 = 156
+    DI38 = 157
+    DI39 = 158
+    DI40 = 159
+    DI41 = 160
+    DI42 = 161
+    DI43 = 162
+    DI44 = 163
+    DI45 = 164
+    DI46 = 165
+    DI47 = 166
+    DI48 = 167
+    DI49 = 168
+    DI50 = 169
+    DI51 = 170
+    DI52 = 171
+    DI53 = 172
+    DI54 = 173
+    DI55 = 174
+    DI56 = 175
+    DI57 = 176
+    DI58 = 177
+    DI59 = 178
+    DI60 = 179
+    DI61 = 180
+    DI62 = 181
+    DI63 = 182
+    DI64 = 183
+    DI65 = 184
+    DI66 = 185
+    DI67 = 186
+    DI68 = 187
+    DI69 = 188
+    DI70 = 189
+    DI71 = 190
+    DI72 = 191
+    DI73 = 192
+    DI74 = 193
+    DI75 = 194
+    DI76 = 195
+    DI77 = 196
+    DI78 = 197
+    DI79 = 198
+    DI80 = 199
+    DI81 = 200
+    DI82 = 201
+    DI83 = 202
+    DI84 = 203
+    DI85 = 204
+    DI86 = 205
+    DI87 = 206
+    DI88 = 207
+    DI89 = 208
+    DI90 = 209
+    DI91 = 210
+    DI92 = 211
+    DI93 = 212
+    DI94 = 213
+    DI95 = 214
+    DI96 = 215
+    DI97 = 216
+    DI98 = 217
+    DI99 = 218
+    DI100 = 219
+    DI101 = 220
+    DI102 = 221
+    DI103 = 222
+    DI104 = 223
+    DI105 = 224
+    DI106 = 225
+    DI107 = 226
+    DI108 = 227
+    DI109 = 228
+    DI110 = 229
+    DI111 = 230
+    DI112 = 231
+    DI113 = 232
+    DI114 = 233
+    DI115 = 234
+    DI116 = 235
+    DI117 = 236
+    DI118 = 237
+    DI119 = 238
+    DI120 = 239
+    DI121 = 240
+    DI122 = 241
+    DI123 = 242
+    DI124 = 243
+    DI125 = 244
+    DI126 = 245
+    DI127 = 246
+    DI128 = 247
+    DI129 = 248
+    DI130 = 249
+    DI131 = 250
+    DI132 = 251
+    DI133 = 252
+    DI134 = 253
+    DI135 = 254
+    DI136 = 255
+    DI137 = 256
+    DI138 = 257
+    DI139 = 258
+    DI140 = 259
+    DI141 = 260
+    DI142 = 261
+    DI143 = 262
+    DI144 = 263
+    DI145 = 264
+    DI146 = 265
+    DI147 = 266
+    DI148 = 267
+    DI149 = 268
+    DI150 = 269
+    DI151 = 270
+    DI152 = 271
+    DI153 = 272
+    DI154 = 273
+    DI155 = 274
+    DI156 = 275
+    DI157 = 276
+    DI158 = 277
+    DI159 = 278
+    DI160 = 279
+    DI161 = 280
+    DI162 = 281
+    DI163 = 282
+    DI164 = 283
+    DI165 = 284
+    DI166 = 285
+    DI167 = 286
+    DI168 = 287
+    DI169 = 288
+    DI170 = 289
+    DI171 = 290
+    DI172 = 291
+    DI173 = 292
+    DI174 = 293
+    DI175 = 294
+    DI176 = 295
+    DI177 = 296
+    DI178 = 297
+    DI179 = 298
+    DI180 = 299
+    DI181 = 300
+    DI182 = 301
+    DI183 = 302
+    DI184 = 303
+    DI185 = 304
+    DI186 = 305
+    DI187 = 306
+    DI188 = 307
+    DI189 = 308
+    DI190 = 309
+    DI191 = 310
+    DI192 = 311
+    DI193 = 312
+    DI194 = 313
+    DI195 = 314
+    DI196 = 315
+    DI197 = 316
+    DI198 = 317
+    DI199 = 318
+    DI200 = 319
+    DI201 = 320
+    DI202 = 321
+    DI203 = 322
+    DI204 = 323
+    DI205 = 324
+    DI206 = 325
+    DI207 = 326
+    DI208 = 327
+    DI209 = 328
+    DI210 = 329
+    DI211 = 330
+    DI212 = 331
+    DI213 = 332
+    DI214 = 333
+    DI215 = 334
+    DI216 = 335
+    DI217 = 336
+    DI218 = 337
+    DI219 = 338
+    DI220 = 339
+    DI221 = 340
+    DI222 = 341
+    DI223 = 342
+    DI224 = 343
+    DI225 = 344
+    DI226 = 345
+    DI227 = 346
+    DI228 = 347
+    DI229 = 348
+    DI230 = 349
+    DI231 = 350
+    DI232 = 351
+    DI233 = 352
+    DI234 = 353
+    DI235 = 354
+    DI236 = 355
+    DI237 = 356
+    DI238 = 357
+    DI239 = 358
+    DI240 = 359
+    DI241 = 360
+    DI242 = 361
+    DI243 = 362
+    DI244 = 363
+    DI245 = 364
+    DI246 = 365
+    DI247 = 366
+    DI248 = 367
+    DI249 = 368
+    DI250 = 369
+    DI251 = 370
+    DI252 = 371
+    DI253 = 372
+    DI254 = 373
+    DI255 = 374
+
+    # DIO pins
+    DIO0 = 375
+    DIO1 = 376
+    DIO2 = 377
+    DIO3 = 378
+    DIO4 = 379
+    DIO5 = 380
+    DIO6 = 381
+    DIO7 = 382
+    DIO8 = 383
+    DIO9 = 384
+    DIO10 = 385
+    DIO11 = 386
+    DIO12 = 387
+    DIO13 = 388
+    DIO14 = 389
+    DIO15 = 390
+    DIO16 = 391
+    DIO17 = 392
+    DIO18 = 393
+    DIO19 = 394
+    DIO20 = 395
+    DIO21 = 396
+    DIO22 = 397
+    DIO23 = 398
+    DIO24 = 399
+    DIO25 = 400
+    DIO26 = 401
+    DIO27 = 402
+    DIO28 = 403
+    DIO29 = 404
+    DIO30 = 405
+    DIO31 = 406
+    DIO32 = 407
+    DIO33 = 408
+    DIO34 = 409
+    DIO35 = 410
+    DIO36 = 411
+    DIO37 = 412
+    DIO38 = 413
+    DIO39 = 414
+    DIO40 = 415
+    DIO41 = 416
+    DIO42 = 417
+    DIO43 = 418
+    DIO44 = 419
+    DIO45 = 420
+    DIO46 = 421
+    DIO47 = 422
+    DIO48 = 423
+    DIO49 = 424
+    DIO50 = 425
+    DIO51 = 426
+    DIO52 = 427
+    DIO53 = 428
+    DIO54 = 429
+    DIO55 = 430
+    DIO56 = 431
+    DIO57 = 432
+    DIO58 = 433
+    DIO59 = 434
+    DIO60 = 435
+    DIO61 = 436
+    DIO62 = 437
+    DIO63 = 438
+    DIO64 = 439
+    DIO65 = 440
+    DIO66 = 441
+    DIO67 = 442
+    DIO68 = 443
+    DIO69 = 444
+    DIO70 = 445
+    DIO71 = 446
+    DIO72 = 447
+    DIO73 = 448
+    DIO74 = 449
+    DIO75 = 450
+    DIO76 = 451
+    DIO77 = 452
+    DIO78 = 453
+    DIO79 = 454
+    DIO80 = 455
+    DIO81 = 456
+    DIO82 = 457
+    DIO83 = 458
+    DIO84 = 459
+    DIO85 = 460
+    DIO86 = 461
+    DIO87 = 462
+    DIO88 = 463
+    DIO89 = 464
+    DIO90 = 465
+    DIO91 = 466
+    DIO92 = 467
+    DIO93 = 468
+    DIO94 = 469
+    DIO95 = 470
+    DIO96 = 471
+    DIO97 = 472
+    DIO98 = 473
+    DIO99 = 474
+    DIO100 = 475
+    DIO101 = 476
+    DIO102 = 477
+    DIO103 = 478
+    DIO104 = 479
+    DIO105 = 480
+    DIO106 = 481
+    DIO107 = 482
+    DIO108 = 483
+    DIO109 = 484
+    DIO110 = 485
+    DIO111 = 486
+    DIO112 = 487
+    DIO113 = 488
+    DIO114 = 489
+    DIO115 = 490
+    DIO116 = 491
+    DIO117 = 492
+    DIO118 = 493
+    DIO119 = 494
+    DIO120 = 495
+    DIO121 = 496
+    DIO122 = 497
+    DIO123 = 498
+    DIO124 = 499
+    DIO125 = 500
+    DIO126 = 501
+    DIO127 = 502
+    DIO128 = 503
+    DIO129 = 504
+    DIO130 = 505
+    DIO131 = 506
+    DIO132 = 507
+    DIO133 = 508
+    DIO134 = 509
+    DIO135 = 510
+    DIO136 = 511
+    DIO137 = 512
+    DIO138 = 513
+    DIO139 = 514
+    DIO140 = 515
+    DIO141 = 516
+    DIO142 = 517
+    DIO143 = 518
+    DIO144 = 519
+    DIO145 = 520
+    DIO146 = 521
+    DIO147 = 522
+    DIO148 = 523
+    DIO149 = 524
+    DIO150 = 525
+    DIO151 = 526
+    DIO152 = 527
+    DIO153 = 528
+    DIO154 = 529
+    DIO155 = 530
+    DIO156 = 531
+    DIO157 = 532
+    DIO158 = 533
+    DIO159 = 534
+    DIO160 = 535
+    DIO161 = 536
+    DIO162 = 537
+    DIO163 = 538
+    DIO164 = 539
+    DIO165 = 540
+    DIO166 = 541
+    DIO167 = 542
+    DIO168 = 543
+    DIO169 = 544
+    DIO170 = 545
+    DIO171 = 546
+    DIO172 = 547
+    DIO173 = 548
+    DIO174 = 549
+    DIO175 = 550
+    DIO176 = 551
+    DIO177 = 552
+    DIO178 = 553
+    DIO179 = 554
+    DIO180 = 555
+    DIO181 = 556
+    DIO182 = 557
+    DIO183 = 558
+    DIO184 = 559
+    DIO185 = 560
+    DIO186 = 561
+    DIO187 = 562
+    DIO188 = 563
+    DIO189 = 564
+    DIO190 = 565
+    DIO191 = 566
+    DIO192 = 567
+    DIO193 = 568
+    DIO194 = 569
+    DIO195 = 570
+    DIO196 = 571
+    DIO197 = 572
+    DIO198 = 573
+    DIO199 = 574
+    DIO200 = 575
+    DIO201 = 576
+    DIO202 = 577
+    DIO203 = 578
+    DIO204 = 579
+    DIO205 = 580
+    DIO206 = 581
+    DIO207 = 582
+    DIO208 = 583
+    DIO209 = 584
+    DIO210 = 585
+    DIO211 = 586
+    DIO212 = 587
+    DIO213 = 588
+    DIO214 = 589
+    DIO215 = 590
+    DIO216 = 591
+    DIO217 = 592
+    DIO218 = 593
+    DIO219 = 594
+    DIO220 = 595
+    DIO221 = 596
+    DIO222 = 597
+    DIO223 = 598
+    DIO224 = 599
+    DIO225 = 600
+    DIO226 = 601
+    DIO227 = 602
+    DIO228 = 603
+    DIO229 = 604
+    DIO230 = 605
+    DIO231 = 606
+    DIO232 = 607
+    DIO233 = 608
+    DIO234 = 609
+    DIO235 = 610
+    DIO236 = 611
+    DIO237 = 612
+    DIO238 = 613
+    DIO239 = 614
+    DIO240 = 615
+    DIO241 = 616
+    DIO242 = 617
+    DIO243 = 618
+    DIO244 = 619
+    DIO245 = 620
+    DIO246 = 621
+    DIO247 = 622
+    DIO248 = 623
+    DIO249 = 624
+    DIO250 = 625
+    DIO251 = 626
+    DIO252 = 627
+    DIO253 = 628
+    DIO254 = 629
+    DIO255 = 630
+
+    # Counter clock pins
+    CntClk0 = 631
+    CntClk1 = 632
+    CntClk2 = 633
+    CntClk3 = 634
+    CntClk4 = 635
+    CntClk5 = 636
+    CntClk6 = 637
+    CntClk7 = 638
+
+    # counter gate pins
+    CntGate0 = 639
+    CntGate1 = 640
+    CntGate2 = 641
+    CntGate3 = 642
+    CntGate4 = 643
+    CntGate5 = 644
+    CntGate6 = 645
+    CntGate7 = 646
+
+    # counter out pins
+    CntOut0 = 647
+    CntOut1 = 648
+    CntOut2 = 649
+    CntOut3 = 650
+    CntOut4 = 651
+    CntOut5 = 652
+    CntOut6 = 653
+    CntOut7 = 654
+
+    # counter frequency out pins
+    CntFreqOut0 = 655
+    CntFreqOut1 = 656
+    CntFreqOut2 = 657
+    CntFreqOut3 = 658
+    CntFreqOut4 = 659
+    CntFreqOut5 = 660
+    CntFreqOut6 = 661
+    CntFreqOut7 = 662
+
+    # AMSI pins
+    AMSI0 = 663
+    AMSI1 = 664
+    AMSI2 = 665
+    AMSI3 = 666
+    AMSI4 = 667
+    AMSI5 = 668
+    AMSI6 = 669
+    AMSI7 = 670
+    AMSI8 = 671
+    AMSI9 = 672
+    AMSI10 = 673
+    AMSI11 = 674
+    AMSI12 = 675
+    AMSI13 = 676
+    AMSI14 = 677
+    AMSI15 = 678
+    AMSI16 = 679
+    AMSI17 = 680
+    AMSI18 = 681
+    AMSI19 = 682
+
+    # new clocks
+    Internal2Hz = 683  # Device built-in clock, 2Hz
+    Internal20Hz = 684  # Device built-in clock, 20Hz
+    Internal200Hz = 685  # Device built-in clock, 200KHz
+    Internal2KHz = 686  # Device built-in clock, 2KHz
+    Internal20KHz = 687  # Device built-in clock, 20KHz
+    Internal200KHz = 688  # Device built-in clock, 200KHz
+    Internal2MHz = 689  # Device built-in clock, 2MHz
+
+    # New Function pin on connector
+    ExtAnalogTrigger1 = 690  # external analog trigger pin of connector 1
+
+    # Reference clock
+    ExtDigRefClock = 691  # digital clock pin of connector
+    Internal100MHz = 692
+    AIConvClock = 693
+
+    # digital trigger from master after ADC latency
+    SigExtDigitalTrgADCLatency = 694
+    SigExtDigitalTrg0ADCLatency = SigExtDigitalTrgADCLatency
+    SigExtDigitalTrg1ADCLatency = 695
+
+    # digital trigger from master/MSDI pin after ADC latency
+    MDSITrg0 = 696
+    MDSITrg1 = 697
+
+    MDSITrg0ADCLatency = 698
+    MDSITrg1ADCLatency = 699
+
+    # reference clock source from master/MDSI pin
+    MDSIRefClock = 700
+    MDSIClock = 701
+
+    # clock source & trigger for Master/Slave module
+    # internal clock x, as a master module
+    IntClock0 = 702
+    IntClock1 = 703
+    IntClock2 = 704
+    IntClock3 = 705
+
+    # clock from internal clock x, as a slave module
+    IntClk0Slv = 706
+    IntClk1Slv = 707
+    IntClk2Slv = 708
+    IntClk3Slv = 709
+
+    # Trigger x from trigger pin, as a slave module
+    ExtDigTrg0Slv = 710
+    ExtDigTrg1Slv = 711
+    ExtDigTrg2Slv = 712
+    ExtDigTrg3Slv = 713
@@ -20,6 +20,10 @@ class AICtrlBase(DAQCtrlBase):
         # self._ai_channels = []
         super().__init__(scenario, dev_info, profile_path)
 
+    def _invalidateFeatures(self) -> None:
+        super()._invalidateFeatures()
+        self._ai_features = None
+
     @property
     def features(self) -> AIFeatures:
         if self._ai_features is None:
@@ -21,6 +21,10 @@ class AOCtrlBase(DAQCtrlBase):
         # self._ao_channels.clear()
         super().__init__(scenario, dev_info, profile_path)
 
+    def _invalidateFeatures(self) -> None:
+        super()._invalidateFeatures()
+        self._ao_features = None
+
     @property
     def features(self) -> AOFeatures:
         if self._ao_features is None:
@@ -1,49 +1,57 @@
 from ctypes import byref, pointer
+from typing import TYPE_CHECKING
 
 from . import (
     MathInterval,
     SamplingMethod,
-    SignalDrop,
     TriggerAction,
     ValueRange,
     utils,
 )
 from .api import ao_features, array
+from .features import Features, feature
 
-__all__ = ["AOFeatures"]
+if TYPE_CHECKING:
+    from . import SignalDrop
 
+__all__ = ["AOFeatures"]
 
-class AOFeatures:
-    def __init__(self, native_feature: int) -> None:
-        self._obj: int = native_feature
 
+class AOFeatures(Features):
     # DAC features
     @property
+    @feature
     def resolution(self) -> int:
         return ao_features.get_resolution(self._obj)
 
     @property
+    @feature
     def dataSize(self) -> int:
         return ao_features.get_data_size(self._obj)
 
     @property
+    @feature
     def dataMask(self) -> int:
         return ao_features.get_data_mask(self._obj)
 
     # channel features
     @property
+    @feature
     def channelCountMax(self) -> int:
         return ao_features.get_channel_count_max(self._obj)
 
     @property
+    @feature
     def valueRanges(self) -> list[ValueRange]:
         return array.to_value_range(ao_features.get_value_ranges(self._obj), True)
 
     @property
+    @feature
     def externalRefAntiPolar(self) -> bool:
         return True if ao_features.get_external_ref_anti_polar(self._obj) else False
 
     @property
+    @feature
     def externalRefRange(self) -> MathInterval:
         x: MathInterval = MathInterval()
         ao_features.get_external_ref_range(self._obj, pointer(x))
@@ -51,29 +59,35 @@ class AOFeatures:
 
     # buffered ao->basic features
     @property
+    @feature
     def bufferedAoSupported(self) -> bool:
         return True if ao_features.get_buffered_ao_supported(self._obj) else False
 
     @property
+    @feature
     def samplingMethod(self) -> SamplingMethod:
         return utils.toSamplingMethod(ao_features.get_sampling_method(self._obj))
 
     @property
+    @feature
     def channelStartBase(self) -> int:
         return ao_features.get_channel_start_base(self._obj)
 
     @property
+    @feature
     def channelCountBase(self) -> int:
         return ao_features.get_channel_count_base(self._obj)
 
     # buffered ao->conversion clock features
     @property
-    def convertClockSources(self) -> list[SignalDrop]:
+    @feature
+    def convertClockSources(self) -> "list[SignalDrop]":
         return array.to_signal_drop(
             ao_features.get_convert_clock_sources(self._obj), True
         )
 
     @property
+    @feature
     def convertClockRange(self) -> MathInterval:
         x: MathInterval = MathInterval()
         ao_features.get_convert_clock_range(self._obj, pointer(x))
@@ -81,10 +95,12 @@ class AOFeatures:
 
     # buffered ao->trigger features
     @property
+    @feature
     def triggerCount(self) -> int:
         return ao_features.get_trigger_count(self._obj)
 
     @property
+    @feature
     def retriggerable(self) -> bool:
         return True if ao_features.get_retriggerable(self._obj) else False
 
@@ -98,17 +114,20 @@ class AOFeatures:
     def trigger1Supported(self) -> bool:
         return self.triggerCount > 1
 
+    @feature
     def getTriggerActions(self, trigger: int = 0) -> list[TriggerAction]:
         return array.to_trigger_action(
             ao_features.get_trigger_actions(self._obj, trigger), True
         )
 
+    @feature
     def getTriggerDelayRange(self, trigger: int = 0) -> MathInterval:
         x: MathInterval = MathInterval()
         ao_features.get_trigger_delay_range(self._obj, trigger, byref(x))
         return x
 
-    def getTriggerSources(self, trigger: int = 0) -> list[SignalDrop]:
+    @feature
+    def getTriggerSources(self, trigger: int = 0) -> "list[SignalDrop]":
         return array.to_signal_drop(
             ao_features.get_trigger_sources(self._obj, trigger), True
         )
@@ -1,21 +1,24 @@
 import os
 import platform
+import sys
 
 # noinspection PyProtectedMember
 from _ctypes import Array, _Pointer
 from ctypes import (
-    CDLL,
     POINTER,
+    c_int,
     c_int32,
     c_uint32,
     c_uint64,
-    c_ulong,
+    c_void_p,
     c_wchar,
     c_wchar_p,
     create_unicode_buffer,
 )
+from functools import update_wrapper
+from typing import Any, Callable, Sequence
 
-from .. import ErrorCode, MathInterval, ValueUnit
+from .. import ErrorCode, MathInterval
 
 c_uint_: type
 if platform.architecture()[0] == "32bit":
@@ -23,59 +26,195 @@ if platform.architecture()[0] == "32bit":
 else:
     c_uint_ = c_uint64
 
-dll: CDLL
 if os.name == "nt":
-    from ctypes import windll
-
-    dll = windll.LoadLibrary("biodaq")
+    from ctypes import WINFUNCTYPE as FUNCTYPE
 else:
-    from ctypes import cdll
+    from ctypes import CFUNCTYPE as FUNCTYPE
+
+# the event callback: the sender, the event arguments, and the user parameter
+DaqEventProc: type = FUNCTYPE(None, c_void_p, c_void_p, c_void_p)
+
+# the library itself, or anything that provides its functions,
+# loaded on the first call to any of them rather than on the import
+_dll: Any = None
+
+
+def _library() -> Any:
+    global _dll
+    if _dll is None:
+        if os.getenv("DAQ_BACKEND", "").casefold() == "simulator":
+            from .simulator import Simulator
+
+            _dll = Simulator()
+        elif os.name == "nt":
+            from ctypes import windll
+
+            _dll = windll.LoadLibrary("biodaq")
+        else:
+            from ctypes import cdll
+
+            _dll = cdll.LoadLibrary("libbiodaq.so")
+        if os.getenv("DAQ_CALL_STATS"):
+            from .call_stats import enable
+
+            enable()
+    return _dll
+
+
+def __getattr__(name: str) -> Any:
+    if name == "dll":
+        return _library()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    dll = cdll.LoadLibrary("libbiodaq.so")
 
 __all__ = [
+    "DaqEventProc",
     "adx_enum_to_string",
     "adx_get_value_range_information",
-    "is_error_code",
-    "dll",
     "c_uint_",
+    "dll",
+    "is_error_code",
+    "is_warning_code",
+    "prototype",
 ]
 
+# the library functions with their signatures set, by the symbol name
+_functions: dict[str, Any] = {}
+# all the stand-ins, to expose the library functions again when the wrapping changes
+_prototypes: list["_Prototype"] = []
+# what wraps a library function as it's bound, if anything, given the symbol name
+_wrapper: Callable[[str, Any], Any] | None = None
+
+
+class _Prototype:
+    """A stand-in for a library function that binds it on the first call"""
+
+    def __init__(
+        self,
+        stub: Callable[..., Any],
+        name: str,
+        argtypes: Sequence[type],
+        restype: type | None,
+    ) -> None:
+        update_wrapper(self, stub)
+        self._name: str = name
+        self._argtypes: Sequence[type] = argtypes
+        self._restype: type | None = restype
+        _prototypes.append(self)
+
+    def __call__(self, *args: Any) -> Any:
+        return self.bind()(*args)
+
+    def bind(self) -> Any:
+        function: Any = _functions.get(self._name)
+        if function is None:
+            function = getattr(_library(), self._name)
+            function.argtypes = self._argtypes
+            function.restype = self._restype
+            _functions[self._name] = function
+        if _wrapper is not None:
+            function = _wrapper(self._name, function)
+        self.expose(function)
+        return function
+
+    def expose(self, function: Any) -> None:
+        # from now on, the module attribute is the library function itself
+        # (or its wrapper) unless the interpreter is shutting down
+        module: Any = sys.modules.get(self.__module__)
+        if module is not None:
+            setattr(module, self.__name__, function)
+
+    def rebind(self) -> None:
+        """Expose the library function again if it's been bound already"""
+        if self._name in _functions:
+            self.bind()
+
+
+def _set_wrapper(wrapper: Callable[[str, Any], Any] | None) -> None:
+    """Wrap the library functions with `wrapper`, or call them directly if it's `None`"""
+    global _wrapper
+    _wrapper = wrapper
+    for stand_in in _prototypes:
+        stand_in.rebind()
+
+
+def prototype[**_P, _R](
+    name: str,
+    argtypes: Sequence[type] = (),
+    restype: type | None = c_int,
+) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Replace the decorated stub with the library function `name`
+
+    The symbol is resolved and typed once, on the first call, so that the
+    following calls cost just the call to the library.
+    The stub only documents the signature and is never called.
+    """
+
+    def decorator(stub: Callable[_P, _R]) -> Callable[_P, _R]:
+        return _Prototype(stub, name, argtypes, restype)
+
+    return decorator
+
+
+@prototype(
+    "AdxEnumToString",
+    [c_wchar_p, c_uint32, c_uint32, c_wchar_p],
+    restype=c_int32,
+)
+def _adx_enum_to_string(
+    enumName: str,
+    enumValue: int,
+    enumStrLen: int,
+    enumString: Array[c_wchar],
+) -> int: ...
+
 
 def adx_enum_to_string(enumName: str, enumValue: int, enumStrLen: int) -> str:
     p_str: Array[c_wchar] = create_unicode_buffer("\0", enumStrLen)
-    dll.AdxEnumToString.argtypes = [c_wchar_p, c_uint32, c_uint32, c_wchar_p]
-    dll.AdxEnumToString.restype = c_int32
-    dll.AdxEnumToString(enumName, enumValue, enumStrLen, p_str)
+    _adx_enum_to_string(enumName, enumValue, enumStrLen, p_str)
     return p_str.value
 
 
+@prototype(
+    "AdxGetValueRangeInformation",
+    [
+        c_uint32,
+        c_uint32,
+        c_wchar_p,
+        POINTER(MathInterval),
+        POINTER(c_int32),  # ValueUnit
+    ],
+    restype=c_uint32,
+)
 def adx_get_value_range_information(
     valueRangeArg: int,
     sizeofDesc: int,
     pDescription: "_Pointer[c_wchar]",
     pMathIntervalRange: "_Pointer[MathInterval]",
     pValueUnit: "_Pointer[c_int32]",
-) -> int:
-    dll.AdxGetValueRangeInformation.argtypes = [
-        c_uint32,
-        c_uint32,
-        c_wchar_p,
-        POINTER(MathInterval),
-        POINTER(ValueUnit),
-    ]
-    dll.AdxGetValueRangeInformation.restype = c_uint32
+) -> int: ...
 
-    return dll.AdxGetValueRangeInformation(
-        valueRangeArg, sizeofDesc, pDescription, pMathIntervalRange, pValueUnit
-    )
+
+# the severity is encoded in the highest bits of an error code
+_WARNING_CODES: frozenset[ErrorCode] = frozenset(
+    code for code in ErrorCode if 0xA0000000 <= code.value < 0xC0000000
+)
+_ERROR_CODES: frozenset[ErrorCode] = frozenset(
+    code for code in ErrorCode if code.value >= 0xC0000000
+)
 
 
 def is_error_code(ret: ErrorCode | int) -> bool:
-    if not isinstance(ret, (ErrorCode, int)):
-        raise TypeError("an int or an ErrorCode is required")
     if isinstance(ret, ErrorCode):
-        ret = ret.value
-    if c_ulong(ret).value >= c_ulong(0xC0000000).value:
-        return True
-    return False
+        return ret in _ERROR_CODES
+    if isinstance(ret, int):
+        return (ret & 0xFFFFFFFF) >= 0xC0000000
+    raise TypeError("an int or an ErrorCode is required")
+
+
+def is_warning_code(ret: ErrorCode | int) -> bool:
+    if isinstance(ret, ErrorCode):
+        return ret in _WARNING_CODES
+    if isinstance(ret, int):
+        return 0xA0000000 <= (ret & 0xFFFFFFFF) < 0xC0000000
+    raise TypeError("an int or an ErrorCode is required")
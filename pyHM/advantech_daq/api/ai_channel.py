@@ -2,7 +2,7 @@ from _ctypes import Array
 from ctypes import POINTER, c_double, c_int, c_int32, c_wchar, c_wchar_p
 
 from .. import MapFuncPiece
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_burn_short_ret_value",
@@ -36,178 +36,151 @@ __all__ = [
 ]
 
 
-def get_channel(obj: int) -> int:
-    dll.TAiChannel_getChannel.restype = c_int32
-    dll.TAiChannel_getChannel.argtypes = [c_uint_]
-    return dll.TAiChannel_getChannel(obj)
+@prototype("TAiChannel_getChannel", [c_uint_], restype=c_int32)
+def get_channel(obj: int) -> int: ...
 
 
-def get_logical_number(obj: int) -> int:
-    dll.TAiChannel_getLogicalNumber.restype = c_int32
-    dll.TAiChannel_getLogicalNumber.argtypes = [c_uint_]
-    return dll.TAiChannel_getLogicalNumber(obj)
+@prototype("TAiChannel_getLogicalNumber", [c_uint_], restype=c_int32)
+def get_logical_number(obj: int) -> int: ...
 
 
-def get_value_range(obj: int) -> int:
-    dll.TAiChannel_getValueRange.restype = c_int
-    dll.TAiChannel_getValueRange.argtypes = [c_uint_]
-    return dll.TAiChannel_getValueRange(obj)
+@prototype("TAiChannel_getValueRange", [c_uint_], restype=c_int)
+def get_value_range(obj: int) -> int: ...
 
 
-def set_value_range(obj: int, valueRangeValue: int) -> int:
-    dll.TAiChannel_setValueRange.argtypes = [c_uint_, c_int32]
-    return dll.TAiChannel_setValueRange(obj, valueRangeValue)
+@prototype("TAiChannel_setValueRange", [c_uint_, c_int32])
+def set_value_range(obj: int, valueRangeValue: int) -> int: ...
 
 
-def get_signal_type(obj: int) -> int:
-    dll.TAiChannel_getSignalType.restype = c_int
-    dll.TAiChannel_getSignalType.argtypes = [c_uint_]
-    return dll.TAiChannel_getSignalType(obj)
+@prototype("TAiChannel_getSignalType", [c_uint_], restype=c_int)
+def get_signal_type(obj: int) -> int: ...
 
 
-def set_signal_type(obj: int, aiSignalTypeValue: int) -> int:
-    dll.TAiChannel_setSignalType.argtypes = [c_uint_, c_int32]
-    return dll.TAiChannel_setSignalType(obj, aiSignalTypeValue)
+@prototype("TAiChannel_setSignalType", [c_uint_, c_int32])
+def set_signal_type(obj: int, aiSignalTypeValue: int) -> int: ...
 
 
-def get_burnout_ret_type(obj: int) -> int:
-    dll.TAiChannel_getBurnoutRetType.restype = c_int
-    dll.TAiChannel_getBurnoutRetType.argtypes = [c_uint_]
-    return dll.TAiChannel_getBurnoutRetType(obj)
+@prototype("TAiChannel_getBurnoutRetType", [c_uint_], restype=c_int)
+def get_burnout_ret_type(obj: int) -> int: ...
 
 
-def set_burnout_ret_type(obj: int, burnoutRetTypeValue: int) -> int:
-    dll.TAiChannel_setBurnoutRetType.argtypes = [c_uint_, c_int32]
-    return dll.TAiChannel_setBurnoutRetType(obj, burnoutRetTypeValue)
+@prototype("TAiChannel_setBurnoutRetType", [c_uint_, c_int32])
+def set_burnout_ret_type(obj: int, burnoutRetTypeValue: int) -> int: ...
 
 
-def get_burnout_ret_value(obj: int) -> int:
-    dll.TAiChannel_getBurnoutRetValue.restype = c_double
-    dll.TAiChannel_getBurnoutRetValue.argtypes = [c_uint_]
-    return dll.TAiChannel_getBurnoutRetValue(obj)
+@prototype("TAiChannel_getBurnoutRetValue", [c_uint_], restype=c_double)
+def get_burnout_ret_value(obj: int) -> int: ...
 
 
-def set_burnout_ret_value(obj: int, value: float) -> int:
-    dll.TAiChannel_setBurnoutRetValue.argtypes = [c_uint_, c_double]
-    return dll.TAiChannel_setBurnoutRetValue(obj, c_double(value))
+@prototype("TAiChannel_setBurnoutRetValue", [c_uint_, c_double])
+def set_burnout_ret_value(obj: int, value: float) -> int: ...
 
 
-def get_burn_short_ret_value(obj: int) -> float:
-    dll.TAiChannel_getBurnShortRetValue.restype = c_double
-    dll.TAiChannel_getBurnShortRetValue.argtypes = [c_uint_]
-    return dll.TAiChannel_getBurnShortRetValue(obj)
+@prototype("TAiChannel_getBurnShortRetValue", [c_uint_], restype=c_double)
+def get_burn_short_ret_value(obj: int) -> float: ...
 
 
-def set_burn_short_ret_value(obj: int, value: float) -> int:
-    dll.TAiChannel_setBurnShortRetValue.argtypes = [c_uint_, c_double]
-    return dll.TAiChannel_setBurnShortRetValue(obj, c_double(value))
+@prototype("TAiChannel_setBurnShortRetValue", [c_uint_, c_double])
+def set_burn_short_ret_value(obj: int, value: float) -> int: ...
 
 
-def get_filter_type(obj: int) -> int:
-    dll.TAiChannel_getFilterType.restype = c_int
-    dll.TAiChannel_getFilterType.argtypes = [c_uint_]
-    return dll.TAiChannel_getFilterType(obj)
+@prototype("TAiChannel_getFilterType", [c_uint_], restype=c_int)
+def get_filter_type(obj: int) -> int: ...
 
 
-def set_filter_type(obj: int, filterTypeValue: int) -> int:
-    dll.TAiChannel_setFilterType.argtypes = [c_uint_, c_int32]
-    return dll.TAiChannel_setFilterType(obj, filterTypeValue)
+@prototype("TAiChannel_setFilterType", [c_uint_, c_int32])
+def set_filter_type(obj: int, filterTypeValue: int) -> int: ...
 
 
-def get_filter_cutoff_freq(obj: int) -> float:
-    dll.TAiChannel_getFilterCutoffFreq.restype = c_double
-    dll.TAiChannel_getFilterCutoffFreq.argtypes = [c_uint_]
-    return dll.TAiChannel_getFilterCutoffFreq(obj)
+@prototype("TAiChannel_getFilterCutoffFreq", [c_uint_], restype=c_double)
+def get_filter_cutoff_freq(obj: int) -> float: ...
 
 
-def set_filter_cutoff_freq(obj: int, value: float) -> int:
-    dll.TAiChannel_setFilterCutoffFreq.argtypes = [c_uint_, c_double]
-    return dll.TAiChannel_setFilterCutoffFreq(obj, c_double(value))
+@prototype("TAiChannel_setFilterCutoffFreq", [c_uint_, c_double])
+def set_filter_cutoff_freq(obj: int, value: float) -> int: ...
 
 
-def get_filter_cutoff_freq1(obj: int) -> float:
-    dll.TAiChannel_getFilterCutoffFreq1.restype = c_double
-    dll.TAiChannel_getFilterCutoffFreq1.argtypes = [c_uint_]
-    return dll.TAiChannel_getFilterCutoffFreq1(obj)
+@prototype("TAiChannel_getFilterCutoffFreq1", [c_uint_], restype=c_double)
+def get_filter_cutoff_freq1(obj: int) -> float: ...
 
 
-def set_filter_cutoff_freq1(obj: int, value: float) -> int:
-    dll.TAiChannel_setFilterCutoffFreq1.argtypes = [c_uint_, c_double]
-    return dll.TAiChannel_setFilterCutoffFreq1(obj, c_double(value))
+@prototype("TAiChannel_setFilterCutoffFreq1", [c_uint_, c_double])
+def set_filter_cutoff_freq1(obj: int, value: float) -> int: ...
 
 
-def get_coupling_type(obj: int) -> int:
-    dll.TAiChannel_getCouplingType.restype = c_int
-    dll.TAiChannel_getCouplingType.argtypes = [c_uint_]
-    return dll.TAiChannel_getCouplingType(obj)
+@prototype("TAiChannel_getCouplingType", [c_uint_], restype=c_int)
+def get_coupling_type(obj: int) -> int: ...
 
 
-def set_coupling_type(obj: int, couplingTypeValue: int) -> int:
-    dll.TAiChannel_setCouplingType.argtypes = [c_uint_, c_int32]
-    return dll.TAiChannel_setCouplingType(obj, couplingTypeValue)
+@prototype("TAiChannel_setCouplingType", [c_uint_, c_int32])
+def set_coupling_type(obj: int, couplingTypeValue: int) -> int: ...
 
 
-def get_iepe_type(obj: int) -> int:
-    dll.TAiChannel_getIepeType.restype = c_int
-    dll.TAiChannel_getIepeType.argtypes = [c_uint_]
-    return dll.TAiChannel_getIepeType(obj)
+@prototype("TAiChannel_getIepeType", [c_uint_], restype=c_int)
+def get_iepe_type(obj: int) -> int: ...
 
 
-def set_iepe_type(obj: int, iepeTypeValue: int) -> int:
-    dll.TAiChannel_setIepeType.argtypes = [c_uint_, c_int32]
-    return dll.TAiChannel_setIepeType(obj, iepeTypeValue)
+@prototype("TAiChannel_setIepeType", [c_uint_, c_int32])
+def set_iepe_type(obj: int, iepeTypeValue: int) -> int: ...
 
 
-def get_impedance_type(obj: int) -> int:
-    dll.TAiChannel_getImpedanceType.restype = c_int
-    dll.TAiChannel_getImpedanceType.argtypes = [c_uint_]
-    return dll.TAiChannel_getImpedanceType(obj)
+@prototype("TAiChannel_getImpedanceType", [c_uint_], restype=c_int)
+def get_impedance_type(obj: int) -> int: ...
 
 
-def set_impedance_type(obj: int, impedanceTypeValue: int) -> int:
-    dll.TAiChannel_setImpedanceType.argtypes = [c_uint_, c_int32]
-    return dll.TAiChannel_setImpedanceType(obj, impedanceTypeValue)
+@prototype("TAiChannel_setImpedanceType", [c_uint_, c_int32])
+def set_impedance_type(obj: int, impedanceTypeValue: int) -> int: ...
 
 
+@prototype(
+    "TAiChannel_getSensorDescription",
+    [
+        c_uint_,
+        POINTER(c_int32),
+        c_wchar_p,
+    ],
+)
 def get_sensor_description(
     obj: int,
     pSize: Array[c_int32],
     wDescArr: Array[c_wchar],
-) -> int:
-    dll.TAiChannel_getSensorDescription.argtypes = [
-        c_uint_,
-        POINTER(c_int32),
-        c_wchar_p,
-    ]
-    return dll.TAiChannel_getSensorDescription(obj, pSize, wDescArr)
+) -> int: ...
 
 
-def set_sensor_description(obj: int, size: int, wDescArr: Array[c_wchar]) -> int:
-    dll.TAiChannel_setSensorDescription.argtypes = [
+@prototype(
+    "TAiChannel_setSensorDescription",
+    [
         c_uint_,
         c_int32,
         c_wchar_p,
-    ]
-    return dll.TAiChannel_setSensorDescription(obj, size, wDescArr)
+    ],
+)
+def set_sensor_description(obj: int, size: int, wDescArr: Array[c_wchar]) -> int: ...
 
 
+@prototype(
+    "TAiChannel_getScaleTable",
+    [
+        c_uint_,
+        POINTER(c_int32),
+        POINTER(MapFuncPiece),
+    ],
+)
 def get_scale_table(
     obj: int,
     pSize: Array[c_int32],
     mapFuncPieceTable: Array[MapFuncPiece],
-) -> int:
-    dll.TAiChannel_getScaleTable.argtypes = [
-        c_uint_,
-        POINTER(c_int32),
-        POINTER(MapFuncPiece),
-    ]
-    return dll.TAiChannel_getScaleTable(obj, pSize, mapFuncPieceTable)
+) -> int: ...
 
 
-def set_scale_table(obj: int, size: int, mapFuncPieceTable: Array[MapFuncPiece]) -> int:
-    dll.TAiChannel_setScaleTable.argtypes = [
+@prototype(
+    "TAiChannel_setScaleTable",
+    [
         c_uint_,
         c_int32,
         POINTER(MapFuncPiece),
-    ]
-    return dll.TAiChannel_setScaleTable(obj, size, mapFuncPieceTable)
+    ],
+)
+def set_scale_table(
+    obj: int, size: int, mapFuncPieceTable: Array[MapFuncPiece]
+) -> int: ...
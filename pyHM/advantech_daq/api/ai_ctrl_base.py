@@ -1,23 +1,17 @@
 from ctypes import c_int32
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = ["get_channel_count", "get_channels", "get_features"]
 
 
-def get_features(obj: int) -> int:
-    dll.TAiCtrlBase_getFeatures.argtypes = [c_uint_]
-    dll.TAiCtrlBase_getFeatures.restype = c_uint_
-    return dll.TAiCtrlBase_getFeatures(obj)
+@prototype("TAiCtrlBase_getFeatures", [c_uint_], restype=c_uint_)
+def get_features(obj: int) -> int: ...
 
 
-def get_channels(obj: int) -> int:
-    dll.TAiCtrlBase_getChannels.restype = c_uint_
-    dll.TAiCtrlBase_getChannels.argtypes = [c_uint_]
-    return dll.TAiCtrlBase_getChannels(obj)
+@prototype("TAiCtrlBase_getChannels", [c_uint_], restype=c_uint_)
+def get_channels(obj: int) -> int: ...
 
 
-def get_channel_count(obj: int) -> int:
-    dll.TAiCtrlBase_getChannelCount.restype = c_int32
-    dll.TAiCtrlBase_getChannelCount.argtypes = [c_uint_]
-    return dll.TAiCtrlBase_getChannelCount(obj)
+@prototype("TAiCtrlBase_getChannelCount", [c_uint_], restype=c_int32)
+def get_channel_count(obj: int) -> int: ...
@@ -3,7 +3,7 @@ from _ctypes import _Pointer
 from ctypes import POINTER, c_double, c_int, c_int8, c_int32
 
 from .. import MathInterval
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_bridge_resistances",
@@ -51,316 +51,256 @@ __all__ = [
 ]
 
 
-def get_resolution(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getResolution.restype = c_int32
-    dll.TAiFeatures_getResolution.argtypes = [c_uint_]
-    return dll.TAiFeatures_getResolution(aiFeatureObj)
+@prototype("TAiFeatures_getResolution", [c_uint_], restype=c_int32)
+def get_resolution(aiFeatureObj: int) -> int: ...
 
 
-def get_data_size(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getDataSize.restype = c_int32
-    dll.TAiFeatures_getDataSize.argtypes = [c_uint_]
-    return dll.TAiFeatures_getDataSize(aiFeatureObj)
+@prototype("TAiFeatures_getDataSize", [c_uint_], restype=c_int32)
+def get_data_size(aiFeatureObj: int) -> int: ...
 
 
-def get_data_mask(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getDataMask.restype = c_int32
-    dll.TAiFeatures_getDataMask.argtypes = [c_uint_]
-    return dll.TAiFeatures_getDataMask(aiFeatureObj)
+@prototype("TAiFeatures_getDataMask", [c_uint_], restype=c_int32)
+def get_data_mask(aiFeatureObj: int) -> int: ...
 
 
 # new: timestamp resolution
 
 
-def get_timestamp_resolution(aiFeatureObj: int) -> float:
-    dll.TAiFeatures_getTimestampResolution.restype = c_double
-    dll.TAiFeatures_getTimestampResolution.argtypes = [c_uint_]
-    return dll.TAiFeatures_getTimestampResolution(aiFeatureObj)
+@prototype("TAiFeatures_getTimestampResolution", [c_uint_], restype=c_double)
+def get_timestamp_resolution(aiFeatureObj: int) -> float: ...
 
 
 #  channel features
 
 
-def get_channel_count_max(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getChannelCountMax.restype = c_int32
-    dll.TAiFeatures_getChannelCountMax.argtypes = [c_uint_]
-    return dll.TAiFeatures_getChannelCountMax(aiFeatureObj)
+@prototype("TAiFeatures_getChannelCountMax", [c_uint_], restype=c_int32)
+def get_channel_count_max(aiFeatureObj: int) -> int: ...
 
 
-def get_channel_type(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getChannelType.restype = c_int
-    dll.TAiFeatures_getChannelType.argtypes = [c_uint_]
-    return dll.TAiFeatures_getChannelType(aiFeatureObj)
+@prototype("TAiFeatures_getChannelType", [c_uint_], restype=c_int)
+def get_channel_type(aiFeatureObj: int) -> int: ...
 
 
-def get_overall_value_range(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getOverallValueRange.restype = c_int8
-    dll.TAiFeatures_getOverallValueRange.argtypes = [c_uint_]
-    return dll.TAiFeatures_getOverallValueRange(aiFeatureObj)
+@prototype("TAiFeatures_getOverallValueRange", [c_uint_], restype=c_int8)
+def get_overall_value_range(aiFeatureObj: int) -> int: ...
 
 
-def get_value_ranges(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getValueRanges.argtypes = [c_uint_]
-    dll.TAiFeatures_getValueRanges.restype = c_uint_
-    return dll.TAiFeatures_getValueRanges(aiFeatureObj)
+@prototype("TAiFeatures_getValueRanges", [c_uint_], restype=c_uint_)
+def get_value_ranges(aiFeatureObj: int) -> int: ...
 
 
-def get_burnout_return_types(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getBurnoutReturnTypes.argtypes = [c_uint_]
-    dll.TAiFeatures_getBurnoutReturnTypes.restype = c_uint_
-    return dll.TAiFeatures_getBurnoutReturnTypes(aiFeatureObj)
+@prototype("TAiFeatures_getBurnoutReturnTypes", [c_uint_], restype=c_uint_)
+def get_burnout_return_types(aiFeatureObj: int) -> int: ...
 
 
-def get_connection_types(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getConnectionTypes.argtypes = [c_uint_]
-    dll.TAiFeatures_getConnectionTypes.restype = c_uint_
-    return dll.TAiFeatures_getConnectionTypes(aiFeatureObj)
+@prototype("TAiFeatures_getConnectionTypes", [c_uint_], restype=c_uint_)
+def get_connection_types(aiFeatureObj: int) -> int: ...
 
 
-def get_overall_connection(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getOverallConnection.restype = c_int8
-    dll.TAiFeatures_getOverallConnection.argtypes = [c_uint_]
-    return dll.TAiFeatures_getOverallConnection(aiFeatureObj)
+@prototype("TAiFeatures_getOverallConnection", [c_uint_], restype=c_int8)
+def get_overall_connection(aiFeatureObj: int) -> int: ...
 
 
 # filter
 
 
-def get_filter_types(aiFeatureObj: int) -> int:
-    dll.TAiFeatures_getFilterTypes.argtypes = [c_uint_]
-    dll.TAiFeatures_getFilterTypes.restype = c_uint_
-    return dll.TAiFeatures_getFilterTypes(aiFeatureObj)
+@prototype("TAiFeatures_getFilterTypes", [c_uint_], restype=c_uint_)
+def get_filter_types(aiFeatureObj: int) -> int: ...
 
 
+@prototype(
+    "TAiFeatures_getFilterCutoffFreqRange",
+    [
+        c_uint_,
+        POINTER(MathInterval),
+    ],
+)
 def get_filter_cutoff_freq_range(
     aiFeaturesObj: int,
     mathIntervalVal: "_Pointer[MathInterval]",
-) -> int:
-    dll.TAiFeatures_getFilterCutoffFreqRange.argtypes = [
-        c_uint_,
-        POINTER(MathInterval),
-    ]
-    return dll.TAiFeatures_getFilterCutoffFreqRange(aiFeaturesObj, mathIntervalVal)
+) -> int: ...
 
 
+@prototype(
+    "TAiFeatures_getFilterCutoffFreq1Range",
+    [
+        c_uint_,
+        POINTER(MathInterval),
+    ],
+)
 def get_filter_cutoff_freq1_range(
     aiFeaturesObj: int,
     mathIntervalVal: "_Pointer[MathInterval]",
-) -> int:
-    dll.TAiFeatures_getFilterCutoffFreq1Range.argtypes = [
-        c_uint_,
-        POINTER(MathInterval),
-    ]
-    return dll.TAiFeatures_getFilterCutoffFreq1Range(aiFeaturesObj, mathIntervalVal)
+) -> int: ...
 
 
 # CJC features
 
 
-def get_thermo_supported(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getThermoSupported.restype = c_int8
-    dll.TAiFeatures_getThermoSupported.argtypes = [c_uint_]
-    return dll.TAiFeatures_getThermoSupported(aiFeaturesObj)
+@prototype("TAiFeatures_getThermoSupported", [c_uint_], restype=c_int8)
+def get_thermo_supported(aiFeaturesObj: int) -> int: ...
 
 
-def get_cjc_channels(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getCjcChannels.argtypes = [c_uint_]
-    dll.TAiFeatures_getCjcChannels.restype = c_uint_
-    return dll.TAiFeatures_getCjcChannels(aiFeaturesObj)
+@prototype("TAiFeatures_getCjcChannels", [c_uint_], restype=c_uint_)
+def get_cjc_channels(aiFeaturesObj: int) -> int: ...
 
 
 # buffered ai -> basic features
 
 
-def get_buffered_ai_supported(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getBufferedAiSupported.restype = c_int8
-    dll.TAiFeatures_getBufferedAiSupported.argtypes = [c_uint_]
-    return dll.TAiFeatures_getBufferedAiSupported(aiFeaturesObj)
+@prototype("TAiFeatures_getBufferedAiSupported", [c_uint_], restype=c_int8)
+def get_buffered_ai_supported(aiFeaturesObj: int) -> int: ...
 
 
-def get_sampling_method(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getSamplingMethod.restype = c_int
-    dll.TAiFeatures_getSamplingMethod.argtypes = [c_uint_]
-    return dll.TAiFeatures_getSamplingMethod(aiFeaturesObj)
+@prototype("TAiFeatures_getSamplingMethod", [c_uint_], restype=c_int)
+def get_sampling_method(aiFeaturesObj: int) -> int: ...
 
 
-def get_channel_start_base(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getChannelStartBase.restype = c_int32
-    dll.TAiFeatures_getChannelStartBase.argtypes = [c_uint_]
-    return dll.TAiFeatures_getChannelStartBase(aiFeaturesObj)
+@prototype("TAiFeatures_getChannelStartBase", [c_uint_], restype=c_int32)
+def get_channel_start_base(aiFeaturesObj: int) -> int: ...
 
 
-def get_channel_count_base(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getChannelCountBase.restype = c_int32
-    dll.TAiFeatures_getChannelCountBase.argtypes = [c_uint_]
-    return dll.TAiFeatures_getChannelCountBase(aiFeaturesObj)
+@prototype("TAiFeatures_getChannelCountBase", [c_uint_], restype=c_int32)
+def get_channel_count_base(aiFeaturesObj: int) -> int: ...
 
 
 # buffered ai->conversion clock features
 
 
-def get_convert_clock_sources(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getConvertClockSources.argtypes = [c_uint_]
-    dll.TAiFeatures_getConvertClockSources.restype = c_uint_
-    return dll.TAiFeatures_getConvertClockSources(aiFeaturesObj)
+@prototype("TAiFeatures_getConvertClockSources", [c_uint_], restype=c_uint_)
+def get_convert_clock_sources(aiFeaturesObj: int) -> int: ...
 
 
+@prototype(
+    "TAiFeatures_getConvertClockRange",
+    [
+        c_uint_,
+        POINTER(MathInterval),
+    ],
+)
 def get_convert_clock_range(
     aiFeaturesObj: int,
     mathIntervalValue: "_Pointer[MathInterval]",
-) -> int:
-    dll.TAiFeatures_getConvertClockRange.argtypes = [
-        c_uint_,
-        POINTER(MathInterval),
-    ]
-    return dll.TAiFeatures_getConvertClockRange(aiFeaturesObj, mathIntervalValue)
+) -> int: ...
 
 
 # buffered ai->burst scan
 
 
-def get_burst_scan_supported(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getBurstScanSupported.restype = c_int8
-    dll.TAiFeatures_getBurstScanSupported.argtypes = [c_uint_]
-    return dll.TAiFeatures_getBurstScanSupported(aiFeaturesObj)
+@prototype("TAiFeatures_getBurstScanSupported", [c_uint_], restype=c_int8)
+def get_burst_scan_supported(aiFeaturesObj: int) -> int: ...
 
 
-def get_scan_clock_sources(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getScanClockSources.argtypes = [c_uint_]
-    dll.TAiFeatures_getScanClockSources.restype = c_uint_
-    return dll.TAiFeatures_getScanClockSources(aiFeaturesObj)
+@prototype("TAiFeatures_getScanClockSources", [c_uint_], restype=c_uint_)
+def get_scan_clock_sources(aiFeaturesObj: int) -> int: ...
 
 
+@prototype("TAiFeatures_getScanClockRange", [c_uint_, POINTER(MathInterval)])
 def get_scan_clock_range(
     aiFeaturesObj: int,
     mathIntervalValue: "_Pointer[MathInterval]",
-) -> int:
-    dll.TAiFeatures_getScanClockRange.argtypes = [c_uint_, POINTER(MathInterval)]
-    return dll.TAiFeatures_getScanClockRange(aiFeaturesObj, mathIntervalValue)
+) -> int: ...
 
 
-def get_scan_count_max(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getScanCountMax.restype = c_int32
-    dll.TAiFeatures_getScanCountMax.argtypes = [c_uint_]
-    return dll.TAiFeatures_getScanCountMax(aiFeaturesObj)
+@prototype("TAiFeatures_getScanCountMax", [c_uint_], restype=c_int32)
+def get_scan_count_max(aiFeaturesObj: int) -> int: ...
 
 
 # buffered ai->trigger features
 
 
-def get_retriggerable(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getRetriggerable.restype = c_int8
-    dll.TAiFeatures_getRetriggerable.argtypes = [c_uint_]
-    return dll.TAiFeatures_getRetriggerable(aiFeaturesObj)
+@prototype("TAiFeatures_getRetriggerable", [c_uint_], restype=c_int8)
+def get_retriggerable(aiFeaturesObj: int) -> int: ...
 
 
-def get_trigger_count(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getTriggerCount.restype = c_int32
-    dll.TAiFeatures_getTriggerCount.argtypes = [c_uint_]
-    return dll.TAiFeatures_getTriggerCount(aiFeaturesObj)
+@prototype("TAiFeatures_getTriggerCount", [c_uint_], restype=c_int32)
+def get_trigger_count(aiFeaturesObj: int) -> int: ...
 
 
-def get_trigger_filter_types(aiFeaturesObj: int, reserved: int) -> int:
-    dll.TAiFeatures_getTriggerFilterTypes.argtypes = [c_uint_, c_int32]
-    dll.TAiFeatures_getTriggerFilterTypes.restype = c_uint_
-    return dll.TAiFeatures_getTriggerFilterTypes(aiFeaturesObj, reserved)
+@prototype("TAiFeatures_getTriggerFilterTypes", [c_uint_, c_int32], restype=c_uint_)
+def get_trigger_filter_types(aiFeaturesObj: int, reserved: int) -> int: ...
 
 
+@prototype(
+    "TAiFeatures_getTriggerFilterCutoffFreqRange",
+    [
+        c_uint_,
+        c_int32,
+        POINTER(MathInterval),
+    ],
+)
 def get_trigger_filter_cutoff_freq_range(
     aiFeaturesObj: int,
     reserved: int,
     mathIntervalValue: "_Pointer[MathInterval]",
-) -> int:
-    dll.TAiFeatures_getTriggerFilterCutoffFreqRange.argtypes = [
-        c_uint_,
-        c_int32,
-        POINTER(MathInterval),
-    ]
-    return dll.TAiFeatures_getTriggerFilterCutoffFreqRange(
-        aiFeaturesObj, reserved, mathIntervalValue
-    )
+) -> int: ...
 
 
 # buffered ai->trigger0/1/.../x features
 
 
-def get_trigger_actions(aiFeaturesObj: int, trigger: int) -> int:
-    dll.TAiFeatures_getTriggerActions.argtypes = [c_uint_, c_int32]
-    dll.TAiFeatures_getTriggerActions.restype = c_uint_
-    return dll.TAiFeatures_getTriggerActions(aiFeaturesObj, trigger)
+@prototype("TAiFeatures_getTriggerActions", [c_uint_, c_int32], restype=c_uint_)
+def get_trigger_actions(aiFeaturesObj: int, trigger: int) -> int: ...
 
 
+@prototype(
+    "TAiFeatures_getTriggerDelayRange",
+    [
+        c_uint_,
+        c_int32,
+        POINTER(MathInterval),
+    ],
+)
 def get_trigger_delay_range(
     aiFeaturesObj: int,
     trigger: int,
     mathIntervalX: "_Pointer[MathInterval]",
-) -> int:
-    dll.TAiFeatures_getTriggerDelayRange.argtypes = [
-        c_uint_,
-        c_int32,
-        POINTER(MathInterval),
-    ]
-    return dll.TAiFeatures_getTriggerDelayRange(aiFeaturesObj, trigger, mathIntervalX)
+) -> int: ...
 
 
-def get_trigger_sources(aiFeaturesObj: int, trigger: int) -> int:
-    dll.TAiFeatures_getTriggerSources.argtypes = [c_uint_, c_int32]
-    dll.TAiFeatures_getTriggerSources.restype = c_uint_
-    return dll.TAiFeatures_getTriggerSources(aiFeaturesObj, trigger)
+@prototype("TAiFeatures_getTriggerSources", [c_uint_, c_int32], restype=c_uint_)
+def get_trigger_sources(aiFeaturesObj: int, trigger: int) -> int: ...
 
 
-def get_trigger_source_vrg(aiFeaturesObj: int, trigger: int) -> int:
-    dll.TAiFeatures_getTriggerSourceVrg.argtypes = [c_uint_, c_int32]
-    return dll.TAiFeatures_getTriggerSourceVrg(aiFeaturesObj, trigger)
+@prototype("TAiFeatures_getTriggerSourceVrg", [c_uint_, c_int32])
+def get_trigger_source_vrg(aiFeaturesObj: int, trigger: int) -> int: ...
 
 
-def get_trigger_hysteresis_index_max(aiFeaturesObj: int, trigger: int) -> float:
-    dll.TAiFeatures_getTriggerHysteresisIndexMax.argtypes = [c_uint_, c_int32]
-    dll.TAiFeatures_getTriggerHysteresisIndexMax.restype = c_double
-    return dll.TAiFeatures_getTriggerHysteresisIndexMax(aiFeaturesObj, trigger)
+@prototype(
+    "TAiFeatures_getTriggerHysteresisIndexMax", [c_uint_, c_int32], restype=c_double
+)
+def get_trigger_hysteresis_index_max(aiFeaturesObj: int, trigger: int) -> float: ...
 
 
-def get_trigger_hysteresis_index_step(aiFeaturesObj: int, trigger: int) -> int:
-    dll.TAiFeatures_getTriggerHysteresisIndexStep.argtypes = [c_uint_, c_int32]
-    return dll.TAiFeatures_getTriggerHysteresisIndexStep(aiFeaturesObj, trigger)
+@prototype("TAiFeatures_getTriggerHysteresisIndexStep", [c_uint_, c_int32])
+def get_trigger_hysteresis_index_step(aiFeaturesObj: int, trigger: int) -> int: ...
 
 
 # new coupling & IEPE & Impedance
 
 
-def get_coupling_types(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getCouplingTypes.argtypes = [c_uint_]
-    dll.TAiFeatures_getCouplingTypes.restype = c_uint_
-    return dll.TAiFeatures_getCouplingTypes(aiFeaturesObj)
+@prototype("TAiFeatures_getCouplingTypes", [c_uint_], restype=c_uint_)
+def get_coupling_types(aiFeaturesObj: int) -> int: ...
 
 
-def get_iepe_types(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getIepeTypes.argtypes = [c_uint_]
-    dll.TAiFeatures_getIepeTypes.restype = c_uint_
-    return dll.TAiFeatures_getIepeTypes(aiFeaturesObj)
+@prototype("TAiFeatures_getIepeTypes", [c_uint_], restype=c_uint_)
+def get_iepe_types(aiFeaturesObj: int) -> int: ...
 
 
-def get_impedance_types(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getImpedanceTypes.argtypes = [c_uint_]
-    dll.TAiFeatures_getImpedanceTypes.restype = c_uint_
-    return dll.TAiFeatures_getImpedanceTypes(aiFeaturesObj)
+@prototype("TAiFeatures_getImpedanceTypes", [c_uint_], restype=c_uint_)
+def get_impedance_types(aiFeaturesObj: int) -> int: ...
 
 
 # new: sensor features
 
 
-def get_measure_types(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getMeasureTypes.argtypes = [c_uint_]
-    dll.TAiFeatures_getMeasureTypes.restype = c_uint_
-    return dll.TAiFeatures_getMeasureTypes(aiFeaturesObj)
+@prototype("TAiFeatures_getMeasureTypes", [c_uint_], restype=c_uint_)
+def get_measure_types(aiFeaturesObj: int) -> int: ...
 
 
-def get_bridge_resistances(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getBridgeResistances.argtypes = [c_uint_]
-    dll.TAiFeatures_getBridgeResistances.restype = c_uint_
-    return dll.TAiFeatures_getBridgeResistances(aiFeaturesObj)
+@prototype("TAiFeatures_getBridgeResistances", [c_uint_], restype=c_uint_)
+def get_bridge_resistances(aiFeaturesObj: int) -> int: ...
 
 
-def get_exciting_voltage_range(aiFeaturesObj: int) -> int:
-    dll.TAiFeatures_getExcitingVoltageRange.argtypes = [c_uint_]
-    return dll.TAiFeatures_getExcitingVoltageRange(aiFeaturesObj)
+@prototype("TAiFeatures_getExcitingVoltageRange", [c_uint_])
+def get_exciting_voltage_range(aiFeaturesObj: int) -> int: ...
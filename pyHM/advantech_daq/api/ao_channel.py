@@ -2,7 +2,7 @@ from _ctypes import Array
 from ctypes import POINTER, c_double, c_int32
 
 from .. import MapFuncPiece
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_channel",
@@ -17,68 +17,62 @@ __all__ = [
 ]
 
 
-def get_channel(aoChannelObj: int) -> int:
-    dll.TAoChannel_getChannel.restype = c_int32
-    dll.TAoChannel_getChannel.argtypes = [c_uint_]
-    return dll.TAoChannel_getChannel(aoChannelObj)
+@prototype("TAoChannel_getChannel", [c_uint_], restype=c_int32)
+def get_channel(aoChannelObj: int) -> int: ...
 
 
-def get_value_range(aoChannelObj: int) -> int:
-    dll.TAoChannel_getValueRange.argtypes = [c_uint_]
-    return dll.TAoChannel_getValueRange(aoChannelObj)
+@prototype("TAoChannel_getValueRange", [c_uint_])
+def get_value_range(aoChannelObj: int) -> int: ...
 
 
-def set_value_range(aoChannelObj: int, valueRange: int) -> int:
-    dll.TAoChannel_setValueRange.argtypes = [c_uint_, c_int32]
-    return dll.TAoChannel_setValueRange(aoChannelObj, valueRange)
+@prototype("TAoChannel_setValueRange", [c_uint_, c_int32])
+def set_value_range(aoChannelObj: int, valueRange: int) -> int: ...
 
 
-def get_ext_ref_bipolar(aoChannelObj: int) -> float:
-    dll.TAoChannel_getExtRefBipolar.restype = c_double
-    dll.TAoChannel_getExtRefBipolar.argtypes = [c_uint_]
-    return dll.TAoChannel_getExtRefBipolar(aoChannelObj)
+@prototype("TAoChannel_getExtRefBipolar", [c_uint_], restype=c_double)
+def get_ext_ref_bipolar(aoChannelObj: int) -> float: ...
 
 
-def set_ext_ref_bipolar(aoChannelObj: int, value: float) -> int:
-    dll.TAoChannel_setExtRefBipolar.argtypes = [c_uint_, c_double]
-    return dll.TAoChannel_setExtRefBipolar(aoChannelObj, c_double(value))
+@prototype("TAoChannel_setExtRefBipolar", [c_uint_, c_double])
+def set_ext_ref_bipolar(aoChannelObj: int, value: float) -> int: ...
 
 
-def get_ext_ref_unipolar(aoChannelObj: int) -> float:
-    dll.TAoChannel_getExtRefUnipolar.restype = c_double
-    dll.TAoChannel_getExtRefUnipolar.argtypes = [c_uint_]
-    return dll.TAoChannel_getExtRefUnipolar(aoChannelObj)
+@prototype("TAoChannel_getExtRefUnipolar", [c_uint_], restype=c_double)
+def get_ext_ref_unipolar(aoChannelObj: int) -> float: ...
 
 
-def set_ext_ref_unipolar(aoChannelObj: int, value: float) -> int:
-    dll.TAoChannel_setExtRefUnipolar.argtypes = [c_uint_, c_double]
-    return dll.TAoChannel_setExtRefUnipolar(aoChannelObj, c_double(value))
+@prototype("TAoChannel_setExtRefUnipolar", [c_uint_, c_double])
+def set_ext_ref_unipolar(aoChannelObj: int, value: float) -> int: ...
 
 
 # new: scale table
 
 
+@prototype(
+    "TAoChannel_getScaleTable",
+    [
+        c_uint_,
+        POINTER(c_int32),
+        POINTER(MapFuncPiece),
+    ],
+)
 def get_scale_table(
     aoChannelObj: int,
     pSize: Array[c_int32],
     mapFuncPieceTable: Array[MapFuncPiece],
-) -> int:
-    dll.TAoChannel_getScaleTable.argtypes = [
-        c_uint_,
-        POINTER(c_int32),
-        POINTER(MapFuncPiece),
-    ]
-    return dll.TAoChannel_getScaleTable(aoChannelObj, pSize, mapFuncPieceTable)
+) -> int: ...
 
 
+@prototype(
+    "TAoChannel_setScaleTable",
+    [
+        c_uint_,
+        c_int32,
+        POINTER(MapFuncPiece),
+    ],
+)
 def set_scale_table(
     aoChannelObj: int,
     size: int,
     mapFuncPieceTable: Array[MapFuncPiece],
-) -> int:
-    dll.TAoChannel_setScaleTable.argtypes = [
-        c_uint_,
-        c_int32,
-        POINTER(MapFuncPiece),
-    ]
-    return dll.TAoChannel_setScaleTable(aoChannelObj, size, mapFuncPieceTable)
+) -> int: ...
@@ -1,6 +1,6 @@
 from ctypes import c_double, c_int32
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_channel_count",
@@ -13,41 +13,29 @@ __all__ = [
 ]
 
 
-def get_features(obj: int) -> int:
-    dll.TAoCtrlBase_getFeatures.argtypes = [c_uint_]
-    dll.TAoCtrlBase_getFeatures.restype = c_uint_
-    return dll.TAoCtrlBase_getFeatures(obj)
+@prototype("TAoCtrlBase_getFeatures", [c_uint_], restype=c_uint_)
+def get_features(obj: int) -> int: ...
 
 
-def get_channels(obj: int) -> int:
-    dll.TAoCtrlBase_getChannels.argtypes = [c_uint_]
-    dll.TAoCtrlBase_getChannels.restype = c_uint_
-    return dll.TAoCtrlBase_getChannels(obj)
+@prototype("TAoCtrlBase_getChannels", [c_uint_], restype=c_uint_)
+def get_channels(obj: int) -> int: ...
 
 
-def get_channel_count(obj: int) -> int:
-    dll.TAoCtrlBase_getChannelCount.restype = c_int32
-    dll.TAoCtrlBase_getChannelCount.argtypes = [c_uint_]
-    return dll.TAoCtrlBase_getChannelCount(obj)
+@prototype("TAoCtrlBase_getChannelCount", [c_uint_], restype=c_int32)
+def get_channel_count(obj: int) -> int: ...
 
 
-def get_ext_ref_value_for_unipolar(obj: int) -> float:
-    dll.TAoCtrlBase_getExtRefValueForUnipolar.restype = c_double
-    dll.TAoCtrlBase_getExtRefValueForUnipolar.argtypes = [c_uint_]
-    return dll.TAoCtrlBase_getExtRefValueForUnipolar(obj)
+@prototype("TAoCtrlBase_getExtRefValueForUnipolar", [c_uint_], restype=c_double)
+def get_ext_ref_value_for_unipolar(obj: int) -> float: ...
 
 
-def set_ext_ref_value_for_unipolar(obj: int, value: float) -> int:
-    dll.TAoCtrlBase_setExtRefValueForUnipolar.argtypes = [c_uint_, c_double]
-    return dll.TAoCtrlBase_setExtRefValueForUnipolar(obj, c_double(value))
+@prototype("TAoCtrlBase_setExtRefValueForUnipolar", [c_uint_, c_double])
+def set_ext_ref_value_for_unipolar(obj: int, value: float) -> int: ...
 
 
-def get_ext_ref_value_for_bipolar(obj: int) -> float:
-    dll.TAoCtrlBase_getExtRefValueForBipolar.restype = c_double
-    dll.TAoCtrlBase_getExtRefValueForBipolar.argtypes = [c_uint_]
-    return dll.TAoCtrlBase_getExtRefValueForBipolar(obj)
+@prototype("TAoCtrlBase_getExtRefValueForBipolar", [c_uint_], restype=c_double)
+def get_ext_ref_value_for_bipolar(obj: int) -> float: ...
 
 
-def set_ext_ref_value_for_bipolar(obj: int, value: float) -> int:
-    dll.TAoCtrlBase_setExtRefValueForBipolar.argtypes = [c_uint_, c_double]
-    return dll.TAoCtrlBase_setExtRefValueForBipolar(obj, c_double(value))
+@prototype("TAoCtrlBase_setExtRefValueForBipolar", [c_uint_, c_double])
+def set_ext_ref_value_for_bipolar(obj: int, value: float) -> int: ...
@@ -3,7 +3,7 @@ from _ctypes import _Pointer
 from ctypes import POINTER, c_int8, c_int32
 
 from .. import MathInterval
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_buffered_ao_supported",
@@ -27,137 +27,111 @@ __all__ = [
 ]
 
 
-def get_resolution(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getResolution.restype = c_int32
-    dll.TAoFeatures_getResolution.argtypes = [c_uint_]
-    return dll.TAoFeatures_getResolution(aoFeatureObj)
+@prototype("TAoFeatures_getResolution", [c_uint_], restype=c_int32)
+def get_resolution(aoFeatureObj: int) -> int: ...
 
 
-def get_data_size(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getDataSize.restype = c_int32
-    dll.TAoFeatures_getDataSize.argtypes = [c_uint_]
-    return dll.TAoFeatures_getDataSize(aoFeatureObj)
+@prototype("TAoFeatures_getDataSize", [c_uint_], restype=c_int32)
+def get_data_size(aoFeatureObj: int) -> int: ...
 
 
-def get_data_mask(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getDataMask.restype = c_int32
-    dll.TAoFeatures_getDataMask.argtypes = [c_uint_]
-    return dll.TAoFeatures_getDataMask(aoFeatureObj)
+@prototype("TAoFeatures_getDataMask", [c_uint_], restype=c_int32)
+def get_data_mask(aoFeatureObj: int) -> int: ...
 
 
 # channel features
 
 
-def get_channel_count_max(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getChannelCountMax.restype = c_int32
-    dll.TAoFeatures_getChannelCountMax.argtypes = [c_uint_]
-    return dll.TAoFeatures_getChannelCountMax(aoFeatureObj)
+@prototype("TAoFeatures_getChannelCountMax", [c_uint_], restype=c_int32)
+def get_channel_count_max(aoFeatureObj: int) -> int: ...
 
 
-def get_value_ranges(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getValueRanges.argtypes = [c_uint_]
-    dll.TAoFeatures_getValueRanges.restype = c_uint_
-    return dll.TAoFeatures_getValueRanges(aoFeatureObj)
+@prototype("TAoFeatures_getValueRanges", [c_uint_], restype=c_uint_)
+def get_value_ranges(aoFeatureObj: int) -> int: ...
 
 
-def get_external_ref_anti_polar(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getExternalRefAntiPolar.restype = c_int8
-    dll.TAoFeatures_getExternalRefAntiPolar.argtypes = [c_uint_]
-    return dll.TAoFeatures_getExternalRefAntiPolar(aoFeatureObj)
+@prototype("TAoFeatures_getExternalRefAntiPolar", [c_uint_], restype=c_int8)
+def get_external_ref_anti_polar(aoFeatureObj: int) -> int: ...
 
 
+@prototype("TAoFeatures_getExternalRefRange", [c_uint_, POINTER(MathInterval)])
 def get_external_ref_range(
     aoFeatureObj: int,
     mathIntervalObj: "_Pointer[MathInterval]",
-) -> int:
-    dll.TAoFeatures_getExternalRefRange.argtypes = [c_uint_, POINTER(MathInterval)]
-    return dll.TAoFeatures_getExternalRefRange(aoFeatureObj, mathIntervalObj)
+) -> int: ...
 
 
 # buffered ao->basic features
 
 
-def get_buffered_ao_supported(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getBufferedAoSupported.restype = c_int8
-    dll.TAoFeatures_getBufferedAoSupported.argtypes = [c_uint_]
-    return dll.TAoFeatures_getBufferedAoSupported(aoFeatureObj)
+@prototype("TAoFeatures_getBufferedAoSupported", [c_uint_], restype=c_int8)
+def get_buffered_ao_supported(aoFeatureObj: int) -> int: ...
 
 
-def get_sampling_method(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getSamplingMethod.argtypes = [c_uint_]
-    return dll.TAoFeatures_getSamplingMethod(aoFeatureObj)
+@prototype("TAoFeatures_getSamplingMethod", [c_uint_])
+def get_sampling_method(aoFeatureObj: int) -> int: ...
 
 
-def get_channel_start_base(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getChannelStartBase.restype = c_int32
-    dll.TAoFeatures_getChannelStartBase.argtypes = [c_uint_]
-    return dll.TAoFeatures_getChannelStartBase(aoFeatureObj)
+@prototype("TAoFeatures_getChannelStartBase", [c_uint_], restype=c_int32)
+def get_channel_start_base(aoFeatureObj: int) -> int: ...
 
 
-def get_channel_count_base(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getChannelCountBase.restype = c_int32
-    dll.TAoFeatures_getChannelCountBase.argtypes = [c_uint_]
-    return dll.TAoFeatures_getChannelCountBase(aoFeatureObj)
+@prototype("TAoFeatures_getChannelCountBase", [c_uint_], restype=c_int32)
+def get_channel_count_base(aoFeatureObj: int) -> int: ...
 
 
 # buffered ao->conversion clock features
 
 
-def get_convert_clock_sources(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getConvertClockSources.argtypes = [c_uint_]
-    dll.TAoFeatures_getConvertClockSources.restype = c_uint_
-    return dll.TAoFeatures_getConvertClockSources(aoFeatureObj)
+@prototype("TAoFeatures_getConvertClockSources", [c_uint_], restype=c_uint_)
+def get_convert_clock_sources(aoFeatureObj: int) -> int: ...
 
 
+@prototype(
+    "TAoFeatures_getConvertClockRange",
+    [
+        c_uint_,
+        POINTER(MathInterval),
+    ],
+)
 def get_convert_clock_range(
     aoFeatureObj: int,
     mathInterval: "_Pointer[MathInterval]",
-) -> int:
-    dll.TAoFeatures_getConvertClockRange.argtypes = [
-        c_uint_,
-        POINTER(MathInterval),
-    ]
-    return dll.TAoFeatures_getConvertClockRange(aoFeatureObj, mathInterval)
+) -> int: ...
 
 
 # buffered ao->trigger features
 
 
-def get_trigger_count(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getTriggerCount.restype = c_int32
-    dll.TAoFeatures_getTriggerCount.argtypes = [c_uint_]
-    return dll.TAoFeatures_getTriggerCount(aoFeatureObj)
+@prototype("TAoFeatures_getTriggerCount", [c_uint_], restype=c_int32)
+def get_trigger_count(aoFeatureObj: int) -> int: ...
 
 
-def get_retriggerable(aoFeatureObj: int) -> int:
-    dll.TAoFeatures_getRetriggerable.restype = c_int8
-    dll.TAoFeatures_getRetriggerable.argtypes = [c_uint_]
-    return dll.TAoFeatures_getRetriggerable(aoFeatureObj)
+@prototype("TAoFeatures_getRetriggerable", [c_uint_], restype=c_int8)
+def get_retriggerable(aoFeatureObj: int) -> int: ...
 
 
 # buffered ao->trigger0/1/.../x features
 
 
-def get_trigger_sources(aoFeatureObj: int, trigger: int) -> int:
-    dll.TAoFeatures_getTriggerSources.argtypes = [c_uint_, c_int32]
-    dll.TAoFeatures_getTriggerSources.restype = c_uint_
-    return dll.TAoFeatures_getTriggerSources(aoFeatureObj, trigger)
+@prototype("TAoFeatures_getTriggerSources", [c_uint_, c_int32], restype=c_uint_)
+def get_trigger_sources(aoFeatureObj: int, trigger: int) -> int: ...
 
 
-def get_trigger_actions(aoFeatureObj: int, trigger: int) -> int:
-    dll.TAoFeatures_getTriggerActions.argtypes = [c_uint_, c_int32]
-    dll.TAoFeatures_getTriggerActions.restype = c_uint_
-    return dll.TAoFeatures_getTriggerActions(aoFeatureObj, trigger)
+@prototype("TAoFeatures_getTriggerActions", [c_uint_, c_int32], restype=c_uint_)
+def get_trigger_actions(aoFeatureObj: int, trigger: int) -> int: ...
 
 
+@prototype(
+    "TAoFeatures_getTriggerDelayRange",
+    [
+        c_uint_,
+        c_int32,
+        POINTER(MathInterval),
+    ],
+)
 def get_trigger_delay_range(
     aoFeatureObj: int,
     trigger: int,
     mathIntervalX: "_Pointer[MathInterval]",
-):
-    dll.TAoFeatures_getTriggerDelayRange.argtypes = [
-        c_uint_,
-        c_int32,
-        POINTER(MathInterval),
-    ]
-    return dll.TAoFeatures_getTriggerDelayRange(aoFeatureObj, trigger, mathIntervalX)
+): ...
@@ -1,36 +1,42 @@
-from ctypes import POINTER, c_byte, c_int, c_int32, c_int64, cast
-from typing import Callable
+from ctypes import addressof, c_byte, c_int, c_int32, c_int64, memmove, sizeof
+from typing import TYPE_CHECKING, Any, Callable
 
 from .. import (
     AccessMode,
     ActiveSignal,
     AISignalType,
     BurnoutRetType,
-    CounterCapability,
-    CounterCascadeGroup,
-    CountingType,
     CouplingType,
     DeviceTreeNode,
     DOCircuitType,
     EventId,
     FilterType,
-    FreqMeasureMethod,
     IEPEType,
     ImpedanceType,
-    OutSignalType,
-    SignalDrop,
     SignalPolarity,
     TerminalBoard,
     TriggerAction,
     ValueRange,
     utils,
 )
-from . import c_uint_, dll
+from . import c_uint_, prototype
+
+if TYPE_CHECKING:
+    from .. import (
+        CounterCapability,
+        CounterCascadeGroup,
+        CountingType,
+        FreqMeasureMethod,
+        OutSignalType,
+        SignalDrop,
+    )
 
 __all__ = [
     "dispose",
     "get_item",
+    "get_items",
     "get_length",
+    "get_values",
     "to_access_mode",
     "to_active_signal",
     "to_ai_signal_type",
@@ -60,18 +66,38 @@ __all__ = [
 ]
 
 
+def get_items[_CT](dtype: type[_CT], TArrayObj: int) -> Any:
+    """Copy the items of a native array into a ctypes array at once
+
+    The native items are usually stored contiguously, and then the whole storage
+    is copied in one go. Otherwise, the items are copied one by one.
+    """
+    count: int = get_length(TArrayObj) if TArrayObj else 0
+    items: Any = (dtype * max(count, 0))()
+    if count <= 0:
+        return items
+    item_size: int = sizeof(dtype)
+    first: int = get_item(TArrayObj, 0)
+    if count == 1 or get_item(TArrayObj, count - 1) - first == (count - 1) * item_size:
+        memmove(items, first, count * item_size)
+    else:
+        for i in range(count):
+            memmove(addressof(items) + i * item_size, get_item(TArrayObj, i), item_size)
+    return items
+
+
+def get_values[_CT](dtype: type[_CT], TArrayObj: int) -> list[Any]:
+    """Get the values of a native array of a simple ctypes type at once"""
+    # `memoryview` knows no ctypes formats like `<i`, but it knows the native ones
+    return memoryview(get_items(dtype, TArrayObj)).cast("B").cast(dtype._type_).tolist()
+
+
 def to_simple_type[_CT, T2](
     dtype: type[_CT], TArrayObj: int, auto_free: bool
 ) -> list[T2]:
-    if TArrayObj == 0 or get_length(TArrayObj) == 0:
+    if TArrayObj == 0:
         return []
-    count: int = get_length(TArrayObj)
-    arr: list[T2] = []
-    for i in range(count):
-        item: int = get_item(TArrayObj, i)
-        int_obj: _CT = cast(item, POINTER(dtype)).contents
-        arr.append(int_obj.value)
-
+    arr: list[T2] = get_values(dtype, TArrayObj)
     if auto_free:
         dispose(TArrayObj)
     return arr
@@ -89,44 +115,24 @@ def to_byte(TArrayObj: int, auto_free: bool) -> list[int]:
     return to_simple_type(c_byte, TArrayObj, auto_free)
 
 
-def dispose(TArrayObj: int) -> None:
-    dll.TArray_Dispose.argtypes = [c_uint_]
-    dll.TArray_Dispose(TArrayObj)
+@prototype("TArray_Dispose", [c_uint_])
+def dispose(TArrayObj: int) -> None: ...
 
 
-def get_length(TArrayObj: int) -> int:
-    dll.TArray_getLength.argtypes = [c_uint_]
-    dll.TArray_getLength.restype = c_int32
-    return dll.TArray_getLength(TArrayObj)
+@prototype("TArray_getLength", [c_uint_], restype=c_int32)
+def get_length(TArrayObj: int) -> int: ...
 
 
-def get_item(TArrayObj: int, index: int) -> int:
-    dll.TArray_getItem.argtypes = [c_uint_, c_int32]
-    dll.TArray_getItem.restype = c_uint_
-    return dll.TArray_getItem(TArrayObj, index)
+@prototype("TArray_getItem", [c_uint_, c_int32], restype=c_uint_)
+def get_item(TArrayObj: int, index: int) -> int: ...
 
 
 def to_device_tree_node(
     native_array: int, auto_free: bool = True
 ) -> list[DeviceTreeNode]:
-    count: int = get_length(native_array)
-    device_tree_node_list: list[DeviceTreeNode] = []
-    for i in range(count):
-        item = get_item(native_array, i)
-        device_tree_node_obj_save: DeviceTreeNode = DeviceTreeNode()
-        device_tree_node_obj: DeviceTreeNode = cast(
-            item, POINTER(DeviceTreeNode)
-        ).contents
-
-        device_tree_node_obj_save.DeviceNumber = device_tree_node_obj.DeviceNumber
-        device_tree_node_obj_save.Description = device_tree_node_obj.Description
-        for j in range(8):
-            device_tree_node_obj_save.ModulesIndex[j] = (
-                device_tree_node_obj.ModulesIndex[j]
-            )
-
-        device_tree_node_list.append(device_tree_node_obj_save)
-        del device_tree_node_obj
+    device_tree_node_list: list[DeviceTreeNode] = list(
+        get_items(DeviceTreeNode, native_array)
+    )
     if auto_free:
         dispose(native_array)
     return device_tree_node_list
@@ -137,100 +143,105 @@ def to_enum[T](
 ) -> list[T]:
     if p_array_obj == 0:
         return []
-    count: int = get_length(p_array_obj)
-    data_list: list[T] = []
-    for i in range(count):
-        item = get_item(p_array_obj, i)
-        enum_value = cast(item, POINTER(c_int)).contents.value
-        # cast to enum
-        enum_obj: T = convert(enum_value)
-        data_list.append(enum_obj)
+    data_list: list[T] = list(map(convert, get_values(c_int, p_array_obj)))
     if auto_free:
         dispose(p_array_obj)
     return data_list
 
 
 def to_terminal_board(native_array: int, auto_free: bool) -> list[TerminalBoard]:
-    return to_enum(native_array, auto_free, utils.toTerminalBoard)
+    return to_enum(native_array, auto_free, utils.enum_decoder(TerminalBoard))
 
 
 def to_event_id(native_array: int, auto_free: bool) -> list[EventId]:
-    return to_enum(native_array, auto_free, utils.toEventId)
+    return to_enum(native_array, auto_free, utils.enum_decoder(EventId))
 
 
 def to_access_mode(native_array: int, auto_free: bool) -> list[AccessMode]:
-    return to_enum(native_array, auto_free, utils.toAccessMode)
+    return to_enum(native_array, auto_free, utils.enum_decoder(AccessMode))
 
 
 def to_value_range(native_array: int, auto_free: bool) -> list[ValueRange]:
-    return to_enum(native_array, auto_free, utils.toValueRange)
+    return to_enum(native_array, auto_free, utils.enum_decoder(ValueRange))
 
 
 def to_ai_signal_type(native_array: int, auto_free: bool) -> list[AISignalType]:
-    return to_enum(native_array, auto_free, utils.toAISignalType)
+    return to_enum(native_array, auto_free, utils.enum_decoder(AISignalType))
 
 
 def to_burnout_ret_type(native_array: int, auto_free: bool) -> list[BurnoutRetType]:
-    return to_enum(native_array, auto_free, utils.toBurnoutRetType)
+    return to_enum(native_array, auto_free, utils.enum_decoder(BurnoutRetType))
 
 
 def to_filter_type(native_array: int, auto_free: bool) -> list[FilterType]:
-    return to_enum(native_array, auto_free, utils.toFilterType)
+    return to_enum(native_array, auto_free, utils.enum_decoder(FilterType))
 
 
-def to_signal_drop(native_array: int, auto_free: bool) -> list[SignalDrop]:
-    return to_enum(native_array, auto_free, utils.toSignalDrop)
+def to_signal_drop(native_array: int, auto_free: bool) -> "list[SignalDrop]":
+    from .. import SignalDrop
+
+    return to_enum(native_array, auto_free, utils.enum_decoder(SignalDrop))
 
 
 def to_active_signal(native_array: int, auto_free: bool) -> list[ActiveSignal]:
-    return to_enum(native_array, auto_free, utils.toActiveSignal)
+    return to_enum(native_array, auto_free, utils.enum_decoder(ActiveSignal))
 
 
 def to_trigger_action(native_array: int, auto_free: bool) -> list[TriggerAction]:
-    return to_enum(native_array, auto_free, utils.toTriggerAction)
+    return to_enum(native_array, auto_free, utils.enum_decoder(TriggerAction))
 
 
 def to_counter_capability(
     native_array: int, auto_free: bool
-) -> list[CounterCapability]:
-    return to_enum(native_array, auto_free, utils.toCounterCapability)
+) -> "list[CounterCapability]":
+    from .. import CounterCapability
+
+    return to_enum(native_array, auto_free, utils.enum_decoder(CounterCapability))
 
 
 def to_signal_polarity(native_array: int, auto_free: bool) -> list[SignalPolarity]:
-    return to_enum(native_array, auto_free, utils.toSignalPolarity)
+    return to_enum(native_array, auto_free, utils.enum_decoder(SignalPolarity))
+
 
+def to_out_signal_type(native_array: int, auto_free: bool) -> "list[OutSignalType]":
+    from .. import OutSignalType
 
-def to_out_signal_type(native_array: int, auto_free: bool) -> list[OutSignalType]:
-    return to_enum(native_array, auto_free, utils.toOutSignalType)
+    return to_enum(native_array, auto_free, utils.enum_decoder(OutSignalType))
 
 
 def to_freq_measure_method(
     native_array: int, auto_free: bool
-) -> list[FreqMeasureMethod]:
-    return to_enum(native_array, auto_free, utils.toFreqMeasureMethod)
+) -> "list[FreqMeasureMethod]":
+    from .. import FreqMeasureMethod
+
+    return to_enum(native_array, auto_free, utils.enum_decoder(FreqMeasureMethod))
 
 
 def to_counter_cascade_group(
     native_array: int, auto_free: bool
-) -> list[CounterCascadeGroup]:
-    return to_enum(native_array, auto_free, utils.toCounterCascadeGroup)
+) -> "list[CounterCascadeGroup]":
+    from .. import CounterCascadeGroup
+
+    return to_enum(native_array, auto_free, utils.enum_decoder(CounterCascadeGroup))
+
 
+def to_counting_type(native_array: int, auto_free: bool) -> "list[CountingType]":
+    from .. import CountingType
 
-def to_counting_type(native_array: int, auto_free: bool) -> list[CountingType]:
-    return to_enum(native_array, auto_free, utils.toCountingType)
+    return to_enum(native_array, auto_free, utils.enum_decoder(CountingType))
 
 
 def to_coupling_type(native_array: int, auto_free: bool) -> list[CouplingType]:
-    return to_enum(native_array, auto_free, utils.toCouplingType)
+    return to_enum(native_array, auto_free, utils.enum_decoder(CouplingType))
 
 
 def to_iepe_type(native_array: int, auto_free: bool) -> list[IEPEType]:
-    return to_enum(native_array, auto_free, utils.toIEPEType)
+    return to_enum(native_array, auto_free, utils.enum_decoder(IEPEType))
 
 
 def to_impedance_type(native_array: int, auto_free: bool) -> list[ImpedanceType]:
-    return to_enum(native_array, auto_free, utils.toImpedanceType)
+    return to_enum(native_array, auto_free, utils.enum_decoder(ImpedanceType))
 
 
 def to_do_circuit_type(native_array: int, auto_free: bool) -> list[DOCircuitType]:
-    return to_enum(native_array, auto_free, utils.toDoCircuitType)
+    return to_enum(native_array, auto_free, utils.enum_decoder(DOCircuitType))
@@ -0,0 +1,59 @@
+from _ctypes import Array
+from ctypes import POINTER, c_int32, c_void_p
+
+from . import c_uint_, prototype
+
+__all__ = [
+    "get_conversion",
+    "get_record",
+    "get_trigger",
+    "prepare",
+    "set_data",
+    "start",
+    "stop",
+]
+
+
+@prototype("TBufferedAoCtrl_Prepare", [c_uint_])
+def prepare(obj: int) -> int: ...
+
+
+@prototype("TBufferedAoCtrl_Start", [c_uint_])
+def start(obj: int) -> int: ...
+
+
+@prototype("TBufferedAoCtrl_Stop", [c_uint_, c_int32])
+def stop(obj: int, action: int) -> int: ...
+
+
+@prototype(
+    "TBufferedAoCtrl_SetData",
+    [
+        c_uint_,
+        c_int32,
+        c_int32,
+        c_void_p,
+        c_int32,
+        POINTER(c_int32),
+    ],
+)
+def set_data(
+    obj: int,
+    dt: int,
+    count: int,
+    buffer: c_void_p,
+    timeout: int,
+    transmitted: Array[c_int32],
+) -> int: ...
+
+
+@prototype("TBufferedAoCtrl_getConversion", [c_uint_], restype=c_uint_)
+def get_conversion(obj: int) -> int: ...
+
+
+@prototype("TBufferedAoCtrl_getRecord", [c_uint_], restype=c_uint_)
+def get_record(obj: int) -> int: ...
+
+
+@prototype("TBufferedAoCtrl_getTrigger", [c_uint_, c_int32], restype=c_uint_)
+def get_trigger(obj: int, trigIdx: int) -> int: ...
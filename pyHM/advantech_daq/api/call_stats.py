@@ -0,0 +1,135 @@
+"""The count and the duration of the library calls, by the symbol name
+
+The statistics are gathered only while enabled, for the library functions are
+wrapped then. When disabled, the functions are called directly, at no cost.
+Set the `DAQ_CALL_STATS` environment variable to enable the gathering
+as the library gets loaded.
+"""
+
+from threading import Lock
+from time import perf_counter_ns
+from typing import Any, Callable
+
+from . import _set_wrapper
+
+__all__ = [
+    "CallStatistics",
+    "disable",
+    "enable",
+    "is_enabled",
+    "report",
+    "reset",
+    "statistics",
+]
+
+
+class CallStatistics:
+    """The calls of a library function
+
+    The histogram counts the calls by their duration rounded up
+    to a power of two of nanoseconds, by the exponent.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.count: int = 0
+        self.total_time: int = 0  # [ns]
+        self.max_time: int = 0  # [ns]
+        self.histogram: dict[int, int] = {}
+        self._lock: Lock = Lock()
+
+    def add(self, duration: int) -> None:
+        bucket: int = (duration - 1).bit_length() if duration > 0 else 0
+        with self._lock:
+            self.count += 1
+            self.total_time += duration
+            self.max_time = max(self.max_time, duration)
+            self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    @property
+    def mean_time(self) -> float:
+        """The mean duration of a call, [ns]"""
+        return self.total_time / self.count if self.count else 0.0
+
+
+_statistics: dict[str, CallStatistics] = {}
+# the wrappers, by the symbol name, to wrap every function once
+_wrappers: dict[str, Callable[..., Any]] = {}
+
+
+def _timed(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    wrapper: Callable[..., Any] | None = _wrappers.get(name)
+    if wrapper is not None:
+        return wrapper
+    stats: CallStatistics = _statistics.setdefault(name, CallStatistics(name))
+
+    def wrapper(*args: Any) -> Any:
+        start: int = perf_counter_ns()
+        try:
+            return function(*args)
+        finally:
+            stats.add(perf_counter_ns() - start)
+
+    wrapper.__name__ = wrapper.__qualname__ = name
+    _wrappers[name] = wrapper
+    return wrapper
+
+
+def enable() -> None:
+    """Start gathering the statistics of the library calls"""
+    _set_wrapper(_timed)
+
+
+def disable() -> None:
+    """Stop gathering the statistics, and call the library functions directly"""
+    _set_wrapper(None)
+
+
+def is_enabled() -> bool:
+    from .. import api
+
+    return api._wrapper is _timed
+
+
+def reset() -> None:
+    """Forget the statistics gathered"""
+    for stats in _statistics.values():
+        with stats._lock:
+            stats.count = stats.total_time = stats.max_time = 0
+            stats.histogram.clear()
+
+
+def statistics() -> dict[str, CallStatistics]:
+    """Get the statistics of the functions called, by the symbol name"""
+    return {name: stats for name, stats in _statistics.items() if stats.count}
+
+
+def _format_time(duration: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if duration >= scale:
+            return f"{duration / scale:.3g} {unit}"
+    return f"{duration:.3g} ns"
+
+
+def report() -> str:
+    """Tabulate the statistics, the functions that took longer going first"""
+    lines: list[str] = [
+        f"{'function':<40}{'calls':>10}{'total':>12}{'mean':>12}{'max':>12}"
+    ]
+    for stats in sorted(
+        statistics().values(), key=lambda s: s.total_time, reverse=True
+    ):
+        lines.append(
+            f"{stats.name:<40}{stats.count:>10}"
+            f"{_format_time(stats.total_time):>12}"
+            f"{_format_time(stats.mean_time):>12}"
+            f"{_format_time(stats.max_time):>12}"
+        )
+        lines.append(
+            "    "
+            + ", ".join(
+                f"≤{_format_time(1 << bucket)}: {count}"
+                for bucket, count in sorted(stats.histogram.items())
+            )
+        )
+    return "\n".join(lines)
@@ -0,0 +1,46 @@
+from ctypes import c_int32, c_uint8
+
+from . import c_uint_, prototype
+
+__all__ = [
+    "get_channel_count",
+    "get_channel_start",
+    "get_enabled",
+    "get_features",
+    "get_running",
+    "set_channel_count",
+    "set_channel_start",
+    "set_enabled",
+]
+
+
+@prototype("TCntrCtrlBase_getFeatures", [c_uint_], restype=c_uint_)
+def get_features(obj: int) -> int: ...
+
+
+@prototype("TCntrCtrlBase_getChannelStart", [c_uint_], restype=c_int32)
+def get_channel_start(obj: int) -> int: ...
+
+
+@prototype("TCntrCtrlBase_setChannelStart", [c_uint_, c_int32])
+def set_channel_start(obj: int, value: int) -> int: ...
+
+
+@prototype("TCntrCtrlBase_getChannelCount", [c_uint_], restype=c_int32)
+def get_channel_count(obj: int) -> int: ...
+
+
+@prototype("TCntrCtrlBase_setChannelCount", [c_uint_, c_int32])
+def set_channel_count(obj: int, value: int) -> int: ...
+
+
+@prototype("TCntrCtrlBase_getEnabled", [c_uint_], restype=c_uint8)
+def get_enabled(obj: int) -> int: ...
+
+
+@prototype("TCntrCtrlBase_setEnabled", [c_uint_, c_uint8])
+def set_enabled(obj: int, value: int | bool) -> int: ...
+
+
+@prototype("TCntrCtrlBase_getRunning", [c_uint_], restype=c_uint8)
+def get_running(obj: int) -> int: ...
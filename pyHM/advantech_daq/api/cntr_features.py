@@ -0,0 +1,13 @@
+from ctypes import c_int32
+
+from . import c_uint_, prototype
+
+__all__ = ["get_channel_count_max", "get_resolution"]
+
+
+@prototype("TCntrFeatures_getChannelCountMax", [c_uint_], restype=c_int32)
+def get_channel_count_max(obj: int) -> int: ...
+
+
+@prototype("TCntrFeatures_getResolution", [c_uint_], restype=c_int32)
+def get_resolution(obj: int) -> int: ...
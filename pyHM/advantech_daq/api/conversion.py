@@ -1,7 +1,7 @@
 from _ctypes import Array
 from ctypes import POINTER, c_byte, c_double, c_int32
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_channel_count",
@@ -17,62 +17,55 @@ __all__ = [
 ]
 
 
-def get_clock_source(obj: int) -> int:
-    dll.TConversion_getClockSource.argtypes = [c_uint_]
-    return dll.TConversion_getClockSource(obj)
+@prototype("TConversion_getClockSource", [c_uint_])
+def get_clock_source(obj: int) -> int: ...
 
 
-def set_clock_source(obj: int, value: int) -> int:
-    dll.TConversion_setClockSource.argtypes = [c_uint_, c_int32]
-    return dll.TConversion_setClockSource(obj, value)
+@prototype("TConversion_setClockSource", [c_uint_, c_int32])
+def set_clock_source(obj: int, value: int) -> int: ...
 
 
-def get_clock_rate(obj: int) -> float:
-    dll.TConversion_getClockRate.restype = c_double
-    dll.TConversion_getClockRate.argtypes = [c_uint_]
-    return dll.TConversion_getClockRate(obj)
+@prototype("TConversion_getClockRate", [c_uint_], restype=c_double)
+def get_clock_rate(obj: int) -> float: ...
 
 
-def set_clock_rate(obj: int, value: float) -> int:
-    dll.TConversion_setClockRate.argtypes = [c_uint_, c_double]
-    return dll.TConversion_setClockRate(obj, c_double(value))
+@prototype("TConversion_setClockRate", [c_uint_, c_double])
+def set_clock_rate(obj: int, value: float) -> int: ...
 
 
-def get_channel_start(obj: int) -> int:
-    dll.TConversion_getChannelStart.restype = c_int32
-    dll.TConversion_getChannelStart.argtypes = [c_uint_]
-    return dll.TConversion_getChannelStart(obj)
+@prototype("TConversion_getChannelStart", [c_uint_], restype=c_int32)
+def get_channel_start(obj: int) -> int: ...
 
 
-def set_channel_start(obj: int, value: int) -> int:
-    dll.TConversion_setChannelStart.argtypes = [c_uint_, c_int32]
-    return dll.TConversion_setChannelStart(obj, value)
+@prototype("TConversion_setChannelStart", [c_uint_, c_int32])
+def set_channel_start(obj: int, value: int) -> int: ...
 
 
-def get_channel_count(obj: int) -> int:
-    dll.TConversion_getChannelCount.restype = c_int32
-    dll.TConversion_getChannelCount.argtypes = [c_uint_]
-    return dll.TConversion_getChannelCount(obj)
+@prototype("TConversion_getChannelCount", [c_uint_], restype=c_int32)
+def get_channel_count(obj: int) -> int: ...
 
 
-def set_channel_count(obj: int, value: int) -> int:
-    dll.TConversion_setChannelCount.argtypes = [c_uint_, c_int32]
-    return dll.TConversion_setChannelCount(obj, value)
+@prototype("TConversion_setChannelCount", [c_uint_, c_int32])
+def set_channel_count(obj: int, value: int) -> int: ...
 
 
-def get_channel_map(obj: int, count: int, chMap: Array[c_byte]) -> int:
-    dll.TConversion_getChannelMap.argtypes = [
+@prototype(
+    "TConversion_getChannelMap",
+    [
         c_uint_,
         c_int32,
         POINTER(c_byte),
-    ]  # need attention
-    return dll.TConversion_getChannelMap(obj, count, chMap)
+    ],  # need attention
+)
+def get_channel_map(obj: int, count: int, chMap: Array[c_byte]) -> int: ...
 
 
-def set_channel_map(obj: int, count: int, chMap: Array[c_byte]) -> int:
-    dll.TConversion_setChannelMap.argtypes = [
+@prototype(
+    "TConversion_setChannelMap",
+    [
         c_uint_,
         c_int32,
         POINTER(c_byte),
-    ]  # need attention
-    return dll.TConversion_setChannelMap(obj, count, chMap)
+    ],  # need attention
+)
+def set_channel_map(obj: int, count: int, chMap: Array[c_byte]) -> int: ...
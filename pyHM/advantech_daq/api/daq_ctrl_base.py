@@ -1,13 +1,12 @@
-from ctypes import POINTER, byref, c_int32, c_void_p, c_wchar_p
+from ctypes import POINTER, c_int32, c_void_p, c_wchar_p
 
 from .. import DeviceInformation
-from . import c_uint_, dll
+from . import DaqEventProc, c_uint_, prototype
 
 __all__ = [
-    "create",
-    "load_profile",
     "add_event_handler",
     "cleanup",
+    "create",
     "dispose",
     "get_device",
     "get_module",
@@ -15,88 +14,83 @@ __all__ = [
     "get_state",
     "get_supported_devices",
     "get_supported_modes",
+    "load_profile",
     "remove_event_handler",
     "set_selected_device",
 ]
 
 
-def add_event_handler(obj: int, eventId: int, eventProc: int, userParam: int) -> None:
-    dll.TDaqCtrlBase_addEventHandler.argtypes = [c_uint_]
-    dll.TDaqCtrlBase_addEventHandler(
-        obj, eventId, eventProc, userParam
-    )  # after add types
+@prototype(
+    "TDaqCtrlBase_addEventHandler",
+    [c_uint_, c_int32, DaqEventProc, c_void_p],  # EventId
+    restype=None,
+)
+def add_event_handler(
+    obj: int, eventId: int, eventProc: DaqEventProc, userParam: int | None
+) -> None: ...
 
 
+@prototype(
+    "TDaqCtrlBase_removeEventHandler",
+    [c_uint_, c_int32, DaqEventProc, c_void_p],  # EventId
+    restype=None,
+)
 def remove_event_handler(
-    obj: int, eventId: int, eventProc: int, userParam: int
-) -> None:
-    dll.TDaqCtrlBase_removeEventHandler.argtypes = [c_uint_]
-    dll.TDaqCtrlBase_removeEventHandler(
-        obj, eventId, eventProc, userParam
-    )  # after add types
+    obj: int, eventId: int, eventProc: DaqEventProc, userParam: int | None
+) -> None: ...
 
 
-def cleanup(obj: int) -> None:
-    dll.TDaqCtrlBase_Cleanup.argtypes = [c_uint_]
-    dll.TDaqCtrlBase_Cleanup(obj)
+@prototype("TDaqCtrlBase_Cleanup", [c_uint_])
+def cleanup(obj: int) -> None: ...
 
 
-def dispose(obj: int) -> None:
-    dll.TDaqCtrlBase_Dispose.argtypes = [c_uint_]
-    dll.TDaqCtrlBase_Dispose(obj)
+@prototype("TDaqCtrlBase_Dispose", [c_uint_])
+def dispose(obj: int) -> None: ...
 
 
-def get_selected_device(obj: int, devInfo: DeviceInformation) -> int:
-    dll.TDaqCtrlBase_getSelectedDevice.argtypes = [
+@prototype(
+    "TDaqCtrlBase_getSelectedDevice",
+    [
         c_uint_,
         POINTER(DeviceInformation),
-    ]
-    return dll.TDaqCtrlBase_getSelectedDevice(obj, byref(devInfo))
+    ],
+)
+def get_selected_device(obj: int, devInfo: DeviceInformation) -> int: ...
 
 
-def set_selected_device(obj: int, devInfo: DeviceInformation) -> int:
-    dll.TDaqCtrlBase_setSelectedDevice.argtypes = [
+@prototype(
+    "TDaqCtrlBase_setSelectedDevice",
+    [
         c_uint_,
         POINTER(DeviceInformation),
-    ]
-    return dll.TDaqCtrlBase_setSelectedDevice(obj, byref(devInfo))
+    ],
+)
+def set_selected_device(obj: int, devInfo: DeviceInformation) -> int: ...
 
 
-def get_state(obj: int) -> int:
-    dll.TDaqCtrlBase_getState.argtypes = [c_uint_]
-    return dll.TDaqCtrlBase_getState(obj)
+@prototype("TDaqCtrlBase_getState", [c_uint_])
+def get_state(obj: int) -> int: ...
 
 
-def get_device(obj: int) -> int:
-    dll.TDaqCtrlBase_getDevice.argtypes = [c_uint_]
-    dll.TDaqCtrlBase_getDevice.restype = c_void_p
-    return dll.TDaqCtrlBase_getDevice(obj)
+@prototype("TDaqCtrlBase_getDevice", [c_uint_], restype=c_void_p)
+def get_device(obj: int) -> int: ...
 
 
-def get_supported_devices(obj: int) -> int:
-    dll.TDaqCtrlBase_getSupportedDevices.argtypes = [c_uint_]
-    dll.TDaqCtrlBase_getSupportedDevices.restype = c_uint_
-    return dll.TDaqCtrlBase_getSupportedDevices(obj)
+@prototype("TDaqCtrlBase_getSupportedDevices", [c_uint_], restype=c_uint_)
+def get_supported_devices(obj: int) -> int: ...
 
 
-def get_supported_modes(obj: int) -> int:
-    dll.TDaqCtrlBase_getSupportedModes.argtypes = [c_uint_]
-    dll.TDaqCtrlBase_getSupportedModes.restype = c_uint_
-    return dll.TDaqCtrlBase_getSupportedModes(obj)
+@prototype("TDaqCtrlBase_getSupportedModes", [c_uint_], restype=c_uint_)
+def get_supported_modes(obj: int) -> int: ...
 
 
-def create(scenario: int) -> int:
-    dll.TDaqCtrlBase_Create.argtypes = [c_int32]
-    dll.TDaqCtrlBase_Create.restype = c_uint_
-    return dll.TDaqCtrlBase_Create(scenario)
+@prototype("TDaqCtrlBase_Create", [c_int32], restype=c_uint_)
+def create(scenario: int) -> int: ...
 
 
-def get_module(obj: int) -> int:
-    dll.TDaqCtrlBase_getModule.argtypes = [c_uint_]
-    dll.TDaqCtrlBase_getModule.restype = c_void_p
-    return dll.TDaqCtrlBase_getModule(obj)
+@prototype("TDaqCtrlBase_getModule", [c_uint_], restype=c_void_p)
+def get_module(obj: int) -> int: ...
 
 
-def load_profile(obj: int, profile: str) -> int:
-    dll.TDaqCtrlBase_LoadProfile.argtypes = [c_uint_, c_wchar_p]
-    return dll.TDaqCtrlBase_LoadProfile(obj, profile)
+@prototype("TDaqCtrlBase_LoadProfile", [c_uint_, c_wchar_p])
+def load_profile(obj: int, profile: str) -> int: ...
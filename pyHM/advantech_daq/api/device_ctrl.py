@@ -11,7 +11,7 @@ from ctypes import (
     c_wchar_p,
 )
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "calculate_absolute_time",
@@ -48,224 +48,207 @@ __all__ = [
 ]
 
 
-def refresh(dev_obj: int) -> int:
-    dll.TDeviceCtrl_Refresh.argtypes = [c_void_p]
-    return dll.TDeviceCtrl_Refresh(dev_obj)
+@prototype("TDeviceCtrl_Refresh", [c_void_p])
+def refresh(dev_obj: int) -> int: ...
 
 
-def read_register(
-    dev_obj: int, space: int, offset: int, length: int, data_arr: Array[c_byte]
-) -> int:
-    dll.TDeviceCtrl_ReadRegister.argtypes = [
+@prototype(
+    "TDeviceCtrl_ReadRegister",
+    [
         c_void_p,
         c_int32,
         c_int32,
         c_int32,
         c_void_p,
-    ]  # need attention
-    return dll.TDeviceCtrl_ReadRegister(dev_obj, space, offset, length, data_arr)
+    ],  # need attention
+)
+def read_register(
+    dev_obj: int, space: int, offset: int, length: int, data_arr: Array[c_byte]
+) -> int: ...
 
 
-def write_register(
-    dev_obj: int, space: int, offset: int, length: int, data_arr: Array[c_byte]
-) -> int:
-    dll.TDeviceCtrl_WriteRegister.argtypes = [
+@prototype(
+    "TDeviceCtrl_WriteRegister",
+    [
         c_void_p,
         c_int32,
         c_int32,
         c_int32,
         c_void_p,
-    ]  # need attention
-    return dll.TDeviceCtrl_WriteRegister(dev_obj, space, offset, length, data_arr)
+    ],  # need attention
+)
+def write_register(
+    dev_obj: int, space: int, offset: int, length: int, data_arr: Array[c_byte]
+) -> int: ...
 
 
-def read_private_region(
-    dev_obj: int, signature: int, length: int, data_arr: Array[c_uint8]
-) -> int:
-    dll.TDeviceCtrl_ReadPrivateRegion.argtypes = [
+@prototype(
+    "TDeviceCtrl_ReadPrivateRegion",
+    [
         c_void_p,
         c_int32,
         c_int32,
         POINTER(c_uint8),
-    ]  # need attention
-    return dll.TDeviceCtrl_ReadPrivateRegion(dev_obj, signature, length, data_arr)
+    ],  # need attention
+)
+def read_private_region(
+    dev_obj: int, signature: int, length: int, data_arr: Array[c_uint8]
+) -> int: ...
 
 
-def write_private_region(
-    dev_obj: int, signature: int, length: int, data_arr: Array[c_uint8]
-) -> int:
-    dll.TDeviceCtrl_WritePrivateRegion.argtypes = [
+@prototype(
+    "TDeviceCtrl_WritePrivateRegion",
+    [
         c_void_p,
         c_int32,
         c_int32,
         POINTER(c_uint8),
-    ]  # need attention
-    return dll.TDeviceCtrl_WritePrivateRegion(dev_obj, signature, length, data_arr)
+    ],  # need attention
+)
+def write_private_region(
+    dev_obj: int, signature: int, length: int, data_arr: Array[c_uint8]
+) -> int: ...
 
 
-def synchronize_timebase(dev_obj: int) -> int:
-    dll.TDeviceCtrl_SynchronizeTimebase.argtypes = [c_void_p]
-    return dll.TDeviceCtrl_SynchronizeTimebase(dev_obj)
+@prototype("TDeviceCtrl_SynchronizeTimebase", [c_void_p])
+def synchronize_timebase(dev_obj: int) -> int: ...
 
 
-def calculate_absolute_time(dev_obj: int, relativeTime: float) -> float:
-    dll.TDeviceCtrl_CalculateAbsoluteTime.restype = c_double
-    dll.TDeviceCtrl_CalculateAbsoluteTime.argtypes = [c_void_p, c_double]
-    return dll.TDeviceCtrl_CalculateAbsoluteTime(dev_obj, c_double(relativeTime))
+@prototype("TDeviceCtrl_CalculateAbsoluteTime", [c_void_p, c_double], restype=c_double)
+def calculate_absolute_time(dev_obj: int, relativeTime: float) -> float: ...
 
 
-def get_device_number(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getDeviceNumber.restype = c_int32
-    dll.TDeviceCtrl_getDeviceNumber.argtypes = [c_void_p]
-    return dll.TDeviceCtrl_getDeviceNumber(dev_obj)
+@prototype("TDeviceCtrl_getDeviceNumber", [c_void_p], restype=c_int32)
+def get_device_number(dev_obj: int) -> int: ...
 
 
-def get_description(dev_obj: int, length: int, descr: Array[c_wchar]) -> int:
-    dll.TDeviceCtrl_getDescription.argtypes = [
+@prototype(
+    "TDeviceCtrl_getDescription",
+    [
         c_void_p,
         c_int32,
         c_wchar_p,
-    ]  # need attention
-    return dll.TDeviceCtrl_getDescription(dev_obj, length, descr)
+    ],  # need attention
+)
+def get_description(dev_obj: int, length: int, descr: Array[c_wchar]) -> int: ...
 
 
-def set_description(dev_obj: int, length: int, descr: Array[c_wchar]) -> int:
-    dll.TDeviceCtrl_setDescription.argtypes = [
+@prototype(
+    "TDeviceCtrl_setDescription",
+    [
         c_void_p,
         c_int32,
         c_wchar_p,
-    ]  # need attention
-    return dll.TDeviceCtrl_setDescription(dev_obj, length, descr)
+    ],  # need attention
+)
+def set_description(dev_obj: int, length: int, descr: Array[c_wchar]) -> int: ...
 
 
-def get_access_mode(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getAccessMode.argtypes = [c_void_p]
-    return dll.TDeviceCtrl_getAccessMode(dev_obj)
+@prototype("TDeviceCtrl_getAccessMode", [c_void_p])
+def get_access_mode(dev_obj: int) -> int: ...
 
 
-def get_product_id(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getProductId.argtypes = [c_void_p]
-    return dll.TDeviceCtrl_getProductId(dev_obj)
+@prototype("TDeviceCtrl_getProductId", [c_void_p])
+def get_product_id(dev_obj: int) -> int: ...
 
 
-def get_board_id(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getBoardId.restype = c_int32
-    dll.TDeviceCtrl_getBoardId.argtypes = [c_void_p]
-    return dll.TDeviceCtrl_getBoardId(dev_obj)
+@prototype("TDeviceCtrl_getBoardId", [c_void_p], restype=c_int32)
+def get_board_id(dev_obj: int) -> int: ...
 
 
-def set_board_id(dev_obj: int, value: int) -> int:
-    dll.TDeviceCtrl_setBoardId.argtypes = [c_void_p, c_int32]
-    return dll.TDeviceCtrl_setBoardId(dev_obj, value)
+@prototype("TDeviceCtrl_setBoardId", [c_void_p, c_int32])
+def set_board_id(dev_obj: int, value: int) -> int: ...
 
 
-def get_board_version(dev_obj: int, length: int, version: Array[c_wchar]) -> int:
-    dll.TDeviceCtrl_getBoardVersion.argtypes = [c_void_p, c_int32, c_wchar_p]
-    return dll.TDeviceCtrl_getBoardVersion(dev_obj, length, version)
+@prototype("TDeviceCtrl_getBoardVersion", [c_void_p, c_int32, c_wchar_p])
+def get_board_version(dev_obj: int, length: int, version: Array[c_wchar]) -> int: ...
 
 
-def get_driver_version(dev_obj: int, length: int, version: Array[c_wchar]) -> int:
-    dll.TDeviceCtrl_getDriverVersion.argtypes = [c_void_p, c_int32, c_wchar_p]
-    return dll.TDeviceCtrl_getDriverVersion(dev_obj, length, version)
+@prototype("TDeviceCtrl_getDriverVersion", [c_void_p, c_int32, c_wchar_p])
+def get_driver_version(dev_obj: int, length: int, version: Array[c_wchar]) -> int: ...
 
 
-def get_dll_version(dev_obj: int, length: int, version: Array[c_wchar]) -> int:
-    dll.TDeviceCtrl_getDllVersion.argtypes = [c_void_p, c_int32, c_wchar_p]
-    return dll.TDeviceCtrl_getDllVersion(dev_obj, length, version)
+@prototype("TDeviceCtrl_getDllVersion", [c_void_p, c_int32, c_wchar_p])
+def get_dll_version(dev_obj: int, length: int, version: Array[c_wchar]) -> int: ...
 
 
-def get_location(dev_obj: int, length: int, location: Array[c_wchar]) -> int:
-    dll.TDeviceCtrl_getLocation.argtypes = [c_void_p, c_int32, c_wchar_p]
-    return dll.TDeviceCtrl_getLocation(dev_obj, length, location)
+@prototype("TDeviceCtrl_getLocation", [c_void_p, c_int32, c_wchar_p])
+def get_location(dev_obj: int, length: int, location: Array[c_wchar]) -> int: ...
 
 
-def get_private_region_length(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getPrivateRegionLength.restype = c_int32
-    dll.TDeviceCtrl_getPrivateRegionLength.argtypes = [c_void_p]
-    return dll.TDeviceCtrl_getPrivateRegionLength(dev_obj)
+@prototype("TDeviceCtrl_getPrivateRegionLength", [c_void_p], restype=c_int32)
+def get_private_region_length(dev_obj: int) -> int: ...
 
 
-def get_hot_reset_preventable(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getHotResetPreventable.restype = c_int32
-    dll.TDeviceCtrl_getHotResetPreventable.argtypes = [c_void_p]
-    return dll.TDeviceCtrl_getHotResetPreventable(dev_obj)
+@prototype("TDeviceCtrl_getHotResetPreventable", [c_void_p], restype=c_int32)
+def get_hot_reset_preventable(dev_obj: int) -> int: ...
 
 
-def get_base_addresses(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getBaseAddresses.argtypes = [c_void_p]
-    dll.TDeviceCtrl_getBaseAddresses.restype = c_uint_
-    return dll.TDeviceCtrl_getBaseAddresses(dev_obj)
+@prototype("TDeviceCtrl_getBaseAddresses", [c_void_p], restype=c_uint_)
+def get_base_addresses(dev_obj: int) -> int: ...
 
 
-def get_interrupts(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getInterrupts.argtypes = [c_void_p]
-    dll.TDeviceCtrl_getInterrupts.restype = c_uint_
-    return dll.TDeviceCtrl_getInterrupts(dev_obj)
+@prototype("TDeviceCtrl_getInterrupts", [c_void_p], restype=c_uint_)
+def get_interrupts(dev_obj: int) -> int: ...
 
 
-def get_supported_terminal_board(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getSupportedTerminalBoard.argtypes = [c_void_p]
-    dll.TDeviceCtrl_getSupportedTerminalBoard.restype = c_uint_
-    return dll.TDeviceCtrl_getSupportedTerminalBoard(dev_obj)
+@prototype("TDeviceCtrl_getSupportedTerminalBoard", [c_void_p], restype=c_uint_)
+def get_supported_terminal_board(dev_obj: int) -> int: ...
 
 
-def get_supported_events(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getSupportedEvents.argtypes = [c_void_p]
-    dll.TDeviceCtrl_getSupportedEvents.restype = c_uint_
-    return dll.TDeviceCtrl_getSupportedEvents(dev_obj)
+@prototype("TDeviceCtrl_getSupportedEvents", [c_void_p], restype=c_uint_)
+def get_supported_events(dev_obj: int) -> int: ...
 
 
-def get_supported_scenarios(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getSupportedScenarios.restype = c_int32
-    dll.TDeviceCtrl_getSupportedScenarios.argtypes = [c_void_p]
-    return dll.TDeviceCtrl_getSupportedScenarios(dev_obj)
+@prototype("TDeviceCtrl_getSupportedScenarios", [c_void_p], restype=c_int32)
+def get_supported_scenarios(dev_obj: int) -> int: ...
 
 
-def get_terminal_board(dev_obj: int) -> int:
-    dll.TDeviceCtrl_getTerminalBoard.argtypes = [c_void_p]
-    return dll.TDeviceCtrl_getTerminalBoard(dev_obj)
+@prototype("TDeviceCtrl_getTerminalBoard", [c_void_p])
+def get_terminal_board(dev_obj: int) -> int: ...
 
 
-def set_terminal_board(dev_obj: int, value: int) -> int:
-    dll.TDeviceCtrl_setTerminalBoard.argtypes = [c_void_p, c_int32]
-    return dll.TDeviceCtrl_setTerminalBoard(dev_obj, value)
+@prototype("TDeviceCtrl_setTerminalBoard", [c_void_p, c_int32])
+def set_terminal_board(dev_obj: int, value: int) -> int: ...
 
 
-def set_locate_enabled(dev_obj: int, value: int) -> int:
-    dll.TDeviceCtrl_setLocateEnabled.argtypes = [c_void_p, c_int32]
-    return dll.TDeviceCtrl_setLocateEnabled(dev_obj, value)
+@prototype("TDeviceCtrl_setLocateEnabled", [c_void_p, c_int32])
+def set_locate_enabled(dev_obj: int, value: int) -> int: ...
 
 
-def get_installed_devices() -> int:
-    dll.TDeviceCtrl_getInstalledDevices.restype = c_uint_
-    return dll.TDeviceCtrl_getInstalledDevices()
+@prototype("TDeviceCtrl_getInstalledDevices", (), restype=c_uint_)
+def get_installed_devices() -> int: ...
 
 
+@prototype(
+    "TDeviceCtrl_getHwSpecific",
+    [
+        c_void_p,
+        c_wchar_p,
+        POINTER(c_int32),
+        c_void_p,
+    ],
+)
 def get_hw_specific(
     dev_obj: int,
     name: Array[c_wchar],
     pSize: "_Pointer[c_int32]",
     dataArr: Array[c_int32],
-) -> int:
-    dll.TDeviceCtrl_getHwSpecific.argtypes = [
+) -> int: ...
+
+
+@prototype(
+    "TDeviceCtrl_setHwSpecific",
+    [
         c_void_p,
         c_wchar_p,
-        POINTER(c_int32),
+        c_int32,
         c_void_p,
-    ]
-    return dll.TDeviceCtrl_getHwSpecific(dev_obj, name, pSize, dataArr)
-
-
+    ],
+)
 def set_hw_specific(
     dev_obj: int,
     name: Array[c_wchar],
     size: int,
     dataArr: Array[c_int32],
-) -> int:
-    dll.TDeviceCtrl_setHwSpecific.argtypes = [
-        c_void_p,
-        c_wchar_p,
-        c_int32,
-        c_void_p,
-    ]
-    return dll.TDeviceCtrl_setHwSpecific(dev_obj, name, size, dataArr)
+) -> int: ...
@@ -1,22 +1,17 @@
 from ctypes import c_byte, c_int32, c_uint8
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = ["get_mask", "get_port", "set_mask"]
 
 
-def get_port(obj: int) -> int:
-    dll.TDiCosintPort_getPort.restype = c_int32
-    dll.TDiCosintPort_getPort.argtypes = [c_uint_]
-    return dll.TDiCosintPort_getPort(obj)
+@prototype("TDiCosintPort_getPort", [c_uint_], restype=c_int32)
+def get_port(obj: int) -> int: ...
 
 
-def get_mask(obj: int) -> int:
-    dll.TDiCosintPort_getMask.restype = c_byte
-    dll.TDiCosintPort_getMask.argtypes = [c_uint_]
-    return dll.TDiCosintPort_getMask(obj)
+@prototype("TDiCosintPort_getMask", [c_uint_], restype=c_byte)
+def get_mask(obj: int) -> int: ...
 
 
-def set_mask(obj: int, value: int) -> int:
-    dll.TDiCosintPort_setMask.argtypes = [c_uint_, c_uint8]
-    return dll.TDiCosintPort_setMask(obj, value)
+@prototype("TDiCosintPort_setMask", [c_uint_, c_uint8])
+def set_mask(obj: int, value: int) -> int: ...
@@ -1,6 +1,6 @@
 from ctypes import c_int8, c_int32
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_channel",
@@ -13,39 +13,29 @@ __all__ = [
 ]
 
 
-def get_channel(diIntChanObj: int) -> int:
-    dll.TDiintChannel_getChannel.restype = c_int32
-    dll.TDiintChannel_getChannel.argtypes = [c_uint_]
-    return dll.TDiintChannel_getChannel(diIntChanObj)
+@prototype("TDiintChannel_getChannel", [c_uint_], restype=c_int32)
+def get_channel(diIntChanObj: int) -> int: ...
 
 
-def get_enabled(diIntChanObj: int) -> int:
-    dll.TDiintChannel_getEnabled.restype = c_int8
-    dll.TDiintChannel_getEnabled.argtypes = [c_uint_]
-    return dll.TDiintChannel_getEnabled(diIntChanObj)
+@prototype("TDiintChannel_getEnabled", [c_uint_], restype=c_int8)
+def get_enabled(diIntChanObj: int) -> int: ...
 
 
-def set_enabled(diIntChanObj: int, value: int) -> int:
-    dll.TDiintChannel_setEnabled.argtypes = [c_uint_, c_int8]
-    return dll.TDiintChannel_setEnabled(diIntChanObj, value)
+@prototype("TDiintChannel_setEnabled", [c_uint_, c_int8])
+def set_enabled(diIntChanObj: int, value: int) -> int: ...
 
 
-def get_gated(diIntChanObj: int) -> int:
-    dll.TDiintChannel_getGated.restype = c_int8
-    dll.TDiintChannel_getGated.argtypes = [c_uint_]
-    return dll.TDiintChannel_getGated(diIntChanObj)
+@prototype("TDiintChannel_getGated", [c_uint_], restype=c_int8)
+def get_gated(diIntChanObj: int) -> int: ...
 
 
-def set_gated(diIntChanObj: int, value: int) -> int:
-    dll.TDiintChannel_setGated.argtypes = [c_uint_, c_int8]
-    return dll.TDiintChannel_setGated(diIntChanObj, value)
+@prototype("TDiintChannel_setGated", [c_uint_, c_int8])
+def set_gated(diIntChanObj: int, value: int) -> int: ...
 
 
-def get_trig_edge(diIntChanObj: int) -> int:
-    dll.TDiintChannel_getTrigEdge.argtypes = [c_uint_]
-    return dll.TDiintChannel_getTrigEdge(diIntChanObj)
+@prototype("TDiintChannel_getTrigEdge", [c_uint_])
+def get_trig_edge(diIntChanObj: int) -> int: ...
 
 
-def set_trig_edge(diIntChanObj: int, value: int) -> int:
-    dll.TDiintChannel_setTrigEdge.argtypes = [c_uint_, c_int32]
-    return dll.TDiintChannel_setTrigEdge(diIntChanObj, value)
+@prototype("TDiintChannel_setTrigEdge", [c_uint_, c_int32])
+def set_trig_edge(diIntChanObj: int, value: int) -> int: ...
@@ -1,33 +1,25 @@
 from ctypes import c_int32, c_uint8
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = ["get_mask", "get_pattern", "get_port", "set_mask", "set_pattern"]
 
 
-def get_port(obj: int) -> int:
-    dll.TDiPmintPort_getPort.restype = c_int32
-    dll.TDiPmintPort_getPort.argtypes = [c_uint_]
-    return dll.TDiPmintPort_getPort(obj)
+@prototype("TDiPmintPort_getPort", [c_uint_], restype=c_int32)
+def get_port(obj: int) -> int: ...
 
 
-def get_mask(obj: int) -> int:
-    dll.TDiPmintPort_getMask.restype = c_uint8
-    dll.TDiPmintPort_getMask.argtypes = [c_uint_]
-    return dll.TDiPmintPort_getMask(obj)
+@prototype("TDiPmintPort_getMask", [c_uint_], restype=c_uint8)
+def get_mask(obj: int) -> int: ...
 
 
-def set_mask(obj: int, value: int) -> int:
-    dll.TDiPmintPort_setMask.argtypes = [c_uint_, c_uint8]
-    return dll.TDiPmintPort_setMask(obj, value)
+@prototype("TDiPmintPort_setMask", [c_uint_, c_uint8])
+def set_mask(obj: int, value: int) -> int: ...
 
 
-def get_pattern(obj: int) -> int:
-    dll.TDiPmintPort_getPattern.restype = c_uint8
-    dll.TDiPmintPort_getPattern.argtypes = [c_uint_]
-    return dll.TDiPmintPort_getPattern(obj)
+@prototype("TDiPmintPort_getPattern", [c_uint_], restype=c_uint8)
+def get_pattern(obj: int) -> int: ...
 
 
-def set_pattern(obj: int, value: int) -> int:
-    dll.TDiPmintPort_setPattern.argtypes = [c_uint_, c_uint8]
-    return dll.TDiPmintPort_setPattern(obj, value)
+@prototype("TDiPmintPort_setPattern", [c_uint_, c_uint8])
+def set_pattern(obj: int, value: int) -> int: ...
@@ -1,23 +1,17 @@
 from ctypes import c_int32
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = ["get_features", "get_port_count", "get_ports"]
 
 
-def get_features(obj: int) -> int:
-    dll.TDioCtrlBase_getFeatures.argtypes = [c_uint_]
-    dll.TDioCtrlBase_getFeatures.restype = c_uint_
-    return dll.TDioCtrlBase_getFeatures(obj)
+@prototype("TDioCtrlBase_getFeatures", [c_uint_], restype=c_uint_)
+def get_features(obj: int) -> int: ...
 
 
-def get_port_count(obj: int) -> int:
-    dll.TDioCtrlBase_getPortCount.restype = c_int32
-    dll.TDioCtrlBase_getPortCount.argtypes = [c_uint_]
-    return dll.TDioCtrlBase_getPortCount(obj)
+@prototype("TDioCtrlBase_getPortCount", [c_uint_], restype=c_int32)
+def get_port_count(obj: int) -> int: ...
 
 
-def get_ports(obj: int) -> int:
-    dll.TDioCtrlBase_getPorts.argtypes = [c_uint_]
-    dll.TDioCtrlBase_getPorts.restype = c_uint_
-    return dll.TDioCtrlBase_getPorts(obj)
+@prototype("TDioCtrlBase_getPorts", [c_uint_], restype=c_uint_)
+def get_ports(obj: int) -> int: ...
@@ -3,7 +3,7 @@ from _ctypes import _Pointer
 from ctypes import POINTER, c_int8, c_int32
 
 from .. import MathInterval
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_channel_count_max",
@@ -24,97 +24,79 @@ __all__ = [
 ]
 
 
-def get_port_programmable(obj: int) -> int:
-    dll.TDioFeatures_getPortProgrammable.restype = c_int8
-    dll.TDioFeatures_getPortProgrammable.argtypes = [c_uint_]
-    return dll.TDioFeatures_getPortProgrammable(obj)
+@prototype("TDioFeatures_getPortProgrammable", [c_uint_], restype=c_int8)
+def get_port_programmable(obj: int) -> int: ...
 
 
-def get_channel_count_max(obj: int) -> int:
-    dll.TDioFeatures_getChannelCountMax.restype = c_int32
-    dll.TDioFeatures_getChannelCountMax.argtypes = [c_uint_]
-    return dll.TDioFeatures_getChannelCountMax(obj)
+@prototype("TDioFeatures_getChannelCountMax", [c_uint_], restype=c_int32)
+def get_channel_count_max(obj: int) -> int: ...
 
 
-def get_port_count(obj: int) -> int:
-    dll.TDioFeatures_getPortCount.restype = c_int32
-    dll.TDioFeatures_getPortCount.argtypes = [c_uint_]
-    return dll.TDioFeatures_getPortCount(obj)
+@prototype("TDioFeatures_getPortCount", [c_uint_], restype=c_int32)
+def get_port_count(obj: int) -> int: ...
 
 
-def get_ports_type(obj: int) -> int:
-    dll.TDioFeatures_getPortsType.argtypes = [c_uint_]
-    dll.TDioFeatures_getPortsType.restype = c_uint_
-    return dll.TDioFeatures_getPortsType(obj)
+@prototype("TDioFeatures_getPortsType", [c_uint_], restype=c_uint_)
+def get_ports_type(obj: int) -> int: ...
 
 
-def get_di_supported(obj: int) -> int:
-    dll.TDioFeatures_getDiSupported.restype = c_int8
-    dll.TDioFeatures_getDiSupported.argtypes = [c_uint_]
-    return dll.TDioFeatures_getDiSupported(obj)
+@prototype("TDioFeatures_getDiSupported", [c_uint_], restype=c_int8)
+def get_di_supported(obj: int) -> int: ...
 
 
-def get_do_supported(obj: int) -> int:
-    dll.TDioFeatures_getDoSupported.restype = c_int8
-    dll.TDioFeatures_getDoSupported.argtypes = [c_uint_]
-    return dll.TDioFeatures_getDoSupported(obj)
+@prototype("TDioFeatures_getDoSupported", [c_uint_], restype=c_int8)
+def get_do_supported(obj: int) -> int: ...
 
 
-def get_di_data_mask(obj: int) -> int:
-    dll.TDioFeatures_getDiDataMask.argtypes = [c_uint_]
-    dll.TDioFeatures_getDiDataMask.restype = c_uint_
-    return dll.TDioFeatures_getDiDataMask(obj)
+@prototype("TDioFeatures_getDiDataMask", [c_uint_], restype=c_uint_)
+def get_di_data_mask(obj: int) -> int: ...
 
 
-def get_di_noise_filter_supported(obj: int) -> int:
-    dll.TDioFeatures_getDiNoiseFilterSupported.restype = c_int8
-    dll.TDioFeatures_getDiNoiseFilterSupported.argtypes = [c_uint_]
-    return dll.TDioFeatures_getDiNoiseFilterSupported(obj)
+@prototype("TDioFeatures_getDiNoiseFilterSupported", [c_uint_], restype=c_int8)
+def get_di_noise_filter_supported(obj: int) -> int: ...
 
 
-def get_di_noise_filter_of_channels(obj: int) -> int:
-    dll.TDioFeatures_getDiNoiseFilterOfChannels.argtypes = [c_uint_]
-    dll.TDioFeatures_getDiNoiseFilterOfChannels.restype = c_uint_
-    return dll.TDioFeatures_getDiNoiseFilterOfChannels(obj)
+@prototype("TDioFeatures_getDiNoiseFilterOfChannels", [c_uint_], restype=c_uint_)
+def get_di_noise_filter_of_channels(obj: int) -> int: ...
 
 
+@prototype(
+    "TDioFeatures_getDiNoiseFilterBlockTimeRange",
+    [
+        c_uint_,
+        POINTER(MathInterval),
+    ],
+)
 def get_di_noise_filter_block_time_range(
     obj: int,
     mathIntervalValue: "_Pointer[MathInterval]",
-) -> int:
-    dll.TDioFeatures_getDiNoiseFilterBlockTimeRange.argtypes = [
-        c_uint_,
-        POINTER(MathInterval),
-    ]
-    return dll.TDioFeatures_getDiNoiseFilterBlockTimeRange(obj, mathIntervalValue)
+) -> int: ...
 
 
-def get_do_data_mask(obj: int) -> int:
-    dll.TDioFeatures_getDoDataMask.argtypes = [c_uint_]
-    return dll.TDioFeatures_getDoDataMask(obj)
+@prototype("TDioFeatures_getDoDataMask", [c_uint_])
+def get_do_data_mask(obj: int) -> int: ...
 
 
-def get_do_freeze_signal_sources(obj: int) -> int:
-    dll.TDioFeatures_getDoFreezeSignalSources.argtypes = [c_uint_]
-    return dll.TDioFeatures_getDoFreezeSignalSources(obj)
+@prototype("TDioFeatures_getDoFreezeSignalSources", [c_uint_])
+def get_do_freeze_signal_sources(obj: int) -> int: ...
 
 
+@prototype(
+    "TDioFeatures_getDoReflectWdtFeedIntervalRange",
+    [
+        c_uint_,
+        POINTER(MathInterval),
+    ],
+)
 def get_do_reflect_wdt_feed_interval_range(
     obj: int,
     mathInterValValue: "_Pointer[MathInterval]",
-) -> int:
-    dll.TDioFeatures_getDoReflectWdtFeedIntervalRange.argtypes = [
-        c_uint_,
-        POINTER(MathInterval),
-    ]
-    return dll.TDioFeatures_getDoReflectWdtFeedIntervalRange(obj, mathInterValValue)
+) -> int: ...
 
 
-def get_do_preset_value_depository(obj: int) -> int:
-    dll.TDioFeatures_getDoPresetValueDepository.argtypes = [c_uint_]
-    return dll.TDioFeatures_getDoPresetValueDepository(obj)
+@prototype("TDioFeatures_getDoPresetValueDepository", [c_uint_])
+def get_do_preset_value_depository(obj: int) -> int: ...
 
 
-def get_do_circuit_selectable_types(obj: int) -> int:
-    dll.TDioFeatures_getDoCircuitSelectableTypes.argtypes = [c_uint_]
-    return dll.TDioFeatures_getDoCircuitSelectableTypes(obj)
+@prototype("TDioFeatures_getDoCircuitSelectableTypes", [c_uint_])
+def get_do_circuit_selectable_types(obj: int) -> int: ...
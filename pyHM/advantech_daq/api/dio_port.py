@@ -1,6 +1,6 @@
 from ctypes import c_int32, c_uint8
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_di_inverse_port",
@@ -17,60 +17,45 @@ __all__ = [
 ]
 
 
-def get_port(obj: int) -> int:
-    dll.TDioPort_getPort.restype = c_int32
-    dll.TDioPort_getPort.argtypes = [c_uint_]
-    return dll.TDioPort_getPort(obj)
+@prototype("TDioPort_getPort", [c_uint_], restype=c_int32)
+def get_port(obj: int) -> int: ...
 
 
-def get_direction(obj: int) -> int:
-    dll.TDioPort_getDirection.argtypes = [c_uint_]
-    return dll.TDioPort_getDirection(obj)
+@prototype("TDioPort_getDirection", [c_uint_])
+def get_direction(obj: int) -> int: ...
 
 
-def set_direction(obj: int, value: int) -> int:
-    dll.TDioPort_setDirection.argtypes = [c_uint_, c_int32]
-    return dll.TDioPort_setDirection(obj, value)
+@prototype("TDioPort_setDirection", [c_uint_, c_int32])
+def set_direction(obj: int, value: int) -> int: ...
 
 
-def get_di_inverse_port(obj: int) -> int:
-    dll.TDioPort_getDiInversePort.restype = c_uint8
-    dll.TDioPort_getDiInversePort.argtypes = [c_uint_]
-    return dll.TDioPort_getDiInversePort(obj)
+@prototype("TDioPort_getDiInversePort", [c_uint_], restype=c_uint8)
+def get_di_inverse_port(obj: int) -> int: ...
 
 
-def set_di_inverse_port(obj: int, value: int) -> int:
-    dll.TDioPort_setDiInversePort.argtypes = [c_uint_, c_uint8]
-    return dll.TDioPort_setDiInversePort(obj, value)
+@prototype("TDioPort_setDiInversePort", [c_uint_, c_uint8])
+def set_di_inverse_port(obj: int, value: int) -> int: ...
 
 
-def get_di_open_state(obj: int) -> int:
-    dll.TDioPort_getDiOpenState.restype = c_uint8
-    dll.TDioPort_getDiOpenState.argtypes = [c_uint_]
-    return dll.TDioPort_getDiOpenState(obj)
+@prototype("TDioPort_getDiOpenState", [c_uint_], restype=c_uint8)
+def get_di_open_state(obj: int) -> int: ...
 
 
-def set_di_open_state(obj: int, value: int) -> int:
-    dll.TDioPort_setDiOpenState.argtypes = [c_uint_, c_uint8]
-    return dll.TDioPort_setDiOpenState(obj, value)
+@prototype("TDioPort_setDiOpenState", [c_uint_, c_uint8])
+def set_di_open_state(obj: int, value: int) -> int: ...
 
 
-def get_do_preset_value(obj: int) -> int:
-    dll.TDioPort_getDoPresetValue.restype = c_uint8
-    dll.TDioPort_getDoPresetValue.argtypes = [c_uint_]
-    return dll.TDioPort_getDoPresetValue(obj)
+@prototype("TDioPort_getDoPresetValue", [c_uint_], restype=c_uint8)
+def get_do_preset_value(obj: int) -> int: ...
 
 
-def set_do_preset_value(obj: int, value: int) -> int:
-    dll.TDioPort_setDoPresetValue.argtypes = [c_uint_, c_uint8]
-    return dll.TDioPort_setDoPresetValue(obj, value)
+@prototype("TDioPort_setDoPresetValue", [c_uint_, c_uint8])
+def set_do_preset_value(obj: int, value: int) -> int: ...
 
 
-def get_do_circuit_type(obj: int) -> int:
-    dll.TDioPort_getDoCircuitType.argtypes = [c_uint_]
-    return dll.TDioPort_getDoCircuitType(obj)
+@prototype("TDioPort_getDoCircuitType", [c_uint_])
+def get_do_circuit_type(obj: int) -> int: ...
 
 
-def set_do_circuit_type(obj: int, value: int) -> int:
-    dll.TDioPort_setDoCircuitType.argtypes = [c_uint_, c_int32]
-    return dll.TDioPort_setDoCircuitType(obj, value)
+@prototype("TDioPort_setDoCircuitType", [c_uint_, c_int32])
+def set_do_circuit_type(obj: int, value: int) -> int: ...
@@ -1,7 +1,7 @@
 from _ctypes import Array
 from ctypes import POINTER, c_double, c_int32, c_uint8
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_di_cosint_ports",
@@ -17,68 +17,59 @@ __all__ = [
 ]
 
 
-def read_any(
-    obj: int, portStart: int, portCount: int, dataArray: Array[c_uint8]
-) -> int:
-    dll.TInstantDiCtrl_ReadAny.argtypes = [
+@prototype(
+    "TInstantDiCtrl_ReadAny",
+    [
         c_uint_,
         c_int32,
         c_int32,
         POINTER(c_uint8),
-    ]
-    return dll.TInstantDiCtrl_ReadAny(obj, portStart, portCount, dataArray)
+    ],
+)
+def read_any(
+    obj: int, portStart: int, portCount: int, dataArray: Array[c_uint8]
+) -> int: ...
 
 
-def read_bit(obj: int, port: int, bit: int, data: Array[c_uint8]) -> int:
-    dll.TInstantDiCtrl_ReadBit.argtypes = [
+@prototype(
+    "TInstantDiCtrl_ReadBit",
+    [
         c_uint_,
         c_int32,
         c_int32,
         POINTER(c_uint8),
-    ]
-    return dll.TInstantDiCtrl_ReadBit(obj, port, bit, data)
+    ],
+)
+def read_bit(obj: int, port: int, bit: int, data: Array[c_uint8]) -> int: ...
 
 
-def snap_start(obj: int) -> int:
-    dll.TInstantDiCtrl_SnapStart.argtypes = [c_uint_]
-    return dll.TInstantDiCtrl_SnapStart(obj)
+@prototype("TInstantDiCtrl_SnapStart", [c_uint_])
+def snap_start(obj: int) -> int: ...
 
 
-def snap_stop(obj: int) -> int:
-    dll.TInstantDiCtrl_SnapStop.argtypes = [c_uint_]
-    return dll.TInstantDiCtrl_SnapStop(obj)
+@prototype("TInstantDiCtrl_SnapStop", [c_uint_])
+def snap_stop(obj: int) -> int: ...
 
 
-def get_noise_filter_block_time(obj: int) -> float:
-    dll.TInstantDiCtrl_getNoiseFilterBlockTime.restype = c_double
-    dll.TInstantDiCtrl_getNoiseFilterBlockTime.argtypes = [c_uint_]
-    return dll.TInstantDiCtrl_getNoiseFilterBlockTime(obj)
+@prototype("TInstantDiCtrl_getNoiseFilterBlockTime", [c_uint_], restype=c_double)
+def get_noise_filter_block_time(obj: int) -> float: ...
 
 
-def set_noise_filter_block_time(obj: int, value: float) -> int:
-    dll.TInstantDiCtrl_setNoiseFilterBlockTime.argtypes = [c_uint_, c_double]
-    return dll.TInstantDiCtrl_setNoiseFilterBlockTime(obj, c_double(value))
+@prototype("TInstantDiCtrl_setNoiseFilterBlockTime", [c_uint_, c_double])
+def set_noise_filter_block_time(obj: int, value: float) -> int: ...
 
 
-def get_noise_filter(obj: int) -> int:
-    dll.TInstantDiCtrl_getNoiseFilter.argtypes = [c_uint_]
-    dll.TInstantDiCtrl_getNoiseFilter.restype = c_uint_
-    return dll.TInstantDiCtrl_getNoiseFilter(obj)
+@prototype("TInstantDiCtrl_getNoiseFilter", [c_uint_], restype=c_uint_)
+def get_noise_filter(obj: int) -> int: ...
 
 
-def get_diint_channels(obj: int) -> int:
-    dll.TInstantDiCtrl_getDiintChannels.argtypes = [c_uint_]
-    dll.TInstantDiCtrl_getDiintChannels.restype = c_uint_
-    return dll.TInstantDiCtrl_getDiintChannels(obj)
+@prototype("TInstantDiCtrl_getDiintChannels", [c_uint_], restype=c_uint_)
+def get_diint_channels(obj: int) -> int: ...
 
 
-def get_di_cosint_ports(obj: int) -> int:
-    dll.TInstantDiCtrl_getDiCosintPorts.argtypes = [c_uint_]
-    dll.TInstantDiCtrl_getDiCosintPorts.restype = c_uint_
-    return dll.TInstantDiCtrl_getDiCosintPorts(obj)
+@prototype("TInstantDiCtrl_getDiCosintPorts", [c_uint_], restype=c_uint_)
+def get_di_cosint_ports(obj: int) -> int: ...
 
 
-def get_di_pmint_ports(obj: int) -> int:
-    dll.TInstantDiCtrl_getDiPmintPorts.argtypes = [c_uint_]
-    dll.TInstantDiCtrl_getDiPmintPorts.restype = c_uint_
-    return dll.TInstantDiCtrl_getDiPmintPorts(obj)
+@prototype("TInstantDiCtrl_getDiPmintPorts", [c_uint_], restype=c_uint_)
+def get_di_pmint_ports(obj: int) -> int: ...
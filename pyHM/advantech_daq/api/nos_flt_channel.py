@@ -1,21 +1,17 @@
 from ctypes import c_int8
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = ["get_channel", "get_enabled", "set_enabled"]
 
 
-def get_channel(obj: int) -> int:
-    dll.TNosFltChannel_getChannel.argtypes = [c_uint_]
-    return dll.TNosFltChannel_getChannel(obj)
+@prototype("TNosFltChannel_getChannel", [c_uint_])
+def get_channel(obj: int) -> int: ...
 
 
-def get_enabled(obj: int) -> int:
-    dll.TNosFltChannel_getEnabled.restype = c_int8
-    dll.TNosFltChannel_getEnabled.argtypes = [c_uint_]
-    return dll.TNosFltChannel_getEnabled(obj)
+@prototype("TNosFltChannel_getEnabled", [c_uint_], restype=c_int8)
+def get_enabled(obj: int) -> int: ...
 
 
-def set_enabled(obj: int, value: int) -> int:
-    dll.TNosFltChannel_setEnabled.argtypes = [c_uint_, c_int8]
-    return dll.TNosFltChannel_setEnabled(obj, value)
+@prototype("TNosFltChannel_setEnabled", [c_uint_, c_int8])
+def set_enabled(obj: int, value: int) -> int: ...
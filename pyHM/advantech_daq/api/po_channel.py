@@ -0,0 +1,34 @@
+# noinspection PyProtectedMember
+from _ctypes import _Pointer
+from ctypes import POINTER, c_int32
+
+from .. import PulseWidth
+from . import c_uint_, prototype
+
+__all__ = [
+    "get_channel",
+    "get_pulse_count",
+    "get_pulse_width",
+    "set_pulse_count",
+    "set_pulse_width",
+]
+
+
+@prototype("TPoChannel_getChannel", [c_uint_], restype=c_int32)
+def get_channel(poChannelObj: int) -> int: ...
+
+
+@prototype("TPoChannel_getPulseWidth", [c_uint_, POINTER(PulseWidth)])
+def get_pulse_width(poChannelObj: int, value: "_Pointer[PulseWidth]") -> int: ...
+
+
+@prototype("TPoChannel_setPulseWidth", [c_uint_, POINTER(PulseWidth)])
+def set_pulse_width(poChannelObj: int, value: "_Pointer[PulseWidth]") -> int: ...
+
+
+@prototype("TPoChannel_getPulseCount", [c_uint_], restype=c_int32)
+def get_pulse_count(poChannelObj: int) -> int: ...
+
+
+@prototype("TPoChannel_setPulseCount", [c_uint_, c_int32])
+def set_pulse_count(poChannelObj: int, value: int) -> int: ...
@@ -0,0 +1,7 @@
+from . import c_uint_, prototype
+
+__all__ = ["get_channels"]
+
+
+@prototype("TPwModulatorCtrl_getChannels", [c_uint_], restype=c_uint_)
+def get_channels(obj: int) -> int: ...
@@ -1,6 +1,6 @@
 from ctypes import c_int32
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_cycles",
@@ -12,33 +12,25 @@ __all__ = [
 ]
 
 
-def get_section_length(obj: int) -> int:
-    dll.TRecord_getSectionLength.restype = c_int32
-    dll.TRecord_getSectionLength.argtypes = [c_uint_]
-    return dll.TRecord_getSectionLength(obj)
+@prototype("TRecord_getSectionLength", [c_uint_], restype=c_int32)
+def get_section_length(obj: int) -> int: ...
 
 
-def set_section_length(obj: int, value: int) -> int:
-    dll.TRecord_setSectionLength.argtypes = [c_uint_, c_int32]
-    return dll.TRecord_setSectionLength(obj, value)
+@prototype("TRecord_setSectionLength", [c_uint_, c_int32])
+def set_section_length(obj: int, value: int) -> int: ...
 
 
-def get_section_count(obj: int) -> int:
-    dll.TRecord_getSectionCount.argtypes = [c_uint_]
-    return dll.TRecord_getSectionCount(obj)
+@prototype("TRecord_getSectionCount", [c_uint_])
+def get_section_count(obj: int) -> int: ...
 
 
-def set_section_count(obj: int, value: int) -> int:
-    dll.TRecord_setSectionCount.argtypes = [c_uint_, c_int32]
-    return dll.TRecord_setSectionCount(obj, value)
+@prototype("TRecord_setSectionCount", [c_uint_, c_int32])
+def set_section_count(obj: int, value: int) -> int: ...
 
 
-def get_cycles(obj: int) -> int:
-    dll.TRecord_getCycles.restype = c_int32
-    dll.TRecord_getCycles.argtypes = [c_uint_]
-    return dll.TRecord_getCycles(obj)
+@prototype("TRecord_getCycles", [c_uint_], restype=c_int32)
+def get_cycles(obj: int) -> int: ...
 
 
-def set_cycles(obj: int, value: int) -> int:
-    dll.TRecord_setCycles.argtypes = [c_uint_, c_int32]
-    return dll.TRecord_setCycles(obj, value)
+@prototype("TRecord_setCycles", [c_uint_, c_int32])
+def set_cycles(obj: int, value: int) -> int: ...
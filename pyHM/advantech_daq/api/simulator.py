@@ -0,0 +1,1646 @@
+"""A software model of the DAQ library, the USB-4716 board, and the radiometer
+
+Set the `DAQ_BACKEND` environment variable to `simulator` to use it instead of
+the driver.
+
+The model covers the entry points the measurement uses:
+the waveform AI, with the one-shot and the streaming records and the events,
+the instant and the buffered AO, the start triggers, the instant DI and DO
+with the interrupts of the DI, and the pulse trains of the counters.
+The receivers are wired to the AI channels and the modulating DACs
+to the AO channels of the same numbers.
+The DO bits drive the stepper motor of the mirror, as does a counter output
+wired to the step input of the motor driver,
+and a DI bit shows the zero position of the mirror.
+Another DO bit is wired to the external digital trigger pin,
+so that it can start the waveform AI and the buffered AO.
+The receivers see the sky while the mirror looks above the horizon,
+and the blackbody load otherwise.
+"""
+
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from ctypes import (
+    CFUNCTYPE,
+    addressof,
+    c_double,
+    c_int,
+    c_int8,
+    c_int32,
+    c_uint8,
+    c_uint32,
+    c_void_p,
+    c_wchar,
+    create_unicode_buffer,
+    memmove,
+    sizeof,
+    wstring_at,
+)
+from math import ceil, cos, exp, inf, radians
+from random import Random
+from threading import Condition, Thread
+from types import SimpleNamespace
+from typing import Any, Callable, Sequence
+
+from .. import (
+    ActiveSignal,
+    BfdAIEventArgs,
+    CntrEventArgs,
+    ControlState,
+    DeviceInformation,
+    DiSnapEventArgs,
+    ErrorCode,
+    EventId,
+    MathInterval,
+    PulseWidth,
+    Scenario,
+    TriggerAction,
+    ValueRange,
+    ValueUnit,
+)
+from . import DaqEventProc, c_uint_
+
+__all__ = ["Simulator"]
+
+# the streaming buffer size, in sections
+_BUFFER_SECTIONS: int = 8
+# the DAC level changes kept for the samples yet to read
+_AO_HISTORY_LENGTH: int = 4096
+# the triggers of a waveform AI or a buffered AO
+_TRIGGER_COUNT: int = 1
+# the sources of the triggers simulated, `SignalDrop.SignalNone` and `SignalDrop.ExtDigitalTrigger0`
+_TRIGGER_SOURCES: tuple[int, ...] = (0, 18)
+
+
+def _entry_point[_F: Callable[..., Any]](
+    restype: type | None, *argtypes: type
+) -> Callable[[_F], _F]:
+    """Declare the C signature of a simulated library function
+
+    The pointers are passed as `c_void_p`, so the simulator gets their addresses.
+    """
+
+    def decorator(method: _F) -> _F:
+        method.c_signature = CFUNCTYPE(restype, *argtypes)
+        return method
+
+    return decorator
+
+
+def _value_range_interval(value_range: int) -> tuple[MathInterval, ValueUnit] | None:
+    match: re.Match[str] | None = re.fullmatch(
+        r"(V|mV|mA)_(Neg)?(\d+(?:pt\d+)?)To(\d+(?:pt\d+)?)",
+        ValueRange(value_range).name,
+    )
+    if match is None:
+        return None
+    unit, negative, low, high = match.groups()
+    low_value: float = float(low.replace("pt", "."))
+    return (
+        MathInterval(
+            0, -low_value if negative else low_value, float(high.replace("pt", "."))
+        ),
+        {"V": ValueUnit.Volt, "mV": ValueUnit.MilliVolt, "mA": ValueUnit.MilliAmpere}[
+            unit
+        ],
+    )
+
+
+class Simulator:
+    """The simulated library, with the board and the radiometer behind it
+
+    The attributes set the rig up, and they may be changed at any time.
+    Angles are in degrees, temperatures are in kelvins.
+    """
+
+    def __init__(
+        self,
+        description: str = "USB-4716,BID#0",
+        *,
+        ai_channel_count: int = 16,
+        ao_channel_count: int = 2,
+        dio_port_count: int = 2,
+        counter_channel_count: int = 2,
+        step_bit: int = 6,
+        step_counter: int = 0,
+        direction_bit: int = 7,
+        zero_bit: int = 0,
+        zero_signal: bool = False,
+        trigger_bit: int = 5,
+        step_angle: float = 0.8,
+        zero_angle: float = 0.0,
+        mirror_angle: float = 37.0,
+        tau: Sequence[float] = (0.1, 0.15),
+        atmosphere_temperature: float = 270.0,
+        blackbody_temperature: float = 290.0,
+        gain: Sequence[float] = (1e-3, 1e-3),
+        offset: Sequence[float] = (0.0, 0.0),
+        noise: float = 1e-3,
+        seed: int | None = None,
+    ) -> None:
+        self.description: str = description
+        self.ai_channel_count: int = ai_channel_count
+        self.ao_channel_count: int = ao_channel_count
+        self.dio_port_count: int = dio_port_count
+        self.counter_channel_count: int = counter_channel_count
+
+        # the motor and the zero sensor
+        self.step_bit: int = step_bit
+        self.step_counter: int = step_counter
+        self.direction_bit: int = direction_bit
+        self.zero_bit: int = zero_bit
+        self.zero_signal: bool = zero_signal
+        # the external digital trigger
+        self.trigger_bit: int = trigger_bit
+        self.step_angle: float = step_angle
+        self.zero_angle: float = zero_angle
+        self.mirror_angle: float = mirror_angle
+
+        # the receivers: the optical depth of the atmosphere, the temperatures
+        # of the sky and the load, and the voltage per kelvin per DAC volt
+        self.tau: list[float] = list(tau)
+        self.atmosphere_temperature: float = atmosphere_temperature
+        self.blackbody_temperature: float = blackbody_temperature
+        self.gain: list[float] = list(gain)
+        self.offset: list[float] = list(offset)
+
+        random: Random = Random(seed)
+        self._noise: array[float] = array(
+            "d", (random.gauss(0.0, noise) for _ in range(1 << 16))
+        )
+        self._random: Random = random
+
+        self._objects: list[Any] = []
+        self._device: int = self._new(SimpleNamespace())
+
+        # the entry points, callable the way the library functions are
+        for name, method in vars(Simulator).items():
+            if hasattr(method, "c_signature"):
+                setattr(self, name, method.c_signature(getattr(self, name)))
+
+        # the DAC voltages since the times they were set at
+        self._ao_times: list[float] = [-inf]
+        self._ao_levels: list[tuple[float, ...]] = [(0.0,) * ao_channel_count]
+        # the data a buffered output plays, if any
+        self._ao_pattern: SimpleNamespace | None = None
+        self._do_ports: list[int] = [0] * dio_port_count
+        # the controls waiting for the trigger
+        self._armed: list[int] = []
+        # the DI controls watching their interrupts
+        self._snapping: list[int] = []
+
+    def _new(self, obj: Any) -> int:
+        self._objects.append(obj)
+        return len(self._objects)
+
+    def _get(self, handle: int) -> Any:
+        return self._objects[handle - 1]
+
+    def _array(self, items: Sequence[Any]) -> int:
+        return self._new(SimpleNamespace(items=[self._new(item) for item in items]))
+
+    # the scene
+
+    def _at_zero(self) -> bool:
+        angle: float = (self.mirror_angle - self.zero_angle + 180.0) % 360.0 - 180.0
+        return abs(angle) < self.step_angle / 2
+
+    def _scene_temperature(self, receiver: int) -> float:
+        angle: float = (self.mirror_angle + 180.0) % 360.0 - 180.0
+        if abs(angle) >= 90.0:
+            return self.blackbody_temperature
+        return self.atmosphere_temperature * (
+            1.0 - exp(-self.tau[receiver] / cos(radians(angle)))
+        )
+
+    def _ao_levels_at(self, moment: float) -> tuple[float, ...]:
+        return self._ao_levels[bisect_right(self._ao_times, moment) - 1]
+
+    def _set_ao_levels(
+        self, start: int, levels: Sequence[float], moment: float | None = None
+    ) -> None:
+        new_levels: list[float] = list(self._ao_levels[-1])
+        new_levels[start : start + len(levels)] = levels
+        self._ao_times.append(time.perf_counter() if moment is None else moment)
+        self._ao_levels.append(tuple(new_levels))
+        # the earlier levels are of no use for the samples yet to read
+        del (
+            self._ao_times[1:-_AO_HISTORY_LENGTH],
+            self._ao_levels[1:-_AO_HISTORY_LENGTH],
+        )
+
+    def _play_ao_pattern(self, until: float) -> None:
+        """Put the level changes of the buffered output up to `until` into the history"""
+        pattern: SimpleNamespace | None = self._ao_pattern
+        if pattern is None:
+            return
+        while True:
+            cycle: int
+            index: int
+            cycle, index = divmod(pattern.played, len(pattern.changes))
+            if pattern.cycles and cycle >= pattern.cycles:
+                self._ao_pattern = None
+                break
+            scan: int
+            levels: tuple[float, ...]
+            scan, levels = pattern.changes[index]
+            moment: float = (
+                pattern.start_time
+                + (cycle * pattern.scan_count + scan) / pattern.clock_rate
+            )
+            if moment > until:
+                break
+            self._set_ao_levels(pattern.channel_start, levels, moment)
+            pattern.played += 1
+
+    def _step_motor(self) -> None:
+        di_ports: list[int] = [
+            self._di_port(port) for port in range(self.dio_port_count)
+        ]
+        if self._do_ports[0] >> self.direction_bit & 1:
+            self.mirror_angle -= self.step_angle
+        else:
+            self.mirror_angle += self.step_angle
+        self._snap(di_ports)
+
+    def _set_do_port(self, port: int, value: int) -> None:
+        if port == 0 and (value & ~self._do_ports[0]) >> self.step_bit & 1:
+            self._do_ports[0] = value
+            self._step_motor()
+        if port == 0 and (value ^ self._do_ports[0]) >> self.trigger_bit & 1:
+            self._trigger(
+                ActiveSignal.RisingEdge
+                if value >> self.trigger_bit & 1
+                else ActiveSignal.FallingEdge
+            )
+        self._do_ports[port] = value
+
+    def _armed_trigger(self, control: SimpleNamespace) -> SimpleNamespace | None:
+        """Get the trigger to start the control at, if any"""
+        for handle in control.triggers:
+            trigger: SimpleNamespace = self._get(handle)
+            if trigger.action == TriggerAction.DelayToStart and trigger.source:
+                return trigger
+        return None
+
+    def _trigger(self, edge: ActiveSignal) -> None:
+        """Start the controls armed to the edge of the external digital trigger"""
+        moment: float = time.perf_counter()
+        for obj in tuple(self._armed):
+            control: SimpleNamespace = self._get(obj)
+            trigger: SimpleNamespace | None = self._armed_trigger(control)
+            if trigger is None or trigger.edge not in (edge, ActiveSignal.BothEdge):
+                continue
+            self._armed.remove(obj)
+            if control.scenario == Scenario.BufferedAO:
+                if self._ao_pattern is not None and self._ao_pattern.owner == obj:
+                    self._ao_pattern.start_time = (
+                        moment + trigger.delay_count / self._ao_pattern.clock_rate
+                    )
+                continue
+            with control.acquisition:
+                control.start_time = moment + trigger.delay_count / control.clock_rate
+                Thread(
+                    target=self._acquire,
+                    args=(obj, control.generation),
+                    name="simulated acquisition",
+                    daemon=True,
+                ).start()
+                control.acquisition.notify_all()
+
+    def _di_port(self, port: int) -> int:
+        if port == 0 and self._at_zero() == self.zero_signal:
+            return 1 << self.zero_bit
+        return 0
+
+    def _snap(self, previous_di_ports: Sequence[int]) -> None:
+        """Interrupt the snapping DI controls the changes of the DI since `previous_di_ports` are enabled in"""
+        di_ports: list[int] = [
+            self._di_port(port) for port in range(self.dio_port_count)
+        ]
+        changes: list[int] = [
+            previous ^ current for previous, current in zip(previous_di_ports, di_ports)
+        ]
+        if not any(changes):
+            return
+        for obj in tuple(self._snapping):
+            control: SimpleNamespace = self._get(obj)
+            events: list[tuple[EventId, int]] = []
+            for handle in self._get(control.int_channels).items:
+                int_channel: SimpleNamespace = self._get(handle)
+                port, bit = divmod(int_channel.channel, 8)
+                if not int_channel.enabled or not changes[port] >> bit & 1:
+                    continue
+                edge: ActiveSignal = (
+                    ActiveSignal.RisingEdge
+                    if di_ports[port] >> bit & 1
+                    else ActiveSignal.FallingEdge
+                )
+                if int_channel.trig_edge in (edge, ActiveSignal.BothEdge):
+                    events.append(
+                        (
+                            EventId(EventId.DIIntChannel000 + int_channel.channel),
+                            int_channel.channel,
+                        )
+                    )
+            for handle in self._get(control.cos_ports).items:
+                cos_port: SimpleNamespace = self._get(handle)
+                if cos_port.mask & changes[cos_port.port]:
+                    events.append(
+                        (
+                            EventId(EventId.DICosIntPort000 + cos_port.port),
+                            cos_port.port,
+                        )
+                    )
+            if not events:
+                continue
+            # the noise filter holds the changes of its channels back for the block time
+            delay: float = 0.0
+            for handle in self._get(control.noise_filter).items:
+                filter_channel: SimpleNamespace = self._get(handle)
+                port, bit = divmod(filter_channel.channel, 8)
+                if filter_channel.enabled and changes[port] >> bit & 1:
+                    delay = control.block_time * 1e-6
+            Thread(
+                target=self._fire_snap,
+                args=(obj, events, di_ports, delay),
+                name="simulated DI interrupt",
+                daemon=True,
+            ).start()
+
+    # common functions
+
+    @_entry_point(c_int32, c_void_p, c_uint32, c_uint32, c_void_p)
+    def AdxEnumToString(
+        self, name: int, value: int, length: int, text_buffer: int
+    ) -> int:
+        enum_type: Any = getattr(
+            sys.modules[__package__.rpartition(".")[0]], wstring_at(name), None
+        )
+        try:
+            text: str = enum_type(value).name[: length - 1]
+        except (TypeError, ValueError):
+            return ErrorCode.ErrorParamOutOfRange.value
+        memmove(
+            text_buffer, create_unicode_buffer(text), sizeof(c_wchar) * (len(text) + 1)
+        )
+        return ErrorCode.Success.value
+
+    @_entry_point(c_uint32, c_uint32, c_uint32, c_void_p, c_void_p, c_void_p)
+    def AdxGetValueRangeInformation(
+        self, value_range: int, length: int, description: int, interval: int, unit: int
+    ) -> int:
+        information: tuple[MathInterval, ValueUnit] | None = _value_range_interval(
+            value_range
+        )
+        if information is None:
+            return ErrorCode.ErrorParamOutOfRange.value
+        if description:
+            text: str = ValueRange(value_range).name[: length - 1]
+            memmove(
+                description,
+                create_unicode_buffer(text),
+                sizeof(c_wchar) * (len(text) + 1),
+            )
+        if interval:
+            memmove(interval, addressof(information[0]), sizeof(MathInterval))
+        if unit:
+            c_int32.from_address(unit).value = information[1].value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TArray_getLength(self, obj: int) -> int:
+        return len(self._get(obj).items)
+
+    @_entry_point(c_uint_, c_uint_, c_int32)
+    def TArray_getItem(self, obj: int, index: int) -> int:
+        return self._get(obj).items[index]
+
+    @_entry_point(None, c_uint_)
+    def TArray_Dispose(self, obj: int) -> None:
+        pass
+
+    # controls
+
+    @_entry_point(c_uint_, c_int32)
+    def TDaqCtrlBase_Create(self, scenario: int) -> int:
+        control: SimpleNamespace = SimpleNamespace(
+            scenario=Scenario(scenario),
+            device=DeviceInformation(),
+            state=ControlState.Uninitialized,
+            event_procs={},
+        )
+        if scenario in (Scenario.InstantAI, Scenario.WaveformAI):
+            control.features = self._new(SimpleNamespace())
+            control.channels = self._array(
+                [
+                    SimpleNamespace(
+                        channel=channel,
+                        value_range=ValueRange.V_Neg10To10,
+                        signal_type=0,
+                    )
+                    for channel in range(self.ai_channel_count)
+                ]
+            )
+            control.conversion = self._new(
+                SimpleNamespace(
+                    clock_rate=1000.0,
+                    channel_start=0,
+                    channel_count=1,
+                    channel_limit=self.ai_channel_count,
+                )
+            )
+            control.record = self._new(
+                SimpleNamespace(section_length=1024, section_count=1, cycles=1)
+            )
+            control.triggers = self._triggers()
+            control.acquisition = Condition()
+            control.generation = 0
+        elif scenario in (Scenario.InstantAO, Scenario.BufferedAO):
+            control.features = self._new(SimpleNamespace())
+            control.channels = self._array(
+                [
+                    SimpleNamespace(channel=channel, value_range=ValueRange.V_Neg10To10)
+                    for channel in range(self.ao_channel_count)
+                ]
+            )
+            control.conversion = self._new(
+                SimpleNamespace(
+                    clock_rate=1000.0,
+                    channel_start=0,
+                    channel_count=1,
+                    channel_limit=self.ao_channel_count,
+                )
+            )
+            control.record = self._new(
+                SimpleNamespace(section_length=1024, section_count=1, cycles=1)
+            )
+            control.triggers = self._triggers()
+            control.data = array("d")
+        elif scenario == Scenario.PulseWidthModulator:
+            control.features = self._new(SimpleNamespace())
+            control.channels = self._array(
+                [
+                    SimpleNamespace(
+                        channel=channel,
+                        pulse_width=PulseWidth(0.5e-3, 0.5e-3),
+                        pulse_count=0,
+                    )
+                    for channel in range(self.counter_channel_count)
+                ]
+            )
+            control.channel_start = 0
+            control.channel_count = 1
+            control.enabled = False
+            control.running = 0
+            control.generation = 0
+        else:
+            control.features = self._new(SimpleNamespace())
+            control.ports = self._array(
+                [SimpleNamespace(port=port) for port in range(self.dio_port_count)]
+            )
+            if scenario == Scenario.InstantDI:
+                control.noise_filter = self._array(
+                    [
+                        SimpleNamespace(channel=channel, enabled=False)
+                        for channel in range(8 * self.dio_port_count)
+                    ]
+                )
+                control.block_time = 0.0
+                # the first bit of every port may interrupt, and any bit may change the state of its port
+                control.int_channels = self._array(
+                    [
+                        SimpleNamespace(
+                            channel=8 * port,
+                            enabled=False,
+                            gated=False,
+                            trig_edge=ActiveSignal.RisingEdge,
+                        )
+                        for port in range(self.dio_port_count)
+                    ]
+                )
+                control.cos_ports = self._array(
+                    [
+                        SimpleNamespace(port=port, mask=0)
+                        for port in range(self.dio_port_count)
+                    ]
+                )
+                control.pm_ports = self._array([])
+        return self._new(control)
+
+    def _triggers(self) -> list[int]:
+        return [
+            self._new(
+                SimpleNamespace(
+                    source=0,
+                    edge=ActiveSignal.RisingEdge,
+                    level=0.0,
+                    action=TriggerAction.ActionNone,
+                    delay_count=0,
+                )
+            )
+            for _ in range(_TRIGGER_COUNT)
+        ]
+
+    @_entry_point(c_int32, c_uint_, c_void_p)
+    def TDaqCtrlBase_setSelectedDevice(self, obj: int, device: int) -> int:
+        info: DeviceInformation = DeviceInformation.from_address(device)
+        if info.Description.casefold() != self.description.casefold() and (
+            info.Description or info.DeviceNumber != 0
+        ):
+            return ErrorCode.ErrorDeviceNotExist.value
+        control: SimpleNamespace = self._get(obj)
+        control.device = DeviceInformation(Description=self.description, DeviceNumber=0)
+        control.state = ControlState.Idle
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_void_p)
+    def TDaqCtrlBase_getSelectedDevice(self, obj: int, device: int) -> int:
+        memmove(device, addressof(self._get(obj).device), sizeof(DeviceInformation))
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int, c_uint_)
+    def TDaqCtrlBase_getState(self, obj: int) -> int:
+        return self._get(obj).state.value
+
+    @_entry_point(c_void_p, c_uint_)
+    def TDaqCtrlBase_getDevice(self, obj: int) -> int:
+        return self._device
+
+    @_entry_point(c_int32, c_void_p)
+    def TDeviceCtrl_Refresh(self, obj: int) -> int:
+        return ErrorCode.Success.value
+
+    @_entry_point(None, c_uint_, c_int32, c_void_p, c_void_p)
+    def TDaqCtrlBase_addEventHandler(
+        self, obj: int, event_id: int, proc: int, user_param: int | None
+    ) -> None:
+        procs: dict[int, list[tuple[int, int | None]]] = self._get(obj).event_procs
+        procs.setdefault(event_id, []).append((proc, user_param))
+
+    @_entry_point(None, c_uint_, c_int32, c_void_p, c_void_p)
+    def TDaqCtrlBase_removeEventHandler(
+        self, obj: int, event_id: int, proc: int, user_param: int | None
+    ) -> None:
+        procs: list[tuple[int, int | None]] = self._get(obj).event_procs.get(
+            event_id, []
+        )
+        if (proc, user_param) in procs:
+            procs.remove((proc, user_param))
+
+    @_entry_point(None, c_uint_)
+    def TDaqCtrlBase_Cleanup(self, obj: int) -> None:
+        self._stop(obj)
+
+    @_entry_point(None, c_uint_)
+    def TDaqCtrlBase_Dispose(self, obj: int) -> None:
+        self._stop(obj)
+
+    def _stop(self, obj: int) -> None:
+        scenario: Scenario = self._get(obj).scenario
+        if scenario == Scenario.WaveformAI:
+            self._stop_acquisition(obj)
+        elif scenario == Scenario.BufferedAO:
+            self._stop_output(obj)
+        elif scenario == Scenario.PulseWidthModulator:
+            self._stop_pulses(obj)
+        elif obj in self._snapping:
+            self._snapping.remove(obj)
+
+    def _fire(self, obj: int, events: Sequence[tuple[EventId, int, int]]) -> None:
+        procs: dict[int, list[tuple[int, int | None]]] = self._get(obj).event_procs
+        for event_id, offset, count in events:
+            args: BfdAIEventArgs = BfdAIEventArgs(event_id.value, offset, count, 0)
+            for proc, user_param in tuple(procs.get(event_id, ())):
+                DaqEventProc(proc)(obj, addressof(args), user_param)
+
+    def _fire_counter(self, obj: int, event_id: EventId, channel: int) -> None:
+        procs: dict[int, list[tuple[int, int | None]]] = self._get(obj).event_procs
+        args: CntrEventArgs = CntrEventArgs(event_id.value, channel)
+        for proc, user_param in tuple(procs.get(event_id, ())):
+            DaqEventProc(proc)(obj, addressof(args), user_param)
+
+    def _fire_snap(
+        self,
+        obj: int,
+        events: Sequence[tuple[EventId, int]],
+        di_ports: Sequence[int],
+        delay: float,
+    ) -> None:
+        if delay > 0.0:
+            time.sleep(delay)
+        if obj not in self._snapping:
+            return
+        procs: dict[int, list[tuple[int, int | None]]] = self._get(obj).event_procs
+        for event_id, source in events:
+            args: DiSnapEventArgs = DiSnapEventArgs(
+                event_id.value, source, len(di_ports), tuple(di_ports)
+            )
+            for proc, user_param in tuple(procs.get(event_id, ())):
+                DaqEventProc(proc)(obj, addressof(args), user_param)
+
+    # triggers
+
+    @_entry_point(c_int32, c_uint_)
+    def TTrigger_getSource(self, obj: int) -> int:
+        return self._get(obj).source
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TTrigger_setSource(self, obj: int, value: int) -> int:
+        if value not in _TRIGGER_SOURCES:
+            return ErrorCode.ErrorPropValueNotSupported.value
+        self._get(obj).source = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TTrigger_getEdge(self, obj: int) -> int:
+        return self._get(obj).edge.value
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TTrigger_setEdge(self, obj: int, value: int) -> int:
+        if value not in (
+            ActiveSignal.RisingEdge,
+            ActiveSignal.FallingEdge,
+            ActiveSignal.BothEdge,
+        ):
+            return ErrorCode.ErrorPropValueNotSupported.value
+        self._get(obj).edge = ActiveSignal(value)
+        return ErrorCode.Success.value
+
+    @_entry_point(c_double, c_uint_)
+    def TTrigger_getLevel(self, obj: int) -> float:
+        return self._get(obj).level
+
+    @_entry_point(c_int32, c_uint_, c_double)
+    def TTrigger_setLevel(self, obj: int, value: float) -> int:
+        self._get(obj).level = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TTrigger_getAction(self, obj: int) -> int:
+        return self._get(obj).action.value
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TTrigger_setAction(self, obj: int, value: int) -> int:
+        if value not in (TriggerAction.ActionNone, TriggerAction.DelayToStart):
+            return ErrorCode.ErrorPropValueNotSupported.value
+        self._get(obj).action = TriggerAction(value)
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TTrigger_getDelayCount(self, obj: int) -> int:
+        return self._get(obj).delay_count
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TTrigger_setDelayCount(self, obj: int, value: int) -> int:
+        if value < 0:
+            return ErrorCode.ErrorPropValueOutOfRange.value
+        self._get(obj).delay_count = value
+        return ErrorCode.Success.value
+
+    # analog input
+
+    @_entry_point(c_uint_, c_uint_)
+    def TAiCtrlBase_getFeatures(self, obj: int) -> int:
+        return self._get(obj).features
+
+    @_entry_point(c_uint_, c_uint_)
+    def TAiCtrlBase_getChannels(self, obj: int) -> int:
+        return self._get(obj).channels
+
+    @_entry_point(c_int32, c_uint_)
+    def TAiCtrlBase_getChannelCount(self, obj: int) -> int:
+        return self.ai_channel_count
+
+    @_entry_point(c_int32, c_uint_)
+    def TAiFeatures_getChannelCountMax(self, obj: int) -> int:
+        return self.ai_channel_count
+
+    @_entry_point(c_int32, c_uint_)
+    def TAiFeatures_getResolution(self, obj: int) -> int:
+        return 16
+
+    @_entry_point(c_int32, c_uint_)
+    def TAiFeatures_getDataSize(self, obj: int) -> int:
+        return 2
+
+    @_entry_point(c_int32, c_uint_)
+    def TAiFeatures_getDataMask(self, obj: int) -> int:
+        return 0xFFFF
+
+    @_entry_point(c_int8, c_uint_)
+    def TAiFeatures_getBufferedAiSupported(self, obj: int) -> int:
+        return 1
+
+    @_entry_point(c_int32, c_uint_)
+    def TAiFeatures_getTriggerCount(self, obj: int) -> int:
+        return _TRIGGER_COUNT
+
+    @_entry_point(c_int32, c_uint_, c_void_p)
+    def TAiFeatures_getConvertClockRange(self, obj: int, x: int) -> int:
+        interval: MathInterval = MathInterval(Type=0x5, Min=1.0, Max=200_000.0)
+        memmove(x, addressof(interval), sizeof(MathInterval))
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TAiChannel_getChannel(self, obj: int) -> int:
+        return self._get(obj).channel
+
+    @_entry_point(c_int, c_uint_)
+    def TAiChannel_getValueRange(self, obj: int) -> int:
+        return self._get(obj).value_range.value
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TAiChannel_setValueRange(self, obj: int, value: int) -> int:
+        if _value_range_interval(value) is None:
+            return ErrorCode.ErrorPropValueNotSupported.value
+        self._get(obj).value_range = ValueRange(value)
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int, c_uint_)
+    def TAiChannel_getSignalType(self, obj: int) -> int:
+        return self._get(obj).signal_type
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TAiChannel_setSignalType(self, obj: int, value: int) -> int:
+        self._get(obj).signal_type = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_void_p, c_void_p)
+    def TAiChannel_getScaleTable(self, obj: int, size: int, table: int) -> int:
+        return ErrorCode.ErrorFuncNotSupported.value
+
+    @_entry_point(c_double, c_uint_)
+    def TConversion_getClockRate(self, obj: int) -> float:
+        return self._get(obj).clock_rate
+
+    @_entry_point(c_int32, c_uint_, c_double)
+    def TConversion_setClockRate(self, obj: int, value: float) -> int:
+        if not 0.0 < value <= 200e3:
+            return ErrorCode.ErrorPropValueOutOfRange.value
+        self._get(obj).clock_rate = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TConversion_getChannelStart(self, obj: int) -> int:
+        return self._get(obj).channel_start
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TConversion_setChannelStart(self, obj: int, value: int) -> int:
+        if not 0 <= value < self._get(obj).channel_limit:
+            return ErrorCode.ErrorPropValueOutOfRange.value
+        self._get(obj).channel_start = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TConversion_getChannelCount(self, obj: int) -> int:
+        return self._get(obj).channel_count
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TConversion_setChannelCount(self, obj: int, value: int) -> int:
+        if not 0 < value <= self._get(obj).channel_limit:
+            return ErrorCode.ErrorPropValueOutOfRange.value
+        self._get(obj).channel_count = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TRecord_getSectionLength(self, obj: int) -> int:
+        return self._get(obj).section_length
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TRecord_setSectionLength(self, obj: int, value: int) -> int:
+        if value <= 0:
+            return ErrorCode.ErrorPropValueOutOfRange.value
+        self._get(obj).section_length = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TRecord_getSectionCount(self, obj: int) -> int:
+        return self._get(obj).section_count
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TRecord_setSectionCount(self, obj: int, value: int) -> int:
+        if value < 0:
+            return ErrorCode.ErrorPropValueOutOfRange.value
+        self._get(obj).section_count = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TRecord_getCycles(self, obj: int) -> int:
+        return self._get(obj).cycles
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TRecord_setCycles(self, obj: int, value: int) -> int:
+        self._get(obj).cycles = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_uint_, c_uint_)
+    def TWaveformAiCtrl_getConversion(self, obj: int) -> int:
+        return self._get(obj).conversion
+
+    @_entry_point(c_uint_, c_uint_)
+    def TWaveformAiCtrl_getRecord(self, obj: int) -> int:
+        return self._get(obj).record
+
+    @_entry_point(c_uint_, c_uint_, c_int32)
+    def TWaveformAiCtrl_getTrigger(self, obj: int, index: int) -> int:
+        return self._get(obj).triggers[index]
+
+    @_entry_point(c_int32, c_uint_)
+    def TWaveformAiCtrl_Prepare(self, obj: int) -> int:
+        control: SimpleNamespace = self._get(obj)
+        if control.state == ControlState.Uninitialized:
+            return ErrorCode.ErrorFuncNotInited.value
+        if control.state == ControlState.Running:
+            return ErrorCode.ErrorFuncBusy.value
+        control.state = ControlState.Ready
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TWaveformAiCtrl_Start(self, obj: int) -> int:
+        control: SimpleNamespace = self._get(obj)
+        if control.state == ControlState.Running:
+            return ErrorCode.ErrorFuncBusy.value
+        if control.state not in (ControlState.Ready, ControlState.Stopped):
+            return ErrorCode.ErrorFuncNotInited.value
+        conversion: SimpleNamespace = self._get(control.conversion)
+        record: SimpleNamespace = self._get(control.record)
+        with control.acquisition:
+            control.generation += 1
+            control.state = ControlState.Running
+            control.clock_rate = conversion.clock_rate
+            control.channel_start = conversion.channel_start
+            control.channel_count = conversion.channel_count
+            control.section_length = record.section_length
+            control.scan_count = (
+                record.section_length * record.section_count
+                if record.section_count
+                else inf
+            )
+            control.read_count = 0  # samples
+            control.ready_count = 0  # scans
+            if self._armed_trigger(control) is not None:
+                # the clock starts at the trigger
+                control.start_time = inf
+                self._armed.append(obj)
+                return ErrorCode.Success.value
+            Thread(
+                target=self._acquire,
+                args=(obj, control.generation),
+                name="simulated acquisition",
+                daemon=True,
+            ).start()
+            # the clock starts as the call returns
+            control.start_time = time.perf_counter()
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TWaveformAiCtrl_Stop(self, obj: int) -> int:
+        self._stop_acquisition(obj)
+        return ErrorCode.Success.value
+
+    def _stop_acquisition(self, obj: int) -> None:
+        control: SimpleNamespace = self._get(obj)
+        if control.state != ControlState.Running:
+            return
+        if obj in self._armed:
+            self._armed.remove(obj)
+        with control.acquisition:
+            control.generation += 1
+            control.state = ControlState.Stopped
+            control.acquisition.notify_all()
+
+    def _update_acquisition(
+        self, control: SimpleNamespace, moment: float
+    ) -> list[tuple[EventId, int, int]]:
+        """Move the acquisition on to `moment`, return the events to fire
+
+        The data are transferred by sections. A streaming buffer that is full
+        loses the oldest sections.
+        """
+        events: list[tuple[EventId, int, int]] = []
+        if control.state != ControlState.Running or moment < control.start_time:
+            return events
+        section_samples: int = control.section_length * control.channel_count
+        scan_count: float = min(
+            control.scan_count,
+            (moment - control.start_time)
+            * control.clock_rate
+            // control.section_length
+            * control.section_length,
+        )
+        while control.ready_count < scan_count:
+            control.ready_count += control.section_length
+            events.append(
+                (
+                    EventId.BufferedAIDataReady,
+                    control.ready_count * control.channel_count - section_samples,
+                    section_samples,
+                )
+            )
+        lost: int = control.ready_count * control.channel_count - (
+            control.read_count + _BUFFER_SECTIONS * section_samples
+        )
+        if control.scan_count == inf and lost > 0:
+            lost = -(-lost // section_samples) * section_samples
+            control.read_count += lost
+            events.append((EventId.BufferedAIOverrun, 0, lost))
+        if control.ready_count >= control.scan_count:
+            control.state = ControlState.Stopped
+            events.append((EventId.BufferedAIStopped, 0, 0))
+        return events
+
+    def _acquire(self, obj: int, generation: int) -> None:
+        control: SimpleNamespace = self._get(obj)
+        while True:
+            with control.acquisition:
+                if control.generation != generation:
+                    return
+                events: list[tuple[EventId, int, int]] = self._update_acquisition(
+                    control, time.perf_counter()
+                )
+                running: bool = control.state == ControlState.Running
+                next_time: float = (
+                    control.start_time
+                    + (control.ready_count + control.section_length)
+                    / control.clock_rate
+                )
+                if events:
+                    control.acquisition.notify_all()
+            self._fire(obj, events)
+            if not running:
+                return
+            time.sleep(max(0.0, next_time - time.perf_counter()))
+
+    def _samples(
+        self, control: SimpleNamespace, first: int, count: int
+    ) -> array[float]:
+        """Get the voltages of `count` samples acquired, starting at sample `first`"""
+        channel_count: int = control.channel_count
+        # the noise comes from a table, read from a random place
+        noise_start: int = self._random.randrange(len(self._noise))
+        values: array[float] = self._noise[noise_start : noise_start + count]
+        while len(values) < count:
+            values.extend(self._noise[: count - len(values)])
+        temperatures: list[float] = [
+            self._scene_temperature(receiver) for receiver in range(len(self.tau))
+        ]
+
+        # the DAC voltages change between the scans only
+        self._play_ao_pattern(
+            control.start_time
+            + ((first + count - 1) // channel_count + 1) / control.clock_rate
+        )
+        scan: int = first // channel_count
+        last_scan: int = (first + count - 1) // channel_count
+        while scan <= last_scan:
+            scan_time: float = control.start_time + scan / control.clock_rate
+            levels: tuple[float, ...] = self._ao_levels_at(scan_time)
+            index: int = bisect_right(self._ao_times, scan_time)
+            end_scan: int = last_scan + 1
+            if index < len(self._ao_times):
+                end_scan = min(
+                    end_scan,
+                    max(
+                        scan + 1,
+                        ceil(
+                            (self._ao_times[index] - control.start_time)
+                            * control.clock_rate
+                        ),
+                    ),
+                )
+            start: int = max(scan * channel_count, first) - first
+            stop: int = min(end_scan * channel_count, first + count) - first
+            for position in range(channel_count):
+                channel: int = (
+                    control.channel_start + position
+                ) % self.ai_channel_count
+                if channel >= len(temperatures) or channel >= len(levels):
+                    continue
+                level: float = (
+                    self.offset[channel]
+                    + self.gain[channel] * levels[channel] * temperatures[channel]
+                )
+                offset: int = start + (position - (first + start)) % channel_count
+                values[offset:stop:channel_count] = array(
+                    "d", map(level.__add__, values[offset:stop:channel_count])
+                )
+            scan = end_scan
+        return values
+
+    def _raw_samples(
+        self, control: SimpleNamespace, first: int, values: array[float], type_code: str
+    ) -> array[int]:
+        """Convert the voltages into the offset binary counts"""
+        counts: array[int] = array(
+            type_code, bytes(len(values) * array(type_code).itemsize)
+        )
+        channel_count: int = control.channel_count
+        channels: list[Any] = self._get(control.channels).items
+        for position in range(channel_count):
+            channel: int = (control.channel_start + position) % self.ai_channel_count
+            information: tuple[MathInterval, ValueUnit] | None = _value_range_interval(
+                self._get(channels[channel]).value_range
+            )
+            if information is None:
+                continue
+            interval: MathInterval = information[0]
+            gain: float = 0x10000 / (interval.Max - interval.Min)
+            offset: int = (position - first) % channel_count
+            counts[offset::channel_count] = array(
+                type_code,
+                (
+                    min(0xFFFF, max(0, int((value - interval.Min) * gain)))
+                    for value in values[offset::channel_count]
+                ),
+            )
+        return counts
+
+    @_entry_point(
+        c_int32,
+        c_uint_,
+        c_int32,
+        c_int32,
+        c_void_p,
+        c_int32,
+        c_void_p,
+        c_void_p,
+        c_void_p,
+        c_void_p,
+    )
+    def TWaveformAiCtrl_GetData(
+        self,
+        obj: int,
+        data_type: int,
+        count: int,
+        buffer: int,
+        timeout: int,
+        returned: int,
+        start_time: int | None,
+        mark_count: int | None,
+        mark_buffer: int | None,
+    ) -> int:
+        control: SimpleNamespace = self._get(obj)
+        if not buffer:
+            return ErrorCode.ErrorBufferIsNull.value
+        if data_type not in (2, 4, 8):
+            return ErrorCode.ErrorParamNotSupported.value
+        if control.state not in (ControlState.Running, ControlState.Stopped):
+            return ErrorCode.ErrorFuncNotInited.value
+        deadline: float = time.perf_counter() + timeout / 1000
+        ret: ErrorCode = ErrorCode.Success
+        with control.acquisition:
+            while True:
+                events: list[tuple[EventId, int, int]] = self._update_acquisition(
+                    control, time.perf_counter()
+                )
+                available: int = (
+                    control.ready_count * control.channel_count - control.read_count
+                )
+                remaining: float = deadline - time.perf_counter()
+                if (
+                    available >= count
+                    or control.state != ControlState.Running
+                    or remaining <= 0.0
+                ):
+                    break
+                control.acquisition.wait(remaining)
+            if available < count and timeout:
+                ret = ErrorCode.WarningFuncTimeout
+            count = min(count, available)
+            first: int = control.read_count
+            control.read_count += count
+            values: array[float] = self._samples(control, first, count)
+        self._fire(obj, events)
+
+        data: array[float] | array[int] = values
+        if data_type == 2:
+            data = self._raw_samples(control, first, values, "H")
+        elif data_type == 4:
+            data = self._raw_samples(
+                control, first, values, "I" if array("I").itemsize == 4 else "L"
+            )
+        if count:
+            memmove(buffer, data.buffer_info()[0], count * data.itemsize)
+        if returned:
+            c_int32.from_address(returned).value = count
+        if start_time:
+            c_double.from_address(start_time).value = (
+                first // control.channel_count / control.clock_rate
+            )
+        if mark_count:
+            c_int32.from_address(mark_count).value = 0
+        return ret.value
+
+    # analog output
+
+    @_entry_point(c_uint_, c_uint_)
+    def TAoCtrlBase_getFeatures(self, obj: int) -> int:
+        return self._get(obj).features
+
+    @_entry_point(c_uint_, c_uint_)
+    def TAoCtrlBase_getChannels(self, obj: int) -> int:
+        return self._get(obj).channels
+
+    @_entry_point(c_int32, c_uint_)
+    def TAoCtrlBase_getChannelCount(self, obj: int) -> int:
+        return self.ao_channel_count
+
+    @_entry_point(c_int32, c_uint_)
+    def TAoFeatures_getChannelCountMax(self, obj: int) -> int:
+        return self.ao_channel_count
+
+    @_entry_point(c_int32, c_uint_)
+    def TAoFeatures_getResolution(self, obj: int) -> int:
+        return 16
+
+    @_entry_point(c_int32, c_uint_)
+    def TAoFeatures_getDataMask(self, obj: int) -> int:
+        return 0xFFFF
+
+    @_entry_point(c_int32, c_uint_)
+    def TAoFeatures_getTriggerCount(self, obj: int) -> int:
+        return _TRIGGER_COUNT
+
+    @_entry_point(c_uint_, c_uint_, c_int32)
+    def TBufferedAoCtrl_getTrigger(self, obj: int, index: int) -> int:
+        return self._get(obj).triggers[index]
+
+    @_entry_point(c_uint_, c_uint_)
+    def TBufferedAoCtrl_getConversion(self, obj: int) -> int:
+        return self._get(obj).conversion
+
+    @_entry_point(c_uint_, c_uint_)
+    def TBufferedAoCtrl_getRecord(self, obj: int) -> int:
+        return self._get(obj).record
+
+    @_entry_point(c_int32, c_uint_)
+    def TBufferedAoCtrl_Prepare(self, obj: int) -> int:
+        control: SimpleNamespace = self._get(obj)
+        if control.state == ControlState.Uninitialized:
+            return ErrorCode.ErrorFuncNotInited.value
+        if control.state == ControlState.Running:
+            return ErrorCode.ErrorFuncBusy.value
+        control.data = array("d")
+        control.state = ControlState.Ready
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_int32, c_int32, c_void_p, c_int32, c_void_p)
+    def TBufferedAoCtrl_SetData(
+        self,
+        obj: int,
+        data_type: int,
+        count: int,
+        buffer: int,
+        timeout: int,
+        transmitted: int,
+    ) -> int:
+        control: SimpleNamespace = self._get(obj)
+        if control.state not in (ControlState.Ready, ControlState.Stopped):
+            return ErrorCode.ErrorFuncNotInited.value
+        if data_type != sizeof(c_double):
+            return ErrorCode.ErrorFuncNotSupported.value
+        conversion: SimpleNamespace = self._get(control.conversion)
+        record: SimpleNamespace = self._get(control.record)
+        size: int = (
+            record.section_length * max(record.section_count, 1)
+        ) * conversion.channel_count
+        count = max(0, min(count, size - len(control.data)))
+        control.data.extend((c_double * count).from_address(buffer))
+        if transmitted:
+            c_int32.from_address(transmitted).value = count
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TBufferedAoCtrl_Start(self, obj: int) -> int:
+        control: SimpleNamespace = self._get(obj)
+        if control.state == ControlState.Running:
+            return ErrorCode.ErrorFuncBusy.value
+        if control.state not in (ControlState.Ready, ControlState.Stopped):
+            return ErrorCode.ErrorFuncNotInited.value
+        conversion: SimpleNamespace = self._get(control.conversion)
+        record: SimpleNamespace = self._get(control.record)
+        channel_count: int = conversion.channel_count
+        scan_count: int = len(control.data) // channel_count
+        if not scan_count:
+            return ErrorCode.ErrorBufferIsNull.value
+        # the levels at the scans they change at
+        changes: list[tuple[int, tuple[float, ...]]] = []
+        for scan in range(scan_count):
+            levels: tuple[float, ...] = tuple(
+                control.data[scan * channel_count : (scan + 1) * channel_count]
+            )
+            if not changes or changes[-1][1] != levels:
+                changes.append((scan, levels))
+        control.state = ControlState.Running
+        start_time: float = time.perf_counter()  # the clock starts as the call returns
+        if self._armed_trigger(control) is not None:
+            # or at the trigger
+            start_time = inf
+            self._armed.append(obj)
+        self._ao_pattern = SimpleNamespace(
+            owner=obj,
+            start_time=start_time,
+            clock_rate=conversion.clock_rate,
+            channel_start=conversion.channel_start,
+            scan_count=scan_count,
+            cycles=record.cycles,
+            changes=changes,
+            played=0,
+        )
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TBufferedAoCtrl_Stop(self, obj: int, action: int) -> int:
+        self._stop_output(obj)
+        return ErrorCode.Success.value
+
+    def _stop_output(self, obj: int) -> None:
+        control: SimpleNamespace = self._get(obj)
+        if control.state != ControlState.Running:
+            return
+        if obj in self._armed:
+            self._armed.remove(obj)
+        if self._ao_pattern is not None and self._ao_pattern.owner == obj:
+            self._play_ao_pattern(time.perf_counter())
+            self._ao_pattern = None
+        control.state = ControlState.Stopped
+
+    @_entry_point(c_int32, c_uint_)
+    def TAoChannel_getChannel(self, obj: int) -> int:
+        return self._get(obj).channel
+
+    @_entry_point(c_int, c_uint_)
+    def TAoChannel_getValueRange(self, obj: int) -> int:
+        return self._get(obj).value_range.value
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TAoChannel_setValueRange(self, obj: int, value: int) -> int:
+        if _value_range_interval(value) is None:
+            return ErrorCode.ErrorPropValueNotSupported.value
+        self._get(obj).value_range = ValueRange(value)
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_int32, c_int32, c_void_p, c_void_p)
+    def TInstantAoCtrl_WriteAny(
+        self,
+        obj: int,
+        channel_start: int,
+        channel_count: int,
+        data_raw: int | None,
+        data_scaled: int | None,
+    ) -> int:
+        if channel_start < 0 or channel_start + channel_count > self.ao_channel_count:
+            return ErrorCode.ErrorParamOutOfRange.value
+        if not data_scaled:
+            return ErrorCode.ErrorFuncNotSupported.value
+        self._set_ao_levels(
+            channel_start, list((c_double * channel_count).from_address(data_scaled))
+        )
+        return ErrorCode.Success.value
+
+    # digital input and output
+
+    @_entry_point(c_uint_, c_uint_)
+    def TDioCtrlBase_getFeatures(self, obj: int) -> int:
+        return self._get(obj).features
+
+    @_entry_point(c_int32, c_uint_)
+    def TDioCtrlBase_getPortCount(self, obj: int) -> int:
+        return self.dio_port_count
+
+    @_entry_point(c_uint_, c_uint_)
+    def TDioCtrlBase_getPorts(self, obj: int) -> int:
+        return self._get(obj).ports
+
+    @_entry_point(c_int32, c_uint_)
+    def TDioFeatures_getPortCount(self, obj: int) -> int:
+        return self.dio_port_count
+
+    @_entry_point(c_int32, c_uint_)
+    def TDioFeatures_getChannelCountMax(self, obj: int) -> int:
+        return 8 * self.dio_port_count
+
+    @_entry_point(c_int8, c_uint_)
+    def TDioFeatures_getDiSupported(self, obj: int) -> int:
+        return 1
+
+    @_entry_point(c_int8, c_uint_)
+    def TDioFeatures_getDoSupported(self, obj: int) -> int:
+        return 1
+
+    @_entry_point(c_int32, c_uint_)
+    def TDioPort_getPort(self, obj: int) -> int:
+        return self._get(obj).port
+
+    @_entry_point(c_int32, c_uint_, c_int32, c_int32, c_void_p)
+    def TInstantDiCtrl_ReadAny(
+        self, obj: int, port_start: int, port_count: int, data: int
+    ) -> int:
+        if port_start < 0 or port_start + port_count > self.dio_port_count:
+            return ErrorCode.ErrorParamOutOfRange.value
+        for index in range(port_count):
+            c_uint8.from_address(data + index).value = self._di_port(port_start + index)
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_int32, c_int32, c_void_p)
+    def TInstantDiCtrl_ReadBit(self, obj: int, port: int, bit: int, data: int) -> int:
+        if not 0 <= port < self.dio_port_count or not 0 <= bit < 8:
+            return ErrorCode.ErrorParamOutOfRange.value
+        c_uint8.from_address(data).value = self._di_port(port) >> bit & 1
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TInstantDiCtrl_SnapStart(self, obj: int) -> int:
+        if self._get(obj).state == ControlState.Uninitialized:
+            return ErrorCode.ErrorFuncNotInited.value
+        if obj not in self._snapping:
+            self._snapping.append(obj)
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TInstantDiCtrl_SnapStop(self, obj: int) -> int:
+        if obj in self._snapping:
+            self._snapping.remove(obj)
+        return ErrorCode.Success.value
+
+    @_entry_point(c_double, c_uint_)
+    def TInstantDiCtrl_getNoiseFilterBlockTime(self, obj: int) -> float:
+        return self._get(obj).block_time
+
+    @_entry_point(c_int32, c_uint_, c_double)
+    def TInstantDiCtrl_setNoiseFilterBlockTime(self, obj: int, value: float) -> int:
+        if value < 0.0:
+            return ErrorCode.ErrorPropValueOutOfRange.value
+        self._get(obj).block_time = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_uint_, c_uint_)
+    def TInstantDiCtrl_getNoiseFilter(self, obj: int) -> int:
+        return self._get(obj).noise_filter
+
+    @_entry_point(c_uint_, c_uint_)
+    def TInstantDiCtrl_getDiintChannels(self, obj: int) -> int:
+        return self._get(obj).int_channels
+
+    @_entry_point(c_uint_, c_uint_)
+    def TInstantDiCtrl_getDiCosintPorts(self, obj: int) -> int:
+        return self._get(obj).cos_ports
+
+    @_entry_point(c_uint_, c_uint_)
+    def TInstantDiCtrl_getDiPmintPorts(self, obj: int) -> int:
+        return self._get(obj).pm_ports
+
+    @_entry_point(c_int32, c_uint_)
+    def TNosFltChannel_getChannel(self, obj: int) -> int:
+        return self._get(obj).channel
+
+    @_entry_point(c_int8, c_uint_)
+    def TNosFltChannel_getEnabled(self, obj: int) -> int:
+        return int(self._get(obj).enabled)
+
+    @_entry_point(c_int32, c_uint_, c_int8)
+    def TNosFltChannel_setEnabled(self, obj: int, value: int) -> int:
+        self._get(obj).enabled = bool(value)
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TDiintChannel_getChannel(self, obj: int) -> int:
+        return self._get(obj).channel
+
+    @_entry_point(c_int8, c_uint_)
+    def TDiintChannel_getEnabled(self, obj: int) -> int:
+        return int(self._get(obj).enabled)
+
+    @_entry_point(c_int32, c_uint_, c_int8)
+    def TDiintChannel_setEnabled(self, obj: int, value: int) -> int:
+        self._get(obj).enabled = bool(value)
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int8, c_uint_)
+    def TDiintChannel_getGated(self, obj: int) -> int:
+        return int(self._get(obj).gated)
+
+    @_entry_point(c_int32, c_uint_, c_int8)
+    def TDiintChannel_setGated(self, obj: int, value: int) -> int:
+        if value:
+            # no gate inputs on the board
+            return ErrorCode.ErrorPropValueNotSupported.value
+        self._get(obj).gated = False
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int, c_uint_)
+    def TDiintChannel_getTrigEdge(self, obj: int) -> int:
+        return self._get(obj).trig_edge.value
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TDiintChannel_setTrigEdge(self, obj: int, value: int) -> int:
+        try:
+            self._get(obj).trig_edge = ActiveSignal(value)
+        except ValueError:
+            return ErrorCode.ErrorPropValueOutOfRange.value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TDiCosintPort_getPort(self, obj: int) -> int:
+        return self._get(obj).port
+
+    @_entry_point(c_int8, c_uint_)
+    def TDiCosintPort_getMask(self, obj: int) -> int:
+        return self._get(obj).mask
+
+    @_entry_point(c_int32, c_uint_, c_uint8)
+    def TDiCosintPort_setMask(self, obj: int, value: int) -> int:
+        self._get(obj).mask = value & 0xFF
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_int32, c_int32, c_void_p)
+    def TInstantDoCtrl_WriteAny(
+        self, obj: int, port_start: int, port_count: int, data: int
+    ) -> int:
+        if port_start < 0 or port_start + port_count > self.dio_port_count:
+            return ErrorCode.ErrorParamOutOfRange.value
+        for index in range(port_count):
+            self._set_do_port(
+                port_start + index, c_uint8.from_address(data + index).value
+            )
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_int32, c_int32, c_void_p)
+    def TInstantDoCtrl_ReadAny(
+        self, obj: int, port_start: int, port_count: int, data: int
+    ) -> int:
+        if port_start < 0 or port_start + port_count > self.dio_port_count:
+            return ErrorCode.ErrorParamOutOfRange.value
+        for index in range(port_count):
+            c_uint8.from_address(data + index).value = self._do_ports[
+                port_start + index
+            ]
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_int32, c_int32, c_uint8)
+    def TInstantDoCtrl_WriteBit(self, obj: int, port: int, bit: int, data: int) -> int:
+        if not 0 <= port < self.dio_port_count or not 0 <= bit < 8:
+            return ErrorCode.ErrorParamOutOfRange.value
+        self._set_do_port(
+            port, self._do_ports[port] & ~(1 << bit) | (1 << bit if data else 0)
+        )
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_int32, c_int32, c_void_p)
+    def TInstantDoCtrl_ReadBit(self, obj: int, port: int, bit: int, data: int) -> int:
+        if not 0 <= port < self.dio_port_count or not 0 <= bit < 8:
+            return ErrorCode.ErrorParamOutOfRange.value
+        c_uint8.from_address(data).value = self._do_ports[port] >> bit & 1
+        return ErrorCode.Success.value
+
+    # counters
+
+    @_entry_point(c_uint_, c_uint_)
+    def TCntrCtrlBase_getFeatures(self, obj: int) -> int:
+        return self._get(obj).features
+
+    @_entry_point(c_int32, c_uint_)
+    def TCntrFeatures_getChannelCountMax(self, obj: int) -> int:
+        return self.counter_channel_count
+
+    @_entry_point(c_int32, c_uint_)
+    def TCntrFeatures_getResolution(self, obj: int) -> int:
+        return 32
+
+    @_entry_point(c_int32, c_uint_)
+    def TCntrCtrlBase_getChannelStart(self, obj: int) -> int:
+        return self._get(obj).channel_start
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TCntrCtrlBase_setChannelStart(self, obj: int, value: int) -> int:
+        control: SimpleNamespace = self._get(obj)
+        if not 0 <= value < self.counter_channel_count:
+            return ErrorCode.ErrorParamOutOfRange.value
+        control.channel_start = value
+        control.channel_count = min(
+            control.channel_count, self.counter_channel_count - value
+        )
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TCntrCtrlBase_getChannelCount(self, obj: int) -> int:
+        return self._get(obj).channel_count
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TCntrCtrlBase_setChannelCount(self, obj: int, value: int) -> int:
+        control: SimpleNamespace = self._get(obj)
+        if not 0 < value <= self.counter_channel_count - control.channel_start:
+            return ErrorCode.ErrorParamOutOfRange.value
+        control.channel_count = value
+        return ErrorCode.Success.value
+
+    @_entry_point(c_uint8, c_uint_)
+    def TCntrCtrlBase_getEnabled(self, obj: int) -> int:
+        return int(self._get(obj).enabled)
+
+    @_entry_point(c_int32, c_uint_, c_uint8)
+    def TCntrCtrlBase_setEnabled(self, obj: int, value: int) -> int:
+        control: SimpleNamespace = self._get(obj)
+        if control.state == ControlState.Uninitialized:
+            return ErrorCode.ErrorFuncNotInited.value
+        self._stop_pulses(obj)
+        if not value:
+            return ErrorCode.Success.value
+        control.enabled = True
+        start_time: float = time.perf_counter()
+        for index in range(control.channel_count):
+            channel: SimpleNamespace = self._get(
+                self._get(control.channels).items[control.channel_start + index]
+            )
+            control.running += 1
+            Thread(
+                target=self._output_pulses,
+                args=(obj, control.generation, channel, start_time),
+                name="simulated pulses",
+                daemon=True,
+            ).start()
+        return ErrorCode.Success.value
+
+    @_entry_point(c_uint8, c_uint_)
+    def TCntrCtrlBase_getRunning(self, obj: int) -> int:
+        return int(self._get(obj).running > 0)
+
+    def _stop_pulses(self, obj: int) -> None:
+        control: SimpleNamespace = self._get(obj)
+        control.generation += 1
+        control.enabled = False
+        control.running = 0
+
+    def _output_pulses(
+        self,
+        obj: int,
+        generation: int,
+        channel: SimpleNamespace,
+        start_time: float,
+    ) -> None:
+        """Step the motor at the rising edges of the pulses, if the channel drives it"""
+        control: SimpleNamespace = self._get(obj)
+        period: float = channel.pulse_width.HiPeriod + channel.pulse_width.LoPeriod
+        count: int = channel.pulse_count
+        output: int = 0
+        while control.generation == generation:
+            due: int = int((time.perf_counter() - start_time) / period) + 1
+            if count:
+                due = min(due, count)
+            while output < due:
+                if channel.channel == self.step_counter:
+                    self._step_motor()
+                output += 1
+            if count and output >= count:
+                # the pulse train ends with the low level of the last pulse
+                time.sleep(max(0.0, start_time + count * period - time.perf_counter()))
+                break
+            time.sleep(max(0.0, start_time + output * period - time.perf_counter()))
+        else:
+            return
+        if control.generation != generation:
+            return
+        control.running -= 1
+        self._fire_counter(
+            obj,
+            EventId(EventId.CntTerminalCount0 + channel.channel),
+            channel.channel,
+        )
+
+    @_entry_point(c_uint_, c_uint_)
+    def TPwModulatorCtrl_getChannels(self, obj: int) -> int:
+        return self._get(obj).channels
+
+    @_entry_point(c_int32, c_uint_)
+    def TPoChannel_getChannel(self, obj: int) -> int:
+        return self._get(obj).channel
+
+    @_entry_point(c_int32, c_uint_, c_void_p)
+    def TPoChannel_getPulseWidth(self, obj: int, value: int) -> int:
+        memmove(value, addressof(self._get(obj).pulse_width), sizeof(PulseWidth))
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_, c_void_p)
+    def TPoChannel_setPulseWidth(self, obj: int, value: int) -> int:
+        pulse_width: PulseWidth = PulseWidth.from_buffer_copy(
+            (c_uint8 * sizeof(PulseWidth)).from_address(value)
+        )
+        if pulse_width.HiPeriod <= 0.0 or pulse_width.LoPeriod <= 0.0:
+            return ErrorCode.ErrorPropValueOutOfRange.value
+        self._get(obj).pulse_width = pulse_width
+        return ErrorCode.Success.value
+
+    @_entry_point(c_int32, c_uint_)
+    def TPoChannel_getPulseCount(self, obj: int) -> int:
+        return self._get(obj).pulse_count
+
+    @_entry_point(c_int32, c_uint_, c_int32)
+    def TPoChannel_setPulseCount(self, obj: int, value: int) -> int:
+        if value < 0:
+            return ErrorCode.ErrorPropValueOutOfRange.value
+        self._get(obj).pulse_count = value
+        return ErrorCode.Success.value
@@ -1,6 +1,6 @@
 from ctypes import c_double, c_int32
 
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
     "get_action",
@@ -22,89 +22,65 @@ __all__ = [
 ]
 
 
-def get_source(obj: int) -> int:
-    dll.TTrigger_getSource.argtypes = [c_uint_]
-    dll.TTrigger_getSource.restype = c_int32
-    return dll.TTrigger_getSource(obj)
+@prototype("TTrigger_getSource", [c_uint_], restype=c_int32)
+def get_source(obj: int) -> int: ...
 
 
-def set_source(obj: int, value: int) -> int:
-    dll.TTrigger_setSource.argtypes = [c_uint_, c_int32]
-    return dll.TTrigger_setSource(obj, value)
+@prototype("TTrigger_setSource", [c_uint_, c_int32])
+def set_source(obj: int, value: int) -> int: ...
 
 
-def get_edge(obj: int) -> int:
-    dll.TTrigger_getEdge.argtypes = [c_uint_]
-    dll.TTrigger_getEdge.restype = c_int32
-    return dll.TTrigger_getEdge(obj)
+@prototype("TTrigger_getEdge", [c_uint_], restype=c_int32)
+def get_edge(obj: int) -> int: ...
 
 
-def set_edge(obj: int, value: int) -> int:
-    dll.TTrigger_setEdge.argtypes = [c_uint_, c_int32]
-    return dll.TTrigger_setEdge(obj, value)
+@prototype("TTrigger_setEdge", [c_uint_, c_int32])
+def set_edge(obj: int, value: int) -> int: ...
 
 
-def get_level(obj: int) -> float:
-    dll.TTrigger_getLevel.argtypes = [c_uint_]
-    dll.TTrigger_getLevel.restype = c_double
-    return dll.TTrigger_getLevel(obj)
+@prototype("TTrigger_getLevel", [c_uint_], restype=c_double)
+def get_level(obj: int) -> float: ...
 
 
-def set_level(obj: int, value: float) -> int:
-    dll.TTrigger_setLevel.argtypes = [c_uint_, c_double]
-    return dll.TTrigger_setLevel(obj, c_double(value))
+@prototype("TTrigger_setLevel", [c_uint_, c_double])
+def set_level(obj: int, value: float) -> int: ...
 
 
-def get_action(obj: int) -> int:
-    dll.TTrigger_getAction.argtypes = [c_uint_]
-    dll.TTrigger_getAction.restype = c_int32
-    return dll.TTrigger_getAction(obj)
+@prototype("TTrigger_getAction", [c_uint_], restype=c_int32)
+def get_action(obj: int) -> int: ...
 
 
-def set_action(obj: int, value: int) -> int:
-    dll.TTrigger_setAction.argtypes = [c_uint_, c_int32]
-    return dll.TTrigger_setAction(obj, value)
+@prototype("TTrigger_setAction", [c_uint_, c_int32])
+def set_action(obj: int, value: int) -> int: ...
 
 
-def get_delay_count(obj: int) -> int:
-    dll.TTrigger_getDelayCount.argtypes = [c_uint_]
-    dll.TTrigger_getDelayCount.restype = c_int32
-    return dll.TTrigger_getDelayCount(obj)
+@prototype("TTrigger_getDelayCount", [c_uint_], restype=c_int32)
+def get_delay_count(obj: int) -> int: ...
 
 
-def set_delay_count(obj: int, value: int) -> int:
-    dll.TTrigger_setDelayCount.argtypes = [c_uint_, c_int32]
-    return dll.TTrigger_setDelayCount(obj, value)
+@prototype("TTrigger_setDelayCount", [c_uint_, c_int32])
+def set_delay_count(obj: int, value: int) -> int: ...
 
 
-def get_hysteresis_index(obj: int) -> float:
-    dll.TTrigger_getHysteresisIndex.argtypes = [c_uint_]
-    dll.TTrigger_getHysteresisIndex.restype = c_double
-    return dll.TTrigger_getHysteresisIndex(obj)
+@prototype("TTrigger_getHysteresisIndex", [c_uint_], restype=c_double)
+def get_hysteresis_index(obj: int) -> float: ...
 
 
-def set_hysteresis_index(obj: int, value: float) -> int:
-    dll.TTrigger_setHysteresisIndex.argtypes = [c_uint_, c_double]
-    return dll.TTrigger_setHysteresisIndex(obj, c_double(value))
+@prototype("TTrigger_setHysteresisIndex", [c_uint_, c_double])
+def set_hysteresis_index(obj: int, value: float) -> int: ...
 
 
-def get_filter_type(obj: int) -> int:
-    dll.TTrigger_getFilterType.argtypes = [c_uint_]
-    dll.TTrigger_getFilterType.restype = c_int32
-    return dll.TTrigger_getFilterType(obj)
+@prototype("TTrigger_getFilterType", [c_uint_], restype=c_int32)
+def get_filter_type(obj: int) -> int: ...
 
 
-def set_filter_type(obj: int, value: int) -> int:
-    dll.TTrigger_setFilterType.argtypes = [c_uint_, c_int32]
-    return dll.TTrigger_setFilterType(obj, value)
+@prototype("TTrigger_setFilterType", [c_uint_, c_int32])
+def set_filter_type(obj: int, value: int) -> int: ...
 
 
-def get_filter_cutoff_freq(obj: int) -> float:
-    dll.TTrigger_getFilterCutoffFreq.argtypes = [c_uint_]
-    dll.TTrigger_getFilterCutoffFreq.restype = c_double
-    return dll.TTrigger_getFilterCutoffFreq(obj)
+@prototype("TTrigger_getFilterCutoffFreq", [c_uint_], restype=c_double)
+def get_filter_cutoff_freq(obj: int) -> float: ...
 
 
-def set_filter_cutoff_freq(obj: int, value: float) -> int:
-    dll.TTrigger_setFilterCutoffFreq.argtypes = [c_uint_, c_double]
-    return dll.TTrigger_setFilterCutoffFreq(obj, c_double(value))
+@prototype("TTrigger_setFilterCutoffFreq", [c_uint_, c_double])
+def set_filter_cutoff_freq(obj: int, value: float) -> int: ...
@@ -2,34 +2,45 @@ from _ctypes import Array
 from ctypes import POINTER, c_double, c_int16, c_int32, c_void_p
 
 from .. import DataMark
-from . import c_uint_, dll
+from . import c_uint_, prototype
 
 __all__ = [
+    "get_conversion",
     "get_data",
+    "get_record",
+    "get_trigger",
     "prepare",
     "start",
     "stop",
-    "get_conversion",
-    "get_record",
-    "get_trigger",
 ]
 
 
-def prepare(obj: int) -> int:
-    dll.TWaveformAiCtrl_Prepare.argtypes = [c_uint_]
-    return dll.TWaveformAiCtrl_Prepare(obj)
+@prototype("TWaveformAiCtrl_Prepare", [c_uint_])
+def prepare(obj: int) -> int: ...
 
 
-def start(obj: int) -> int:
-    dll.TWaveformAiCtrl_Start.argtypes = [c_uint_]
-    return dll.TWaveformAiCtrl_Start(obj)
+@prototype("TWaveformAiCtrl_Start", [c_uint_])
+def start(obj: int) -> int: ...
 
 
-def stop(obj: int) -> int:
-    dll.TWaveformAiCtrl_Stop.argtypes = [c_uint_]
-    return dll.TWaveformAiCtrl_Stop(obj)
+@prototype("TWaveformAiCtrl_Stop", [c_uint_])
+def stop(obj: int) -> int: ...
 
 
+@prototype(
+    "TWaveformAiCtrl_GetData",
+    [
+        c_uint_,
+        c_int32,
+        c_int32,
+        c_void_p,
+        c_int32,
+        POINTER(c_int32),
+        POINTER(c_double),
+        POINTER(c_int32),
+        POINTER(DataMark),
+    ],
+)
 def get_data(
     obj: int,
     dt: int,
@@ -40,36 +51,16 @@ def get_data(
     startTime: Array[c_double] | None,
     markCount: Array[c_int32] | None,
     markBuf: Array[DataMark] | None,
-) -> int:
-    dll.TWaveformAiCtrl_GetData.argtypes = [
-        c_uint_,
-        c_int32,
-        c_int32,
-        c_void_p,
-        c_int32,
-        POINTER(c_int32),
-        POINTER(c_double),
-        POINTER(c_int32),
-        POINTER(DataMark),
-    ]
-    return dll.TWaveformAiCtrl_GetData(
-        obj, dt, count, buffer, timeout, returned, startTime, markCount, markBuf
-    )
+) -> int: ...
 
 
-def get_conversion(obj: int) -> int:
-    dll.TWaveformAiCtrl_getConversion.argtypes = [c_uint_]
-    dll.TWaveformAiCtrl_getConversion.restype = c_uint_
-    return dll.TWaveformAiCtrl_getConversion(obj)
+@prototype("TWaveformAiCtrl_getConversion", [c_uint_], restype=c_uint_)
+def get_conversion(obj: int) -> int: ...
 
 
-def get_record(obj: int) -> int:
-    dll.TWaveformAiCtrl_getRecord.argtypes = [c_uint_]
-    dll.TWaveformAiCtrl_getRecord.restype = c_uint_
-    return dll.TWaveformAiCtrl_getRecord(obj)
+@prototype("TWaveformAiCtrl_getRecord", [c_uint_], restype=c_uint_)
+def get_record(obj: int) -> int: ...
 
 
-def get_trigger(obj: int, trigIdx: int) -> int:
-    dll.TWaveformAiCtrl_getTrigger.argtypes = [c_uint_, c_int32]
-    dll.TWaveformAiCtrl_getTrigger.restype = c_uint_
-    return dll.TWaveformAiCtrl_getTrigger(obj, trigIdx)
+@prototype("TWaveformAiCtrl_getTrigger", [c_uint_, c_int32], restype=c_uint_)
+def get_trigger(obj: int, trigIdx: int) -> int: ...
@@ -0,0 +1,235 @@
+import asyncio
+from array import array
+from collections.abc import AsyncIterator, Buffer
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, Self
+
+from . import BfdAIEventArgs, ControlState, ErrorCode, EventId
+from .api import is_error_code
+from .instant_ao_ctrl import InstantAOCtrl
+from .instant_di_ctrl import InstantDICtrl
+from .instant_do_ctrl import InstantDoCtrl
+from .waveform_ai_ctrl import WaveformAICtrl
+
+__all__ = ["AsyncDevice"]
+
+
+def _check(ret: ErrorCode, action: str) -> None:
+    if is_error_code(ret):
+        raise ValueError(f"{action} is failed, the error code is 0x{ret.value:X}")
+
+
+class AsyncDevice:
+    """The controls of a device, to be awaited from an asyncio event loop
+
+    The blocking calls to the driver run in an executor of a single thread
+    dedicated to the device, so the loop never waits for the device,
+    and the calls to the device keep their order.
+    The controls are created on their first use, in the executor, too.
+    """
+
+    def __init__(self, dev_info: str) -> None:
+        self.dev_info: str = dev_info
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            1, thread_name_prefix=dev_info
+        )
+        self._wf_ai_ctrl: WaveformAICtrl | None = None
+        self._instant_ao_ctrl: InstantAOCtrl | None = None
+        self._instant_di_ctrl: InstantDICtrl | None = None
+        self._instant_do_ctrl: InstantDoCtrl | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
+
+    async def call[**_P, _R](
+        self, function: Callable[_P, _R], *args: _P.args, **kwargs: _P.kwargs
+    ) -> _R:
+        """Run `function` in the executor of the device, and get its result"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(function, *args, **kwargs)
+        )
+
+    async def close(self) -> None:
+        """Dispose of the controls, and shut the executor down"""
+        await self.call(self._dispose)
+        self._executor.shutdown()
+
+    def _dispose(self) -> None:
+        for ctrl in (
+            self._wf_ai_ctrl,
+            self._instant_ao_ctrl,
+            self._instant_di_ctrl,
+            self._instant_do_ctrl,
+        ):
+            if ctrl is not None:
+                ctrl.dispose()
+        self._wf_ai_ctrl = None
+        self._instant_ao_ctrl = None
+        self._instant_di_ctrl = None
+        self._instant_do_ctrl = None
+
+    # the controls, to be got in the executor only
+
+    def _ai(self) -> WaveformAICtrl:
+        if self._wf_ai_ctrl is None:
+            self._wf_ai_ctrl = WaveformAICtrl(self.dev_info)
+        return self._wf_ai_ctrl
+
+    def _ao(self) -> InstantAOCtrl:
+        if self._instant_ao_ctrl is None:
+            self._instant_ao_ctrl = InstantAOCtrl(self.dev_info)
+        return self._instant_ao_ctrl
+
+    def _di(self) -> InstantDICtrl:
+        if self._instant_di_ctrl is None:
+            self._instant_di_ctrl = InstantDICtrl(self.dev_info)
+        return self._instant_di_ctrl
+
+    def _do(self) -> InstantDoCtrl:
+        if self._instant_do_ctrl is None:
+            self._instant_do_ctrl = InstantDoCtrl(self.dev_info)
+        return self._instant_do_ctrl
+
+    async def waveform_ai(self) -> WaveformAICtrl:
+        """Get the waveform AI control, to be set up with `call`"""
+        return await self.call(self._ai)
+
+    # the digital and the analog I/O
+
+    async def write_levels(
+        self, levels: Iterable[float], channel_start: int = 0
+    ) -> None:
+        """Set the voltages of the AO channels, starting at `channel_start`"""
+        ret: ErrorCode = await self.call(
+            lambda: self._ao().writeAny(channel_start, None, levels)
+        )
+        _check(ret, "write levels")
+
+    async def read_bit(self, port: int, bit: int) -> bool:
+        ret: ErrorCode
+        data: int
+        ret, data = await self.call(lambda: self._di().readBit(port, bit))
+        _check(ret, "read bit")
+        return bool(data)
+
+    async def write_bit(self, port: int, bit: int, value: bool) -> None:
+        ret: ErrorCode = await self.call(lambda: self._do().writeBit(port, bit, value))
+        _check(ret, "write bit")
+
+    # the waveform AI
+
+    def _fill(self, buffer: Buffer, timeout: int) -> int:
+        ai: WaveformAICtrl = self._ai()
+        view: memoryview = memoryview(buffer)
+        size: int = view.nbytes // view.itemsize
+        stored: int = 0
+        while stored < size:
+            ret: ErrorCode
+            returned: int
+            ret, returned = ai.getDataInto(buffer, stored, timeout=timeout)
+            _check(ret, "get data")
+            if not returned:
+                break
+            stored += returned
+        return stored
+
+    def _timeout(self, sample_count: int) -> int:
+        """The time to wait for `sample_count` samples, [ms]"""
+        ai: WaveformAICtrl = self._ai()
+        scan_count: float = sample_count / ai.conversion.channelCount
+        return round(2000 * scan_count / ai.conversion.clockRate) + 1000
+
+    def _read_block(self, buffer: Buffer) -> int:
+        ai: WaveformAICtrl = self._ai()
+        view: memoryview = memoryview(buffer)
+        sample_count: int = view.nbytes // view.itemsize
+        ai.record.sectionLength = sample_count // ai.conversion.channelCount
+        ai.record.sectionCount = 1
+        _check(ai.prepare(), "prepare")
+        _check(ai.start(), "start")
+        try:
+            return self._fill(buffer, self._timeout(sample_count))
+        finally:
+            if ai.state == ControlState.Running:
+                _check(ai.stop(), "stop")
+
+    async def read_block(self, buffer: Buffer) -> int:
+        """Acquire the whole scans that fit into `buffer` once, with the AI conversion set up as it is
+
+        The buffer type selects the sample type, as with `WaveformAICtrl.getDataInto`.
+        Return the number of the samples stored.
+        """
+        return await self.call(self._read_block, buffer)
+
+    async def sections(
+        self, section_length: int, raw: bool = False
+    ) -> AsyncIterator[memoryview]:
+        """Stream the AI, and yield every section of `section_length` scans as it's ready
+
+        The sections are fresh buffers of the raw counts or of the voltages,
+        so they may be kept. All the samples every data-ready event reports are read,
+        so that the stream keeps up even if the driver merges the events;
+        a report of no whole section yields a shorter one, but never an empty one.
+        Should the driver lose any samples, `BufferError` is raised.
+        The streaming stops as the iteration ends; to end it at once
+        when leaving the loop early, wrap the iterator into `contextlib.aclosing`.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        events: asyncio.Queue[BfdAIEventArgs] = asyncio.Queue()
+
+        def on_event(_sender: WaveformAICtrl, args: BfdAIEventArgs) -> None:
+            loop.call_soon_threadsafe(events.put_nowait, args)
+
+        ai: WaveformAICtrl = await self.waveform_ai()
+        handlers: tuple[tuple[Callable[..., None], Callable[..., None]], ...] = (
+            (ai.addDataReadyHandler, ai.removeDataReadyHandler),
+            (ai.addOverrunHandler, ai.removeOverrunHandler),
+            (ai.addCacheOverflowHandler, ai.removeCacheOverflowHandler),
+            (ai.addStoppedHandler, ai.removeStoppedHandler),
+        )
+
+        def start() -> tuple[int, int]:
+            for add, _remove in handlers:
+                add(on_event)
+            ai.record.sectionLength = section_length
+            ai.record.sectionCount = 0  # endless
+            _check(ai.prepare(), "prepare")
+            _check(ai.start(), "start")
+            section_size: int = section_length * ai.conversion.channelCount
+            return section_size, self._timeout(section_size)
+
+        def stop() -> None:
+            if ai.state == ControlState.Running:
+                ai.stop()
+            for _add, remove in handlers:
+                remove(on_event)
+
+        try:
+            section_size: int
+            timeout: int
+            section_size, timeout = await self.call(start)
+            while True:
+                args: BfdAIEventArgs = await events.get()
+                if args.Id in (
+                    EventId.BufferedAIOverrun,
+                    EventId.BufferedAICacheOverflow,
+                ):
+                    raise BufferError(f"the driver has lost {args.Count} samples")
+                if args.Id == EventId.BufferedAIStopped:
+                    break
+                remaining: int = args.Count
+                while remaining > 0:
+                    section: memoryview = memoryview(
+                        array("h" if raw else "d", [0]) * min(section_size, remaining)
+                    )
+                    stored: int = await self.call(self._fill, section, timeout)
+                    if not stored:
+                        break
+                    remaining -= stored
+                    yield section[:stored]
+        finally:
+            await self.call(stop)
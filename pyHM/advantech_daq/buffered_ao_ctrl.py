@@ -0,0 +1,155 @@
+from _ctypes import Array
+from collections.abc import Buffer
+from ctypes import byref, c_byte, c_int32
+from typing import Callable
+
+from . import BfdAOEventArgs, ErrorCode, EventId, Scenario
+from .ao_ctrl_base import AOCtrlBase
+from .api import buffered_ao_ctrl
+from .conversion import Conversion
+from .record import Record
+from .trigger import Trigger
+
+__all__ = ["BufferedAOCtrl"]
+
+
+class BufferedAOCtrl(AOCtrlBase):
+    def __init__(self, dev_info: str, profile_path: str = ""):
+        self._conversion: Conversion | None = None
+        self._record: Record | None = None
+        self._triggers: list[Trigger] = []
+        self._transmitted: Array[c_int32] = (c_int32 * 1)()
+        super().__init__(Scenario.BufferedAO, dev_info, profile_path)
+
+    @property
+    def conversion(self) -> Conversion:
+        if self._conversion is None:
+            self._conversion = Conversion(
+                buffered_ao_ctrl.get_conversion(self._obj),
+                self.features.channelCountMax,
+            )
+        return self._conversion
+
+    @property
+    def record(self) -> Record:
+        if self._record is None:
+            self._record = Record(buffered_ao_ctrl.get_record(self._obj))
+        return self._record
+
+    @property
+    def trigger(self) -> list[Trigger]:
+        if not self._triggers:
+            for i in range(self.features.triggerCount):
+                self._triggers.append(
+                    Trigger(buffered_ao_ctrl.get_trigger(self._obj, i))
+                )
+        return self._triggers
+
+    def addDataTransmittedHandler(
+        self, handler: Callable[["BufferedAOCtrl", BfdAOEventArgs], None]
+    ) -> None:
+        self.addEventHandler(EventId.BufferedAODataTransmitted, handler, BfdAOEventArgs)
+
+    def removeDataTransmittedHandler(
+        self, handler: Callable[["BufferedAOCtrl", BfdAOEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId.BufferedAODataTransmitted, handler)
+
+    def addUnderrunHandler(
+        self, handler: Callable[["BufferedAOCtrl", BfdAOEventArgs], None]
+    ) -> None:
+        self.addEventHandler(EventId.BufferedAOUnderRun, handler, BfdAOEventArgs)
+
+    def removeUnderrunHandler(
+        self, handler: Callable[["BufferedAOCtrl", BfdAOEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId.BufferedAOUnderRun, handler)
+
+    def addCacheEmptiedHandler(
+        self, handler: Callable[["BufferedAOCtrl", BfdAOEventArgs], None]
+    ) -> None:
+        self.addEventHandler(EventId.BufferedAOCacheEmptied, handler, BfdAOEventArgs)
+
+    def removeCacheEmptiedHandler(
+        self, handler: Callable[["BufferedAOCtrl", BfdAOEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId.BufferedAOCacheEmptied, handler)
+
+    def addTransStoppedHandler(
+        self, handler: Callable[["BufferedAOCtrl", BfdAOEventArgs], None]
+    ) -> None:
+        self.addEventHandler(EventId.BufferedAOTransStopped, handler, BfdAOEventArgs)
+
+    def removeTransStoppedHandler(
+        self, handler: Callable[["BufferedAOCtrl", BfdAOEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId.BufferedAOTransStopped, handler)
+
+    def addStoppedHandler(
+        self, handler: Callable[["BufferedAOCtrl", BfdAOEventArgs], None]
+    ) -> None:
+        self.addEventHandler(EventId.BufferedAOStopped, handler, BfdAOEventArgs)
+
+    def removeStoppedHandler(
+        self, handler: Callable[["BufferedAOCtrl", BfdAOEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId.BufferedAOStopped, handler)
+
+    def prepare(self) -> ErrorCode:
+        return ErrorCode.lookup(buffered_ao_ctrl.prepare(self._obj))
+
+    def start(self) -> ErrorCode:
+        return ErrorCode.lookup(buffered_ao_ctrl.start(self._obj))
+
+    def stop(self, action: int = 0) -> ErrorCode:
+        """Stop the output, at once by default
+
+        A non-zero `action` lets the data already in the buffer be output first.
+        """
+        return ErrorCode.lookup(buffered_ao_ctrl.stop(self._obj, action))
+
+    def setData(
+        self,
+        buffer: Buffer,
+        offset: int = 0,
+        count: int | None = None,
+        timeout: int = 0,
+    ) -> tuple[ErrorCode, int]:
+        """Pass the samples from `buffer`, starting at item `offset`, to the output
+
+        The buffer type selects the sample type: 16- or 32-bit signed integers
+        for the raw data, or `double` for the scaled one.
+        The samples of the channels alternate within every scan.
+        Return the error code and the number of the samples taken.
+        """
+        view: memoryview = memoryview(buffer)
+        if not view.c_contiguous:
+            raise TypeError("a contiguous buffer is required")
+        item_format: str = view.format.lstrip("@=<")
+        if not (
+            (item_format in ("h", "i", "l") and view.itemsize in (2, 4))
+            or (item_format == "d" and view.itemsize == 8)
+        ):
+            raise TypeError(f"unsupported buffer format {view.format!r}")
+        size: int = view.nbytes // view.itemsize
+        if count is None:
+            count = size - offset
+        if offset < 0 or count < 0 or offset + count > size:
+            raise ValueError("the data do not fit into the buffer")
+        if not count:
+            return ErrorCode.Success, 0
+
+        # the library does not write into the buffer, but ctypes wants it writable
+        if view.readonly:
+            view = memoryview(bytearray(view)).cast(item_format)
+        ret: ErrorCode = ErrorCode.lookup(
+            buffered_ao_ctrl.set_data(
+                self._obj,
+                view.itemsize,
+                count,
+                byref(c_byte.from_buffer(view.cast("B"), offset * view.itemsize)),
+                timeout,
+                self._transmitted,
+            )
+        )
+        return ret, self._transmitted[0]
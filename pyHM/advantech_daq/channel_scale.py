@@ -0,0 +1,117 @@
+from _ctypes import Array
+from array import array
+from bisect import bisect_left
+from collections.abc import Buffer
+from ctypes import c_int32, c_wchar, create_unicode_buffer
+from typing import Sequence
+
+from . import MAX_VRG_DESC_LEN, ErrorCode, MapFuncPiece, MathInterval, ValueRange, api
+from .api import is_error_code
+
+__all__ = ["ChannelScale", "value_range_interval"]
+
+
+def value_range_interval(value_range: ValueRange) -> MathInterval:
+    interval: MathInterval = MathInterval()
+    unit: Array[c_int32] = (c_int32 * 1)()
+    description: Array[c_wchar] = create_unicode_buffer(MAX_VRG_DESC_LEN)
+    ret: ErrorCode = ErrorCode.lookup(
+        api.adx_get_value_range_information(
+            value_range, MAX_VRG_DESC_LEN, description, interval, unit
+        )
+    )
+    if is_error_code(ret):
+        raise ValueError(
+            f"get value range information is failed, the error code is 0x{ret.value:X}"
+        )
+    return interval
+
+
+class ChannelScale:
+    """Convert the raw ADC counts of a channel into its physical values
+
+    The counts span the value range of the channel, `0` being its minimum.
+    A scale table of the channel, if any, is applied then.
+    As every piece of the table is linear, the conversion stays affine
+    within the piece, and the raw counts are converted in one pass.
+    """
+
+    def __init__(
+        self,
+        value_range: MathInterval,
+        data_mask: int,
+        scale_table: Sequence[MapFuncPiece] = (),
+    ) -> None:
+        self._data_mask: int = data_mask
+        gain: float = (value_range.Max - value_range.Min) / (data_mask + 1)
+        offset: float = value_range.Min
+
+        # upper limits in the raw counts, and the gains and offsets below them
+        self._limits: list[float] = []
+        self._gains: list[float] = []
+        self._offsets: list[float] = []
+        for piece in sorted(scale_table, key=lambda p: p.UpperLimit):
+            if piece.Degree > 1:
+                raise ValueError("only linear scale table pieces are supported")
+            self._limits.append((piece.UpperLimit - offset) / gain)
+            self._gains.append(piece.Coef[1] * gain if piece.Degree else 0.0)
+            self._offsets.append(
+                piece.Coef[0] + (piece.Coef[1] * offset if piece.Degree else 0.0)
+            )
+        if not self._limits:
+            self._limits.append(float(data_mask))
+            self._gains.append(gain)
+            self._offsets.append(offset)
+
+    @property
+    def affine(self) -> bool:
+        return len(self._limits) == 1
+
+    @property
+    def gain(self) -> float:
+        """The physical value per count, the conversion being affine"""
+        return self._gains[0]
+
+    @property
+    def offset(self) -> float:
+        """The physical value of the zero count, the conversion being affine"""
+        return self._offsets[0]
+
+    def _piece(self, raw: float) -> int:
+        return min(bisect_left(self._limits, raw), len(self._limits) - 1)
+
+    def __call__(self, raw: int) -> float:
+        index: int = self._piece(raw & self._data_mask)
+        return self._gains[index] * (raw & self._data_mask) + self._offsets[index]
+
+    def counts(self, raw: Buffer) -> Sequence[int]:
+        """Get the raw counts from a 1-D buffer, masked by the data mask"""
+        view: memoryview = memoryview(raw)
+        item_format: str = view.format.lstrip("@=<")
+        if item_format.isupper() and self._data_mask == (1 << 8 * view.itemsize) - 1:
+            return view
+        # masking makes the signed counts unsigned, too
+        return array(item_format.upper(), map(self._data_mask.__and__, view))
+
+    def scale(self, raw: Buffer) -> array[float]:
+        """Convert the raw counts from a 1-D buffer in one pass"""
+        counts: Sequence[int] = self.counts(raw)
+        if self.affine:
+            return array(
+                "d",
+                map(self._offsets[0].__add__, map(self._gains[0].__mul__, counts)),
+            )
+        return array("d", map(self, counts))
+
+    def mean(self, raw: Buffer) -> float:
+        """Get the mean physical value of the raw counts from a 1-D buffer
+
+        For an affine conversion, the counts are averaged before the scaling.
+        """
+        counts: Sequence[int] = self.counts(raw)
+        if not len(counts):
+            raise ValueError("no data to average")
+        if self.affine:
+            return self._gains[0] * (sum(counts) / len(counts)) + self._offsets[0]
+        scaled: array[float] = self.scale(counts)
+        return sum(scaled) / len(scaled)
@@ -0,0 +1,92 @@
+from typing import Callable
+
+from . import CntrEventArgs, ErrorCode, EventId, Scenario
+from .api import cntr_ctrl_base, is_error_code
+from .cntr_features import CntrFeatures
+from .daq_ctrl_base import DAQCtrlBase
+
+__all__ = ["CntrCtrlBase"]
+
+
+class CntrCtrlBase(DAQCtrlBase):
+    def __init__(
+        self,
+        scenario: Scenario,
+        dev_info: str,
+        profile_path: str = "",
+    ) -> None:
+        self._cntr_features: CntrFeatures | None = None
+        super().__init__(scenario, dev_info, profile_path)
+
+    def _invalidateFeatures(self) -> None:
+        super()._invalidateFeatures()
+        self._cntr_features = None
+
+    @property
+    def features(self) -> CntrFeatures:
+        if self._cntr_features is None:
+            self._cntr_features = CntrFeatures(cntr_ctrl_base.get_features(self._obj))
+        return self._cntr_features
+
+    @property
+    def channelStart(self) -> int:
+        return cntr_ctrl_base.get_channel_start(self._obj)
+
+    @channelStart.setter
+    def channelStart(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("an int is required")
+        ret: ErrorCode = ErrorCode.lookup(
+            cntr_ctrl_base.set_channel_start(self._obj, value)
+        )
+        if is_error_code(ret):
+            raise ValueError(
+                f"set channelStart is failed, the error code is 0x{ret.value:X}"
+            )
+
+    @property
+    def channelCount(self) -> int:
+        return cntr_ctrl_base.get_channel_count(self._obj)
+
+    @channelCount.setter
+    def channelCount(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("an int is required")
+        ret: ErrorCode = ErrorCode.lookup(
+            cntr_ctrl_base.set_channel_count(self._obj, value)
+        )
+        if is_error_code(ret):
+            raise ValueError(
+                f"set channelCount is failed, the error code is 0x{ret.value:X}"
+            )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(cntr_ctrl_base.get_enabled(self._obj))
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError("a bool is required")
+        ret: ErrorCode = ErrorCode.lookup(cntr_ctrl_base.set_enabled(self._obj, value))
+        if is_error_code(ret):
+            raise ValueError(
+                f"set enabled is failed, the error code is 0x{ret.value:X}"
+            )
+
+    @property
+    def running(self) -> bool:
+        return bool(cntr_ctrl_base.get_running(self._obj))
+
+    def addTerminalCountHandler(
+        self, channel: int, handler: Callable[["CntrCtrlBase", CntrEventArgs], None]
+    ) -> None:
+        """Call `handler` as the counter `channel` reaches its terminal count"""
+        self.addEventHandler(
+            EventId(EventId.CntTerminalCount0 + channel), handler, CntrEventArgs
+        )
+
+    def removeTerminalCountHandler(
+        self, channel: int, handler: Callable[["CntrCtrlBase", CntrEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId(EventId.CntTerminalCount0 + channel), handler)
@@ -0,0 +1,16 @@
+from .api import cntr_features
+from .features import Features, feature
+
+__all__ = ["CntrFeatures"]
+
+
+class CntrFeatures(Features):
+    @property
+    @feature
+    def channelCountMax(self) -> int:
+        return cntr_features.get_channel_count_max(self._obj)
+
+    @property
+    @feature
+    def resolution(self) -> int:
+        return cntr_features.get_resolution(self._obj)
@@ -1,9 +1,13 @@
 from _ctypes import Array
 from ctypes import c_byte
+from typing import TYPE_CHECKING
 
-from . import ErrorCode, SignalDrop, utils
+from . import ErrorCode, utils
 from .api import conversion, is_error_code
 
+if TYPE_CHECKING:
+    from . import SignalDrop
+
 __all__ = ["Conversion"]
 
 
@@ -13,11 +17,13 @@ class Conversion:
         self._channel_count: int = channel_count
 
     @property
-    def clockSource(self) -> SignalDrop:
+    def clockSource(self) -> "SignalDrop":
         return utils.toSignalDrop(conversion.get_clock_source(self._obj))
 
     @clockSource.setter
-    def clockSource(self, value: SignalDrop) -> None:
+    def clockSource(self, value: "SignalDrop") -> None:
+        from . import SignalDrop
+
         if not isinstance(value, SignalDrop):
             raise TypeError("a SignalDrop is required")
         ret: ErrorCode = ErrorCode.lookup(conversion.set_clock_source(self._obj, value))
@@ -1,4 +1,6 @@
+from ctypes import Structure, sizeof, string_at
 from pathlib import Path
+from typing import Callable, Self
 
 from . import (
     AccessMode,
@@ -6,10 +8,11 @@ from . import (
     DeviceInformation,
     DeviceTreeNode,
     ErrorCode,
+    EventId,
     Scenario,
     utils,
 )
-from .api import array, daq_ctrl_base, is_error_code
+from .api import DaqEventProc, array, daq_ctrl_base, is_error_code
 from .device_ctrl import DeviceCtrl
 
 __all__ = ["DAQCtrlBase"]
@@ -23,6 +26,7 @@ class DAQCtrlBase:
         profile_path: str = "",
     ) -> None:
         self._deviceCtrl: DeviceCtrl | None = None
+        self._eventProcs: dict[tuple[EventId, Callable], DaqEventProc] = {}
         self._obj: int = daq_ctrl_base.create(scenario.value)
 
         if dev_info:
@@ -76,6 +80,36 @@ class DAQCtrlBase:
             raise ValueError(
                 f"The device is not opened, and the error code is 0x{ret.value:X}"
             )
+        self._invalidateFeatures()
+
+    def _invalidateFeatures(self) -> None:
+        """Forget the features of the device, for it has changed or been refreshed"""
+
+    def addEventHandler[_A: Structure](
+        self,
+        eventId: EventId,
+        handler: Callable[[Self, _A], None],
+        argsType: type[_A],
+    ) -> None:
+        """Call `handler` with the control and a copy of the arguments on the event
+
+        The handler is called from a thread of the driver.
+        """
+        if (eventId, handler) in self._eventProcs:
+            return
+
+        def event_proc(_sender: int | None, args: int, _user_param: int | None) -> None:
+            handler(self, argsType.from_buffer_copy(string_at(args, sizeof(argsType))))
+
+        proc: DaqEventProc = DaqEventProc(event_proc)
+        daq_ctrl_base.add_event_handler(self._obj, eventId.value, proc, None)
+        # the callback must outlive its registration
+        self._eventProcs[eventId, handler] = proc
+
+    def removeEventHandler(self, eventId: EventId, handler: Callable) -> None:
+        proc: DaqEventProc | None = self._eventProcs.pop((eventId, handler), None)
+        if proc is not None:
+            daq_ctrl_base.remove_event_handler(self._obj, eventId.value, proc, None)
 
     @property
     def state(self) -> ControlState:
@@ -84,7 +118,10 @@ class DAQCtrlBase:
     @property
     def device(self) -> DeviceCtrl:
         if self._deviceCtrl is None:
-            self._deviceCtrl = DeviceCtrl(daq_ctrl_base.get_device(self._obj))
+            self._deviceCtrl = DeviceCtrl(
+                daq_ctrl_base.get_device(self._obj),
+                on_refresh=self._invalidateFeatures,
+            )
         return self._deviceCtrl
 
     @property
@@ -8,28 +8,37 @@ from ctypes import (
     create_unicode_buffer,
     pointer,
 )
+from typing import TYPE_CHECKING, Callable
 
 from . import (
     AccessMode,
     DeviceTreeNode,
     ErrorCode,
     EventId,
-    ProductId,
     TerminalBoard,
     utils,
 )
 from .api import array, device_ctrl, is_error_code
 
+if TYPE_CHECKING:
+    from . import ProductId
+
 __all__ = ["DeviceCtrl"]
 
 
 class DeviceCtrl:
-    def __init__(self, native_dev: int) -> None:
+    def __init__(
+        self, native_dev: int, on_refresh: Callable[[], None] | None = None
+    ) -> None:
         self._obj: int = native_dev
+        self._on_refresh: Callable[[], None] | None = on_refresh
 
     # method
     def refresh(self) -> ErrorCode:
-        return ErrorCode.lookup(device_ctrl.refresh(self._obj))
+        ret: ErrorCode = ErrorCode.lookup(device_ctrl.refresh(self._obj))
+        if self._on_refresh is not None:
+            self._on_refresh()
+        return ret
 
     def readRegister(
         self,
@@ -122,7 +131,7 @@ class DeviceCtrl:
         return utils.toAccessMode(device_ctrl.get_access_mode(self._obj))
 
     @property
-    def productId(self) -> ProductId:
+    def productId(self) -> "ProductId":
         return utils.toProductId(device_ctrl.get_product_id(self._obj))
 
     @property
@@ -20,6 +20,10 @@ class DIOCtrlBase(DAQCtrlBase):
         # self._dio_ports = []
         super().__init__(scenario, dev_info, profile_path)
 
+    def _invalidateFeatures(self) -> None:
+        super()._invalidateFeatures()
+        self._dio_features = None
+
     @property
     def features(self) -> DIOFeatures:
         if self._dio_features is None:
@@ -0,0 +1,49 @@
+from ctypes import Structure
+from functools import wraps
+from typing import Any, Callable
+
+__all__ = ["Features", "feature"]
+
+
+class Features:
+    """The static capabilities of a device
+
+    Every feature is queried from the driver once, and its value is kept
+    in the snapshot until the features are invalidated.
+    """
+
+    def __init__(self, native_features: int) -> None:
+        self._obj: int = native_features
+        self._snapshot: dict[tuple[Any, ...], Any] = {}
+
+    def invalidate(self) -> None:
+        """Forget the feature values, so that they are queried again"""
+        self._snapshot.clear()
+
+
+def _frozen(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _thawed(value: Any) -> Any:
+    # hand out copies, so that the snapshot can't be changed by accident
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, Structure):
+        return type(value).from_buffer_copy(value)
+    return value
+
+
+def feature[F: Callable[..., Any]](query: F) -> F:
+    """Keep the value of a feature in the snapshot, separately for every argument"""
+
+    @wraps(query)
+    def wrapper(self: Features, *args: Any, **kwargs: Any) -> Any:
+        key: tuple[Any, ...] = (query.__name__, *args, *sorted(kwargs.items()))
+        if key not in self._snapshot:
+            self._snapshot[key] = _frozen(query(self, *args, **kwargs))
+        return _thawed(self._snapshot[key])
+
+    return wrapper  # type: ignore
@@ -1,7 +1,8 @@
 from _ctypes import Array
 from ctypes import c_uint8
+from typing import Callable
 
-from . import ErrorCode, Scenario
+from . import DiSnapEventArgs, ErrorCode, EventId, Scenario
 from .api import array, instant_di_ctrl, is_error_code
 from .di_cos_int_port import DICosIntPort
 from .di_int_channel import DIIntChannel
@@ -95,3 +96,36 @@ class InstantDICtrl(DIOCtrlBase):
         data_array: Array[c_uint8] = (c_uint8 * 1)()
         ret: int = instant_di_ctrl.read_bit(self._obj, port, bit, data_array)
         return ErrorCode.lookup(ret), data_array[0]
+
+    def snapStart(self) -> ErrorCode:
+        """Start watching the enabled interrupts of the channels and the ports"""
+        return ErrorCode.lookup(instant_di_ctrl.snap_start(self._obj))
+
+    def snapStop(self) -> ErrorCode:
+        return ErrorCode.lookup(instant_di_ctrl.snap_stop(self._obj))
+
+    def addInterruptHandler(
+        self, channel: int, handler: Callable[["InstantDICtrl", DiSnapEventArgs], None]
+    ) -> None:
+        """Call `handler` on the interrupt of DI `channel`, while snapping"""
+        self.addEventHandler(
+            EventId(EventId.DIIntChannel000 + channel), handler, DiSnapEventArgs
+        )
+
+    def removeInterruptHandler(
+        self, channel: int, handler: Callable[["InstantDICtrl", DiSnapEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId(EventId.DIIntChannel000 + channel), handler)
+
+    def addChangeOfStateHandler(
+        self, port: int, handler: Callable[["InstantDICtrl", DiSnapEventArgs], None]
+    ) -> None:
+        """Call `handler` as the masked channels of DI `port` change, while snapping"""
+        self.addEventHandler(
+            EventId(EventId.DICosIntPort000 + port), handler, DiSnapEventArgs
+        )
+
+    def removeChangeOfStateHandler(
+        self, port: int, handler: Callable[["InstantDICtrl", DiSnapEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId(EventId.DICosIntPort000 + port), handler)
@@ -0,0 +1,57 @@
+from ctypes import pointer
+
+from . import ErrorCode, PulseWidth
+from .api import is_error_code, po_channel
+
+__all__ = ["PoChannel"]
+
+
+class PoChannel:
+    """A pulse output channel of a counter"""
+
+    def __init__(self, po_channel_obj: int) -> None:
+        self._obj: int = po_channel_obj
+
+    @property
+    def channel(self) -> int:
+        return po_channel.get_channel(self._obj)
+
+    @property
+    def pulseWidth(self) -> PulseWidth:
+        """The durations of the high and the low levels of a pulse, [s]"""
+        x: PulseWidth = PulseWidth()
+        ret: ErrorCode = ErrorCode.lookup(
+            po_channel.get_pulse_width(self._obj, pointer(x))
+        )
+        if is_error_code(ret):
+            raise ValueError(
+                f"get pulseWidth is failed, the error code is 0x{ret.value:X}"
+            )
+        return x
+
+    @pulseWidth.setter
+    def pulseWidth(self, value: PulseWidth) -> None:
+        if not isinstance(value, PulseWidth):
+            raise TypeError("a PulseWidth is required")
+        ret: ErrorCode = ErrorCode.lookup(
+            po_channel.set_pulse_width(self._obj, pointer(value))
+        )
+        if is_error_code(ret):
+            raise ValueError(
+                f"set pulseWidth is failed, the error code is 0x{ret.value:X}"
+            )
+
+    @property
+    def pulseCount(self) -> int:
+        """The number of the pulses to output as the channel is enabled, `0` for endless"""
+        return po_channel.get_pulse_count(self._obj)
+
+    @pulseCount.setter
+    def pulseCount(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("an int is required")
+        ret: ErrorCode = ErrorCode.lookup(po_channel.set_pulse_count(self._obj, value))
+        if is_error_code(ret):
+            raise ValueError(
+                f"set pulseCount is failed, the error code is 0x{ret.value:X}"
+            )
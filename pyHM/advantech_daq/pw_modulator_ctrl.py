@@ -0,0 +1,29 @@
+from . import Scenario
+from .api import array, pw_modulator_ctrl
+from .cntr_ctrl_base import CntrCtrlBase
+from .po_channel import PoChannel
+
+__all__ = ["PwModulatorCtrl"]
+
+
+class PwModulatorCtrl(CntrCtrlBase):
+    """Output the pulse trains of the given pulse widths on the counter channels
+
+    A channel with a non-zero pulse count stops by itself after the pulses,
+    and the control stops running then.
+    """
+
+    def __init__(self, dev_info: str, profile_path: str = "") -> None:
+        self._po_channels: list[PoChannel] = []
+        super().__init__(Scenario.PulseWidthModulator, dev_info, profile_path)
+
+    @property
+    def channels(self) -> list[PoChannel]:
+        if not self._po_channels:
+            count: int = self.features.channelCountMax
+            native_channel_arr: int = pw_modulator_ctrl.get_channels(self._obj)
+            for i in range(count):
+                self._po_channels.append(
+                    PoChannel(array.get_item(native_channel_arr, i))
+                )
+        return self._po_channels
@@ -1,13 +1,17 @@
+from typing import TYPE_CHECKING
+
 from . import (
     ActiveSignal,
     ErrorCode,
     FilterType,
-    SignalDrop,
     TriggerAction,
     utils,
 )
 from .api import is_error_code, trigger
 
+if TYPE_CHECKING:
+    from . import SignalDrop
+
 __all__ = ["Trigger"]
 
 
@@ -16,11 +20,13 @@ class Trigger:
         self._obj: int = native_trig_obj
 
     @property
-    def source(self) -> SignalDrop:
+    def source(self) -> "SignalDrop":
         return utils.toSignalDrop(trigger.get_source(self._obj))
 
     @source.setter
-    def source(self, value: SignalDrop) -> None:
+    def source(self, value: "SignalDrop") -> None:
+        from . import SignalDrop
+
         if not isinstance(value, SignalDrop):
             raise TypeError("a SignalDrop is required")
         ret: ErrorCode = ErrorCode.lookup(trigger.set_source(self._obj, value.value))
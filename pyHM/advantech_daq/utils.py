@@ -1,5 +1,6 @@
 from _ctypes import Array
-from typing import Any
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable
 
 from . import (
     AccessMode,
@@ -10,9 +11,6 @@ from . import (
     BurnoutRetType,
     CodingType,
     ControlState,
-    CounterCapability,
-    CounterCascadeGroup,
-    CountingType,
     CouplingType,
     Depository,
     DIOPortDir,
@@ -20,21 +18,29 @@ from . import (
     ErrorRetType,
     EventId,
     FilterType,
-    FreqMeasureMethod,
     IEPEType,
     ImpedanceType,
-    OutSignalType,
-    ProductId,
     SamplingMethod,
-    SignalDrop,
     SignalPolarity,
     TerminalBoard,
     TriggerAction,
     ValueRange,
 )
 
+if TYPE_CHECKING:
+    from . import (
+        CounterCapability,
+        CounterCascadeGroup,
+        CountingType,
+        FreqMeasureMethod,
+        OutSignalType,
+        ProductId,
+        SignalDrop,
+    )
+
 __all__ = [
     "create_array",
+    "enum_decoder",
     "toAISignalType",
     "toAccessMode",
     "toActiveSignal",
@@ -72,10 +78,54 @@ def create_array[T](dtype: type[T], num: int) -> Array[T]:
     return (dtype * num)()
 
 
+class _DecodeTable[T](dict[Any, T]):
+    """The items of an enumeration by their values, and by themselves
+
+    Anything else the enumeration has, as `value in enum_type` tells,
+    is converted the usual way.
+    """
+
+    def __init__(self, enum_type: type[T]) -> None:
+        super().__init__((item.value, item) for item in enum_type)  # type: ignore
+        self.update((item, item) for item in enum_type)  # type: ignore
+        self._enum_type: type[T] = enum_type
+
+    def __missing__(self, value: Any) -> T:
+        if value not in self._enum_type:  # type: ignore
+            raise ValueError(f"{self._enum_type.__name__} has no {value!r}")
+        return self._enum_type(value)  # type: ignore
+
+
+_decode_tables: dict[type, _DecodeTable] = {}
+
+
+def enum_decoder[T](enum_type: type[T]) -> Callable[[Any], T]:
+    """Get a function that converts a value into the item of the enumeration
+
+    The lookup table of an enumeration is built on the first call.
+    """
+    table: _DecodeTable[T] | None = _decode_tables.get(enum_type)
+    if table is None:
+        table = _decode_tables[enum_type] = _DecodeTable(enum_type)
+    return table.__getitem__
+
+
 def to_enum_item[T](enum_type: type[T], value: Any) -> T:
-    if value not in enum_type:
-        raise ValueError(f"{enum_type.__name__} has no {value!r}")
-    return enum_type(value)
+    return enum_decoder(enum_type)(value)
+
+
+_lazy_enum_decoders: dict[str, Callable[[Any], Any]] = {}
+
+
+def _lazy_enum_decoder(enum_name: str) -> Callable[[Any], Any]:
+    # the enumerations the package creates on demand are looked up once,
+    # for an import statement in every call would cost more than the conversion
+    decoder: Callable[[Any], Any] | None = _lazy_enum_decoders.get(enum_name)
+    if decoder is None:
+        decoder = _lazy_enum_decoders[enum_name] = enum_decoder(
+            getattr(import_module(__package__), enum_name)
+        )
+    return decoder
 
 
 def toAccessMode(value: int) -> AccessMode:
@@ -86,8 +136,8 @@ def toControlState(value: int) -> ControlState:
     return to_enum_item(enum_type=ControlState, value=value)
 
 
-def toProductId(value: int) -> ProductId:
-    return to_enum_item(enum_type=ProductId, value=value)
+def toProductId(value: int) -> "ProductId":
+    return _lazy_enum_decoder("ProductId")(value)
 
 
 def toTerminalBoard(value: int) -> TerminalBoard:
@@ -122,8 +172,8 @@ def toBurnoutRetType(value: int) -> BurnoutRetType:
     return to_enum_item(enum_type=BurnoutRetType, value=value)
 
 
-def toSignalDrop(value: int) -> SignalDrop:
-    return to_enum_item(enum_type=SignalDrop, value=value)
+def toSignalDrop(value: int) -> "SignalDrop":
+    return _lazy_enum_decoder("SignalDrop")(value)
 
 
 def toSignalPolarity(value: int) -> SignalPolarity:
@@ -150,24 +200,24 @@ def toEventId(value: int) -> EventId:
     return to_enum_item(enum_type=EventId, value=value)
 
 
-def toCounterCapability(value: int) -> CounterCapability:
-    return to_enum_item(enum_type=CounterCapability, value=value)
+def toCounterCapability(value: int) -> "CounterCapability":
+    return _lazy_enum_decoder("CounterCapability")(value)
 
 
-def toCounterCascadeGroup(value: int) -> CounterCascadeGroup:
-    return to_enum_item(enum_type=CounterCascadeGroup, value=value)
+def toCounterCascadeGroup(value: int) -> "CounterCascadeGroup":
+    return _lazy_enum_decoder("CounterCascadeGroup")(value)
 
 
-def toFreqMeasureMethod(value: int) -> FreqMeasureMethod:
-    return to_enum_item(enum_type=FreqMeasureMethod, value=value)
+def toFreqMeasureMethod(value: int) -> "FreqMeasureMethod":
+    return _lazy_enum_decoder("FreqMeasureMethod")(value)
 
 
-def toCountingType(value: int) -> CountingType:
-    return to_enum_item(enum_type=CountingType, value=value)
+def toCountingType(value: int) -> "CountingType":
+    return _lazy_enum_decoder("CountingType")(value)
 
 
-def toOutSignalType(value: int) -> OutSignalType:
-    return to_enum_item(enum_type=OutSignalType, value=value)
+def toOutSignalType(value: int) -> "OutSignalType":
+    return _lazy_enum_decoder("OutSignalType")(value)
 
 
 def toCouplingType(value: int) -> CouplingType:
@@ -1,9 +1,13 @@
 from _ctypes import Array, sizeof
-from ctypes import c_double, c_int, c_int16, c_int32
+from collections.abc import Buffer
+from ctypes import byref, c_byte, c_double, c_int, c_int16, c_int32
+from typing import Callable
 
-from . import DataMark, ErrorCode, Scenario
+from . import BfdAIEventArgs, DataMark, ErrorCode, EventId, MapFuncPiece, Scenario
+from .ai_channel import AIChannel
 from .ai_ctrl_base import AICtrlBase
 from .api import waveform_ai_ctrl
+from .channel_scale import ChannelScale, value_range_interval
 from .conversion import Conversion
 from .record import Record
 from .trigger import Trigger
@@ -16,6 +20,7 @@ class WaveformAICtrl(AICtrlBase):
         self._conversion: Conversion | None = None
         self._record: Record | None = None
         self._triggers: list[Trigger] = []
+        self._returned: Array[c_int32] = (c_int32 * 1)()
         # self._triggers.append(Trigger(None))
         # self._triggers = []
         super().__init__(Scenario.WaveformAI, dev_info, profile_path)
@@ -44,6 +49,72 @@ class WaveformAICtrl(AICtrlBase):
                 )
         return self._triggers
 
+    @property
+    def channelScales(self) -> list[ChannelScale]:
+        """The conversions of the raw data into the physical values
+
+        The list follows the order of the channels in a scan.
+        """
+        data_mask: int = self.features.dataMask
+        channel_count_max: int = self.features.channelCountMax
+        channel_start: int = self.conversion.channelStart
+        scales: list[ChannelScale] = []
+        for index in range(self.conversion.channelCount):
+            channel: AIChannel = self.channels[
+                (channel_start + index) % channel_count_max
+            ]
+            scale_table: list[MapFuncPiece]
+            try:
+                scale_table = channel.scaleTable
+            except ValueError:  # not supported by the device
+                scale_table = []
+            scales.append(
+                ChannelScale(
+                    value_range_interval(channel.valueRange), data_mask, scale_table
+                )
+            )
+        return scales
+
+    def addDataReadyHandler(
+        self, handler: Callable[["WaveformAICtrl", BfdAIEventArgs], None]
+    ) -> None:
+        self.addEventHandler(EventId.BufferedAIDataReady, handler, BfdAIEventArgs)
+
+    def removeDataReadyHandler(
+        self, handler: Callable[["WaveformAICtrl", BfdAIEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId.BufferedAIDataReady, handler)
+
+    def addOverrunHandler(
+        self, handler: Callable[["WaveformAICtrl", BfdAIEventArgs], None]
+    ) -> None:
+        self.addEventHandler(EventId.BufferedAIOverrun, handler, BfdAIEventArgs)
+
+    def removeOverrunHandler(
+        self, handler: Callable[["WaveformAICtrl", BfdAIEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId.BufferedAIOverrun, handler)
+
+    def addCacheOverflowHandler(
+        self, handler: Callable[["WaveformAICtrl", BfdAIEventArgs], None]
+    ) -> None:
+        self.addEventHandler(EventId.BufferedAICacheOverflow, handler, BfdAIEventArgs)
+
+    def removeCacheOverflowHandler(
+        self, handler: Callable[["WaveformAICtrl", BfdAIEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId.BufferedAICacheOverflow, handler)
+
+    def addStoppedHandler(
+        self, handler: Callable[["WaveformAICtrl", BfdAIEventArgs], None]
+    ) -> None:
+        self.addEventHandler(EventId.BufferedAIStopped, handler, BfdAIEventArgs)
+
+    def removeStoppedHandler(
+        self, handler: Callable[["WaveformAICtrl", BfdAIEventArgs], None]
+    ) -> None:
+        self.removeEventHandler(EventId.BufferedAIStopped, handler)
+
     def prepare(self) -> ErrorCode:
         return ErrorCode.lookup(waveform_ai_ctrl.prepare(self._obj))
 
@@ -95,6 +166,53 @@ class WaveformAICtrl(AICtrlBase):
     ]:
         return self.__getData(c_double, count, timeout, startTime, markCount)
 
+    def getDataInto(
+        self,
+        buffer: Buffer,
+        offset: int = 0,
+        count: int | None = None,
+        timeout: int = 0,
+    ) -> tuple[ErrorCode, int]:
+        """Store the samples right in `buffer`, starting at item `offset`
+
+        The buffer type selects the sample type: 16- or 32-bit signed integers
+        for the raw data, or `double` for the scaled one.
+        Return the error code and the number of the samples stored.
+        """
+        view: memoryview = memoryview(buffer)
+        if view.readonly:
+            raise TypeError("a writable buffer is required")
+        if not view.c_contiguous:
+            raise TypeError("a contiguous buffer is required")
+        item_format: str = view.format.lstrip("@=<")
+        if not (
+            (item_format in ("h", "i", "l") and view.itemsize in (2, 4))
+            or (item_format == "d" and view.itemsize == 8)
+        ):
+            raise TypeError(f"unsupported buffer format {view.format!r}")
+        size: int = view.nbytes // view.itemsize
+        if count is None:
+            count = size - offset
+        if offset < 0 or count < 0 or offset + count > size:
+            raise ValueError("the data do not fit into the buffer")
+        if not count:
+            return ErrorCode.Success, 0
+
+        ret: ErrorCode = ErrorCode.lookup(
+            waveform_ai_ctrl.get_data(
+                self._obj,
+                view.itemsize,
+                count,
+                byref(c_byte.from_buffer(view.cast("B"), offset * view.itemsize)),
+                timeout,
+                self._returned,
+                None,
+                None,
+                None,
+            )
+        )
+        return ret, self._returned[0]
+
     def __getData(
         self,
         dtype: type[c_int16] | type[c_int32] | type[c_double],
@@ -0,0 +1,84 @@
+from functools import partial
+from typing import ClassVar, Final, Iterable
+
+from qtpy.QtCore import QDateTime, QObject, QThread, Signal, Slot
+
+from .constants import RECEIVER_MARK_TYPE
+from .settings import Settings
+from .thread_hm import ThreadHM
+
+__all__ = ["BoardGroup"]
+
+
+class BoardGroup(QObject):
+    """Measure with several boards at once, in a thread per board
+
+    The signals of the threads are gathered here, marked with the index of the board.
+    """
+
+    stateChanged: ClassVar[Signal] = Signal(int, str, int, int)
+    dataObtained: ClassVar[Signal] = Signal(int, RECEIVER_MARK_TYPE, int, float)
+    absorptionCalculated: ClassVar[Signal] = Signal(
+        int, QDateTime, RECEIVER_MARK_TYPE, float, float
+    )
+    dataFileChanged: ClassVar[Signal] = Signal(int, str)
+    finished: ClassVar[Signal] = Signal()
+
+    def __init__(
+        self,
+        settings: Settings,
+        devices: Iterable[str],
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+
+        self.devices: Final[list[str]] = list(devices)
+        self.threads: Final[list[ThreadHM]] = []
+        self._running_count: int = 0
+        for index, device in enumerate(self.devices):
+            # a `QSettings` object isn't thread-safe, so each thread reads its own one;
+            # the objects of the same file share the values within the process
+            thread: ThreadHM = ThreadHM(
+                settings if len(self.devices) == 1 else Settings(self),
+                self,
+                device,
+            )
+            thread.stateChanged.connect(partial(self.stateChanged.emit, index))
+            thread.dataObtained.connect(partial(self.dataObtained.emit, index))
+            thread.absorptionCalculated.connect(
+                partial(self.absorptionCalculated.emit, index)
+            )
+            thread.dataFileChanged.connect(partial(self.dataFileChanged.emit, index))
+            thread.finished.connect(self._on_thread_finished)
+            self.threads.append(thread)
+
+    def __len__(self) -> int:
+        return len(self.threads)
+
+    @Slot()
+    def _on_thread_finished(self) -> None:
+        self._running_count -= 1
+        if not self._running_count:
+            self.finished.emit()
+
+    def isRunning(self) -> bool:
+        return any(thread.isRunning() for thread in self.threads)
+
+    def start(
+        self, priority: QThread.Priority = QThread.Priority.InheritPriority
+    ) -> None:
+        self._running_count = len(self.threads)
+        for thread in self.threads:
+            thread.start(priority)
+
+    def requestInterruption(self) -> None:
+        for thread in self.threads:
+            thread.requestInterruption()
+
+    def quit(self) -> None:
+        for thread in self.threads:
+            thread.quit()
+
+    def wait(self) -> None:
+        for thread in self.threads:
+            thread.wait()
@@ -1,6 +1,11 @@
 from typing import Final
 
 DEFAULT_MOTOR_STEP_ANGLE: Final[float] = 0.8
+# частоты шагов двигателя (Гц) и ускорение (шаг/с²);
+# по умолчанию — прежние шаги по 21 мс, без разгона
+DEFAULT_MOTOR_START_STEP_RATE: Final[float] = 1000 / 21
+DEFAULT_MOTOR_STEP_RATE: Final[float] = DEFAULT_MOTOR_START_STEP_RATE
+DEFAULT_MOTOR_STEP_ACCELERATION: Final[float] = 100
 DEFAULT_DELAY_BETWEEN_CYCLES: Final[float] = 10
 # Толщина атмосферы по кислороду(м)
 ATMOSPHERE_THICKNESS_O2: Final[float] = 5300
@@ -28,3 +33,7 @@ WAVELENGTHS: Final[tuple[float, ...]] = (3, 2)
 DI_MOTOR_ZERO: Final[int] = 0
 DO_DIRECTION: Final[int] = 7
 DO_MOTOR_STEP_PULSE: Final[int] = 6
+# линия, соединённая с входом внешнего цифрового триггера
+DO_ADC_TRIGGER: Final[int] = 5
+# счётчик, выход которого соединён со входом шагов двигателя
+CNTR_MOTOR_STEP_PULSE: Final[int] = 0
@@ -41,7 +41,12 @@ class ListInput[T](QLineEdit):
                 with suppress(ValueError):
                     yield conversion(item)
 
-        return list(silent_conversion(self._value_type, self.text().split(";")))
+        return list(
+            silent_conversion(
+                self._value_type,
+                filter(None, map(str.strip, self.text().split(";"))),
+            )
+        )
 
 
 class ListByCategoriesInput[T](QWidget):
@@ -0,0 +1,80 @@
+from math import sqrt
+from typing import NamedTuple, Sequence
+
+__all__ = [
+    "StepProfile",
+    "move_duration",
+    "scan_order",
+    "step_intervals",
+    "step_segments",
+]
+
+
+class StepProfile(NamedTuple):
+    """The limits of the stepper motor speed, in steps per second (squared)"""
+
+    start_rate: float
+    max_rate: float
+    acceleration: float
+
+    def rate(self, steps_done: int, steps_left: int) -> float:
+        """The step rate with `steps_done` steps made and `steps_left` more to make
+
+        The speed ramps up from the start rate, cruises at the maximal rate,
+        and ramps down to the start rate by the end of the move.
+        """
+        if self.acceleration <= 0.0 or self.max_rate <= self.start_rate:
+            return min(self.start_rate, self.max_rate)
+        return min(
+            self.max_rate,
+            sqrt(
+                self.start_rate**2
+                + 2.0 * self.acceleration * min(steps_done, steps_left)
+            ),
+        )
+
+
+def step_intervals(step_count: int, profile: StepProfile) -> list[float]:
+    """The durations of the steps of a move by the trapezoidal speed profile, [s]"""
+    return [
+        1.0 / profile.rate(step, step_count - 1 - step) for step in range(step_count)
+    ]
+
+
+def step_segments(
+    step_count: int, profile: StepProfile, tolerance: float = 0.05
+) -> list[tuple[float, int]]:
+    """Split a move into the runs of steps at a constant rate, for the pulse trains
+
+    A run ends as the rate changes by more than `tolerance` of its first rate.
+    Every run goes at the lowest rate of its steps, so that no step is faster than planned.
+    Return the rate and the number of the steps of every run.
+    """
+    segments: list[tuple[float, int]] = []
+    first_rate: float = 0.0
+    for step in range(step_count):
+        rate: float = profile.rate(step, step_count - 1 - step)
+        if segments and abs(rate - first_rate) <= tolerance * first_rate:
+            segment_rate, segment_steps = segments[-1]
+            segments[-1] = min(segment_rate, rate), segment_steps + 1
+        else:
+            first_rate = rate
+            segments.append((rate, 1))
+    return segments
+
+
+def move_duration(step_count: int, profile: StepProfile) -> float:
+    """The time a move of `step_count` steps takes by the speed profile, [s]"""
+    return sum(step_intervals(step_count, profile))
+
+
+def scan_order(angles: Sequence[float], position: float) -> list[int]:
+    """The order of the indices of `angles` to visit them in from `position` with the least travel
+
+    The angles are visited sorted, starting at the end nearer to `position`,
+    so that the successive scans sweep back and forth.
+    """
+    order: list[int] = sorted(range(len(angles)), key=angles.__getitem__)
+    if order and abs(angles[order[-1]] - position) < abs(angles[order[0]] - position):
+        order.reverse()
+    return order
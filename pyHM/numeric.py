@@ -1,5 +1,6 @@
+from array import array
 from collections import deque
-from math import cos, isnan, log, nan, radians, sqrt
+from math import cos, isnan, log, nan, radians, sqrt, sumprod
 from typing import Sequence
 
 
@@ -70,3 +71,91 @@ def tau_by_min_square_method_kd(
         tau, d_tau, lnk_t_av_t_rel, d_lnk_t_av_t_rel = 0.0, 0.0, 0.0, 0.0
 
     return tau, d_tau, lnk_t_av_t_rel, d_lnk_t_av_t_rel
+
+
+class RunningStatistics:
+    """Накопление среднего и дисперсии отсчётов блоками, по мере поступления
+
+    Сумма квадратов отклонений блока целых отсчётов считается точно по целым суммам,
+    прочих — в два прохода, от среднего блока. Блоки объединяются по формуле Чана,
+    так что отсчёты не хранятся.
+    """
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.mean: float = 0.0
+        self._m2: float = 0.0  # сумма квадратов отклонений от среднего
+
+    def add(self, data: Sequence[float]) -> None:
+        count: int = len(data)
+        if not count:
+            return
+        if isinstance(data, (memoryview, array)):
+            # отсчёты буфера перебираются медленно, список — в разы быстрее
+            data = data.tolist()
+        block_sum: float = sum(data)
+        block_mean: float = block_sum / count
+        block_m2: float
+        if isinstance(block_sum, int):
+            # целые отсчёты АЦП: суммы точные, и вычитание ничего не теряет
+            block_m2 = (count * sumprod(data, data) - block_sum**2) / count
+        else:
+            # отклонения от среднего блока, без вычитания близких больших сумм
+            deviations: list[float] = [value - block_mean for value in data]
+            block_m2 = sumprod(deviations, deviations)
+        total: int = self.count + count
+        delta: float = block_mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += block_m2 + delta**2 * self.count * count / total
+        self.count = total
+
+    def scaled(self, gain: float, offset: float) -> "RunningStatistics":
+        """Статистика отсчётов, пересчитанных как `gain * x + offset`"""
+        statistics: RunningStatistics = RunningStatistics()
+        statistics.count = self.count
+        statistics.mean = gain * self.mean + offset
+        statistics._m2 = gain**2 * self._m2
+        return statistics
+
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            return nan
+        return self._m2 / (self.count - 1)
+
+
+def synchronous_detection(
+    periods: Sequence[RunningStatistics],
+) -> tuple[float, float]:
+    """Синхронное детектирование канала по статистике двух полупериодов модуляции
+
+    Возвращает полуразность и полусумму средних по полупериодам.
+    """
+    mean_0: float
+    mean_1: float
+    mean_0, mean_1 = (period.mean for period in periods)
+    return (mean_0 - mean_1) / 2, (mean_0 + mean_1) / 2
+
+
+def is_settled(
+    previous: Sequence[RunningStatistics],
+    current: Sequence[RunningStatistics],
+    tolerance: float,
+) -> bool:
+    """Установился ли результат синхронного детектирования канала за цикл модуляции
+
+    Сравниваются полуразности по статистике полупериодов двух соседних циклов:
+    изменение не должно превышать долю `tolerance` от результата
+    или утроенную погрешность разности, оценённую по шуму полупериодов.
+    """
+    level: float = synchronous_detection(current)[0]
+    change: float = level - synchronous_detection(previous)[0]
+    error: float = (
+        sqrt(sum(period.variance / period.count for period in (*previous, *current)))
+        / 2
+    )
+    if isnan(error):
+        error = 0.0
+    return abs(change) <= tolerance * abs(level) + 3 * error
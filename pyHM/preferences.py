@@ -122,7 +122,11 @@ class PreferencePage(BaseLogger, QScrollArea):
                     )
                     layout.addRow(key2, text_input)
                 elif isinstance(current_value, list):
-                    list_input = ListInput(current_value, float, widget)
+                    list_input = ListInput(
+                        current_value,
+                        type(current_value[0]) if current_value else float,
+                        widget,
+                    )
                     list_input.changed.connect(
                         partial(_on_event, callback=value2.callback)
                     )
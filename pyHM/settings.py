@@ -15,7 +15,11 @@ from qtpy.QtWidgets import QWidget
 
 from .constants import (
     DEFAULT_DELAY_BETWEEN_CYCLES,
+    DEFAULT_MOTOR_START_STEP_RATE,
+    DEFAULT_MOTOR_STEP_ACCELERATION,
     DEFAULT_MOTOR_STEP_ANGLE,
+    DEFAULT_MOTOR_STEP_RATE,
+    DEVICE_DESCRIPTION,
     RECEIVER_MARK_TYPE,
     RECEIVERS,
     WAVELENGTHS,
@@ -90,6 +94,11 @@ class Settings(QSettings):
         ],
     ]:
         return {
+            (self.tr("Boards"), ("mdi6.expansion-card-variant",)): {
+                self.tr("Devices:"): Settings.CallbackOnly(
+                    Settings.devices.fset.__name__
+                ),
+            },
             (self.tr("Where to save results"), ("mdi6.folder-table-outline",)): {
                 self.tr("Directory:"): Settings.CallbackOnly(
                     Settings.result_dir.fset.__name__
@@ -134,6 +143,37 @@ class Settings(QSettings):
                     },
                     Settings.zero_angle_signal.fset.__name__,
                 ),
+                self.tr("Find zero every:"): Settings.SpinboxAndCallback(
+                    range=(1, 1_000_000),
+                    prefix_and_suffix=("", self.tr(" scans")),
+                    callback=Settings.rehome_interval.fset.__name__,
+                ),
+                self.tr("Find zero by the interrupt"): Settings.CallbackOnly(
+                    Settings.zero_interrupt.fset.__name__
+                ),
+                self.tr("Zero signal filter:"): Settings.SpinboxAndCallback(
+                    range=(0, 1e6),
+                    prefix_and_suffix=("", self.tr(" µs")),
+                    callback=Settings.zero_filter_time.fset.__name__,
+                ),
+                self.tr("Step by the counter"): Settings.CallbackOnly(
+                    Settings.pulse_motor.fset.__name__
+                ),
+                self.tr("Starting step rate:"): Settings.SpinboxAndCallback(
+                    range=(1, 1e6),
+                    prefix_and_suffix=("", self.tr(" Hz")),
+                    callback=Settings.start_step_rate.fset.__name__,
+                ),
+                self.tr("Maximal step rate:"): Settings.SpinboxAndCallback(
+                    range=(1, 1e6),
+                    prefix_and_suffix=("", self.tr(" Hz")),
+                    callback=Settings.step_rate.fset.__name__,
+                ),
+                self.tr("Acceleration:"): Settings.SpinboxAndCallback(
+                    range=(0, 1e9),
+                    prefix_and_suffix=("", self.tr(" steps/s²")),
+                    callback=Settings.step_acceleration.fset.__name__,
+                ),
             },
             (self.tr("ADC"), ("mdi6.gauge",)): {
                 self.tr("Samples per half a period:"): Settings.SpinboxAndCallback(
@@ -146,14 +186,41 @@ class Settings(QSettings):
                     prefix_and_suffix=("", self.tr(" S/s")),
                     callback=Settings.sample_rate.fset.__name__,
                 ),
+                self.tr("Acquire continuously"): Settings.CallbackOnly(
+                    Settings.stream_adc.fset.__name__
+                ),
+                self.tr("Start by the trigger"): Settings.CallbackOnly(
+                    Settings.trigger_adc.fset.__name__
+                ),
+                self.tr("Trigger delay:"): Settings.SpinboxAndCallback(
+                    range=(0, 1_000_000),
+                    prefix_and_suffix=("", self.tr(" scans")),
+                    callback=Settings.trigger_delay.fset.__name__,
+                ),
+                self.tr("Acquire raw counts"): Settings.CallbackOnly(
+                    Settings.raw_adc.fset.__name__
+                ),
                 self.tr("Write debug file"): Settings.CallbackOnly(
                     Settings.save_adc.fset.__name__
                 ),
+                self.tr("Settling tolerance:"): Settings.SpinboxAndCallback(
+                    range=(0, 100),
+                    prefix_and_suffix=("", self.tr("%")),
+                    callback=Settings.settle_tolerance.fset.__name__,
+                ),
+                self.tr("Settling timeout:"): Settings.SpinboxAndCallback(
+                    range=(0, 1e6),
+                    prefix_and_suffix=("", self.tr(" sec")),
+                    callback=Settings.settle_timeout.fset.__name__,
+                ),
             },
             (self.tr("DAC"), ("mdi6.square-wave",)): {
                 self.tr("Voltage:"): Settings.CallbackOnly(
                     Settings.dac.fset.__name__,
                 ),
+                self.tr("Switch by the hardware clock"): Settings.CallbackOnly(
+                    Settings.hardware_dac.fset.__name__
+                ),
             },
             (self.tr("Weather"), ("mdi6.weather-partly-snowy-rainy",)): {
                 self.tr("Clouds:"): Settings.CallbackOnly(
@@ -220,6 +287,23 @@ class Settings(QSettings):
         with suppress(AttributeError), self.section("geometry"):
             o.restoreGeometry(self.value(name, QByteArray()))
 
+    @property
+    def devices(self) -> list[str]:
+        devices: list[str] = []
+        with self.section("Устройства"):
+            i: int = 0
+            while self.contains("Устройство " + str(i)):
+                devices.append(self.value("Устройство " + str(i), "", str))
+                i += 1
+        return devices or [DEVICE_DESCRIPTION]
+
+    @devices.setter
+    def devices(self, devices: Iterable[str]) -> None:
+        with self.section("Устройства"):
+            self.remove("")
+            for i, d in enumerate(devices):
+                self.setValue("Устройство " + str(i), d)
+
     @property
     def angles(self) -> list[float]:
         angles: list[float] = []
@@ -266,6 +350,46 @@ class Settings(QSettings):
         with self.section("АЦП"):
             self.setValue("Количество каналов", channel_count)
 
+    @property
+    def stream_adc(self) -> bool:
+        with self.section("АЦП"):
+            return self.value("Непрерывный сбор", False, bool)
+
+    @stream_adc.setter
+    def stream_adc(self, stream_adc: bool) -> None:
+        with self.section("АЦП"):
+            self.setValue("Непрерывный сбор", stream_adc)
+
+    @property
+    def trigger_adc(self) -> bool:
+        with self.section("АЦП"):
+            return self.value("Запуск по триггеру", False, bool)
+
+    @trigger_adc.setter
+    def trigger_adc(self, trigger_adc: bool) -> None:
+        with self.section("АЦП"):
+            self.setValue("Запуск по триггеру", trigger_adc)
+
+    @property
+    def trigger_delay(self) -> int:
+        with self.section("АЦП"):
+            return self.value("Задержка запуска", 0, int)
+
+    @trigger_delay.setter
+    def trigger_delay(self, trigger_delay: int) -> None:
+        with self.section("АЦП"):
+            self.setValue("Задержка запуска", trigger_delay)
+
+    @property
+    def raw_adc(self) -> bool:
+        with self.section("АЦП"):
+            return self.value("Сырые отсчёты", False, bool)
+
+    @raw_adc.setter
+    def raw_adc(self, raw_adc: bool) -> None:
+        with self.section("АЦП"):
+            self.setValue("Сырые отсчёты", raw_adc)
+
     @property
     def save_adc(self) -> bool:
         with self.section("АЦП"):
@@ -276,6 +400,27 @@ class Settings(QSettings):
         with self.section("АЦП"):
             self.setValue("Служебный файл", save_adc)
 
+    @property
+    def settle_tolerance(self) -> float:
+        # допустимое изменение сигнала за цикл модуляции, [%]
+        with self.section("АЦП"):
+            return self.value("Допуск установления", 1.0, float)
+
+    @settle_tolerance.setter
+    def settle_tolerance(self, settle_tolerance: float) -> None:
+        with self.section("АЦП"):
+            self.setValue("Допуск установления", settle_tolerance)
+
+    @property
+    def settle_timeout(self) -> float:
+        with self.section("АЦП"):
+            return self.value("Наибольшее время установления", 2.0, float)
+
+    @settle_timeout.setter
+    def settle_timeout(self, settle_timeout: float) -> None:
+        with self.section("АЦП"):
+            self.setValue("Наибольшее время установления", settle_timeout)
+
     # @property
     # def gain_list(self) -> list[float]:
     #     gain_list: list[float] = []
@@ -315,6 +460,16 @@ class Settings(QSettings):
                 for i, _d in enumerate(dac.get(receiver, ())):
                     self.setValue(str(wavelength) + "мм " + str(i), _d)
 
+    @property
+    def hardware_dac(self) -> bool:
+        with self.section("ЦАП"):
+            return self.value("Аппаратное переключение", False, bool)
+
+    @hardware_dac.setter
+    def hardware_dac(self, hardware_dac: bool) -> None:
+        with self.section("ЦАП"):
+            self.setValue("Аппаратное переключение", hardware_dac)
+
     @property
     def motor_const(self) -> float:
         with self.section("Двигатель"):
@@ -345,6 +500,79 @@ class Settings(QSettings):
         with self.section("Двигатель"):
             self.setValue("Сигнал нулевого угла", zero_angle_signal)
 
+    @property
+    def rehome_interval(self) -> int:
+        with self.section("Двигатель"):
+            return self.value("Поиск нуля через сканов", 1, int)
+
+    @rehome_interval.setter
+    def rehome_interval(self, rehome_interval: int) -> None:
+        with self.section("Двигатель"):
+            self.setValue("Поиск нуля через сканов", rehome_interval)
+
+    @property
+    def zero_interrupt(self) -> bool:
+        with self.section("Двигатель"):
+            return self.value("Нуль по прерыванию", False, bool)
+
+    @zero_interrupt.setter
+    def zero_interrupt(self, zero_interrupt: bool) -> None:
+        with self.section("Двигатель"):
+            self.setValue("Нуль по прерыванию", zero_interrupt)
+
+    @property
+    def zero_filter_time(self) -> float:
+        # время блокировки фильтра помех, [мкс]; 0 — без фильтра
+        with self.section("Двигатель"):
+            return self.value("Фильтр сигнала нуля", 0.0, float)
+
+    @zero_filter_time.setter
+    def zero_filter_time(self, zero_filter_time: float) -> None:
+        with self.section("Двигатель"):
+            self.setValue("Фильтр сигнала нуля", zero_filter_time)
+
+    @property
+    def pulse_motor(self) -> bool:
+        with self.section("Двигатель"):
+            return self.value("Шаги от счётчика", False, bool)
+
+    @pulse_motor.setter
+    def pulse_motor(self, pulse_motor: bool) -> None:
+        with self.section("Двигатель"):
+            self.setValue("Шаги от счётчика", pulse_motor)
+
+    @property
+    def start_step_rate(self) -> float:
+        with self.section("Двигатель"):
+            return self.value(
+                "Начальная частота шагов", DEFAULT_MOTOR_START_STEP_RATE, float
+            )
+
+    @start_step_rate.setter
+    def start_step_rate(self, start_step_rate: float) -> None:
+        with self.section("Двигатель"):
+            self.setValue("Начальная частота шагов", start_step_rate)
+
+    @property
+    def step_rate(self) -> float:
+        with self.section("Двигатель"):
+            return self.value("Частота шагов", DEFAULT_MOTOR_STEP_RATE, float)
+
+    @step_rate.setter
+    def step_rate(self, step_rate: float) -> None:
+        with self.section("Двигатель"):
+            self.setValue("Частота шагов", step_rate)
+
+    @property
+    def step_acceleration(self) -> float:
+        with self.section("Двигатель"):
+            return self.value("Ускорение", DEFAULT_MOTOR_STEP_ACCELERATION, float)
+
+    @step_acceleration.setter
+    def step_acceleration(self, step_acceleration: float) -> None:
+        with self.section("Двигатель"):
+            self.setValue("Ускорение", step_acceleration)
+
     @property
     def cycle_count(self) -> int:
         with self.section("Настройки"):
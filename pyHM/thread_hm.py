@@ -1,9 +1,16 @@
 import logging
+import re
 import traceback
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
-from math import cos, exp, isnan, log, nan, radians
+from itertools import pairwise
+from math import ceil, cos, exp, isnan, log, nan, radians, sqrt
 from os import getenv, linesep
-from typing import ClassVar, Final
+from queue import Queue
+from threading import Condition, Event
+from time import perf_counter
+from typing import ClassVar, Final, Mapping, Sequence
 
 from qtpy.QtCore import (
     QDateTime,
@@ -17,16 +24,36 @@ from qtpy.QtCore import (
     Signal,
 )
 
-from .advantech_daq import AISignalType, ErrorCode, ValueRange
-from .advantech_daq.api import adx_enum_to_string, is_error_code
+from .advantech_daq import (
+    ActiveSignal,
+    AISignalType,
+    BfdAIEventArgs,
+    CntrEventArgs,
+    ControlState,
+    DiSnapEventArgs,
+    ErrorCode,
+    EventId,
+    PulseWidth,
+    TriggerAction,
+    ValueRange,
+)
+from .advantech_daq.api import adx_enum_to_string, call_stats, is_error_code
+from .advantech_daq.buffered_ao_ctrl import BufferedAOCtrl
+from .advantech_daq.channel_scale import ChannelScale
+from .advantech_daq.cntr_ctrl_base import CntrCtrlBase
 from .advantech_daq.instant_ao_ctrl import InstantAOCtrl
 from .advantech_daq.instant_di_ctrl import InstantDICtrl
 from .advantech_daq.instant_do_ctrl import InstantDoCtrl
+from .advantech_daq.po_channel import PoChannel
+from .advantech_daq.pw_modulator_ctrl import PwModulatorCtrl
+from .advantech_daq.trigger import Trigger
 from .advantech_daq.waveform_ai_ctrl import WaveformAICtrl
 from .constants import (
     ATMOSPHERE_THICKNESS_O2,
+    CNTR_MOTOR_STEP_PULSE,
     DEVICE_DESCRIPTION,
     DI_MOTOR_ZERO,
+    DO_ADC_TRIGGER,
     DO_DIRECTION,
     DO_MOTOR_STEP_PULSE,
     ELEVATION_CAL,
@@ -36,7 +63,19 @@ from .constants import (
     TAU_O2_CAL,
     WAVELENGTHS,
 )
-from .numeric import tau_by_min_square_method_kd
+from .motion import (
+    StepProfile,
+    move_duration,
+    scan_order,
+    step_intervals,
+    step_segments,
+)
+from .numeric import (
+    RunningStatistics,
+    is_settled,
+    synchronous_detection,
+    tau_by_min_square_method_kd,
+)
 from .settings import Settings
 
 __all__ = ["ThreadHM"]
@@ -59,29 +98,42 @@ class ThreadHM(QThread):
     )
     dataFileChanged: ClassVar[Signal] = Signal(str)
 
-    def __init__(self, settings: Settings, parent: QObject | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        parent: QObject | None = None,
+        device: str = DEVICE_DESCRIPTION,
+    ) -> None:
         super().__init__(parent)
 
         self.settings: Settings = settings
+        self.device: Final[str] = device
         self.motor_position: float = 0.0
 
-        # инициализация устройства "0" для измерения
+        # инициализация устройства для измерения
         self._emit_state(self.tr("Initializing…"), 0, 0)
 
         channel_count: Final[int] = self.settings.channel_count
         sample_rate: Final[float] = self.settings.sample_rate
 
         # инициализация АЦП
-        self.wf_ai_ctrl: WaveformAICtrl = WaveformAICtrl(DEVICE_DESCRIPTION)
+        self.wf_ai_ctrl: WaveformAICtrl = WaveformAICtrl(self.device)
         self.wf_ai_ctrl.conversion.channelStart = 0
         self.wf_ai_ctrl.conversion.channelCount = channel_count
         self.wf_ai_ctrl.conversion.clockRate = sample_rate
         for channel in self.wf_ai_ctrl.channels:
             channel.signalType = AISignalType.Differential
+        # события непрерывного сбора
+        self._adc_events: Final[Condition] = Condition()
+        self._adc_event_count: int = 0
+        self._adc_loss_count: int = 0
+        # читаются ли свежие данные: потери вне чтения ничего не портят
+        self._adc_reading: bool = False
 
         # инициализация ЦАП
-        self.instant_ao: InstantAOCtrl = InstantAOCtrl(DEVICE_DESCRIPTION)
+        self.instant_ao: InstantAOCtrl = InstantAOCtrl(self.device)
         self._dac: Final[dict[RECEIVER_MARK_TYPE, list[float]]] = self.settings.dac
+        self._dac_value_ranges: Final[dict[RECEIVER_MARK_TYPE, ValueRange]] = {}
         for receiver, channel in zip(RECEIVERS, self.instant_ao.channels):
             # find best output range
             min_dac: float = min(self._dac[receiver])
@@ -100,12 +152,47 @@ class ThreadHM(QThread):
 
             # noinspection PyPep8Naming
             channel.valueRange = value_range
+            self._dac_value_ranges[receiver] = value_range
+        # ЦАП с аппаратным переключением, если нужен
+        self.bfd_ao_ctrl: BufferedAOCtrl | None = None
+
+        self.instant_di_ctrl: InstantDICtrl = InstantDICtrl(self.device)
+        self.instant_do_ctrl: InstantDoCtrl = InstantDoCtrl(self.device)
+        # состояние порта DO, если известно
+        self._do_port_state: int | None = None
+        # поиск нуля по прерыванию от датчика
+        self._zero_interrupt: bool = False
+        self._zero_signal: bool = self.settings.zero_angle_signal
+        self._zero_reached: Final[Event] = Event()
 
-        self.instant_di_ctrl: InstantDICtrl = InstantDICtrl(DEVICE_DESCRIPTION)
-        self.instant_do_ctrl: InstantDoCtrl = InstantDoCtrl(DEVICE_DESCRIPTION)
+        # шаги двигателя от счётчика, если нужно
+        self.pwm_ctrl: PwModulatorCtrl | None = None
+        self._pulse_motor: bool = False
+        self._motor_pulses_done: Final[Condition] = Condition()
+        # ограничения скорости двигателя и времена шагов последнего перемещения
+        self._step_profile: StepProfile = self._settings_step_profile()
+        self.motor_trace: list[tuple[float, float]] = []
+
+        # запуск АЦП (и ЦАП) по триггеру и число сканов, пропускаемых после фронта
+        self._trigger_adc: bool = False
+        self._adc_delay: int = 0
 
         self._emit_state(self.tr("Initialized"))
 
+    @property
+    def _file_name_suffix(self) -> str:
+        """The mark of the device in the names of the files, unless it's the default one"""
+        if self.device == DEVICE_DESCRIPTION:
+            return ""
+        return "_" + "_".join(re.findall(r"\w+", self.device))
+
+    def _settings_step_profile(self) -> StepProfile:
+        return StepProfile(
+            start_rate=self.settings.start_step_rate,
+            max_rate=self.settings.step_rate,
+            acceleration=self.settings.step_acceleration,
+        )
+
     def _is_error_occurred(self, ret: ErrorCode) -> bool:
         if is_error_code(ret):
             self._emit_state(
@@ -134,31 +221,263 @@ class ThreadHM(QThread):
         logger.debug(f"Read data {data} from bit #{bit_num}")
         return bool(data)
 
+    def _get_do_port(self) -> int | None:
+        if self._do_port_state is None:
+            ret: ErrorCode
+            data: list[int]
+            ret, data = self.instant_do_ctrl.readAny(0, 1)
+            if self._is_error_occurred(ret):
+                return None
+            self._do_port_state = data[0]
+        return self._do_port_state
+
+    def set_do_bits(self, bits: Mapping[int, bool]) -> None:
+        """Set several bits of the DO port at once, writing the whole port
+
+        The port state is cached, so it's written only if it changes.
+        """
+        state: int | None = self._get_do_port()
+        if state is None:
+            return
+        value: int = state
+        for bit_num, bit_value in bits.items():
+            if bit_value:
+                value |= 1 << bit_num
+            else:
+                value &= ~(1 << bit_num)
+        if value == state:
+            return
+        logger.debug(f"Writing data 0x{value:02X} to the port")
+        ret: ErrorCode = self.instant_do_ctrl.writeAny(0, [value])
+        if self._is_error_occurred(ret):
+            # the port state is unknown now
+            self._do_port_state = None
+        else:
+            self._do_port_state = value
+
     def set_do_bit(self, bit_num: int, value: bool) -> None:
-        logger.debug(f"Writing data {value} to bit #{bit_num}")
-        ret: ErrorCode = self.instant_do_ctrl.writeBit(0, bit_num, value)
-        self._is_error_occurred(ret)
+        self.set_do_bits({bit_num: value})
+
+    @staticmethod
+    def _arm_trigger(triggers: list[Trigger], delay: int) -> bool:
+        """Make a control start at an edge of the trigger line, `delay` scans after it
+
+        Return whether the control has a trigger.
+        """
+        from .advantech_daq import SignalDrop
+
+        if not triggers:
+            return False
+        trigger: Trigger = triggers[0]
+        trigger.source = SignalDrop.ExtDigitalTrigger0
+        trigger.edge = ActiveSignal.BothEdge
+        trigger.action = TriggerAction.DelayToStart
+        trigger.delayCount = delay
+        return True
+
+    def _fire_trigger(self) -> bool:
+        """Toggle the trigger line to start the armed controls
+
+        Return whether the line has been toggled successfully.
+        """
+        state: int | None = self._get_do_port()
+        if state is None:
+            return False
+        self.set_do_bit(DO_ADC_TRIGGER, not state >> DO_ADC_TRIGGER & 1)
+        return self._do_port_state is not None
 
     def motor_get_zero(self) -> bool:
         v: bool = self.get_di_bit(DI_MOTOR_ZERO) == self.settings.zero_angle_signal
         logger.debug(f"At zero? {v}")
         return v
 
-    def motor_step(self, direction: bool) -> None:
+    def _prepare_zero_interrupt(self) -> bool:
+        """Make the zero sensor interrupt as the mirror reaches the zero, and start watching it
+
+        Return whether the zero sensor can interrupt.
+        """
+        di: InstantDICtrl = self.instant_di_ctrl
+        self._zero_signal = self.settings.zero_angle_signal
+        filter_time: float = self.settings.zero_filter_time
+        try:
+            for filter_channel in di.noiseFilter:
+                if filter_channel.channel == DI_MOTOR_ZERO:
+                    if filter_time > 0.0:
+                        di.noiseFilterBlockTime = filter_time
+                    filter_channel.enabled = filter_time > 0.0
+                    break
+            else:
+                if filter_time > 0.0:
+                    logger.warning("No noise filter for the zero signal")
+            for int_channel in di.diIntChannels:
+                if int_channel.channel == DI_MOTOR_ZERO:
+                    int_channel.trigEdge = (
+                        ActiveSignal.RisingEdge
+                        if self._zero_signal
+                        else ActiveSignal.FallingEdge
+                    )
+                    int_channel.enabled = True
+                    di.addInterruptHandler(DI_MOTOR_ZERO, self._on_zero_event)
+                    break
+            else:
+                # изменение состояния порта, если у канала нет своего прерывания
+                for cos_port in di.diCosIntPorts:
+                    if cos_port.port == 0:
+                        cos_port.mask |= 1 << DI_MOTOR_ZERO
+                        di.addChangeOfStateHandler(0, self._on_zero_event)
+                        break
+                else:
+                    logger.warning("The zero signal can't interrupt; polling it")
+                    return False
+        except ValueError as ex:
+            logger.warning(f"The zero signal can't interrupt: {ex}; polling it")
+            return False
+        return not self._is_error_occurred(di.snapStart())
+
+    def _stop_zero_interrupt(self) -> None:
+        self.instant_di_ctrl.snapStop()
+        self.instant_di_ctrl.removeInterruptHandler(DI_MOTOR_ZERO, self._on_zero_event)
+        self.instant_di_ctrl.removeChangeOfStateHandler(0, self._on_zero_event)
+
+    def _on_zero_event(self, _sender: InstantDICtrl, args: DiSnapEventArgs) -> None:
+        # на изменение состояния порта — только при появлении сигнала нуля
+        if args.Length > 0 and (
+            bool(args.PortData[0] >> DI_MOTOR_ZERO & 1) != self._zero_signal
+        ):
+            return
+        self._zero_reached.set()
+
+    def _prepare_motor_pulses(self) -> None:
+        """Make the counter output the steps of the motor"""
+        if self.pwm_ctrl is None:
+            self.pwm_ctrl = PwModulatorCtrl(self.device)
+        self.pwm_ctrl.channelStart = CNTR_MOTOR_STEP_PULSE
+        self.pwm_ctrl.channelCount = 1
+        self.pwm_ctrl.addTerminalCountHandler(
+            CNTR_MOTOR_STEP_PULSE, self._on_motor_pulses_done
+        )
+
+    def _on_motor_pulses_done(
+        self, _sender: CntrCtrlBase, _args: CntrEventArgs
+    ) -> None:
+        with self._motor_pulses_done:
+            self._motor_pulses_done.notify_all()
+
+    def _output_motor_pulses(self, step_count: int, step_rate: float) -> None:
+        """Make `step_count` steps at `step_rate` by a single pulse train, and wait for it to end"""
+        if self.pwm_ctrl is None or step_count <= 0:
+            return
+        channel: PoChannel = self.pwm_ctrl.channels[CNTR_MOTOR_STEP_PULSE]
+        half_period: float = 0.5 / step_rate
+        channel.pulseWidth = PulseWidth(half_period, half_period)
+        channel.pulseCount = step_count
+        with self._motor_pulses_done:
+            self.pwm_ctrl.enabled = True
+            done: bool = self._motor_pulses_done.wait_for(
+                lambda: not self.pwm_ctrl.running,
+                timeout=2.0 * step_count / step_rate + 1.0,
+            )
+        self.pwm_ctrl.enabled = False
+        if not done:
+            self._emit_state(self.tr("Error: the motor steps have not been completed"))
+
+    @staticmethod
+    def _sleep_until(moment: float) -> None:
+        delay: float = moment - perf_counter()
+        if delay > 0.0:
+            QThread.usleep(round(delay * 1e6))
+
+    def _set_motor_direction(self, direction: bool) -> None:
+        state: int | None = self._get_do_port()
+        if state is None or bool(state >> DO_DIRECTION & 1) != direction:
+            self.set_do_bit(DO_DIRECTION, direction)
+            QThread.msleep(1)
+
+    def _move_motor(self, direction: bool, step_count: int) -> None:
+        """Make `step_count` steps by the trapezoidal speed profile
+
+        The planned and the actual moments of the steps, or of the ends of the pulse trains,
+        since the start of the move, are kept in `motor_trace`, [s].
+        """
         # Направление
-        self.set_do_bit(DO_DIRECTION, direction)
-        QThread.msleep(1)
-        # Шаг
-        for on in (True, False):
-            self.set_do_bit(DO_MOTOR_STEP_PULSE, on)
-            QThread.msleep(10)
+        self._set_motor_direction(direction)
+        # Шаги
+        self.motor_trace.clear()
+        start: float = perf_counter()
+        planned: float = 0.0
+        if self._pulse_motor:
+            for step_rate, count in step_segments(step_count, self._step_profile):
+                self._output_motor_pulses(count, step_rate)
+                planned += count / step_rate
+                self.motor_trace.append((planned, perf_counter() - start))
+        else:
+            for interval in step_intervals(step_count, self._step_profile):
+                self._sleep_until(start + planned)
+                self.motor_trace.append((planned, perf_counter() - start))
+                self.set_do_bit(DO_MOTOR_STEP_PULSE, True)
+                self._sleep_until(start + planned + 0.5 * interval)
+                self.set_do_bit(DO_MOTOR_STEP_PULSE, False)
+                planned += interval
+            self._sleep_until(start + planned)
+        if self.motor_trace:
+            logger.debug(
+                f"{step_count} steps took {perf_counter() - start:.3f} s "
+                f"of {planned:.3f} s planned, the largest lag being "
+                f"{max(actual - moment for moment, actual in self.motor_trace) * 1e3:.1f} ms"
+            )
         # Положение
         if direction:
-            self.motor_position -= self.settings.motor_const
+            self.motor_position -= step_count * self.settings.motor_const
         else:
-            self.motor_position += self.settings.motor_const
+            self.motor_position += step_count * self.settings.motor_const
+
+    def motor_step(self, direction: bool) -> None:
+        self._move_motor(direction, 1)
+
+    def _sweep_to_zero(self, max_step_count: int) -> bool:
+        """Rotate towards the zero at the starting step rate until the zero sensor interrupts
+
+        The sensor isn't read between the steps, and the steps of the counter aren't stopped for.
+        Return whether the sensor has interrupted.
+        """
+        self._set_motor_direction(True)
+        step_rate: float = self._step_profile.rate(0, 0)
+        self._zero_reached.clear()
+        start: float = perf_counter()
+        step_count: int = 0
+        if self._pulse_motor and self.pwm_ctrl is not None:
+            channel: PoChannel = self.pwm_ctrl.channels[CNTR_MOTOR_STEP_PULSE]
+            half_period: float = 0.5 / step_rate
+            channel.pulseWidth = PulseWidth(half_period, half_period)
+            channel.pulseCount = max_step_count
+            self.pwm_ctrl.enabled = True
+            self._zero_reached.wait(timeout=max_step_count / step_rate + 1.0)
+            self.pwm_ctrl.enabled = False
+            # шаги счётчика не считываются, а оцениваются по времени
+            step_count = min(max_step_count, ceil((perf_counter() - start) * step_rate))
+        else:
+            while step_count < max_step_count and not self._zero_reached.wait(
+                max(0.0, start + step_count / step_rate - perf_counter())
+            ):
+                self.set_do_bit(DO_MOTOR_STEP_PULSE, True)
+                self._sleep_until(start + (step_count + 0.5) / step_rate)
+                self.set_do_bit(DO_MOTOR_STEP_PULSE, False)
+                step_count += 1
+        logger.debug(
+            f"Swept {step_count} steps towards the zero in {perf_counter() - start:.3f} s"
+        )
+        self.motor_position -= step_count * self.settings.motor_const
+        return self._zero_reached.is_set()
 
     def motor_find_zero(self) -> None:
+        if self._zero_interrupt and not self.motor_get_zero():
+            # проход до нуля без опроса датчика на каждом шаге
+            if self._sweep_to_zero(500):
+                # возврат, если двигатель проскочил нуль
+                for i in range(10):
+                    if self.motor_get_zero():
+                        break
+                    self.motor_step(False)
         for i in range(500):
             if self.motor_get_zero():
                 self.motor_position = -self.settings.angle_correction
@@ -167,6 +486,55 @@ class ThreadHM(QThread):
             else:
                 self.motor_step(True)
 
+    def _motor_drifted(self) -> bool:
+        """Whether the zero sensor disagrees with the position of the motor
+
+        The zero is found stepping down to the first step the sensor signals at,
+        so the band of the sensor starts at the zero and spreads below it
+        by an unknown width. The sensor is thus checked to signal at the zero,
+        and to be silent a step or more above it; below the zero, it's not checked.
+        """
+        steps_above_zero: int = round(
+            (self.motor_position + self.settings.angle_correction)
+            / self.settings.motor_const
+        )
+        if steps_above_zero < 0:
+            return False
+        return self.motor_get_zero() != (steps_above_zero == 0)
+
+    def _scan_time_saved(
+        self,
+        angles: Sequence[float],
+        order: Sequence[int],
+        start: float,
+        zero_found: bool,
+    ) -> float:
+        """The motor time a scan saves against finding the zero and visiting `angles` in their order, [s]
+
+        The scan starts at `start`, and it finds the zero first if `zero_found`.
+        The search for the zero is taken as single steps from the start to the zero;
+        the old scans paused for a second after it.
+        """
+        motor_const: float = self.settings.motor_const
+
+        def search_time(position: float) -> float:
+            step_count: int = round(abs(position) / motor_const)
+            return step_count / self._step_profile.rate(0, 0)
+
+        def travel_time(positions: Sequence[float]) -> float:
+            return sum(
+                move_duration(round(abs(b - a) / motor_const), self._step_profile)
+                for a, b in pairwise(positions)
+            )
+
+        plain_time: float = search_time(start) + 1.0 + travel_time([0.0, *angles])
+        scan_time: float = travel_time(
+            [0.0 if zero_found else start, *(angles[index] for index in order)]
+        )
+        if zero_found:
+            scan_time += search_time(start)
+        return plain_time - scan_time
+
     def motor_set_angle(self, angle: float) -> None:
         # разница положения в количестве шагов
         step_count: int = round(
@@ -176,10 +544,515 @@ class ThreadHM(QThread):
         if direction := (step_count < 0):
             step_count = -step_count
         # вращение
-        for i in range(step_count):
-            self.motor_step(direction)
+        self._move_motor(direction, step_count)
+
+    def _on_adc_event(self, _sender: WaveformAICtrl, args: BfdAIEventArgs) -> None:
+        with self._adc_events:
+            if args.Id in (EventId.BufferedAIOverrun, EventId.BufferedAICacheOverflow):
+                if self._adc_reading:
+                    logger.warning(f"ADC data lost: {EventId(args.Id).name}")
+                else:
+                    logger.debug(f"ADC data lost unread: {EventId(args.Id).name}")
+                self._adc_loss_count += 1
+            self._adc_event_count += 1
+            self._adc_events.notify_all()
+
+    def _read_streamed_adc_data(
+        self,
+        buffer: memoryview,
+        offset: int = 0,
+        count: int | None = None,
+    ) -> int | None:
+        """Get the streamed samples as soon as the driver reports them ready
+
+        Return the number of the samples stored, or `None` on an error.
+        """
+        if count is None:
+            count = len(buffer) - offset
+        # время ожидания секции, [s]
+        timeout: float = (
+            2.0 * sectionLength / self.wf_ai_ctrl.conversion.clockRate + 1.0
+        )
+        stored: int = 0
+        while stored < count and not self.isInterruptionRequested():
+            event_count: int = self._adc_event_count
+            ret: ErrorCode
+            returned: int
+            ret, returned = self.wf_ai_ctrl.getDataInto(
+                buffer, offset + stored, count - stored
+            )
+            if self._is_error_occurred(ret):
+                return None
+            stored += returned
+            if stored < count:
+                with self._adc_events:
+                    if not self._adc_events.wait_for(
+                        lambda seen=event_count: self._adc_event_count != seen,
+                        timeout,
+                    ):
+                        self._emit_state(self.tr("Error: no data from the ADC"))
+                        return None
+        return stored
+
+    def _skip_adc_data(self, scratch: memoryview, channel_count: int) -> bool:
+        """Drop the samples acquired so far in the continuous mode
+
+        The section in flight is dropped, too, for it may hold the samples
+        taken before the DAC voltages changed.
+        Return whether the data has been skipped successfully.
+        """
+        ret: ErrorCode
+        returned: int
+        # накопленные данные
+        ret, returned = self.wf_ai_ctrl.getDataInto(scratch)
+        while not is_error_code(ret) and returned == len(scratch):
+            ret, returned = self.wf_ai_ctrl.getDataInto(scratch)
+        if self._is_error_occurred(ret):
+            return False
+        # текущая секция и выравнивание по каналам
+        return (
+            self._read_streamed_adc_data(
+                scratch, count=len(scratch) - returned % channel_count
+            )
+            is not None
+        )
+
+    def _acquire_streamed_adc_data(
+        self, data: memoryview, scratch: memoryview, channel_count: int
+    ) -> bool:
+        """Fill `data` with the fresh samples in the continuous mode
+
+        Between the readings, nothing reads the stream, and the driver overwrites
+        the samples unread; those losses are of no matter, and they aren't warned of.
+        Should the driver lose any samples while reading, the data are acquired again.
+        Return whether the data has been acquired successfully.
+        """
+        while not self.isInterruptionRequested():
+            if not self._skip_adc_data(scratch, channel_count):
+                return False
+            loss_count: int = self._adc_loss_count
+            self._adc_reading = True
+            try:
+                if self._read_streamed_adc_data(data) is None:
+                    return False
+            finally:
+                self._adc_reading = False
+            if loss_count == self._adc_loss_count:
+                break
+            self._emit_state(self.tr("ADC data lost, measuring again…"))
+        return True
+
+    def _prepare_dac_pattern(self, sample_count: int) -> bool:
+        """Load the DAC voltages of both half periods to be output by the hardware clock
+
+        The DAC is clocked at the ADC scan rate, a half period lasting `sample_count` scans
+        and the scans skipped after the DAC switches.
+        Return whether the pattern has been loaded successfully.
+        """
+        if self.bfd_ao_ctrl is None:
+            self.bfd_ao_ctrl = BufferedAOCtrl(self.device)
+            for receiver, channel in zip(RECEIVERS, self.bfd_ao_ctrl.channels):
+                channel.valueRange = self._dac_value_ranges[receiver]
+            # ЦАП запускается тем же фронтом, что и АЦП, но без задержки
+            if self._trigger_adc and not self._arm_trigger(self.bfd_ao_ctrl.trigger, 0):
+                self._emit_state(self.tr("Error: the DAC can't be triggered"))
+                return False
+        sample_count += self._adc_delay
+        self.bfd_ao_ctrl.conversion.channelStart = 0
+        self.bfd_ao_ctrl.conversion.channelCount = len(RECEIVERS)
+        self.bfd_ao_ctrl.conversion.clockRate = self.wf_ai_ctrl.conversion.clockRate
+        self.bfd_ao_ctrl.record.sectionLength = 2 * sample_count
+        self.bfd_ao_ctrl.record.sectionCount = 1
+        self.bfd_ao_ctrl.record.cycles = 0  # бесконечно
+        pattern: array[float] = array("d")
+        for period in (0, 1):
+            pattern.extend(
+                array("d", [self._dac[receiver][period] for receiver in RECEIVERS])
+                * sample_count
+            )
+        ret: ErrorCode = self.bfd_ao_ctrl.prepare()
+        if self._is_error_occurred(ret):
+            return False
+        ret, _transmitted = self.bfd_ao_ctrl.setData(pattern)
+        return not self._is_error_occurred(ret)
+
+    def _start_modulated_adc(
+        self, period: int, scratch: memoryview, channel_count: int, sample_count: int
+    ) -> bool:
+        """Start the DAC pattern and the ADC, and drop the samples before half period `period`
+
+        Both run at the same clock rate, so the lag between their starts stays
+        the same for the whole acquisition. When triggered, both start at the same edge,
+        and the lag is exactly the trigger delay. Otherwise, the clocks are taken to start
+        as the calls return, so the lag is only as accurate as the timing of the calls.
+        Return whether the acquisition has been started successfully.
+        """
+        if self.bfd_ao_ctrl is None:
+            return False
+        clock_rate: float = self.wf_ai_ctrl.conversion.clockRate
+        start_times: list[float] = []
+        for ctrl in (self.bfd_ao_ctrl, self.wf_ai_ctrl):
+            ret: ErrorCode = ctrl.start()
+            start_times.append(perf_counter())
+            if self._is_error_occurred(ret):
+                return False
+        # сколько сканов ЦАП успел выдать до запуска АЦП
+        lag: int
+        if self._trigger_adc:
+            if not self._fire_trigger():
+                return False
+            lag = self._adc_delay
+        else:
+            lag = round((start_times[1] - start_times[0]) * clock_rate)
+        half_period: int = sample_count + self._adc_delay
+        return self._drop_streamed_adc_data(
+            scratch,
+            (period * half_period + self._adc_delay - lag)
+            % (2 * half_period)
+            * channel_count,
+            channel_count,
+        )
+
+    def _drop_streamed_adc_data(
+        self, scratch: memoryview, count: int, channel_count: int
+    ) -> bool:
+        """Read `count` streamed samples into `scratch`, and drop them
+
+        Return whether the data has been dropped successfully.
+        """
+        while count > 0:
+            chunk: int = min(count, len(scratch) - len(scratch) % channel_count)
+            if self._read_streamed_adc_data(scratch, count=chunk) is None:
+                return False
+            count -= chunk
+        return True
+
+    def _stop_modulated_adc(self) -> None:
+        if self.wf_ai_ctrl.state == ControlState.Running:
+            self._is_error_occurred(self.wf_ai_ctrl.stop())
+        if (
+            self.bfd_ao_ctrl is not None
+            and self.bfd_ao_ctrl.state == ControlState.Running
+        ):
+            self._is_error_occurred(self.bfd_ao_ctrl.stop())
+
+    def _acquire_modulated_adc_data(
+        self,
+        data: memoryview,
+        period: int,
+        scratch: memoryview,
+        channel_count: int,
+        sample_count: int,
+    ) -> bool:
+        """Fill `data` with the samples of the next half period, the DAC being switched by the hardware
+
+        The samples taken while the DAC settles after it switches
+        to the following half period are dropped then.
+        Should the driver lose any samples meanwhile, the acquisition is restarted,
+        and the data are acquired again.
+        Return whether the data has been acquired successfully.
+        """
+        while not self.isInterruptionRequested():
+            loss_count: int = self._adc_loss_count
+            self._adc_reading = True
+            try:
+                if self._read_streamed_adc_data(data) is None:
+                    return False
+                if not self._drop_streamed_adc_data(
+                    scratch, self._adc_delay * channel_count, channel_count
+                ):
+                    return False
+            finally:
+                self._adc_reading = False
+            if loss_count == self._adc_loss_count:
+                break
+            self._emit_state(self.tr("ADC data lost, measuring again…"))
+            self._stop_modulated_adc()
+            if not self._start_modulated_adc(
+                period, scratch, channel_count, sample_count
+            ):
+                return False
+        return True
+
+    def _acquire_adc_data(
+        self,
+        data: memoryview,
+        period: int,
+        scratch: memoryview,
+        channel_count: int,
+        sample_count: int,
+        hardware_dac: bool,
+        stream_adc: bool,
+    ) -> bool:
+        """Set the DAC voltages of half period `period`, unless switched by the hardware, and fill `data`
+
+        Return whether the data has been acquired successfully.
+        """
+        ret: ErrorCode
+        # установка напряжения ЦАПов
+        if not hardware_dac:
+            ret = self.instant_ao.writeAny(
+                0,
+                None,
+                [self._dac[receiver][period] for receiver in RECEIVERS],
+            )
+            if self._is_error_occurred(ret):
+                return False
+
+        # сбор данных
+        if hardware_dac:
+            return self._acquire_modulated_adc_data(
+                data, period, scratch, channel_count, sample_count
+            )
+        if stream_adc:
+            return self._acquire_streamed_adc_data(data, scratch, channel_count)
+        clock_rate: float = self.wf_ai_ctrl.conversion.clockRate
+        data_length: int = 0
+        while data_length < len(data):
+            if self.isInterruptionRequested():
+                break
+            ret = self.wf_ai_ctrl.prepare()
+            if self._is_error_occurred(ret):
+                return False
+            ret = self.wf_ai_ctrl.start()
+            if self._is_error_occurred(ret):
+                return False
+            if self._trigger_adc and not self._fire_trigger():
+                return False
+            remainder: int = len(data) - data_length
+            returned: int
+            ret, returned = self.wf_ai_ctrl.getDataInto(
+                data,
+                data_length,
+                timeout=round(2000 * clock_rate / remainder),  # [ms]
+            )
+            if self._is_error_occurred(ret):
+                return False
+            data_length += returned
+            logger.debug(f"Got {data_length / len(data):.2%} of data")
+        ret = self.wf_ai_ctrl.stop()
+        return not self._is_error_occurred(ret)
+
+    @staticmethod
+    def _add_adc_statistics(
+        data: memoryview,
+        statistics: list[RunningStatistics],
+        channel_scales: list[ChannelScale],
+        channel_count: int,
+    ) -> None:
+        """Accumulate the statistics of every channel by the scans in `data`
+
+        The raw data are scaled by `channel_scales`, if they're given.
+        For an affine scale, the statistics of the counts are accumulated instead,
+        to be scaled by `_scaled_adc_statistics` in the end.
+        """
+        raw_adc: bool = bool(channel_scales)
+        # накопление статистики каналов
+        if raw_adc:  # беззнаковые отсчёты
+            data = data.cast("B").cast("H")
+        for channel, channel_statistics in enumerate(statistics):
+            if not raw_adc:
+                channel_statistics.add(data[channel::channel_count])
+            elif channel_scales[channel].affine:
+                channel_statistics.add(
+                    channel_scales[channel].counts(data[channel::channel_count])
+                )
+            else:
+                channel_statistics.add(
+                    channel_scales[channel].scale(data[channel::channel_count])
+                )
+
+    @staticmethod
+    def _scaled_adc_statistics(
+        statistics: list[RunningStatistics], channel_scales: list[ChannelScale]
+    ) -> list[RunningStatistics]:
+        """Get the statistics of the physical values of the channels out of `_add_adc_statistics`"""
+        if not channel_scales:
+            return statistics
+        return [
+            (
+                channel_statistics.scaled(scale.gain, scale.offset)
+                if scale.affine
+                else channel_statistics
+            )
+            for channel_statistics, scale in zip(statistics, channel_scales)
+        ]
+
+    def _settle(
+        self,
+        adc_buffers: dict[int, memoryview],
+        scratch: memoryview,
+        channel_scales: list[ChannelScale],
+        channel_count: int,
+        sample_count: int,
+        hardware_dac: bool,
+        stream_adc: bool,
+    ) -> bool:
+        """Acquire cycle after cycle until the synchronous detection of every receiver stops changing
+
+        The cycles are acquired into `adc_buffers`, the same way the measurement does.
+        The signal is taken as settled as soon as it changes between two cycles by no more
+        than the tolerance or than the noise allows; the wait is limited by the timeout.
+        Return whether the data has been acquired successfully.
+        """
+        tolerance: float = 0.01 * self.settings.settle_tolerance
+        timeout: float = self.settings.settle_timeout
+        start: float = perf_counter()
+        previous: dict[int, list[RunningStatistics]] | None = None
+        cycle_count: int = 0
+        while not self.isInterruptionRequested() and perf_counter() - start < timeout:
+            statistics: dict[int, list[RunningStatistics]] = {
+                period: [RunningStatistics() for _channel in range(channel_count)]
+                for period in (0, 1)
+            }
+            for period in (0, 1):
+                data: memoryview = adc_buffers[period][: channel_count * sample_count]
+                if not self._acquire_adc_data(
+                    data,
+                    period,
+                    scratch,
+                    channel_count,
+                    sample_count,
+                    hardware_dac,
+                    stream_adc,
+                ):
+                    return False
+                self._add_adc_statistics(
+                    data, statistics[period], channel_scales, channel_count
+                )
+            cycle_count += 1
+            # сравнение не зависит от аффинного пересчёта отсчётов в напряжение
+            if previous is not None and all(
+                is_settled(
+                    [previous[period][int(receiver)] for period in (0, 1)],
+                    [statistics[period][int(receiver)] for period in (0, 1)],
+                    tolerance,
+                )
+                for receiver in RECEIVERS
+            ):
+                logger.debug(
+                    f"Settled in {perf_counter() - start:.3f} s, {cycle_count} cycles"
+                )
+                return True
+            previous = statistics
+        if cycle_count:
+            logger.info(f"The signal has not settled in {timeout} s")
+        return True
+
+    def _process_angle(
+        self,
+        index: int,
+        adc_statistics: dict[int, list[RunningStatistics]],
+        adc_buffers: dict[int, memoryview],
+        channel_scales: list[ChannelScale],
+        channel_count: int,
+        sample_count: int,
+        debug_file_name: str,
+    ) -> dict[RECEIVER_MARK_TYPE, tuple[float, float]]:
+        """Get the synchronous detection result and the mean for every receiver at angle #`index`
+
+        The statistics of the channels are accumulated by half-periods during the measurement.
+        The buffers hold the scans of all the cycles of a half-period each,
+        and the raw data are saved from them into `debug_file_name`, if it's given.
+        The method runs in the angle pipeline, while the next angle is being measured.
+        """
+        raw_adc: bool = bool(channel_scales)
+        results: dict[RECEIVER_MARK_TYPE, tuple[float, float]] = {}
+
+        # Расчет результата синхронного детектирования для текущего угла каждого приемника
+        scaled_statistics: dict[int, list[RunningStatistics]] = {
+            period: self._scaled_adc_statistics(adc_statistics[period], channel_scales)
+            for period in (0, 1)
+        }
+        for receiver in RECEIVERS:
+            channel: int = int(receiver)
+            statistics: list[RunningStatistics] = [
+                scaled_statistics[period][channel] for period in (0, 1)
+            ]
+            results[receiver] = synchronous_detection(statistics)
+            logger.debug(
+                f"Receiver {receiver} noise: "
+                + ", ".join(f"{sqrt(s.variance):.3e}" for s in statistics)
+            )
+
+            self.dataObtained.emit(receiver, index, results[receiver][1])
+
+        # сохранение служебного файла
+        if debug_file_name:
+            file_adc: QFile = QFile(debug_file_name)
+            if file_adc.open(
+                QIODevice.OpenModeFlag.WriteOnly | QIODevice.OpenModeFlag.Text
+            ):
+                file_adc_stream: QTextStream = QTextStream(file_adc)
+                periods: list[memoryview] = [adc_buffers[period] for period in (0, 1)]
+                if raw_adc:  # беззнаковые отсчёты
+                    periods = [data.cast("B").cast("H") for data in periods]
+                period_sample_count: int = channel_count * sample_count
+                for cycle in range(len(periods[0]) // period_sample_count):
+                    for period in (0, 1):
+                        for sample in range(sample_count):
+                            str_buf: list[str] = [
+                                str(sample + (period + cycle * 2) * sample_count)
+                            ]
+                            for channel in range(channel_count):
+                                value: float = periods[period][
+                                    cycle * period_sample_count
+                                    + sample * channel_count
+                                    + channel
+                                ]
+                                if raw_adc:
+                                    value = channel_scales[channel](value)
+                                str_buf.append("%e" % value)
+                            file_adc_stream << "\t".join(str_buf) << linesep
+
+                (
+                    file_adc_stream
+                    << "\t".join(("Receiver", "Angle", "SD", "Mean"))
+                    << linesep
+                )
+
+                for receiver in RECEIVERS:
+                    (
+                        file_adc_stream
+                        << "\t".join(map(str, (receiver, index, *results[receiver])))
+                        << linesep
+                    )
+
+                file_adc.close()
+            else:
+                self._emit_state(
+                    self.tr("Error {}: {}").format(
+                        file_adc.error(), file_adc.errorString()
+                    )
+                )
+
+        return results
 
     def run(self) -> None:
+        # обработка измеренных углов, по одному
+        self._angle_pipeline = ThreadPoolExecutor(
+            1, thread_name_prefix=f"{self.device} angles"
+        )
+        try:
+            self._run()
+        finally:
+            self._angle_pipeline.shutdown()
+            if self._zero_interrupt:
+                self._stop_zero_interrupt()
+            if self.pwm_ctrl is not None:
+                self.pwm_ctrl.enabled = False
+                self.pwm_ctrl.removeTerminalCountHandler(
+                    CNTR_MOTOR_STEP_PULSE, self._on_motor_pulses_done
+                )
+            self._stop_modulated_adc()
+            self.wf_ai_ctrl.removeDataReadyHandler(self._on_adc_event)
+            self.wf_ai_ctrl.removeOverrunHandler(self._on_adc_event)
+            self.wf_ai_ctrl.removeCacheOverflowHandler(self._on_adc_event)
+            self.wf_ai_ctrl.removeStoppedHandler(self._on_adc_event)
+            if call_stats.is_enabled():
+                logger.info(f"DAQ library calls so far:{linesep}{call_stats.report()}")
+
+    def _run(self) -> None:
         angles: Final[list[float]] = self.settings.angles
         if not angles:
             self._emit_state(self.tr("Error: no angles provided"))
@@ -189,11 +1062,27 @@ class ThreadHM(QThread):
         cycle_count: Final[int] = self.settings.cycle_count
         channel_count: Final[int] = self.settings.channel_count
         sample_count: Final[int] = self.settings.sample_count
+        hardware_dac: Final[bool] = self.settings.hardware_dac
+        self._trigger_adc = self.settings.trigger_adc
+        self._adc_delay = self.settings.trigger_delay if self._trigger_adc else 0
+        rehome_interval: Final[int] = max(1, self.settings.rehome_interval)
+        self._pulse_motor = self.settings.pulse_motor
+        if self._pulse_motor:
+            self._prepare_motor_pulses()
+        self._zero_interrupt = (
+            self.settings.zero_interrupt and self._prepare_zero_interrupt()
+        )
+        self._step_profile = self._settings_step_profile()
+        # при аппаратном переключении ЦАП АЦП работает непрерывно,
+        # а по триггеру без него — по полупериодам
+        stream_adc: Final[bool] = (
+            self.settings.stream_adc and not self._trigger_adc
+        ) or hardware_dac
+        raw_adc: Final[bool] = self.settings.raw_adc
         save_adc: Final[bool] = self.settings.save_adc
         result_dir: Final[QDir] = self.settings.result_dir
         altitude: Final[float] = self.settings.elevation
         interval: Final[float] = self.settings.interval
-        clock_rate: Final[float] = self.wf_ai_ctrl.conversion.clockRate
 
         if not result_dir.exists():
             parents: list[str] = [result_dir.dirName()]
@@ -206,7 +1095,9 @@ class ThreadHM(QThread):
         # Создание файла с результатом
         file_data: QFile = QFile(
             result_dir.filePath(
-                QDateTime.currentDateTime().toString("yyyy-MM-dd_hh-mm-ss") + ".dat"
+                QDateTime.currentDateTime().toString("yyyy-MM-dd_hh-mm-ss")
+                + self._file_name_suffix
+                + ".dat"
             )
         )
         if not file_data.open(
@@ -263,14 +1154,77 @@ class ThreadHM(QThread):
 
         ret: ErrorCode
 
+        # пересчёт отсчётов АЦП в напряжение
+        channel_scales: Final[list[ChannelScale]] = (
+            self.wf_ai_ctrl.channelScales if raw_adc else []
+        )
+
+        # буферы АЦП по полупериодам: на все циклы измерения одного угла,
+        # если данные сохраняются, иначе на один цикл, так как данные накапливаются;
+        # в одни измеряется угол, пока данные предыдущего обрабатываются в других
+        period_sample_count: Final[int] = channel_count * sample_count
+        buffer_cycle_count: Final[int] = cycle_count if save_adc else 1
+        free_adc_buffers: Final[Queue[dict[int, memoryview]]] = Queue()
+        for _ in range(2):
+            free_adc_buffers.put(
+                {
+                    period: memoryview(
+                        array("h" if raw_adc else "d", [0])
+                        * (buffer_cycle_count * period_sample_count)
+                    )
+                    for period in (0, 1)
+                }
+            )
+
+        if self._trigger_adc and not self._arm_trigger(
+            self.wf_ai_ctrl.trigger, self._adc_delay
+        ):
+            self._emit_state(self.tr("Error: the ADC can't be triggered"))
+            return
+
+        # непрерывный сбор данных посекционно в кольцевой буфер драйвера
+        skipped_adc_data: Final[memoryview] = memoryview(
+            array("h" if raw_adc else "d", [0]) * (channel_count * sectionLength)
+        )
+        if stream_adc:
+            self.wf_ai_ctrl.addDataReadyHandler(self._on_adc_event)
+            self.wf_ai_ctrl.addOverrunHandler(self._on_adc_event)
+            self.wf_ai_ctrl.addCacheOverflowHandler(self._on_adc_event)
+            self.wf_ai_ctrl.addStoppedHandler(self._on_adc_event)
+            self.wf_ai_ctrl.record.sectionLength = sectionLength
+            self.wf_ai_ctrl.record.sectionCount = 0  # бесконечно
+            ret = self.wf_ai_ctrl.prepare()
+            if self._is_error_occurred(ret):
+                return
+            # при аппаратном переключении ЦАП АЦП запускается на каждом угле
+            if hardware_dac:
+                if not self._prepare_dac_pattern(sample_count):
+                    return
+            else:
+                ret = self.wf_ai_ctrl.start()
+                if self._is_error_occurred(ret):
+                    return
+
         # Основной цикл...
+        scan: int = 0
         while not self.isInterruptionRequested() and (
             now := QDateTime.currentDateTime()
         ):  # < date_time_stop
-            # Мотор -> 0
-            self._emit_state(self.tr("Mirror → “0”"))
-            self.motor_find_zero()
-            QThread.sleep(1)
+            # Мотор -> 0, раз в несколько циклов или при уходе положения
+            scan_start: float = self.motor_position
+            find_zero: bool = scan % rehome_interval == 0 or self._motor_drifted()
+            if find_zero:
+                self._emit_state(self.tr("Mirror → “0”"))
+                self.motor_find_zero()
+            scan += 1
+
+            # углы — по порядку, ближайшему к текущему положению
+            scan_angles: list[int] = scan_order(angles, self.motor_position)
+            logger.info(
+                f"Scan #{scan}: angles #{', #'.join(map(str, scan_angles))}, "
+                f"{self._scan_time_saved(angles, scan_angles, scan_start, find_zero):.1f} s "
+                f"of the motor time saved"
+            )
 
             data_sd: dict[RECEIVER_MARK_TYPE, list[float]] = {"0": [], "1": []}
             data_mean: dict[RECEIVER_MARK_TYPE, list[float]] = {"0": [], "1": []}
@@ -281,18 +1235,45 @@ class ThreadHM(QThread):
             d_lnk_tav_t_rel: dict[RECEIVER_MARK_TYPE, float] = {"0": nan, "1": nan}
             tau_o2: dict[RECEIVER_MARK_TYPE, float] = {"0": nan, "1": nan}
             q_g_per_sm2: dict[RECEIVER_MARK_TYPE, float] = {"0": nan, "1": nan}
-            for index, angle in enumerate(angles):
+            angle_results: dict[
+                int, Future[dict[RECEIVER_MARK_TYPE, tuple[float, float]]]
+            ] = {}
+            for index in scan_angles:
                 if self.isInterruptionRequested():
                     break
+                angle: float = angles[index]
 
                 # Установка угла наблюдения
                 self._emit_state(
                     self.tr("Setting angle #{} = {}°").format(index, round(angle, 3))
                 )
                 self.motor_set_angle(angle)
-                QThread.sleep(2)
 
-                data_adc: dict[int, list[list[float]]] = {}
+                adc_buffers: dict[int, memoryview] = free_adc_buffers.get()
+                adc_statistics: dict[int, list[RunningStatistics]] = {
+                    period: [RunningStatistics() for _channel in range(channel_count)]
+                    for period in (0, 1)
+                }
+                if hardware_dac and not self._start_modulated_adc(
+                    0, skipped_adc_data, channel_count, sample_count
+                ):
+                    return
+                # ожидание установления сигнала после поворота
+                self._emit_state(
+                    self.tr("Settling at angle #{} = {}°…").format(
+                        index, round(angle, 3)
+                    )
+                )
+                if not self._settle(
+                    adc_buffers,
+                    skipped_adc_data,
+                    channel_scales,
+                    channel_count,
+                    sample_count,
+                    hardware_dac,
+                    stream_adc,
+                ):
+                    return
                 # Измерение
                 for cycle in range(cycle_count):
                     if self.isInterruptionRequested():
@@ -308,51 +1289,33 @@ class ThreadHM(QThread):
                     # полупериоды
                     for period in (0, 1):
                         logger.debug(f"Period {period}")
-                        # установка напряжения ЦАПов
-                        ret = self.instant_ao.writeAny(
-                            0,
-                            None,
-                            [self._dac[receiver][period] for receiver in RECEIVERS],
-                        )
-                        if self._is_error_occurred(ret):
-                            return
-
                         # сбор данных
-                        data: list[float] = []
-                        data_piece: list[float]
-                        while len(data) < channel_count * sample_count:
-                            if self.isInterruptionRequested():
-                                break
-                            ret = self.wf_ai_ctrl.prepare()
-                            if self._is_error_occurred(ret):
-                                return
-                            ret = self.wf_ai_ctrl.start()
-                            if self._is_error_occurred(ret):
-                                return
-                            remainder: int = channel_count * sample_count - len(data)
-                            (
-                                ret,
-                                data_piece,
-                                *_,
-                            ) = self.wf_ai_ctrl.getDataF64(
-                                remainder,
-                                round(2000 * clock_rate / remainder),  # [ms]
-                            )
-                            if self._is_error_occurred(ret):
-                                return
-                            data.extend(data_piece)
-                            logger.debug(
-                                f"Got {len(data) / channel_count * sample_count:.2%} of data"
-                            )
-                        if period not in data_adc:
-                            data_adc[period] = []
-                        data_adc[period].append(data)
-                        ret = self.wf_ai_ctrl.stop()
-                        if self._is_error_occurred(ret):
+                        data_start: int = (
+                            cycle % buffer_cycle_count
+                        ) * period_sample_count
+                        data: memoryview = adc_buffers[period][
+                            data_start : data_start + period_sample_count
+                        ]
+                        if not self._acquire_adc_data(
+                            data,
+                            period,
+                            skipped_adc_data,
+                            channel_count,
+                            sample_count,
+                            hardware_dac,
+                            stream_adc,
+                        ):
                             return
+                        self._add_adc_statistics(
+                            data, adc_statistics[period], channel_scales, channel_count
+                        )
                 # цикл измерения
 
+                if hardware_dac:
+                    self._stop_modulated_adc()
+
                 if self.isInterruptionRequested():
+                    free_adc_buffers.put(adc_buffers)
                     break
 
                 # установка напряжения ЦАПов в “0”
@@ -364,97 +1327,41 @@ class ThreadHM(QThread):
                 if self._is_error_occurred(ret):
                     return
 
-                # Расчет результата синхронного детектирования для текущего угла каждого приемника
-                for receiver, wavelength in zip(RECEIVERS, WAVELENGTHS, strict=True):
-                    self._emit_state(
-                        self.tr("Calculating results for {}-mm receiver…").format(
-                            wavelength
-                        )
-                    )
-
-                    mean = [
-                        sum(
-                            sum(d_cycle[int(receiver) :: channel_count])
-                            / (len(d_cycle) // channel_count)
-                            for d_cycle in data_adc[period]
-                        )
-                        / len(data_adc[period])
-                        for period in (0, 1)
-                    ]
-
-                    data_sd[receiver].append((mean[0] - mean[1]) / 2)
-                    data_mean[receiver].append((mean[0] + mean[1]) / 2)
-
-                    self.dataObtained.emit(receiver, index, data_mean[receiver][-1])
-
-                # сохранение служебного файла
-                if save_adc:
-                    file_adc: QFile = QFile(
+                # обработка угла в фоне, пока измеряется следующий
+                angle_results[index] = self._angle_pipeline.submit(
+                    self._process_angle,
+                    index,
+                    adc_statistics,
+                    adc_buffers,
+                    channel_scales,
+                    channel_count,
+                    sample_count,
+                    (
                         result_dir.filePath(
-                            now.toString("yyyy-MM-dd_hh-mm-ss-zzz") + ".dat"
-                        )
-                    )
-                    if file_adc.open(
-                        QIODevice.OpenModeFlag.WriteOnly | QIODevice.OpenModeFlag.Text
-                    ):
-                        file_adc_stream: QTextStream = QTextStream(file_adc)
-                        for cycle in range(cycle_count):
-                            self._emit_state(
-                                self.tr("Saving debug data…"),
-                                cycle,
-                                cycle_count,
-                            )
-                            for period in (0, 1):
-                                for sample in range(sample_count):
-                                    str_buf: list[str] = [
-                                        str(
-                                            sample + (period + cycle * 2) * sample_count
-                                        )
-                                    ]
-                                    for channel in range(channel_count):
-                                        str_buf.append(
-                                            "%e"
-                                            % data_adc[period][cycle][
-                                                sample * sample_count + channel
-                                            ]
-                                        )
-                                    file_adc_stream << "\t".join(str_buf) << linesep
-
-                        (
-                            file_adc_stream
-                            << "\t".join(("Receiver", "Angle", "SD", "Mean"))
-                            << linesep
-                        )
-
-                        for receiver in RECEIVERS:
-                            (
-                                file_adc_stream
-                                << "\t".join(
-                                    map(
-                                        str,
-                                        (
-                                            receiver,
-                                            index,
-                                            data_sd[receiver][index],
-                                            data_mean[receiver][index],
-                                        ),
-                                    )
-                                )
-                                << linesep
-                            )
-
-                        file_adc.close()
-                    else:
-                        self._emit_state(
-                            self.tr("Error {}: {}").format(
-                                file_adc.error(), file_adc.errorString()
-                            )
+                            now.toString("yyyy-MM-dd_hh-mm-ss-zzz")
+                            + self._file_name_suffix
+                            + ".dat"
                         )
+                        if save_adc
+                        else ""
+                    ),
+                )
+                angle_results[index].add_done_callback(
+                    lambda _future, buffers=adc_buffers: free_adc_buffers.put(buffers)
+                )
             # углы измерения
 
             if self.isInterruptionRequested():
                 break
 
+            # результаты синхронного детектирования по углам
+            for index in range(len(angles)):
+                for receiver, (sd_value, mean_value) in (
+                    angle_results[index].result().items()
+                ):
+                    data_sd[receiver].append(sd_value)
+                    data_mean[receiver].append(mean_value)
+
             # Расчет поглощения
             self._emit_state(self.tr("Absorption calculation…"))
             description: str = ""
@@ -602,6 +1509,12 @@ class ThreadHM(QThread):
                 self.instant_do_ctrl.dispose()
             with suppress(AttributeError):
                 self.instant_ao.dispose()
+            with suppress(AttributeError):
+                if self.bfd_ao_ctrl is not None:
+                    self.bfd_ao_ctrl.dispose()
+            with suppress(AttributeError):
+                if self.pwm_ctrl is not None:
+                    self.pwm_ctrl.dispose()
             with suppress(AttributeError):
                 self.wf_ai_ctrl.dispose()
             self._emit_state(self.tr("Disposed of the DAQ objects"))